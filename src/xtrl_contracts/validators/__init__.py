@@ -0,0 +1 @@
+# generated package marker
@@ -0,0 +1,162 @@
+# generated by tools/contracts/gen.py; never hand-edit
+# source: control/ssot/schemas/api_surface.schema.json
+from __future__ import annotations
+
+
+class ValidationError(ValueError):
+    """Raised by generated validators; the message starts with the data path."""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[k], two[k]) for k in one)
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def _unique(items):
+    for i, a in enumerate(items):
+        for b in items[i + 1 :]:
+            if _equal(a, b):
+                return False
+    return True
+
+
+_REQUIRED_1 = frozenset(["artifact_kind", "ordering", "packages", "schema_version"])
+_CONST_3 = "api_surface"
+_CONST_5 = "stable_lexicographic"
+_REQUIRED_9 = frozenset(["exports", "package"])
+_REQUIRED_13 = frozenset(["kind", "module", "name"])
+_ENUM_15 = frozenset(["class", "constant", "function", "module"])
+_PROPS_18 = frozenset(["kind", "module", "name"])
+_PROPS_20 = frozenset(["exports", "package"])
+_CONST_22 = "0.1"
+_PROPS_23 = frozenset(["artifact_kind", "ordering", "packages", "schema_version"])
+
+
+def validate(data, path="$"):
+    """Raise ValidationError if data does not conform; return data."""
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_1 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_1 - data.keys())}"
+        )
+    if "artifact_kind" in data:
+        v2 = data["artifact_kind"]
+        if not isinstance(v2, str):
+            raise ValidationError(f"{path}.artifact_kind is not of type 'string'")
+        if not (isinstance(v2, str) and v2 == _CONST_3):
+            raise ValidationError(
+                f"{path}.artifact_kind was expected to be {_CONST_3!r}"
+            )
+    if "ordering" in data:
+        v4 = data["ordering"]
+        if not isinstance(v4, str):
+            raise ValidationError(f"{path}.ordering is not of type 'string'")
+        if not (isinstance(v4, str) and v4 == _CONST_5):
+            raise ValidationError(f"{path}.ordering was expected to be {_CONST_5!r}")
+    if "packages" in data:
+        v6 = data["packages"]
+        if not isinstance(v6, list):
+            raise ValidationError(f"{path}.packages is not of type 'array'")
+        for i7, v8 in enumerate(v6):
+            if not isinstance(v8, dict):
+                raise ValidationError(f"{path}.packages[{i7}] is not of type 'object'")
+            if not _REQUIRED_9 <= v8.keys():
+                raise ValidationError(
+                    f"{path}.packages[{i7}] is missing required {sorted(_REQUIRED_9 - v8.keys())}"
+                )
+            if "exports" in v8:
+                v10 = v8["exports"]
+                if not isinstance(v10, list):
+                    raise ValidationError(
+                        f"{path}.packages[{i7}].exports is not of type 'array'"
+                    )
+                for i11, v12 in enumerate(v10):
+                    if not isinstance(v12, dict):
+                        raise ValidationError(
+                            f"{path}.packages[{i7}].exports[{i11}] is not of type 'object'"
+                        )
+                    if not _REQUIRED_13 <= v12.keys():
+                        raise ValidationError(
+                            f"{path}.packages[{i7}].exports[{i11}] is missing required {sorted(_REQUIRED_13 - v12.keys())}"
+                        )
+                    if "kind" in v12:
+                        v14 = v12["kind"]
+                        if not isinstance(v14, str):
+                            raise ValidationError(
+                                f"{path}.packages[{i7}].exports[{i11}].kind is not of type 'string'"
+                            )
+                        if not (isinstance(v14, str) and v14 in _ENUM_15):
+                            raise ValidationError(
+                                f"{path}.packages[{i7}].exports[{i11}].kind is not one of {sorted(_ENUM_15)}"
+                            )
+                    if "module" in v12:
+                        v16 = v12["module"]
+                        if not isinstance(v16, str):
+                            raise ValidationError(
+                                f"{path}.packages[{i7}].exports[{i11}].module is not of type 'string'"
+                            )
+                        if len(v16) < 1:
+                            raise ValidationError(
+                                f"{path}.packages[{i7}].exports[{i11}].module is shorter than 1"
+                            )
+                    if "name" in v12:
+                        v17 = v12["name"]
+                        if not isinstance(v17, str):
+                            raise ValidationError(
+                                f"{path}.packages[{i7}].exports[{i11}].name is not of type 'string'"
+                            )
+                        if len(v17) < 1:
+                            raise ValidationError(
+                                f"{path}.packages[{i7}].exports[{i11}].name is shorter than 1"
+                            )
+                    if v12.keys() - _PROPS_18:
+                        raise ValidationError(
+                            f"{path}.packages[{i7}].exports[{i11}] has unexpected properties {sorted(v12.keys() - _PROPS_18)}"
+                        )
+            if "package" in v8:
+                v19 = v8["package"]
+                if not isinstance(v19, str):
+                    raise ValidationError(
+                        f"{path}.packages[{i7}].package is not of type 'string'"
+                    )
+                if len(v19) < 1:
+                    raise ValidationError(
+                        f"{path}.packages[{i7}].package is shorter than 1"
+                    )
+            if v8.keys() - _PROPS_20:
+                raise ValidationError(
+                    f"{path}.packages[{i7}] has unexpected properties {sorted(v8.keys() - _PROPS_20)}"
+                )
+    if "schema_version" in data:
+        v21 = data["schema_version"]
+        if not isinstance(v21, str):
+            raise ValidationError(f"{path}.schema_version is not of type 'string'")
+        if not (isinstance(v21, str) and v21 == _CONST_22):
+            raise ValidationError(
+                f"{path}.schema_version was expected to be {_CONST_22!r}"
+            )
+    if data.keys() - _PROPS_23:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_23)}"
+        )
+    return data
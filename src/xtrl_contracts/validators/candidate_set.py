@@ -0,0 +1,703 @@
+# generated by tools/contracts/gen.py; never hand-edit
+# source: control/ssot/schemas/candidate_set.schema.json
+from __future__ import annotations
+
+import re
+
+
+class ValidationError(ValueError):
+    """Raised by generated validators; the message starts with the data path."""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[k], two[k]) for k in one)
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def _unique(items):
+    for i, a in enumerate(items):
+        for b in items[i + 1 :]:
+            if _equal(a, b):
+                return False
+    return True
+
+
+_REQUIRED_1 = frozenset(["artifact_kind", "base_ref", "candidates", "meta", "queue_id"])
+_CONST_3 = "candidate_set"
+_REQUIRED_8 = frozenset(
+    [
+        "candidate_id",
+        "evidence_path",
+        "gate_worker_path",
+        "metrics",
+        "patch_proposal_path",
+        "pattern",
+        "work_item_id",
+    ]
+)
+_REQUIRED_14 = frozenset(["checks_passed", "diff_lines_total", "files_touched"])
+_PROPS_20 = frozenset(
+    [
+        "checks_failed",
+        "checks_passed",
+        "diff_lines_total",
+        "files_touched",
+        "policy_warnings",
+    ]
+)
+_PROPS_24 = frozenset(
+    [
+        "candidate_id",
+        "created_at",
+        "evidence_path",
+        "gate_worker_path",
+        "metrics",
+        "patch_proposal_path",
+        "pattern",
+        "work_item_id",
+    ]
+)
+_REQUIRED_26 = frozenset(["guards", "policy_linkage", "requirements"])
+_REQUIRED_28 = frozenset(["eval", "spec"])
+_REQUIRED_32 = frozenset(["guard_id", "status"])
+_ENUM_34 = frozenset(["ALLOW", "DENY", "STOP"])
+_ENUM_44 = frozenset(["FAIL", "PASS", "SKIP"])
+_PROPS_45 = frozenset(
+    ["decision", "evidence_refs", "guard_id", "notes", "reason_codes", "status"]
+)
+_REQUIRED_49 = frozenset(
+    ["deny_decision", "deny_reason_code", "evidence_kinds", "guard_id"]
+)
+_ENUM_51 = frozenset(["DENY", "STOP"])
+_PATTERN_53 = re.compile("^[A-Z0-9_]+$")
+_ENUM_59 = frozenset(["advisory", "repairable", "stop", "structural"])
+_PROPS_61 = frozenset(
+    [
+        "deny_decision",
+        "deny_reason_code",
+        "evidence_kinds",
+        "guard_id",
+        "guard_kind",
+        "predicate_ref",
+    ]
+)
+_PROPS_62 = frozenset(["eval", "spec"])
+_REQUIRED_64 = frozenset(["reason_codes_ref"])
+_REQUIRED_66 = frozenset(["path", "version"])
+_PROPS_71 = frozenset(["id", "path", "sha256", "version"])
+_PROPS_78 = frozenset(
+    [
+        "control_strategy_ref",
+        "guardrails_bundle_ref",
+        "pattern_catalog_ref",
+        "plant_spec_ref",
+        "rank_policy_ref",
+        "reason_codes_ref",
+        "src_conventions_ref",
+    ]
+)
+_REQUIRED_80 = frozenset(["required_evidence"])
+_PROPS_84 = frozenset(["required_evidence"])
+_PROPS_85 = frozenset(["guards", "policy_linkage", "requirements"])
+_PROPS_87 = frozenset(["artifact_kind", "base_ref", "candidates", "meta", "queue_id"])
+_REQUIRED_88 = frozenset(
+    [
+        "candidate_id",
+        "evidence_path",
+        "gate_worker_path",
+        "metrics",
+        "patch_proposal_path",
+        "pattern",
+        "work_item_id",
+    ]
+)
+_REQUIRED_94 = frozenset(["checks_passed", "diff_lines_total", "files_touched"])
+_PROPS_100 = frozenset(
+    [
+        "checks_failed",
+        "checks_passed",
+        "diff_lines_total",
+        "files_touched",
+        "policy_warnings",
+    ]
+)
+_PROPS_104 = frozenset(
+    [
+        "candidate_id",
+        "created_at",
+        "evidence_path",
+        "gate_worker_path",
+        "metrics",
+        "patch_proposal_path",
+        "pattern",
+        "work_item_id",
+    ]
+)
+
+
+def validate(data, path="$"):
+    """Raise ValidationError if data does not conform; return data."""
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_1 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_1 - data.keys())}"
+        )
+    if "artifact_kind" in data:
+        v2 = data["artifact_kind"]
+        if not (isinstance(v2, str) and v2 == _CONST_3):
+            raise ValidationError(
+                f"{path}.artifact_kind was expected to be {_CONST_3!r}"
+            )
+    if "base_ref" in data:
+        v4 = data["base_ref"]
+        if not isinstance(v4, str):
+            raise ValidationError(f"{path}.base_ref is not of type 'string'")
+        if len(v4) < 1:
+            raise ValidationError(f"{path}.base_ref is shorter than 1")
+    if "candidates" in data:
+        v5 = data["candidates"]
+        if not isinstance(v5, list):
+            raise ValidationError(f"{path}.candidates is not of type 'array'")
+        for i6, v7 in enumerate(v5):
+            if not isinstance(v7, dict):
+                raise ValidationError(
+                    f"{path}.candidates[{i6}] is not of type 'object'"
+                )
+            if not _REQUIRED_8 <= v7.keys():
+                raise ValidationError(
+                    f"{path}.candidates[{i6}] is missing required {sorted(_REQUIRED_8 - v7.keys())}"
+                )
+            if "candidate_id" in v7:
+                v9 = v7["candidate_id"]
+                if not isinstance(v9, str):
+                    raise ValidationError(
+                        f"{path}.candidates[{i6}].candidate_id is not of type 'string'"
+                    )
+                if len(v9) < 1:
+                    raise ValidationError(
+                        f"{path}.candidates[{i6}].candidate_id is shorter than 1"
+                    )
+            if "created_at" in v7:
+                v10 = v7["created_at"]
+                if not isinstance(v10, str):
+                    raise ValidationError(
+                        f"{path}.candidates[{i6}].created_at is not of type 'string'"
+                    )
+            if "evidence_path" in v7:
+                v11 = v7["evidence_path"]
+                if not isinstance(v11, str):
+                    raise ValidationError(
+                        f"{path}.candidates[{i6}].evidence_path is not of type 'string'"
+                    )
+                if len(v11) < 1:
+                    raise ValidationError(
+                        f"{path}.candidates[{i6}].evidence_path is shorter than 1"
+                    )
+            if "gate_worker_path" in v7:
+                v12 = v7["gate_worker_path"]
+                if not isinstance(v12, str):
+                    raise ValidationError(
+                        f"{path}.candidates[{i6}].gate_worker_path is not of type 'string'"
+                    )
+                if len(v12) < 1:
+                    raise ValidationError(
+                        f"{path}.candidates[{i6}].gate_worker_path is shorter than 1"
+                    )
+            if "metrics" in v7:
+                v13 = v7["metrics"]
+                if not isinstance(v13, dict):
+                    raise ValidationError(
+                        f"{path}.candidates[{i6}].metrics is not of type 'object'"
+                    )
+                if not _REQUIRED_14 <= v13.keys():
+                    raise ValidationError(
+                        f"{path}.candidates[{i6}].metrics is missing required {sorted(_REQUIRED_14 - v13.keys())}"
+                    )
+                if "checks_failed" in v13:
+                    v15 = v13["checks_failed"]
+                    if not _is_integer(v15):
+                        raise ValidationError(
+                            f"{path}.candidates[{i6}].metrics.checks_failed is not of type 'integer'"
+                        )
+                    if v15 < 0:
+                        raise ValidationError(
+                            f"{path}.candidates[{i6}].metrics.checks_failed violates minimum 0"
+                        )
+                if "checks_passed" in v13:
+                    v16 = v13["checks_passed"]
+                    if not _is_integer(v16):
+                        raise ValidationError(
+                            f"{path}.candidates[{i6}].metrics.checks_passed is not of type 'integer'"
+                        )
+                    if v16 < 0:
+                        raise ValidationError(
+                            f"{path}.candidates[{i6}].metrics.checks_passed violates minimum 0"
+                        )
+                if "diff_lines_total" in v13:
+                    v17 = v13["diff_lines_total"]
+                    if not _is_integer(v17):
+                        raise ValidationError(
+                            f"{path}.candidates[{i6}].metrics.diff_lines_total is not of type 'integer'"
+                        )
+                    if v17 < 0:
+                        raise ValidationError(
+                            f"{path}.candidates[{i6}].metrics.diff_lines_total violates minimum 0"
+                        )
+                if "files_touched" in v13:
+                    v18 = v13["files_touched"]
+                    if not _is_integer(v18):
+                        raise ValidationError(
+                            f"{path}.candidates[{i6}].metrics.files_touched is not of type 'integer'"
+                        )
+                    if v18 < 0:
+                        raise ValidationError(
+                            f"{path}.candidates[{i6}].metrics.files_touched violates minimum 0"
+                        )
+                if "policy_warnings" in v13:
+                    v19 = v13["policy_warnings"]
+                    if not _is_integer(v19):
+                        raise ValidationError(
+                            f"{path}.candidates[{i6}].metrics.policy_warnings is not of type 'integer'"
+                        )
+                    if v19 < 0:
+                        raise ValidationError(
+                            f"{path}.candidates[{i6}].metrics.policy_warnings violates minimum 0"
+                        )
+                if v13.keys() - _PROPS_20:
+                    raise ValidationError(
+                        f"{path}.candidates[{i6}].metrics has unexpected properties {sorted(v13.keys() - _PROPS_20)}"
+                    )
+            if "patch_proposal_path" in v7:
+                v21 = v7["patch_proposal_path"]
+                if not isinstance(v21, str):
+                    raise ValidationError(
+                        f"{path}.candidates[{i6}].patch_proposal_path is not of type 'string'"
+                    )
+                if len(v21) < 1:
+                    raise ValidationError(
+                        f"{path}.candidates[{i6}].patch_proposal_path is shorter than 1"
+                    )
+            if "pattern" in v7:
+                v22 = v7["pattern"]
+                if not isinstance(v22, str):
+                    raise ValidationError(
+                        f"{path}.candidates[{i6}].pattern is not of type 'string'"
+                    )
+                if len(v22) < 1:
+                    raise ValidationError(
+                        f"{path}.candidates[{i6}].pattern is shorter than 1"
+                    )
+            if "work_item_id" in v7:
+                v23 = v7["work_item_id"]
+                if not isinstance(v23, str):
+                    raise ValidationError(
+                        f"{path}.candidates[{i6}].work_item_id is not of type 'string'"
+                    )
+                if len(v23) < 1:
+                    raise ValidationError(
+                        f"{path}.candidates[{i6}].work_item_id is shorter than 1"
+                    )
+            if v7.keys() - _PROPS_24:
+                raise ValidationError(
+                    f"{path}.candidates[{i6}] has unexpected properties {sorted(v7.keys() - _PROPS_24)}"
+                )
+    if "meta" in data:
+        v25 = data["meta"]
+        _ref_definitions_meta(v25, f"{path}.meta")
+    if "queue_id" in data:
+        v86 = data["queue_id"]
+        if not isinstance(v86, str):
+            raise ValidationError(f"{path}.queue_id is not of type 'string'")
+        if len(v86) < 1:
+            raise ValidationError(f"{path}.queue_id is shorter than 1")
+    if data.keys() - _PROPS_87:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_87)}"
+        )
+    return data
+
+
+def validate_candidate(data, path="$"):
+    """Validate data against the subschema at /properties/candidates/items."""
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_88 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_88 - data.keys())}"
+        )
+    if "candidate_id" in data:
+        v89 = data["candidate_id"]
+        if not isinstance(v89, str):
+            raise ValidationError(f"{path}.candidate_id is not of type 'string'")
+        if len(v89) < 1:
+            raise ValidationError(f"{path}.candidate_id is shorter than 1")
+    if "created_at" in data:
+        v90 = data["created_at"]
+        if not isinstance(v90, str):
+            raise ValidationError(f"{path}.created_at is not of type 'string'")
+    if "evidence_path" in data:
+        v91 = data["evidence_path"]
+        if not isinstance(v91, str):
+            raise ValidationError(f"{path}.evidence_path is not of type 'string'")
+        if len(v91) < 1:
+            raise ValidationError(f"{path}.evidence_path is shorter than 1")
+    if "gate_worker_path" in data:
+        v92 = data["gate_worker_path"]
+        if not isinstance(v92, str):
+            raise ValidationError(f"{path}.gate_worker_path is not of type 'string'")
+        if len(v92) < 1:
+            raise ValidationError(f"{path}.gate_worker_path is shorter than 1")
+    if "metrics" in data:
+        v93 = data["metrics"]
+        if not isinstance(v93, dict):
+            raise ValidationError(f"{path}.metrics is not of type 'object'")
+        if not _REQUIRED_94 <= v93.keys():
+            raise ValidationError(
+                f"{path}.metrics is missing required {sorted(_REQUIRED_94 - v93.keys())}"
+            )
+        if "checks_failed" in v93:
+            v95 = v93["checks_failed"]
+            if not _is_integer(v95):
+                raise ValidationError(
+                    f"{path}.metrics.checks_failed is not of type 'integer'"
+                )
+            if v95 < 0:
+                raise ValidationError(
+                    f"{path}.metrics.checks_failed violates minimum 0"
+                )
+        if "checks_passed" in v93:
+            v96 = v93["checks_passed"]
+            if not _is_integer(v96):
+                raise ValidationError(
+                    f"{path}.metrics.checks_passed is not of type 'integer'"
+                )
+            if v96 < 0:
+                raise ValidationError(
+                    f"{path}.metrics.checks_passed violates minimum 0"
+                )
+        if "diff_lines_total" in v93:
+            v97 = v93["diff_lines_total"]
+            if not _is_integer(v97):
+                raise ValidationError(
+                    f"{path}.metrics.diff_lines_total is not of type 'integer'"
+                )
+            if v97 < 0:
+                raise ValidationError(
+                    f"{path}.metrics.diff_lines_total violates minimum 0"
+                )
+        if "files_touched" in v93:
+            v98 = v93["files_touched"]
+            if not _is_integer(v98):
+                raise ValidationError(
+                    f"{path}.metrics.files_touched is not of type 'integer'"
+                )
+            if v98 < 0:
+                raise ValidationError(
+                    f"{path}.metrics.files_touched violates minimum 0"
+                )
+        if "policy_warnings" in v93:
+            v99 = v93["policy_warnings"]
+            if not _is_integer(v99):
+                raise ValidationError(
+                    f"{path}.metrics.policy_warnings is not of type 'integer'"
+                )
+            if v99 < 0:
+                raise ValidationError(
+                    f"{path}.metrics.policy_warnings violates minimum 0"
+                )
+        if v93.keys() - _PROPS_100:
+            raise ValidationError(
+                f"{path}.metrics has unexpected properties {sorted(v93.keys() - _PROPS_100)}"
+            )
+    if "patch_proposal_path" in data:
+        v101 = data["patch_proposal_path"]
+        if not isinstance(v101, str):
+            raise ValidationError(f"{path}.patch_proposal_path is not of type 'string'")
+        if len(v101) < 1:
+            raise ValidationError(f"{path}.patch_proposal_path is shorter than 1")
+    if "pattern" in data:
+        v102 = data["pattern"]
+        if not isinstance(v102, str):
+            raise ValidationError(f"{path}.pattern is not of type 'string'")
+        if len(v102) < 1:
+            raise ValidationError(f"{path}.pattern is shorter than 1")
+    if "work_item_id" in data:
+        v103 = data["work_item_id"]
+        if not isinstance(v103, str):
+            raise ValidationError(f"{path}.work_item_id is not of type 'string'")
+        if len(v103) < 1:
+            raise ValidationError(f"{path}.work_item_id is shorter than 1")
+    if data.keys() - _PROPS_104:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_104)}"
+        )
+    return data
+
+
+def _ref_definitions_guard_eval(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_32 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_32 - data.keys())}"
+        )
+    if "decision" in data:
+        v33 = data["decision"]
+        if not isinstance(v33, str):
+            raise ValidationError(f"{path}.decision is not of type 'string'")
+        if not (isinstance(v33, str) and v33 in _ENUM_34):
+            raise ValidationError(f"{path}.decision is not one of {sorted(_ENUM_34)}")
+    if "evidence_refs" in data:
+        v35 = data["evidence_refs"]
+        if not isinstance(v35, list):
+            raise ValidationError(f"{path}.evidence_refs is not of type 'array'")
+        for i36, v37 in enumerate(v35):
+            if not isinstance(v37, str):
+                raise ValidationError(
+                    f"{path}.evidence_refs[{i36}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v38 = data["guard_id"]
+        if not isinstance(v38, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v38) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "notes" in data:
+        v39 = data["notes"]
+        if not isinstance(v39, str):
+            raise ValidationError(f"{path}.notes is not of type 'string'")
+    if "reason_codes" in data:
+        v40 = data["reason_codes"]
+        if not isinstance(v40, list):
+            raise ValidationError(f"{path}.reason_codes is not of type 'array'")
+        for i41, v42 in enumerate(v40):
+            if not isinstance(v42, str):
+                raise ValidationError(
+                    f"{path}.reason_codes[{i41}] is not of type 'string'"
+                )
+    if "status" in data:
+        v43 = data["status"]
+        if not isinstance(v43, str):
+            raise ValidationError(f"{path}.status is not of type 'string'")
+        if not (isinstance(v43, str) and v43 in _ENUM_44):
+            raise ValidationError(f"{path}.status is not one of {sorted(_ENUM_44)}")
+    if data.keys() - _PROPS_45:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_45)}"
+        )
+
+
+def _ref_definitions_guard_spec(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_49 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_49 - data.keys())}"
+        )
+    if "deny_decision" in data:
+        v50 = data["deny_decision"]
+        if not isinstance(v50, str):
+            raise ValidationError(f"{path}.deny_decision is not of type 'string'")
+        if not (isinstance(v50, str) and v50 in _ENUM_51):
+            raise ValidationError(
+                f"{path}.deny_decision is not one of {sorted(_ENUM_51)}"
+            )
+    if "deny_reason_code" in data:
+        v52 = data["deny_reason_code"]
+        if not isinstance(v52, str):
+            raise ValidationError(f"{path}.deny_reason_code is not of type 'string'")
+        if not _PATTERN_53.search(v52):
+            raise ValidationError(
+                f"{path}.deny_reason_code does not match {_PATTERN_53.pattern!r}"
+            )
+    if "evidence_kinds" in data:
+        v54 = data["evidence_kinds"]
+        if not isinstance(v54, list):
+            raise ValidationError(f"{path}.evidence_kinds is not of type 'array'")
+        for i55, v56 in enumerate(v54):
+            if not isinstance(v56, str):
+                raise ValidationError(
+                    f"{path}.evidence_kinds[{i55}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v57 = data["guard_id"]
+        if not isinstance(v57, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v57) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "guard_kind" in data:
+        v58 = data["guard_kind"]
+        if not isinstance(v58, str):
+            raise ValidationError(f"{path}.guard_kind is not of type 'string'")
+        if not (isinstance(v58, str) and v58 in _ENUM_59):
+            raise ValidationError(f"{path}.guard_kind is not one of {sorted(_ENUM_59)}")
+    if "predicate_ref" in data:
+        v60 = data["predicate_ref"]
+        if not isinstance(v60, str):
+            raise ValidationError(f"{path}.predicate_ref is not of type 'string'")
+        if len(v60) < 1:
+            raise ValidationError(f"{path}.predicate_ref is shorter than 1")
+    if data.keys() - _PROPS_61:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_61)}"
+        )
+
+
+def _ref_definitions_artifact_ref(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_66 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_66 - data.keys())}"
+        )
+    if "id" in data:
+        v67 = data["id"]
+        if not isinstance(v67, str):
+            raise ValidationError(f"{path}.id is not of type 'string'")
+        if len(v67) < 1:
+            raise ValidationError(f"{path}.id is shorter than 1")
+    if "path" in data:
+        v68 = data["path"]
+        if not isinstance(v68, str):
+            raise ValidationError(f"{path}.path is not of type 'string'")
+        if len(v68) < 1:
+            raise ValidationError(f"{path}.path is shorter than 1")
+    if "sha256" in data:
+        v69 = data["sha256"]
+        if not isinstance(v69, str):
+            raise ValidationError(f"{path}.sha256 is not of type 'string'")
+        if len(v69) < 1:
+            raise ValidationError(f"{path}.sha256 is shorter than 1")
+    if "version" in data:
+        v70 = data["version"]
+        if not isinstance(v70, str):
+            raise ValidationError(f"{path}.version is not of type 'string'")
+        if len(v70) < 1:
+            raise ValidationError(f"{path}.version is shorter than 1")
+    if data.keys() - _PROPS_71:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_71)}"
+        )
+
+
+def _ref_definitions_meta(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_26 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_26 - data.keys())}"
+        )
+    if "guards" in data:
+        v27 = data["guards"]
+        if not isinstance(v27, dict):
+            raise ValidationError(f"{path}.guards is not of type 'object'")
+        if not _REQUIRED_28 <= v27.keys():
+            raise ValidationError(
+                f"{path}.guards is missing required {sorted(_REQUIRED_28 - v27.keys())}"
+            )
+        if "eval" in v27:
+            v29 = v27["eval"]
+            if not isinstance(v29, list):
+                raise ValidationError(f"{path}.guards.eval is not of type 'array'")
+            for i30, v31 in enumerate(v29):
+                _ref_definitions_guard_eval(v31, f"{path}.guards.eval[{i30}]")
+        if "spec" in v27:
+            v46 = v27["spec"]
+            if not isinstance(v46, list):
+                raise ValidationError(f"{path}.guards.spec is not of type 'array'")
+            for i47, v48 in enumerate(v46):
+                _ref_definitions_guard_spec(v48, f"{path}.guards.spec[{i47}]")
+        if v27.keys() - _PROPS_62:
+            raise ValidationError(
+                f"{path}.guards has unexpected properties {sorted(v27.keys() - _PROPS_62)}"
+            )
+    if "policy_linkage" in data:
+        v63 = data["policy_linkage"]
+        if not isinstance(v63, dict):
+            raise ValidationError(f"{path}.policy_linkage is not of type 'object'")
+        if not _REQUIRED_64 <= v63.keys():
+            raise ValidationError(
+                f"{path}.policy_linkage is missing required {sorted(_REQUIRED_64 - v63.keys())}"
+            )
+        if "control_strategy_ref" in v63:
+            v65 = v63["control_strategy_ref"]
+            _ref_definitions_artifact_ref(
+                v65, f"{path}.policy_linkage.control_strategy_ref"
+            )
+        if "guardrails_bundle_ref" in v63:
+            v72 = v63["guardrails_bundle_ref"]
+            _ref_definitions_artifact_ref(
+                v72, f"{path}.policy_linkage.guardrails_bundle_ref"
+            )
+        if "pattern_catalog_ref" in v63:
+            v73 = v63["pattern_catalog_ref"]
+            _ref_definitions_artifact_ref(
+                v73, f"{path}.policy_linkage.pattern_catalog_ref"
+            )
+        if "plant_spec_ref" in v63:
+            v74 = v63["plant_spec_ref"]
+            _ref_definitions_artifact_ref(v74, f"{path}.policy_linkage.plant_spec_ref")
+        if "rank_policy_ref" in v63:
+            v75 = v63["rank_policy_ref"]
+            _ref_definitions_artifact_ref(v75, f"{path}.policy_linkage.rank_policy_ref")
+        if "reason_codes_ref" in v63:
+            v76 = v63["reason_codes_ref"]
+            _ref_definitions_artifact_ref(
+                v76, f"{path}.policy_linkage.reason_codes_ref"
+            )
+        if "src_conventions_ref" in v63:
+            v77 = v63["src_conventions_ref"]
+            _ref_definitions_artifact_ref(
+                v77, f"{path}.policy_linkage.src_conventions_ref"
+            )
+        if v63.keys() - _PROPS_78:
+            raise ValidationError(
+                f"{path}.policy_linkage has unexpected properties {sorted(v63.keys() - _PROPS_78)}"
+            )
+    if "requirements" in data:
+        v79 = data["requirements"]
+        if not isinstance(v79, dict):
+            raise ValidationError(f"{path}.requirements is not of type 'object'")
+        if not _REQUIRED_80 <= v79.keys():
+            raise ValidationError(
+                f"{path}.requirements is missing required {sorted(_REQUIRED_80 - v79.keys())}"
+            )
+        if "required_evidence" in v79:
+            v81 = v79["required_evidence"]
+            if not isinstance(v81, list):
+                raise ValidationError(
+                    f"{path}.requirements.required_evidence is not of type 'array'"
+                )
+            for i82, v83 in enumerate(v81):
+                if not isinstance(v83, str):
+                    raise ValidationError(
+                        f"{path}.requirements.required_evidence[{i82}] is not of type 'string'"
+                    )
+        if v79.keys() - _PROPS_84:
+            raise ValidationError(
+                f"{path}.requirements has unexpected properties {sorted(v79.keys() - _PROPS_84)}"
+            )
+    if data.keys() - _PROPS_85:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_85)}"
+        )
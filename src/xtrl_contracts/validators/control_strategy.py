@@ -0,0 +1,953 @@
+# generated by tools/contracts/gen.py; never hand-edit
+# source: control/ssot/schemas/control_strategy.schema.json
+from __future__ import annotations
+
+import re
+
+
+class ValidationError(ValueError):
+    """Raised by generated validators; the message starts with the data path."""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[k], two[k]) for k in one)
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def _unique(items):
+    for i, a in enumerate(items):
+        for b in items[i + 1 :]:
+            if _equal(a, b):
+                return False
+    return True
+
+
+_REQUIRED_1 = frozenset(
+    [
+        "artifact_kind",
+        "inputs",
+        "loop_spine",
+        "meta",
+        "modes",
+        "state_resolution",
+        "strategy_id",
+        "tick_emission",
+        "tool_policy",
+        "transition_policy",
+        "version",
+    ]
+)
+_CONST_3 = "control_strategy"
+_REQUIRED_6 = frozenset(["plant_spec_ref", "reason_codes_ref"])
+_REQUIRED_8 = frozenset(["path", "version"])
+_PROPS_13 = frozenset(["id", "path", "sha256", "version"])
+_PROPS_19 = frozenset(
+    [
+        "guardrails_bundle_ref",
+        "pattern_catalog_ref",
+        "plant_spec_ref",
+        "rank_policy_ref",
+        "reason_codes_ref",
+        "src_conventions_ref",
+    ]
+)
+_REQUIRED_23 = frozenset(["id", "level", "statement"])
+_ENUM_26 = frozenset(["MUST", "SHOULD"])
+_PROPS_28 = frozenset(["id", "level", "statement"])
+_ENUM_32 = frozenset(
+    ["CHECK", "EXEC", "GATE", "ITERATE", "PLAN", "PRECHECK", "PROMOTE"]
+)
+_REQUIRED_34 = frozenset(["guards", "policy_linkage", "requirements"])
+_REQUIRED_36 = frozenset(["eval", "spec"])
+_REQUIRED_40 = frozenset(["guard_id", "status"])
+_ENUM_42 = frozenset(["ALLOW", "DENY", "STOP"])
+_ENUM_52 = frozenset(["FAIL", "PASS", "SKIP"])
+_PROPS_53 = frozenset(
+    ["decision", "evidence_refs", "guard_id", "notes", "reason_codes", "status"]
+)
+_REQUIRED_57 = frozenset(
+    ["deny_decision", "deny_reason_code", "evidence_kinds", "guard_id"]
+)
+_ENUM_59 = frozenset(["DENY", "STOP"])
+_PATTERN_61 = re.compile("^[A-Z0-9_]+$")
+_ENUM_67 = frozenset(["advisory", "repairable", "stop", "structural"])
+_PROPS_69 = frozenset(
+    [
+        "deny_decision",
+        "deny_reason_code",
+        "evidence_kinds",
+        "guard_id",
+        "guard_kind",
+        "predicate_ref",
+    ]
+)
+_PROPS_70 = frozenset(["eval", "spec"])
+_REQUIRED_72 = frozenset(["reason_codes_ref"])
+_PROPS_80 = frozenset(
+    [
+        "control_strategy_ref",
+        "guardrails_bundle_ref",
+        "pattern_catalog_ref",
+        "plant_spec_ref",
+        "rank_policy_ref",
+        "reason_codes_ref",
+        "src_conventions_ref",
+    ]
+)
+_REQUIRED_82 = frozenset(["required_evidence"])
+_PROPS_86 = frozenset(["required_evidence"])
+_PROPS_87 = frozenset(["guards", "policy_linkage", "requirements"])
+_REQUIRED_89 = frozenset(["PROMOTE", "WORK"])
+_REQUIRED_91 = frozenset(["policy_profile", "promotion_policy", "test_policy"])
+_REQUIRED_94 = frozenset(["deny_legacy_roots", "require_clean_repo"])
+_PROPS_97 = frozenset(["deny_legacy_roots", "require_clean_repo"])
+_REQUIRED_99 = frozenset(["no_tests_collected_exit5"])
+_ENUM_101 = frozenset(["DENY", "SKIP"])
+_PROPS_102 = frozenset(["no_tests_collected_exit5"])
+_PROPS_103 = frozenset(["policy_profile", "promotion_policy", "test_policy"])
+_PROPS_105 = frozenset(["PROMOTE", "WORK"])
+_REQUIRED_107 = frozenset(
+    ["emit_field", "method", "required_signals", "tie_breaker", "unknown_handling"]
+)
+_CONST_109 = "state_resolution"
+_ENUM_111 = frozenset(["classifier", "evidence_map", "hybrid", "rules"])
+_ENUM_116 = frozenset(["highest_confidence", "manual", "prefer_latest"])
+_ENUM_118 = frozenset(["deny_transitions", "remain_unknown", "stop_run"])
+_PROPS_119 = frozenset(
+    ["emit_field", "method", "required_signals", "tie_breaker", "unknown_handling"]
+)
+_REQUIRED_122 = frozenset(["require_decision_trace", "required_artifacts"])
+_CONST_124 = True
+_PROPS_128 = frozenset(["require_decision_trace", "required_artifacts"])
+_REQUIRED_130 = frozenset(["allowed_action_kinds", "argv_only", "budgets", "sandbox"])
+_CONST_135 = True
+_REQUIRED_137 = frozenset(["max_iterations", "max_tool_calls_per_iter"])
+_PROPS_142 = frozenset(
+    [
+        "max_diff_lines_total",
+        "max_files_touched",
+        "max_iterations",
+        "max_tool_calls_per_iter",
+    ]
+)
+_REQUIRED_144 = frozenset(
+    ["allowed_commands_source", "allowed_paths_source", "forbidden_paths_source"]
+)
+_PROPS_148 = frozenset(
+    ["allowed_commands_source", "allowed_paths_source", "forbidden_paths_source"]
+)
+_PROPS_149 = frozenset(["allowed_action_kinds", "argv_only", "budgets", "sandbox"])
+_REQUIRED_151 = frozenset(
+    [
+        "guard_evaluation_order",
+        "on_ambiguous_state",
+        "on_missing_evidence",
+        "record_denials_field",
+    ]
+)
+_ENUM_155 = frozenset(["advisory", "repairable", "stop", "structural"])
+_ENUM_157 = frozenset(["DENY", "STOP"])
+_ENUM_159 = frozenset(["ALLOW", "DENY", "SKIP", "STOP"])
+_CONST_161 = "transition_evaluation"
+_PROPS_162 = frozenset(
+    [
+        "guard_evaluation_order",
+        "on_ambiguous_state",
+        "on_missing_evidence",
+        "record_denials_field",
+    ]
+)
+_PROPS_164 = frozenset(
+    [
+        "artifact_kind",
+        "description",
+        "inputs",
+        "invariants",
+        "loop_spine",
+        "meta",
+        "modes",
+        "state_resolution",
+        "strategy_id",
+        "tick_emission",
+        "tool_policy",
+        "transition_policy",
+        "version",
+    ]
+)
+
+
+def validate(data, path="$"):
+    """Raise ValidationError if data does not conform; return data."""
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_1 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_1 - data.keys())}"
+        )
+    if "artifact_kind" in data:
+        v2 = data["artifact_kind"]
+        if not (isinstance(v2, str) and v2 == _CONST_3):
+            raise ValidationError(
+                f"{path}.artifact_kind was expected to be {_CONST_3!r}"
+            )
+    if "description" in data:
+        v4 = data["description"]
+        if not isinstance(v4, str):
+            raise ValidationError(f"{path}.description is not of type 'string'")
+    if "inputs" in data:
+        v5 = data["inputs"]
+        if not isinstance(v5, dict):
+            raise ValidationError(f"{path}.inputs is not of type 'object'")
+        if not _REQUIRED_6 <= v5.keys():
+            raise ValidationError(
+                f"{path}.inputs is missing required {sorted(_REQUIRED_6 - v5.keys())}"
+            )
+        if "guardrails_bundle_ref" in v5:
+            v7 = v5["guardrails_bundle_ref"]
+            _ref_definitions_artifact_ref(v7, f"{path}.inputs.guardrails_bundle_ref")
+        if "pattern_catalog_ref" in v5:
+            v14 = v5["pattern_catalog_ref"]
+            _ref_definitions_artifact_ref(v14, f"{path}.inputs.pattern_catalog_ref")
+        if "plant_spec_ref" in v5:
+            v15 = v5["plant_spec_ref"]
+            _ref_definitions_artifact_ref(v15, f"{path}.inputs.plant_spec_ref")
+        if "rank_policy_ref" in v5:
+            v16 = v5["rank_policy_ref"]
+            _ref_definitions_artifact_ref(v16, f"{path}.inputs.rank_policy_ref")
+        if "reason_codes_ref" in v5:
+            v17 = v5["reason_codes_ref"]
+            _ref_definitions_artifact_ref(v17, f"{path}.inputs.reason_codes_ref")
+        if "src_conventions_ref" in v5:
+            v18 = v5["src_conventions_ref"]
+            _ref_definitions_artifact_ref(v18, f"{path}.inputs.src_conventions_ref")
+        if v5.keys() - _PROPS_19:
+            raise ValidationError(
+                f"{path}.inputs has unexpected properties {sorted(v5.keys() - _PROPS_19)}"
+            )
+    if "invariants" in data:
+        v20 = data["invariants"]
+        if not isinstance(v20, list):
+            raise ValidationError(f"{path}.invariants is not of type 'array'")
+        for i21, v22 in enumerate(v20):
+            _ref_definitions_invariant(v22, f"{path}.invariants[{i21}]")
+    if "loop_spine" in data:
+        v29 = data["loop_spine"]
+        if not isinstance(v29, list):
+            raise ValidationError(f"{path}.loop_spine is not of type 'array'")
+        if len(v29) < 6:
+            raise ValidationError(f"{path}.loop_spine has fewer than 6 items")
+        for i30, v31 in enumerate(v29):
+            if not isinstance(v31, str):
+                raise ValidationError(
+                    f"{path}.loop_spine[{i30}] is not of type 'string'"
+                )
+            if not (isinstance(v31, str) and v31 in _ENUM_32):
+                raise ValidationError(
+                    f"{path}.loop_spine[{i30}] is not one of {sorted(_ENUM_32)}"
+                )
+    if "meta" in data:
+        v33 = data["meta"]
+        _ref_definitions_meta(v33, f"{path}.meta")
+    if "modes" in data:
+        v88 = data["modes"]
+        if not isinstance(v88, dict):
+            raise ValidationError(f"{path}.modes is not of type 'object'")
+        if not _REQUIRED_89 <= v88.keys():
+            raise ValidationError(
+                f"{path}.modes is missing required {sorted(_REQUIRED_89 - v88.keys())}"
+            )
+        if "PROMOTE" in v88:
+            v90 = v88["PROMOTE"]
+            _ref_definitions_mode_profile(v90, f"{path}.modes.PROMOTE")
+        if "WORK" in v88:
+            v104 = v88["WORK"]
+            _ref_definitions_mode_profile(v104, f"{path}.modes.WORK")
+        if v88.keys() - _PROPS_105:
+            raise ValidationError(
+                f"{path}.modes has unexpected properties {sorted(v88.keys() - _PROPS_105)}"
+            )
+    if "state_resolution" in data:
+        v106 = data["state_resolution"]
+        if not isinstance(v106, dict):
+            raise ValidationError(f"{path}.state_resolution is not of type 'object'")
+        if not _REQUIRED_107 <= v106.keys():
+            raise ValidationError(
+                f"{path}.state_resolution is missing required {sorted(_REQUIRED_107 - v106.keys())}"
+            )
+        if "emit_field" in v106:
+            v108 = v106["emit_field"]
+            if not isinstance(v108, str):
+                raise ValidationError(
+                    f"{path}.state_resolution.emit_field is not of type 'string'"
+                )
+            if not (isinstance(v108, str) and v108 == _CONST_109):
+                raise ValidationError(
+                    f"{path}.state_resolution.emit_field was expected to be {_CONST_109!r}"
+                )
+        if "method" in v106:
+            v110 = v106["method"]
+            if not isinstance(v110, str):
+                raise ValidationError(
+                    f"{path}.state_resolution.method is not of type 'string'"
+                )
+            if not (isinstance(v110, str) and v110 in _ENUM_111):
+                raise ValidationError(
+                    f"{path}.state_resolution.method is not one of {sorted(_ENUM_111)}"
+                )
+        if "required_signals" in v106:
+            v112 = v106["required_signals"]
+            if not isinstance(v112, list):
+                raise ValidationError(
+                    f"{path}.state_resolution.required_signals is not of type 'array'"
+                )
+            if len(v112) < 1:
+                raise ValidationError(
+                    f"{path}.state_resolution.required_signals has fewer than 1 items"
+                )
+            for i113, v114 in enumerate(v112):
+                if not isinstance(v114, str):
+                    raise ValidationError(
+                        f"{path}.state_resolution.required_signals[{i113}] is not of type 'string'"
+                    )
+                if len(v114) < 1:
+                    raise ValidationError(
+                        f"{path}.state_resolution.required_signals[{i113}] is shorter than 1"
+                    )
+        if "tie_breaker" in v106:
+            v115 = v106["tie_breaker"]
+            if not isinstance(v115, str):
+                raise ValidationError(
+                    f"{path}.state_resolution.tie_breaker is not of type 'string'"
+                )
+            if not (isinstance(v115, str) and v115 in _ENUM_116):
+                raise ValidationError(
+                    f"{path}.state_resolution.tie_breaker is not one of {sorted(_ENUM_116)}"
+                )
+        if "unknown_handling" in v106:
+            v117 = v106["unknown_handling"]
+            if not isinstance(v117, str):
+                raise ValidationError(
+                    f"{path}.state_resolution.unknown_handling is not of type 'string'"
+                )
+            if not (isinstance(v117, str) and v117 in _ENUM_118):
+                raise ValidationError(
+                    f"{path}.state_resolution.unknown_handling is not one of {sorted(_ENUM_118)}"
+                )
+        if v106.keys() - _PROPS_119:
+            raise ValidationError(
+                f"{path}.state_resolution has unexpected properties {sorted(v106.keys() - _PROPS_119)}"
+            )
+    if "strategy_id" in data:
+        v120 = data["strategy_id"]
+        if not isinstance(v120, str):
+            raise ValidationError(f"{path}.strategy_id is not of type 'string'")
+        if len(v120) < 1:
+            raise ValidationError(f"{path}.strategy_id is shorter than 1")
+    if "tick_emission" in data:
+        v121 = data["tick_emission"]
+        if not isinstance(v121, dict):
+            raise ValidationError(f"{path}.tick_emission is not of type 'object'")
+        if not _REQUIRED_122 <= v121.keys():
+            raise ValidationError(
+                f"{path}.tick_emission is missing required {sorted(_REQUIRED_122 - v121.keys())}"
+            )
+        if "require_decision_trace" in v121:
+            v123 = v121["require_decision_trace"]
+            if not isinstance(v123, bool):
+                raise ValidationError(
+                    f"{path}.tick_emission.require_decision_trace is not of type 'boolean'"
+                )
+            if not _equal(v123, _CONST_124):
+                raise ValidationError(
+                    f"{path}.tick_emission.require_decision_trace was expected to be {_CONST_124!r}"
+                )
+        if "required_artifacts" in v121:
+            v125 = v121["required_artifacts"]
+            if not isinstance(v125, list):
+                raise ValidationError(
+                    f"{path}.tick_emission.required_artifacts is not of type 'array'"
+                )
+            if len(v125) < 1:
+                raise ValidationError(
+                    f"{path}.tick_emission.required_artifacts has fewer than 1 items"
+                )
+            for i126, v127 in enumerate(v125):
+                if not isinstance(v127, str):
+                    raise ValidationError(
+                        f"{path}.tick_emission.required_artifacts[{i126}] is not of type 'string'"
+                    )
+        if v121.keys() - _PROPS_128:
+            raise ValidationError(
+                f"{path}.tick_emission has unexpected properties {sorted(v121.keys() - _PROPS_128)}"
+            )
+    if "tool_policy" in data:
+        v129 = data["tool_policy"]
+        if not isinstance(v129, dict):
+            raise ValidationError(f"{path}.tool_policy is not of type 'object'")
+        if not _REQUIRED_130 <= v129.keys():
+            raise ValidationError(
+                f"{path}.tool_policy is missing required {sorted(_REQUIRED_130 - v129.keys())}"
+            )
+        if "allowed_action_kinds" in v129:
+            v131 = v129["allowed_action_kinds"]
+            if not isinstance(v131, list):
+                raise ValidationError(
+                    f"{path}.tool_policy.allowed_action_kinds is not of type 'array'"
+                )
+            if len(v131) < 1:
+                raise ValidationError(
+                    f"{path}.tool_policy.allowed_action_kinds has fewer than 1 items"
+                )
+            for i132, v133 in enumerate(v131):
+                if not isinstance(v133, str):
+                    raise ValidationError(
+                        f"{path}.tool_policy.allowed_action_kinds[{i132}] is not of type 'string'"
+                    )
+        if "argv_only" in v129:
+            v134 = v129["argv_only"]
+            if not isinstance(v134, bool):
+                raise ValidationError(
+                    f"{path}.tool_policy.argv_only is not of type 'boolean'"
+                )
+            if not _equal(v134, _CONST_135):
+                raise ValidationError(
+                    f"{path}.tool_policy.argv_only was expected to be {_CONST_135!r}"
+                )
+        if "budgets" in v129:
+            v136 = v129["budgets"]
+            if not isinstance(v136, dict):
+                raise ValidationError(
+                    f"{path}.tool_policy.budgets is not of type 'object'"
+                )
+            if not _REQUIRED_137 <= v136.keys():
+                raise ValidationError(
+                    f"{path}.tool_policy.budgets is missing required {sorted(_REQUIRED_137 - v136.keys())}"
+                )
+            if "max_diff_lines_total" in v136:
+                v138 = v136["max_diff_lines_total"]
+                if not _is_integer(v138):
+                    raise ValidationError(
+                        f"{path}.tool_policy.budgets.max_diff_lines_total is not of type 'integer'"
+                    )
+                if v138 < 0:
+                    raise ValidationError(
+                        f"{path}.tool_policy.budgets.max_diff_lines_total violates minimum 0"
+                    )
+            if "max_files_touched" in v136:
+                v139 = v136["max_files_touched"]
+                if not _is_integer(v139):
+                    raise ValidationError(
+                        f"{path}.tool_policy.budgets.max_files_touched is not of type 'integer'"
+                    )
+                if v139 < 0:
+                    raise ValidationError(
+                        f"{path}.tool_policy.budgets.max_files_touched violates minimum 0"
+                    )
+            if "max_iterations" in v136:
+                v140 = v136["max_iterations"]
+                if not _is_integer(v140):
+                    raise ValidationError(
+                        f"{path}.tool_policy.budgets.max_iterations is not of type 'integer'"
+                    )
+                if v140 < 1:
+                    raise ValidationError(
+                        f"{path}.tool_policy.budgets.max_iterations violates minimum 1"
+                    )
+            if "max_tool_calls_per_iter" in v136:
+                v141 = v136["max_tool_calls_per_iter"]
+                if not _is_integer(v141):
+                    raise ValidationError(
+                        f"{path}.tool_policy.budgets.max_tool_calls_per_iter is not of type 'integer'"
+                    )
+                if v141 < 0:
+                    raise ValidationError(
+                        f"{path}.tool_policy.budgets.max_tool_calls_per_iter violates minimum 0"
+                    )
+            if v136.keys() - _PROPS_142:
+                raise ValidationError(
+                    f"{path}.tool_policy.budgets has unexpected properties {sorted(v136.keys() - _PROPS_142)}"
+                )
+        if "sandbox" in v129:
+            v143 = v129["sandbox"]
+            if not isinstance(v143, dict):
+                raise ValidationError(
+                    f"{path}.tool_policy.sandbox is not of type 'object'"
+                )
+            if not _REQUIRED_144 <= v143.keys():
+                raise ValidationError(
+                    f"{path}.tool_policy.sandbox is missing required {sorted(_REQUIRED_144 - v143.keys())}"
+                )
+            if "allowed_commands_source" in v143:
+                v145 = v143["allowed_commands_source"]
+                if not isinstance(v145, str):
+                    raise ValidationError(
+                        f"{path}.tool_policy.sandbox.allowed_commands_source is not of type 'string'"
+                    )
+                if len(v145) < 1:
+                    raise ValidationError(
+                        f"{path}.tool_policy.sandbox.allowed_commands_source is shorter than 1"
+                    )
+            if "allowed_paths_source" in v143:
+                v146 = v143["allowed_paths_source"]
+                if not isinstance(v146, str):
+                    raise ValidationError(
+                        f"{path}.tool_policy.sandbox.allowed_paths_source is not of type 'string'"
+                    )
+                if len(v146) < 1:
+                    raise ValidationError(
+                        f"{path}.tool_policy.sandbox.allowed_paths_source is shorter than 1"
+                    )
+            if "forbidden_paths_source" in v143:
+                v147 = v143["forbidden_paths_source"]
+                if not isinstance(v147, str):
+                    raise ValidationError(
+                        f"{path}.tool_policy.sandbox.forbidden_paths_source is not of type 'string'"
+                    )
+                if len(v147) < 1:
+                    raise ValidationError(
+                        f"{path}.tool_policy.sandbox.forbidden_paths_source is shorter than 1"
+                    )
+            if v143.keys() - _PROPS_148:
+                raise ValidationError(
+                    f"{path}.tool_policy.sandbox has unexpected properties {sorted(v143.keys() - _PROPS_148)}"
+                )
+        if v129.keys() - _PROPS_149:
+            raise ValidationError(
+                f"{path}.tool_policy has unexpected properties {sorted(v129.keys() - _PROPS_149)}"
+            )
+    if "transition_policy" in data:
+        v150 = data["transition_policy"]
+        if not isinstance(v150, dict):
+            raise ValidationError(f"{path}.transition_policy is not of type 'object'")
+        if not _REQUIRED_151 <= v150.keys():
+            raise ValidationError(
+                f"{path}.transition_policy is missing required {sorted(_REQUIRED_151 - v150.keys())}"
+            )
+        if "guard_evaluation_order" in v150:
+            v152 = v150["guard_evaluation_order"]
+            if not isinstance(v152, list):
+                raise ValidationError(
+                    f"{path}.transition_policy.guard_evaluation_order is not of type 'array'"
+                )
+            if len(v152) < 1:
+                raise ValidationError(
+                    f"{path}.transition_policy.guard_evaluation_order has fewer than 1 items"
+                )
+            for i153, v154 in enumerate(v152):
+                if not isinstance(v154, str):
+                    raise ValidationError(
+                        f"{path}.transition_policy.guard_evaluation_order[{i153}] is not of type 'string'"
+                    )
+                if not (isinstance(v154, str) and v154 in _ENUM_155):
+                    raise ValidationError(
+                        f"{path}.transition_policy.guard_evaluation_order[{i153}] is not one of {sorted(_ENUM_155)}"
+                    )
+        if "on_ambiguous_state" in v150:
+            v156 = v150["on_ambiguous_state"]
+            if not isinstance(v156, str):
+                raise ValidationError(
+                    f"{path}.transition_policy.on_ambiguous_state is not of type 'string'"
+                )
+            if not (isinstance(v156, str) and v156 in _ENUM_157):
+                raise ValidationError(
+                    f"{path}.transition_policy.on_ambiguous_state is not one of {sorted(_ENUM_157)}"
+                )
+        if "on_missing_evidence" in v150:
+            v158 = v150["on_missing_evidence"]
+            if not isinstance(v158, str):
+                raise ValidationError(
+                    f"{path}.transition_policy.on_missing_evidence is not of type 'string'"
+                )
+            if not (isinstance(v158, str) and v158 in _ENUM_159):
+                raise ValidationError(
+                    f"{path}.transition_policy.on_missing_evidence is not one of {sorted(_ENUM_159)}"
+                )
+        if "record_denials_field" in v150:
+            v160 = v150["record_denials_field"]
+            if not isinstance(v160, str):
+                raise ValidationError(
+                    f"{path}.transition_policy.record_denials_field is not of type 'string'"
+                )
+            if not (isinstance(v160, str) and v160 == _CONST_161):
+                raise ValidationError(
+                    f"{path}.transition_policy.record_denials_field was expected to be {_CONST_161!r}"
+                )
+        if v150.keys() - _PROPS_162:
+            raise ValidationError(
+                f"{path}.transition_policy has unexpected properties {sorted(v150.keys() - _PROPS_162)}"
+            )
+    if "version" in data:
+        v163 = data["version"]
+        if not isinstance(v163, str):
+            raise ValidationError(f"{path}.version is not of type 'string'")
+        if len(v163) < 1:
+            raise ValidationError(f"{path}.version is shorter than 1")
+    if data.keys() - _PROPS_164:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_164)}"
+        )
+    return data
+
+
+def _ref_definitions_artifact_ref(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_8 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_8 - data.keys())}"
+        )
+    if "id" in data:
+        v9 = data["id"]
+        if not isinstance(v9, str):
+            raise ValidationError(f"{path}.id is not of type 'string'")
+        if len(v9) < 1:
+            raise ValidationError(f"{path}.id is shorter than 1")
+    if "path" in data:
+        v10 = data["path"]
+        if not isinstance(v10, str):
+            raise ValidationError(f"{path}.path is not of type 'string'")
+        if len(v10) < 1:
+            raise ValidationError(f"{path}.path is shorter than 1")
+    if "sha256" in data:
+        v11 = data["sha256"]
+        if not isinstance(v11, str):
+            raise ValidationError(f"{path}.sha256 is not of type 'string'")
+        if len(v11) < 1:
+            raise ValidationError(f"{path}.sha256 is shorter than 1")
+    if "version" in data:
+        v12 = data["version"]
+        if not isinstance(v12, str):
+            raise ValidationError(f"{path}.version is not of type 'string'")
+        if len(v12) < 1:
+            raise ValidationError(f"{path}.version is shorter than 1")
+    if data.keys() - _PROPS_13:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_13)}"
+        )
+
+
+def _ref_definitions_invariant(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_23 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_23 - data.keys())}"
+        )
+    if "id" in data:
+        v24 = data["id"]
+        if not isinstance(v24, str):
+            raise ValidationError(f"{path}.id is not of type 'string'")
+        if len(v24) < 1:
+            raise ValidationError(f"{path}.id is shorter than 1")
+    if "level" in data:
+        v25 = data["level"]
+        if not isinstance(v25, str):
+            raise ValidationError(f"{path}.level is not of type 'string'")
+        if not (isinstance(v25, str) and v25 in _ENUM_26):
+            raise ValidationError(f"{path}.level is not one of {sorted(_ENUM_26)}")
+    if "statement" in data:
+        v27 = data["statement"]
+        if not isinstance(v27, str):
+            raise ValidationError(f"{path}.statement is not of type 'string'")
+        if len(v27) < 1:
+            raise ValidationError(f"{path}.statement is shorter than 1")
+    if data.keys() - _PROPS_28:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_28)}"
+        )
+
+
+def _ref_definitions_guard_eval(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_40 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_40 - data.keys())}"
+        )
+    if "decision" in data:
+        v41 = data["decision"]
+        if not isinstance(v41, str):
+            raise ValidationError(f"{path}.decision is not of type 'string'")
+        if not (isinstance(v41, str) and v41 in _ENUM_42):
+            raise ValidationError(f"{path}.decision is not one of {sorted(_ENUM_42)}")
+    if "evidence_refs" in data:
+        v43 = data["evidence_refs"]
+        if not isinstance(v43, list):
+            raise ValidationError(f"{path}.evidence_refs is not of type 'array'")
+        for i44, v45 in enumerate(v43):
+            if not isinstance(v45, str):
+                raise ValidationError(
+                    f"{path}.evidence_refs[{i44}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v46 = data["guard_id"]
+        if not isinstance(v46, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v46) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "notes" in data:
+        v47 = data["notes"]
+        if not isinstance(v47, str):
+            raise ValidationError(f"{path}.notes is not of type 'string'")
+    if "reason_codes" in data:
+        v48 = data["reason_codes"]
+        if not isinstance(v48, list):
+            raise ValidationError(f"{path}.reason_codes is not of type 'array'")
+        for i49, v50 in enumerate(v48):
+            if not isinstance(v50, str):
+                raise ValidationError(
+                    f"{path}.reason_codes[{i49}] is not of type 'string'"
+                )
+    if "status" in data:
+        v51 = data["status"]
+        if not isinstance(v51, str):
+            raise ValidationError(f"{path}.status is not of type 'string'")
+        if not (isinstance(v51, str) and v51 in _ENUM_52):
+            raise ValidationError(f"{path}.status is not one of {sorted(_ENUM_52)}")
+    if data.keys() - _PROPS_53:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_53)}"
+        )
+
+
+def _ref_definitions_guard_spec(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_57 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_57 - data.keys())}"
+        )
+    if "deny_decision" in data:
+        v58 = data["deny_decision"]
+        if not isinstance(v58, str):
+            raise ValidationError(f"{path}.deny_decision is not of type 'string'")
+        if not (isinstance(v58, str) and v58 in _ENUM_59):
+            raise ValidationError(
+                f"{path}.deny_decision is not one of {sorted(_ENUM_59)}"
+            )
+    if "deny_reason_code" in data:
+        v60 = data["deny_reason_code"]
+        if not isinstance(v60, str):
+            raise ValidationError(f"{path}.deny_reason_code is not of type 'string'")
+        if not _PATTERN_61.search(v60):
+            raise ValidationError(
+                f"{path}.deny_reason_code does not match {_PATTERN_61.pattern!r}"
+            )
+    if "evidence_kinds" in data:
+        v62 = data["evidence_kinds"]
+        if not isinstance(v62, list):
+            raise ValidationError(f"{path}.evidence_kinds is not of type 'array'")
+        for i63, v64 in enumerate(v62):
+            if not isinstance(v64, str):
+                raise ValidationError(
+                    f"{path}.evidence_kinds[{i63}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v65 = data["guard_id"]
+        if not isinstance(v65, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v65) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "guard_kind" in data:
+        v66 = data["guard_kind"]
+        if not isinstance(v66, str):
+            raise ValidationError(f"{path}.guard_kind is not of type 'string'")
+        if not (isinstance(v66, str) and v66 in _ENUM_67):
+            raise ValidationError(f"{path}.guard_kind is not one of {sorted(_ENUM_67)}")
+    if "predicate_ref" in data:
+        v68 = data["predicate_ref"]
+        if not isinstance(v68, str):
+            raise ValidationError(f"{path}.predicate_ref is not of type 'string'")
+        if len(v68) < 1:
+            raise ValidationError(f"{path}.predicate_ref is shorter than 1")
+    if data.keys() - _PROPS_69:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_69)}"
+        )
+
+
+def _ref_definitions_meta(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_34 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_34 - data.keys())}"
+        )
+    if "guards" in data:
+        v35 = data["guards"]
+        if not isinstance(v35, dict):
+            raise ValidationError(f"{path}.guards is not of type 'object'")
+        if not _REQUIRED_36 <= v35.keys():
+            raise ValidationError(
+                f"{path}.guards is missing required {sorted(_REQUIRED_36 - v35.keys())}"
+            )
+        if "eval" in v35:
+            v37 = v35["eval"]
+            if not isinstance(v37, list):
+                raise ValidationError(f"{path}.guards.eval is not of type 'array'")
+            for i38, v39 in enumerate(v37):
+                _ref_definitions_guard_eval(v39, f"{path}.guards.eval[{i38}]")
+        if "spec" in v35:
+            v54 = v35["spec"]
+            if not isinstance(v54, list):
+                raise ValidationError(f"{path}.guards.spec is not of type 'array'")
+            for i55, v56 in enumerate(v54):
+                _ref_definitions_guard_spec(v56, f"{path}.guards.spec[{i55}]")
+        if v35.keys() - _PROPS_70:
+            raise ValidationError(
+                f"{path}.guards has unexpected properties {sorted(v35.keys() - _PROPS_70)}"
+            )
+    if "policy_linkage" in data:
+        v71 = data["policy_linkage"]
+        if not isinstance(v71, dict):
+            raise ValidationError(f"{path}.policy_linkage is not of type 'object'")
+        if not _REQUIRED_72 <= v71.keys():
+            raise ValidationError(
+                f"{path}.policy_linkage is missing required {sorted(_REQUIRED_72 - v71.keys())}"
+            )
+        if "control_strategy_ref" in v71:
+            v73 = v71["control_strategy_ref"]
+            _ref_definitions_artifact_ref(
+                v73, f"{path}.policy_linkage.control_strategy_ref"
+            )
+        if "guardrails_bundle_ref" in v71:
+            v74 = v71["guardrails_bundle_ref"]
+            _ref_definitions_artifact_ref(
+                v74, f"{path}.policy_linkage.guardrails_bundle_ref"
+            )
+        if "pattern_catalog_ref" in v71:
+            v75 = v71["pattern_catalog_ref"]
+            _ref_definitions_artifact_ref(
+                v75, f"{path}.policy_linkage.pattern_catalog_ref"
+            )
+        if "plant_spec_ref" in v71:
+            v76 = v71["plant_spec_ref"]
+            _ref_definitions_artifact_ref(v76, f"{path}.policy_linkage.plant_spec_ref")
+        if "rank_policy_ref" in v71:
+            v77 = v71["rank_policy_ref"]
+            _ref_definitions_artifact_ref(v77, f"{path}.policy_linkage.rank_policy_ref")
+        if "reason_codes_ref" in v71:
+            v78 = v71["reason_codes_ref"]
+            _ref_definitions_artifact_ref(
+                v78, f"{path}.policy_linkage.reason_codes_ref"
+            )
+        if "src_conventions_ref" in v71:
+            v79 = v71["src_conventions_ref"]
+            _ref_definitions_artifact_ref(
+                v79, f"{path}.policy_linkage.src_conventions_ref"
+            )
+        if v71.keys() - _PROPS_80:
+            raise ValidationError(
+                f"{path}.policy_linkage has unexpected properties {sorted(v71.keys() - _PROPS_80)}"
+            )
+    if "requirements" in data:
+        v81 = data["requirements"]
+        if not isinstance(v81, dict):
+            raise ValidationError(f"{path}.requirements is not of type 'object'")
+        if not _REQUIRED_82 <= v81.keys():
+            raise ValidationError(
+                f"{path}.requirements is missing required {sorted(_REQUIRED_82 - v81.keys())}"
+            )
+        if "required_evidence" in v81:
+            v83 = v81["required_evidence"]
+            if not isinstance(v83, list):
+                raise ValidationError(
+                    f"{path}.requirements.required_evidence is not of type 'array'"
+                )
+            for i84, v85 in enumerate(v83):
+                if not isinstance(v85, str):
+                    raise ValidationError(
+                        f"{path}.requirements.required_evidence[{i84}] is not of type 'string'"
+                    )
+        if v81.keys() - _PROPS_86:
+            raise ValidationError(
+                f"{path}.requirements has unexpected properties {sorted(v81.keys() - _PROPS_86)}"
+            )
+    if data.keys() - _PROPS_87:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_87)}"
+        )
+
+
+def _ref_definitions_mode_profile(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_91 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_91 - data.keys())}"
+        )
+    if "policy_profile" in data:
+        v92 = data["policy_profile"]
+        if not isinstance(v92, str):
+            raise ValidationError(f"{path}.policy_profile is not of type 'string'")
+        if len(v92) < 1:
+            raise ValidationError(f"{path}.policy_profile is shorter than 1")
+    if "promotion_policy" in data:
+        v93 = data["promotion_policy"]
+        if not isinstance(v93, dict):
+            raise ValidationError(f"{path}.promotion_policy is not of type 'object'")
+        if not _REQUIRED_94 <= v93.keys():
+            raise ValidationError(
+                f"{path}.promotion_policy is missing required {sorted(_REQUIRED_94 - v93.keys())}"
+            )
+        if "deny_legacy_roots" in v93:
+            v95 = v93["deny_legacy_roots"]
+            if not isinstance(v95, bool):
+                raise ValidationError(
+                    f"{path}.promotion_policy.deny_legacy_roots is not of type 'boolean'"
+                )
+        if "require_clean_repo" in v93:
+            v96 = v93["require_clean_repo"]
+            if not isinstance(v96, bool):
+                raise ValidationError(
+                    f"{path}.promotion_policy.require_clean_repo is not of type 'boolean'"
+                )
+        if v93.keys() - _PROPS_97:
+            raise ValidationError(
+                f"{path}.promotion_policy has unexpected properties {sorted(v93.keys() - _PROPS_97)}"
+            )
+    if "test_policy" in data:
+        v98 = data["test_policy"]
+        if not isinstance(v98, dict):
+            raise ValidationError(f"{path}.test_policy is not of type 'object'")
+        if not _REQUIRED_99 <= v98.keys():
+            raise ValidationError(
+                f"{path}.test_policy is missing required {sorted(_REQUIRED_99 - v98.keys())}"
+            )
+        if "no_tests_collected_exit5" in v98:
+            v100 = v98["no_tests_collected_exit5"]
+            if not isinstance(v100, str):
+                raise ValidationError(
+                    f"{path}.test_policy.no_tests_collected_exit5 is not of type 'string'"
+                )
+            if not (isinstance(v100, str) and v100 in _ENUM_101):
+                raise ValidationError(
+                    f"{path}.test_policy.no_tests_collected_exit5 is not one of {sorted(_ENUM_101)}"
+                )
+        if v98.keys() - _PROPS_102:
+            raise ValidationError(
+                f"{path}.test_policy has unexpected properties {sorted(v98.keys() - _PROPS_102)}"
+            )
+    if data.keys() - _PROPS_103:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_103)}"
+        )
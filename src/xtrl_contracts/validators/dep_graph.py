@@ -0,0 +1,131 @@
+# generated by tools/contracts/gen.py; never hand-edit
+# source: control/ssot/schemas/dep_graph.schema.json
+from __future__ import annotations
+
+
+class ValidationError(ValueError):
+    """Raised by generated validators; the message starts with the data path."""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[k], two[k]) for k in one)
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def _unique(items):
+    for i, a in enumerate(items):
+        for b in items[i + 1 :]:
+            if _equal(a, b):
+                return False
+    return True
+
+
+_REQUIRED_1 = frozenset(["artifact_kind", "modules", "ordering", "schema_version"])
+_CONST_3 = "dep_graph"
+_REQUIRED_7 = frozenset(["imports", "module", "path"])
+_PROPS_13 = frozenset(["imports", "module", "path"])
+_CONST_15 = "stable_lexicographic"
+_CONST_17 = "0.1"
+_PROPS_18 = frozenset(["artifact_kind", "modules", "ordering", "schema_version"])
+
+
+def validate(data, path="$"):
+    """Raise ValidationError if data does not conform; return data."""
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_1 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_1 - data.keys())}"
+        )
+    if "artifact_kind" in data:
+        v2 = data["artifact_kind"]
+        if not isinstance(v2, str):
+            raise ValidationError(f"{path}.artifact_kind is not of type 'string'")
+        if not (isinstance(v2, str) and v2 == _CONST_3):
+            raise ValidationError(
+                f"{path}.artifact_kind was expected to be {_CONST_3!r}"
+            )
+    if "modules" in data:
+        v4 = data["modules"]
+        if not isinstance(v4, list):
+            raise ValidationError(f"{path}.modules is not of type 'array'")
+        for i5, v6 in enumerate(v4):
+            if not isinstance(v6, dict):
+                raise ValidationError(f"{path}.modules[{i5}] is not of type 'object'")
+            if not _REQUIRED_7 <= v6.keys():
+                raise ValidationError(
+                    f"{path}.modules[{i5}] is missing required {sorted(_REQUIRED_7 - v6.keys())}"
+                )
+            if "imports" in v6:
+                v8 = v6["imports"]
+                if not isinstance(v8, list):
+                    raise ValidationError(
+                        f"{path}.modules[{i5}].imports is not of type 'array'"
+                    )
+                for i9, v10 in enumerate(v8):
+                    if not isinstance(v10, str):
+                        raise ValidationError(
+                            f"{path}.modules[{i5}].imports[{i9}] is not of type 'string'"
+                        )
+            if "module" in v6:
+                v11 = v6["module"]
+                if not isinstance(v11, str):
+                    raise ValidationError(
+                        f"{path}.modules[{i5}].module is not of type 'string'"
+                    )
+                if len(v11) < 1:
+                    raise ValidationError(
+                        f"{path}.modules[{i5}].module is shorter than 1"
+                    )
+            if "path" in v6:
+                v12 = v6["path"]
+                if not isinstance(v12, str):
+                    raise ValidationError(
+                        f"{path}.modules[{i5}].path is not of type 'string'"
+                    )
+                if len(v12) < 1:
+                    raise ValidationError(
+                        f"{path}.modules[{i5}].path is shorter than 1"
+                    )
+            if v6.keys() - _PROPS_13:
+                raise ValidationError(
+                    f"{path}.modules[{i5}] has unexpected properties {sorted(v6.keys() - _PROPS_13)}"
+                )
+    if "ordering" in data:
+        v14 = data["ordering"]
+        if not isinstance(v14, str):
+            raise ValidationError(f"{path}.ordering is not of type 'string'")
+        if not (isinstance(v14, str) and v14 == _CONST_15):
+            raise ValidationError(f"{path}.ordering was expected to be {_CONST_15!r}")
+    if "schema_version" in data:
+        v16 = data["schema_version"]
+        if not isinstance(v16, str):
+            raise ValidationError(f"{path}.schema_version is not of type 'string'")
+        if not (isinstance(v16, str) and v16 == _CONST_17):
+            raise ValidationError(
+                f"{path}.schema_version was expected to be {_CONST_17!r}"
+            )
+    if data.keys() - _PROPS_18:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_18)}"
+        )
+    return data
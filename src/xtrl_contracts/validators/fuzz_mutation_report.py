@@ -0,0 +1,418 @@
+# generated by tools/contracts/gen.py; never hand-edit
+# source: control/ssot/schemas/fuzz_mutation_report.schema.json
+from __future__ import annotations
+
+import re
+
+
+class ValidationError(ValueError):
+    """Raised by generated validators; the message starts with the data path."""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[k], two[k]) for k in one)
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def _unique(items):
+    for i, a in enumerate(items):
+        for b in items[i + 1 :]:
+            if _equal(a, b):
+                return False
+    return True
+
+
+_REQUIRED_1 = frozenset(
+    ["generated_at_utc", "meta", "mutations", "schema_version", "seed"]
+)
+_REQUIRED_4 = frozenset(["guards", "policy_linkage", "requirements"])
+_REQUIRED_6 = frozenset(["eval", "spec"])
+_REQUIRED_10 = frozenset(["guard_id", "status"])
+_ENUM_12 = frozenset(["ALLOW", "DENY", "STOP"])
+_ENUM_22 = frozenset(["FAIL", "PASS", "SKIP"])
+_PROPS_23 = frozenset(
+    ["decision", "evidence_refs", "guard_id", "notes", "reason_codes", "status"]
+)
+_REQUIRED_27 = frozenset(
+    ["deny_decision", "deny_reason_code", "evidence_kinds", "guard_id"]
+)
+_ENUM_29 = frozenset(["DENY", "STOP"])
+_PATTERN_31 = re.compile("^[A-Z0-9_]+$")
+_ENUM_37 = frozenset(["advisory", "repairable", "stop", "structural"])
+_PROPS_39 = frozenset(
+    [
+        "deny_decision",
+        "deny_reason_code",
+        "evidence_kinds",
+        "guard_id",
+        "guard_kind",
+        "predicate_ref",
+    ]
+)
+_PROPS_40 = frozenset(["eval", "spec"])
+_REQUIRED_42 = frozenset(["reason_codes_ref"])
+_REQUIRED_44 = frozenset(["path", "version"])
+_PROPS_49 = frozenset(["id", "path", "sha256", "version"])
+_PROPS_56 = frozenset(
+    [
+        "control_strategy_ref",
+        "guardrails_bundle_ref",
+        "pattern_catalog_ref",
+        "plant_spec_ref",
+        "rank_policy_ref",
+        "reason_codes_ref",
+        "src_conventions_ref",
+    ]
+)
+_REQUIRED_58 = frozenset(["required_evidence"])
+_PROPS_62 = frozenset(["required_evidence"])
+_PROPS_63 = frozenset(["guards", "policy_linkage", "requirements"])
+_REQUIRED_67 = frozenset(["case_id", "mutation_id", "reason_codes", "result"])
+_PROPS_74 = frozenset(["case_id", "mutation_id", "reason_codes", "result"])
+_PROPS_77 = frozenset(
+    ["generated_at_utc", "meta", "mutations", "schema_version", "seed"]
+)
+
+
+def validate(data, path="$"):
+    """Raise ValidationError if data does not conform; return data."""
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_1 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_1 - data.keys())}"
+        )
+    if "generated_at_utc" in data:
+        v2 = data["generated_at_utc"]
+        if not isinstance(v2, str):
+            raise ValidationError(f"{path}.generated_at_utc is not of type 'string'")
+    if "meta" in data:
+        v3 = data["meta"]
+        _ref_definitions_meta(v3, f"{path}.meta")
+    if "mutations" in data:
+        v64 = data["mutations"]
+        if not isinstance(v64, list):
+            raise ValidationError(f"{path}.mutations is not of type 'array'")
+        for i65, v66 in enumerate(v64):
+            if not isinstance(v66, dict):
+                raise ValidationError(
+                    f"{path}.mutations[{i65}] is not of type 'object'"
+                )
+            if not _REQUIRED_67 <= v66.keys():
+                raise ValidationError(
+                    f"{path}.mutations[{i65}] is missing required {sorted(_REQUIRED_67 - v66.keys())}"
+                )
+            if "case_id" in v66:
+                v68 = v66["case_id"]
+                if not isinstance(v68, str):
+                    raise ValidationError(
+                        f"{path}.mutations[{i65}].case_id is not of type 'string'"
+                    )
+            if "mutation_id" in v66:
+                v69 = v66["mutation_id"]
+                if not isinstance(v69, str):
+                    raise ValidationError(
+                        f"{path}.mutations[{i65}].mutation_id is not of type 'string'"
+                    )
+            if "reason_codes" in v66:
+                v70 = v66["reason_codes"]
+                if not isinstance(v70, list):
+                    raise ValidationError(
+                        f"{path}.mutations[{i65}].reason_codes is not of type 'array'"
+                    )
+                for i71, v72 in enumerate(v70):
+                    if not isinstance(v72, str):
+                        raise ValidationError(
+                            f"{path}.mutations[{i65}].reason_codes[{i71}] is not of type 'string'"
+                        )
+            if "result" in v66:
+                v73 = v66["result"]
+                if not isinstance(v73, str):
+                    raise ValidationError(
+                        f"{path}.mutations[{i65}].result is not of type 'string'"
+                    )
+            if v66.keys() - _PROPS_74:
+                raise ValidationError(
+                    f"{path}.mutations[{i65}] has unexpected properties {sorted(v66.keys() - _PROPS_74)}"
+                )
+    if "schema_version" in data:
+        v75 = data["schema_version"]
+        if not isinstance(v75, str):
+            raise ValidationError(f"{path}.schema_version is not of type 'string'")
+    if "seed" in data:
+        v76 = data["seed"]
+        if not isinstance(v76, str):
+            raise ValidationError(f"{path}.seed is not of type 'string'")
+    if data.keys() - _PROPS_77:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_77)}"
+        )
+    return data
+
+
+def _ref_definitions_guard_eval(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_10 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_10 - data.keys())}"
+        )
+    if "decision" in data:
+        v11 = data["decision"]
+        if not isinstance(v11, str):
+            raise ValidationError(f"{path}.decision is not of type 'string'")
+        if not (isinstance(v11, str) and v11 in _ENUM_12):
+            raise ValidationError(f"{path}.decision is not one of {sorted(_ENUM_12)}")
+    if "evidence_refs" in data:
+        v13 = data["evidence_refs"]
+        if not isinstance(v13, list):
+            raise ValidationError(f"{path}.evidence_refs is not of type 'array'")
+        for i14, v15 in enumerate(v13):
+            if not isinstance(v15, str):
+                raise ValidationError(
+                    f"{path}.evidence_refs[{i14}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v16 = data["guard_id"]
+        if not isinstance(v16, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v16) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "notes" in data:
+        v17 = data["notes"]
+        if not isinstance(v17, str):
+            raise ValidationError(f"{path}.notes is not of type 'string'")
+    if "reason_codes" in data:
+        v18 = data["reason_codes"]
+        if not isinstance(v18, list):
+            raise ValidationError(f"{path}.reason_codes is not of type 'array'")
+        for i19, v20 in enumerate(v18):
+            if not isinstance(v20, str):
+                raise ValidationError(
+                    f"{path}.reason_codes[{i19}] is not of type 'string'"
+                )
+    if "status" in data:
+        v21 = data["status"]
+        if not isinstance(v21, str):
+            raise ValidationError(f"{path}.status is not of type 'string'")
+        if not (isinstance(v21, str) and v21 in _ENUM_22):
+            raise ValidationError(f"{path}.status is not one of {sorted(_ENUM_22)}")
+    if data.keys() - _PROPS_23:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_23)}"
+        )
+
+
+def _ref_definitions_guard_spec(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_27 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_27 - data.keys())}"
+        )
+    if "deny_decision" in data:
+        v28 = data["deny_decision"]
+        if not isinstance(v28, str):
+            raise ValidationError(f"{path}.deny_decision is not of type 'string'")
+        if not (isinstance(v28, str) and v28 in _ENUM_29):
+            raise ValidationError(
+                f"{path}.deny_decision is not one of {sorted(_ENUM_29)}"
+            )
+    if "deny_reason_code" in data:
+        v30 = data["deny_reason_code"]
+        if not isinstance(v30, str):
+            raise ValidationError(f"{path}.deny_reason_code is not of type 'string'")
+        if not _PATTERN_31.search(v30):
+            raise ValidationError(
+                f"{path}.deny_reason_code does not match {_PATTERN_31.pattern!r}"
+            )
+    if "evidence_kinds" in data:
+        v32 = data["evidence_kinds"]
+        if not isinstance(v32, list):
+            raise ValidationError(f"{path}.evidence_kinds is not of type 'array'")
+        for i33, v34 in enumerate(v32):
+            if not isinstance(v34, str):
+                raise ValidationError(
+                    f"{path}.evidence_kinds[{i33}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v35 = data["guard_id"]
+        if not isinstance(v35, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v35) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "guard_kind" in data:
+        v36 = data["guard_kind"]
+        if not isinstance(v36, str):
+            raise ValidationError(f"{path}.guard_kind is not of type 'string'")
+        if not (isinstance(v36, str) and v36 in _ENUM_37):
+            raise ValidationError(f"{path}.guard_kind is not one of {sorted(_ENUM_37)}")
+    if "predicate_ref" in data:
+        v38 = data["predicate_ref"]
+        if not isinstance(v38, str):
+            raise ValidationError(f"{path}.predicate_ref is not of type 'string'")
+        if len(v38) < 1:
+            raise ValidationError(f"{path}.predicate_ref is shorter than 1")
+    if data.keys() - _PROPS_39:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_39)}"
+        )
+
+
+def _ref_definitions_artifact_ref(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_44 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_44 - data.keys())}"
+        )
+    if "id" in data:
+        v45 = data["id"]
+        if not isinstance(v45, str):
+            raise ValidationError(f"{path}.id is not of type 'string'")
+        if len(v45) < 1:
+            raise ValidationError(f"{path}.id is shorter than 1")
+    if "path" in data:
+        v46 = data["path"]
+        if not isinstance(v46, str):
+            raise ValidationError(f"{path}.path is not of type 'string'")
+        if len(v46) < 1:
+            raise ValidationError(f"{path}.path is shorter than 1")
+    if "sha256" in data:
+        v47 = data["sha256"]
+        if not isinstance(v47, str):
+            raise ValidationError(f"{path}.sha256 is not of type 'string'")
+        if len(v47) < 1:
+            raise ValidationError(f"{path}.sha256 is shorter than 1")
+    if "version" in data:
+        v48 = data["version"]
+        if not isinstance(v48, str):
+            raise ValidationError(f"{path}.version is not of type 'string'")
+        if len(v48) < 1:
+            raise ValidationError(f"{path}.version is shorter than 1")
+    if data.keys() - _PROPS_49:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_49)}"
+        )
+
+
+def _ref_definitions_meta(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_4 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_4 - data.keys())}"
+        )
+    if "guards" in data:
+        v5 = data["guards"]
+        if not isinstance(v5, dict):
+            raise ValidationError(f"{path}.guards is not of type 'object'")
+        if not _REQUIRED_6 <= v5.keys():
+            raise ValidationError(
+                f"{path}.guards is missing required {sorted(_REQUIRED_6 - v5.keys())}"
+            )
+        if "eval" in v5:
+            v7 = v5["eval"]
+            if not isinstance(v7, list):
+                raise ValidationError(f"{path}.guards.eval is not of type 'array'")
+            for i8, v9 in enumerate(v7):
+                _ref_definitions_guard_eval(v9, f"{path}.guards.eval[{i8}]")
+        if "spec" in v5:
+            v24 = v5["spec"]
+            if not isinstance(v24, list):
+                raise ValidationError(f"{path}.guards.spec is not of type 'array'")
+            for i25, v26 in enumerate(v24):
+                _ref_definitions_guard_spec(v26, f"{path}.guards.spec[{i25}]")
+        if v5.keys() - _PROPS_40:
+            raise ValidationError(
+                f"{path}.guards has unexpected properties {sorted(v5.keys() - _PROPS_40)}"
+            )
+    if "policy_linkage" in data:
+        v41 = data["policy_linkage"]
+        if not isinstance(v41, dict):
+            raise ValidationError(f"{path}.policy_linkage is not of type 'object'")
+        if not _REQUIRED_42 <= v41.keys():
+            raise ValidationError(
+                f"{path}.policy_linkage is missing required {sorted(_REQUIRED_42 - v41.keys())}"
+            )
+        if "control_strategy_ref" in v41:
+            v43 = v41["control_strategy_ref"]
+            _ref_definitions_artifact_ref(
+                v43, f"{path}.policy_linkage.control_strategy_ref"
+            )
+        if "guardrails_bundle_ref" in v41:
+            v50 = v41["guardrails_bundle_ref"]
+            _ref_definitions_artifact_ref(
+                v50, f"{path}.policy_linkage.guardrails_bundle_ref"
+            )
+        if "pattern_catalog_ref" in v41:
+            v51 = v41["pattern_catalog_ref"]
+            _ref_definitions_artifact_ref(
+                v51, f"{path}.policy_linkage.pattern_catalog_ref"
+            )
+        if "plant_spec_ref" in v41:
+            v52 = v41["plant_spec_ref"]
+            _ref_definitions_artifact_ref(v52, f"{path}.policy_linkage.plant_spec_ref")
+        if "rank_policy_ref" in v41:
+            v53 = v41["rank_policy_ref"]
+            _ref_definitions_artifact_ref(v53, f"{path}.policy_linkage.rank_policy_ref")
+        if "reason_codes_ref" in v41:
+            v54 = v41["reason_codes_ref"]
+            _ref_definitions_artifact_ref(
+                v54, f"{path}.policy_linkage.reason_codes_ref"
+            )
+        if "src_conventions_ref" in v41:
+            v55 = v41["src_conventions_ref"]
+            _ref_definitions_artifact_ref(
+                v55, f"{path}.policy_linkage.src_conventions_ref"
+            )
+        if v41.keys() - _PROPS_56:
+            raise ValidationError(
+                f"{path}.policy_linkage has unexpected properties {sorted(v41.keys() - _PROPS_56)}"
+            )
+    if "requirements" in data:
+        v57 = data["requirements"]
+        if not isinstance(v57, dict):
+            raise ValidationError(f"{path}.requirements is not of type 'object'")
+        if not _REQUIRED_58 <= v57.keys():
+            raise ValidationError(
+                f"{path}.requirements is missing required {sorted(_REQUIRED_58 - v57.keys())}"
+            )
+        if "required_evidence" in v57:
+            v59 = v57["required_evidence"]
+            if not isinstance(v59, list):
+                raise ValidationError(
+                    f"{path}.requirements.required_evidence is not of type 'array'"
+                )
+            for i60, v61 in enumerate(v59):
+                if not isinstance(v61, str):
+                    raise ValidationError(
+                        f"{path}.requirements.required_evidence[{i60}] is not of type 'string'"
+                    )
+        if v57.keys() - _PROPS_62:
+            raise ValidationError(
+                f"{path}.requirements has unexpected properties {sorted(v57.keys() - _PROPS_62)}"
+            )
+    if data.keys() - _PROPS_63:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_63)}"
+        )
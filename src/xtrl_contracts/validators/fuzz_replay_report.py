@@ -0,0 +1,412 @@
+# generated by tools/contracts/gen.py; never hand-edit
+# source: control/ssot/schemas/fuzz_replay_report.schema.json
+from __future__ import annotations
+
+import re
+
+
+class ValidationError(ValueError):
+    """Raised by generated validators; the message starts with the data path."""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[k], two[k]) for k in one)
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def _unique(items):
+    for i, a in enumerate(items):
+        for b in items[i + 1 :]:
+            if _equal(a, b):
+                return False
+    return True
+
+
+_REQUIRED_1 = frozenset(["cases", "generated_at_utc", "meta", "schema_version", "seed"])
+_REQUIRED_5 = frozenset(["case_id", "out_dir", "reason_codes", "result"])
+_PROPS_12 = frozenset(["case_id", "out_dir", "reason_codes", "result"])
+_REQUIRED_15 = frozenset(["guards", "policy_linkage", "requirements"])
+_REQUIRED_17 = frozenset(["eval", "spec"])
+_REQUIRED_21 = frozenset(["guard_id", "status"])
+_ENUM_23 = frozenset(["ALLOW", "DENY", "STOP"])
+_ENUM_33 = frozenset(["FAIL", "PASS", "SKIP"])
+_PROPS_34 = frozenset(
+    ["decision", "evidence_refs", "guard_id", "notes", "reason_codes", "status"]
+)
+_REQUIRED_38 = frozenset(
+    ["deny_decision", "deny_reason_code", "evidence_kinds", "guard_id"]
+)
+_ENUM_40 = frozenset(["DENY", "STOP"])
+_PATTERN_42 = re.compile("^[A-Z0-9_]+$")
+_ENUM_48 = frozenset(["advisory", "repairable", "stop", "structural"])
+_PROPS_50 = frozenset(
+    [
+        "deny_decision",
+        "deny_reason_code",
+        "evidence_kinds",
+        "guard_id",
+        "guard_kind",
+        "predicate_ref",
+    ]
+)
+_PROPS_51 = frozenset(["eval", "spec"])
+_REQUIRED_53 = frozenset(["reason_codes_ref"])
+_REQUIRED_55 = frozenset(["path", "version"])
+_PROPS_60 = frozenset(["id", "path", "sha256", "version"])
+_PROPS_67 = frozenset(
+    [
+        "control_strategy_ref",
+        "guardrails_bundle_ref",
+        "pattern_catalog_ref",
+        "plant_spec_ref",
+        "rank_policy_ref",
+        "reason_codes_ref",
+        "src_conventions_ref",
+    ]
+)
+_REQUIRED_69 = frozenset(["required_evidence"])
+_PROPS_73 = frozenset(["required_evidence"])
+_PROPS_74 = frozenset(["guards", "policy_linkage", "requirements"])
+_PROPS_77 = frozenset(["cases", "generated_at_utc", "meta", "schema_version", "seed"])
+
+
+def validate(data, path="$"):
+    """Raise ValidationError if data does not conform; return data."""
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_1 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_1 - data.keys())}"
+        )
+    if "cases" in data:
+        v2 = data["cases"]
+        if not isinstance(v2, list):
+            raise ValidationError(f"{path}.cases is not of type 'array'")
+        for i3, v4 in enumerate(v2):
+            if not isinstance(v4, dict):
+                raise ValidationError(f"{path}.cases[{i3}] is not of type 'object'")
+            if not _REQUIRED_5 <= v4.keys():
+                raise ValidationError(
+                    f"{path}.cases[{i3}] is missing required {sorted(_REQUIRED_5 - v4.keys())}"
+                )
+            if "case_id" in v4:
+                v6 = v4["case_id"]
+                if not isinstance(v6, str):
+                    raise ValidationError(
+                        f"{path}.cases[{i3}].case_id is not of type 'string'"
+                    )
+            if "out_dir" in v4:
+                v7 = v4["out_dir"]
+                if not isinstance(v7, str):
+                    raise ValidationError(
+                        f"{path}.cases[{i3}].out_dir is not of type 'string'"
+                    )
+            if "reason_codes" in v4:
+                v8 = v4["reason_codes"]
+                if not isinstance(v8, list):
+                    raise ValidationError(
+                        f"{path}.cases[{i3}].reason_codes is not of type 'array'"
+                    )
+                for i9, v10 in enumerate(v8):
+                    if not isinstance(v10, str):
+                        raise ValidationError(
+                            f"{path}.cases[{i3}].reason_codes[{i9}] is not of type 'string'"
+                        )
+            if "result" in v4:
+                v11 = v4["result"]
+                if not isinstance(v11, str):
+                    raise ValidationError(
+                        f"{path}.cases[{i3}].result is not of type 'string'"
+                    )
+            if v4.keys() - _PROPS_12:
+                raise ValidationError(
+                    f"{path}.cases[{i3}] has unexpected properties {sorted(v4.keys() - _PROPS_12)}"
+                )
+    if "generated_at_utc" in data:
+        v13 = data["generated_at_utc"]
+        if not isinstance(v13, str):
+            raise ValidationError(f"{path}.generated_at_utc is not of type 'string'")
+    if "meta" in data:
+        v14 = data["meta"]
+        _ref_definitions_meta(v14, f"{path}.meta")
+    if "schema_version" in data:
+        v75 = data["schema_version"]
+        if not isinstance(v75, str):
+            raise ValidationError(f"{path}.schema_version is not of type 'string'")
+    if "seed" in data:
+        v76 = data["seed"]
+        if not isinstance(v76, str):
+            raise ValidationError(f"{path}.seed is not of type 'string'")
+    if data.keys() - _PROPS_77:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_77)}"
+        )
+    return data
+
+
+def _ref_definitions_guard_eval(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_21 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_21 - data.keys())}"
+        )
+    if "decision" in data:
+        v22 = data["decision"]
+        if not isinstance(v22, str):
+            raise ValidationError(f"{path}.decision is not of type 'string'")
+        if not (isinstance(v22, str) and v22 in _ENUM_23):
+            raise ValidationError(f"{path}.decision is not one of {sorted(_ENUM_23)}")
+    if "evidence_refs" in data:
+        v24 = data["evidence_refs"]
+        if not isinstance(v24, list):
+            raise ValidationError(f"{path}.evidence_refs is not of type 'array'")
+        for i25, v26 in enumerate(v24):
+            if not isinstance(v26, str):
+                raise ValidationError(
+                    f"{path}.evidence_refs[{i25}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v27 = data["guard_id"]
+        if not isinstance(v27, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v27) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "notes" in data:
+        v28 = data["notes"]
+        if not isinstance(v28, str):
+            raise ValidationError(f"{path}.notes is not of type 'string'")
+    if "reason_codes" in data:
+        v29 = data["reason_codes"]
+        if not isinstance(v29, list):
+            raise ValidationError(f"{path}.reason_codes is not of type 'array'")
+        for i30, v31 in enumerate(v29):
+            if not isinstance(v31, str):
+                raise ValidationError(
+                    f"{path}.reason_codes[{i30}] is not of type 'string'"
+                )
+    if "status" in data:
+        v32 = data["status"]
+        if not isinstance(v32, str):
+            raise ValidationError(f"{path}.status is not of type 'string'")
+        if not (isinstance(v32, str) and v32 in _ENUM_33):
+            raise ValidationError(f"{path}.status is not one of {sorted(_ENUM_33)}")
+    if data.keys() - _PROPS_34:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_34)}"
+        )
+
+
+def _ref_definitions_guard_spec(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_38 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_38 - data.keys())}"
+        )
+    if "deny_decision" in data:
+        v39 = data["deny_decision"]
+        if not isinstance(v39, str):
+            raise ValidationError(f"{path}.deny_decision is not of type 'string'")
+        if not (isinstance(v39, str) and v39 in _ENUM_40):
+            raise ValidationError(
+                f"{path}.deny_decision is not one of {sorted(_ENUM_40)}"
+            )
+    if "deny_reason_code" in data:
+        v41 = data["deny_reason_code"]
+        if not isinstance(v41, str):
+            raise ValidationError(f"{path}.deny_reason_code is not of type 'string'")
+        if not _PATTERN_42.search(v41):
+            raise ValidationError(
+                f"{path}.deny_reason_code does not match {_PATTERN_42.pattern!r}"
+            )
+    if "evidence_kinds" in data:
+        v43 = data["evidence_kinds"]
+        if not isinstance(v43, list):
+            raise ValidationError(f"{path}.evidence_kinds is not of type 'array'")
+        for i44, v45 in enumerate(v43):
+            if not isinstance(v45, str):
+                raise ValidationError(
+                    f"{path}.evidence_kinds[{i44}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v46 = data["guard_id"]
+        if not isinstance(v46, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v46) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "guard_kind" in data:
+        v47 = data["guard_kind"]
+        if not isinstance(v47, str):
+            raise ValidationError(f"{path}.guard_kind is not of type 'string'")
+        if not (isinstance(v47, str) and v47 in _ENUM_48):
+            raise ValidationError(f"{path}.guard_kind is not one of {sorted(_ENUM_48)}")
+    if "predicate_ref" in data:
+        v49 = data["predicate_ref"]
+        if not isinstance(v49, str):
+            raise ValidationError(f"{path}.predicate_ref is not of type 'string'")
+        if len(v49) < 1:
+            raise ValidationError(f"{path}.predicate_ref is shorter than 1")
+    if data.keys() - _PROPS_50:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_50)}"
+        )
+
+
+def _ref_definitions_artifact_ref(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_55 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_55 - data.keys())}"
+        )
+    if "id" in data:
+        v56 = data["id"]
+        if not isinstance(v56, str):
+            raise ValidationError(f"{path}.id is not of type 'string'")
+        if len(v56) < 1:
+            raise ValidationError(f"{path}.id is shorter than 1")
+    if "path" in data:
+        v57 = data["path"]
+        if not isinstance(v57, str):
+            raise ValidationError(f"{path}.path is not of type 'string'")
+        if len(v57) < 1:
+            raise ValidationError(f"{path}.path is shorter than 1")
+    if "sha256" in data:
+        v58 = data["sha256"]
+        if not isinstance(v58, str):
+            raise ValidationError(f"{path}.sha256 is not of type 'string'")
+        if len(v58) < 1:
+            raise ValidationError(f"{path}.sha256 is shorter than 1")
+    if "version" in data:
+        v59 = data["version"]
+        if not isinstance(v59, str):
+            raise ValidationError(f"{path}.version is not of type 'string'")
+        if len(v59) < 1:
+            raise ValidationError(f"{path}.version is shorter than 1")
+    if data.keys() - _PROPS_60:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_60)}"
+        )
+
+
+def _ref_definitions_meta(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_15 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_15 - data.keys())}"
+        )
+    if "guards" in data:
+        v16 = data["guards"]
+        if not isinstance(v16, dict):
+            raise ValidationError(f"{path}.guards is not of type 'object'")
+        if not _REQUIRED_17 <= v16.keys():
+            raise ValidationError(
+                f"{path}.guards is missing required {sorted(_REQUIRED_17 - v16.keys())}"
+            )
+        if "eval" in v16:
+            v18 = v16["eval"]
+            if not isinstance(v18, list):
+                raise ValidationError(f"{path}.guards.eval is not of type 'array'")
+            for i19, v20 in enumerate(v18):
+                _ref_definitions_guard_eval(v20, f"{path}.guards.eval[{i19}]")
+        if "spec" in v16:
+            v35 = v16["spec"]
+            if not isinstance(v35, list):
+                raise ValidationError(f"{path}.guards.spec is not of type 'array'")
+            for i36, v37 in enumerate(v35):
+                _ref_definitions_guard_spec(v37, f"{path}.guards.spec[{i36}]")
+        if v16.keys() - _PROPS_51:
+            raise ValidationError(
+                f"{path}.guards has unexpected properties {sorted(v16.keys() - _PROPS_51)}"
+            )
+    if "policy_linkage" in data:
+        v52 = data["policy_linkage"]
+        if not isinstance(v52, dict):
+            raise ValidationError(f"{path}.policy_linkage is not of type 'object'")
+        if not _REQUIRED_53 <= v52.keys():
+            raise ValidationError(
+                f"{path}.policy_linkage is missing required {sorted(_REQUIRED_53 - v52.keys())}"
+            )
+        if "control_strategy_ref" in v52:
+            v54 = v52["control_strategy_ref"]
+            _ref_definitions_artifact_ref(
+                v54, f"{path}.policy_linkage.control_strategy_ref"
+            )
+        if "guardrails_bundle_ref" in v52:
+            v61 = v52["guardrails_bundle_ref"]
+            _ref_definitions_artifact_ref(
+                v61, f"{path}.policy_linkage.guardrails_bundle_ref"
+            )
+        if "pattern_catalog_ref" in v52:
+            v62 = v52["pattern_catalog_ref"]
+            _ref_definitions_artifact_ref(
+                v62, f"{path}.policy_linkage.pattern_catalog_ref"
+            )
+        if "plant_spec_ref" in v52:
+            v63 = v52["plant_spec_ref"]
+            _ref_definitions_artifact_ref(v63, f"{path}.policy_linkage.plant_spec_ref")
+        if "rank_policy_ref" in v52:
+            v64 = v52["rank_policy_ref"]
+            _ref_definitions_artifact_ref(v64, f"{path}.policy_linkage.rank_policy_ref")
+        if "reason_codes_ref" in v52:
+            v65 = v52["reason_codes_ref"]
+            _ref_definitions_artifact_ref(
+                v65, f"{path}.policy_linkage.reason_codes_ref"
+            )
+        if "src_conventions_ref" in v52:
+            v66 = v52["src_conventions_ref"]
+            _ref_definitions_artifact_ref(
+                v66, f"{path}.policy_linkage.src_conventions_ref"
+            )
+        if v52.keys() - _PROPS_67:
+            raise ValidationError(
+                f"{path}.policy_linkage has unexpected properties {sorted(v52.keys() - _PROPS_67)}"
+            )
+    if "requirements" in data:
+        v68 = data["requirements"]
+        if not isinstance(v68, dict):
+            raise ValidationError(f"{path}.requirements is not of type 'object'")
+        if not _REQUIRED_69 <= v68.keys():
+            raise ValidationError(
+                f"{path}.requirements is missing required {sorted(_REQUIRED_69 - v68.keys())}"
+            )
+        if "required_evidence" in v68:
+            v70 = v68["required_evidence"]
+            if not isinstance(v70, list):
+                raise ValidationError(
+                    f"{path}.requirements.required_evidence is not of type 'array'"
+                )
+            for i71, v72 in enumerate(v70):
+                if not isinstance(v72, str):
+                    raise ValidationError(
+                        f"{path}.requirements.required_evidence[{i71}] is not of type 'string'"
+                    )
+        if v68.keys() - _PROPS_73:
+            raise ValidationError(
+                f"{path}.requirements has unexpected properties {sorted(v68.keys() - _PROPS_73)}"
+            )
+    if data.keys() - _PROPS_74:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_74)}"
+        )
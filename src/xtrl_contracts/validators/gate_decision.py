@@ -0,0 +1,409 @@
+# generated by tools/contracts/gen.py; never hand-edit
+# source: control/ssot/schemas/gate_decision.schema.json
+from __future__ import annotations
+
+import re
+
+
+class ValidationError(ValueError):
+    """Raised by generated validators; the message starts with the data path."""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[k], two[k]) for k in one)
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def _unique(items):
+    for i, a in enumerate(items):
+        for b in items[i + 1 :]:
+            if _equal(a, b):
+                return False
+    return True
+
+
+_REQUIRED_1 = frozenset(
+    [
+        "artifact_kind",
+        "decision",
+        "iteration_id",
+        "meta",
+        "pointers",
+        "reason_codes",
+        "run_id",
+    ]
+)
+_CONST_3 = "gate_decision"
+_ENUM_5 = frozenset(["DENY", "PROMOTE", "STOP"])
+_REQUIRED_8 = frozenset(["guards", "policy_linkage", "requirements"])
+_REQUIRED_10 = frozenset(["eval", "spec"])
+_REQUIRED_14 = frozenset(["guard_id", "status"])
+_ENUM_16 = frozenset(["ALLOW", "DENY", "STOP"])
+_ENUM_26 = frozenset(["FAIL", "PASS", "SKIP"])
+_PROPS_27 = frozenset(
+    ["decision", "evidence_refs", "guard_id", "notes", "reason_codes", "status"]
+)
+_REQUIRED_31 = frozenset(
+    ["deny_decision", "deny_reason_code", "evidence_kinds", "guard_id"]
+)
+_ENUM_33 = frozenset(["DENY", "STOP"])
+_PATTERN_35 = re.compile("^[A-Z0-9_]+$")
+_ENUM_41 = frozenset(["advisory", "repairable", "stop", "structural"])
+_PROPS_43 = frozenset(
+    [
+        "deny_decision",
+        "deny_reason_code",
+        "evidence_kinds",
+        "guard_id",
+        "guard_kind",
+        "predicate_ref",
+    ]
+)
+_PROPS_44 = frozenset(["eval", "spec"])
+_REQUIRED_46 = frozenset(["reason_codes_ref"])
+_REQUIRED_48 = frozenset(["path", "version"])
+_PROPS_53 = frozenset(["id", "path", "sha256", "version"])
+_PROPS_60 = frozenset(
+    [
+        "control_strategy_ref",
+        "guardrails_bundle_ref",
+        "pattern_catalog_ref",
+        "plant_spec_ref",
+        "rank_policy_ref",
+        "reason_codes_ref",
+        "src_conventions_ref",
+    ]
+)
+_REQUIRED_62 = frozenset(["required_evidence"])
+_PROPS_66 = frozenset(["required_evidence"])
+_PROPS_67 = frozenset(["guards", "policy_linkage", "requirements"])
+_PROPS_73 = frozenset(
+    [
+        "artifact_kind",
+        "decision",
+        "iteration_id",
+        "meta",
+        "pointers",
+        "reason_codes",
+        "run_id",
+    ]
+)
+
+
+def validate(data, path="$"):
+    """Raise ValidationError if data does not conform; return data."""
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_1 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_1 - data.keys())}"
+        )
+    if "artifact_kind" in data:
+        v2 = data["artifact_kind"]
+        if not (isinstance(v2, str) and v2 == _CONST_3):
+            raise ValidationError(
+                f"{path}.artifact_kind was expected to be {_CONST_3!r}"
+            )
+    if "decision" in data:
+        v4 = data["decision"]
+        if not isinstance(v4, str):
+            raise ValidationError(f"{path}.decision is not of type 'string'")
+        if not (isinstance(v4, str) and v4 in _ENUM_5):
+            raise ValidationError(f"{path}.decision is not one of {sorted(_ENUM_5)}")
+    if "iteration_id" in data:
+        v6 = data["iteration_id"]
+        if not isinstance(v6, str):
+            raise ValidationError(f"{path}.iteration_id is not of type 'string'")
+    if "meta" in data:
+        v7 = data["meta"]
+        _ref_definitions_meta(v7, f"{path}.meta")
+    if "pointers" in data:
+        v68 = data["pointers"]
+        if not isinstance(v68, dict):
+            raise ValidationError(f"{path}.pointers is not of type 'object'")
+    if "reason_codes" in data:
+        v69 = data["reason_codes"]
+        if not isinstance(v69, list):
+            raise ValidationError(f"{path}.reason_codes is not of type 'array'")
+        for i70, v71 in enumerate(v69):
+            if not isinstance(v71, str):
+                raise ValidationError(
+                    f"{path}.reason_codes[{i70}] is not of type 'string'"
+                )
+    if "run_id" in data:
+        v72 = data["run_id"]
+        if not isinstance(v72, str):
+            raise ValidationError(f"{path}.run_id is not of type 'string'")
+    if data.keys() - _PROPS_73:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_73)}"
+        )
+    return data
+
+
+def _ref_definitions_guard_eval(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_14 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_14 - data.keys())}"
+        )
+    if "decision" in data:
+        v15 = data["decision"]
+        if not isinstance(v15, str):
+            raise ValidationError(f"{path}.decision is not of type 'string'")
+        if not (isinstance(v15, str) and v15 in _ENUM_16):
+            raise ValidationError(f"{path}.decision is not one of {sorted(_ENUM_16)}")
+    if "evidence_refs" in data:
+        v17 = data["evidence_refs"]
+        if not isinstance(v17, list):
+            raise ValidationError(f"{path}.evidence_refs is not of type 'array'")
+        for i18, v19 in enumerate(v17):
+            if not isinstance(v19, str):
+                raise ValidationError(
+                    f"{path}.evidence_refs[{i18}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v20 = data["guard_id"]
+        if not isinstance(v20, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v20) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "notes" in data:
+        v21 = data["notes"]
+        if not isinstance(v21, str):
+            raise ValidationError(f"{path}.notes is not of type 'string'")
+    if "reason_codes" in data:
+        v22 = data["reason_codes"]
+        if not isinstance(v22, list):
+            raise ValidationError(f"{path}.reason_codes is not of type 'array'")
+        for i23, v24 in enumerate(v22):
+            if not isinstance(v24, str):
+                raise ValidationError(
+                    f"{path}.reason_codes[{i23}] is not of type 'string'"
+                )
+    if "status" in data:
+        v25 = data["status"]
+        if not isinstance(v25, str):
+            raise ValidationError(f"{path}.status is not of type 'string'")
+        if not (isinstance(v25, str) and v25 in _ENUM_26):
+            raise ValidationError(f"{path}.status is not one of {sorted(_ENUM_26)}")
+    if data.keys() - _PROPS_27:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_27)}"
+        )
+
+
+def _ref_definitions_guard_spec(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_31 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_31 - data.keys())}"
+        )
+    if "deny_decision" in data:
+        v32 = data["deny_decision"]
+        if not isinstance(v32, str):
+            raise ValidationError(f"{path}.deny_decision is not of type 'string'")
+        if not (isinstance(v32, str) and v32 in _ENUM_33):
+            raise ValidationError(
+                f"{path}.deny_decision is not one of {sorted(_ENUM_33)}"
+            )
+    if "deny_reason_code" in data:
+        v34 = data["deny_reason_code"]
+        if not isinstance(v34, str):
+            raise ValidationError(f"{path}.deny_reason_code is not of type 'string'")
+        if not _PATTERN_35.search(v34):
+            raise ValidationError(
+                f"{path}.deny_reason_code does not match {_PATTERN_35.pattern!r}"
+            )
+    if "evidence_kinds" in data:
+        v36 = data["evidence_kinds"]
+        if not isinstance(v36, list):
+            raise ValidationError(f"{path}.evidence_kinds is not of type 'array'")
+        for i37, v38 in enumerate(v36):
+            if not isinstance(v38, str):
+                raise ValidationError(
+                    f"{path}.evidence_kinds[{i37}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v39 = data["guard_id"]
+        if not isinstance(v39, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v39) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "guard_kind" in data:
+        v40 = data["guard_kind"]
+        if not isinstance(v40, str):
+            raise ValidationError(f"{path}.guard_kind is not of type 'string'")
+        if not (isinstance(v40, str) and v40 in _ENUM_41):
+            raise ValidationError(f"{path}.guard_kind is not one of {sorted(_ENUM_41)}")
+    if "predicate_ref" in data:
+        v42 = data["predicate_ref"]
+        if not isinstance(v42, str):
+            raise ValidationError(f"{path}.predicate_ref is not of type 'string'")
+        if len(v42) < 1:
+            raise ValidationError(f"{path}.predicate_ref is shorter than 1")
+    if data.keys() - _PROPS_43:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_43)}"
+        )
+
+
+def _ref_definitions_artifact_ref(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_48 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_48 - data.keys())}"
+        )
+    if "id" in data:
+        v49 = data["id"]
+        if not isinstance(v49, str):
+            raise ValidationError(f"{path}.id is not of type 'string'")
+        if len(v49) < 1:
+            raise ValidationError(f"{path}.id is shorter than 1")
+    if "path" in data:
+        v50 = data["path"]
+        if not isinstance(v50, str):
+            raise ValidationError(f"{path}.path is not of type 'string'")
+        if len(v50) < 1:
+            raise ValidationError(f"{path}.path is shorter than 1")
+    if "sha256" in data:
+        v51 = data["sha256"]
+        if not isinstance(v51, str):
+            raise ValidationError(f"{path}.sha256 is not of type 'string'")
+        if len(v51) < 1:
+            raise ValidationError(f"{path}.sha256 is shorter than 1")
+    if "version" in data:
+        v52 = data["version"]
+        if not isinstance(v52, str):
+            raise ValidationError(f"{path}.version is not of type 'string'")
+        if len(v52) < 1:
+            raise ValidationError(f"{path}.version is shorter than 1")
+    if data.keys() - _PROPS_53:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_53)}"
+        )
+
+
+def _ref_definitions_meta(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_8 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_8 - data.keys())}"
+        )
+    if "guards" in data:
+        v9 = data["guards"]
+        if not isinstance(v9, dict):
+            raise ValidationError(f"{path}.guards is not of type 'object'")
+        if not _REQUIRED_10 <= v9.keys():
+            raise ValidationError(
+                f"{path}.guards is missing required {sorted(_REQUIRED_10 - v9.keys())}"
+            )
+        if "eval" in v9:
+            v11 = v9["eval"]
+            if not isinstance(v11, list):
+                raise ValidationError(f"{path}.guards.eval is not of type 'array'")
+            for i12, v13 in enumerate(v11):
+                _ref_definitions_guard_eval(v13, f"{path}.guards.eval[{i12}]")
+        if "spec" in v9:
+            v28 = v9["spec"]
+            if not isinstance(v28, list):
+                raise ValidationError(f"{path}.guards.spec is not of type 'array'")
+            for i29, v30 in enumerate(v28):
+                _ref_definitions_guard_spec(v30, f"{path}.guards.spec[{i29}]")
+        if v9.keys() - _PROPS_44:
+            raise ValidationError(
+                f"{path}.guards has unexpected properties {sorted(v9.keys() - _PROPS_44)}"
+            )
+    if "policy_linkage" in data:
+        v45 = data["policy_linkage"]
+        if not isinstance(v45, dict):
+            raise ValidationError(f"{path}.policy_linkage is not of type 'object'")
+        if not _REQUIRED_46 <= v45.keys():
+            raise ValidationError(
+                f"{path}.policy_linkage is missing required {sorted(_REQUIRED_46 - v45.keys())}"
+            )
+        if "control_strategy_ref" in v45:
+            v47 = v45["control_strategy_ref"]
+            _ref_definitions_artifact_ref(
+                v47, f"{path}.policy_linkage.control_strategy_ref"
+            )
+        if "guardrails_bundle_ref" in v45:
+            v54 = v45["guardrails_bundle_ref"]
+            _ref_definitions_artifact_ref(
+                v54, f"{path}.policy_linkage.guardrails_bundle_ref"
+            )
+        if "pattern_catalog_ref" in v45:
+            v55 = v45["pattern_catalog_ref"]
+            _ref_definitions_artifact_ref(
+                v55, f"{path}.policy_linkage.pattern_catalog_ref"
+            )
+        if "plant_spec_ref" in v45:
+            v56 = v45["plant_spec_ref"]
+            _ref_definitions_artifact_ref(v56, f"{path}.policy_linkage.plant_spec_ref")
+        if "rank_policy_ref" in v45:
+            v57 = v45["rank_policy_ref"]
+            _ref_definitions_artifact_ref(v57, f"{path}.policy_linkage.rank_policy_ref")
+        if "reason_codes_ref" in v45:
+            v58 = v45["reason_codes_ref"]
+            _ref_definitions_artifact_ref(
+                v58, f"{path}.policy_linkage.reason_codes_ref"
+            )
+        if "src_conventions_ref" in v45:
+            v59 = v45["src_conventions_ref"]
+            _ref_definitions_artifact_ref(
+                v59, f"{path}.policy_linkage.src_conventions_ref"
+            )
+        if v45.keys() - _PROPS_60:
+            raise ValidationError(
+                f"{path}.policy_linkage has unexpected properties {sorted(v45.keys() - _PROPS_60)}"
+            )
+    if "requirements" in data:
+        v61 = data["requirements"]
+        if not isinstance(v61, dict):
+            raise ValidationError(f"{path}.requirements is not of type 'object'")
+        if not _REQUIRED_62 <= v61.keys():
+            raise ValidationError(
+                f"{path}.requirements is missing required {sorted(_REQUIRED_62 - v61.keys())}"
+            )
+        if "required_evidence" in v61:
+            v63 = v61["required_evidence"]
+            if not isinstance(v63, list):
+                raise ValidationError(
+                    f"{path}.requirements.required_evidence is not of type 'array'"
+                )
+            for i64, v65 in enumerate(v63):
+                if not isinstance(v65, str):
+                    raise ValidationError(
+                        f"{path}.requirements.required_evidence[{i64}] is not of type 'string'"
+                    )
+        if v61.keys() - _PROPS_66:
+            raise ValidationError(
+                f"{path}.requirements has unexpected properties {sorted(v61.keys() - _PROPS_66)}"
+            )
+    if data.keys() - _PROPS_67:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_67)}"
+        )
@@ -0,0 +1,708 @@
+# generated by tools/contracts/gen.py; never hand-edit
+# source: control/ssot/schemas/guardrails_bundle.schema.json
+from __future__ import annotations
+
+import re
+
+
+class ValidationError(ValueError):
+    """Raised by generated validators; the message starts with the data path."""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[k], two[k]) for k in one)
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def _unique(items):
+    for i, a in enumerate(items):
+        for b in items[i + 1 :]:
+            if _equal(a, b):
+                return False
+    return True
+
+
+_REQUIRED_1 = frozenset(["artifact_kind", "bundle_id", "guards", "meta", "version"])
+_CONST_3 = "guardrails_bundle"
+_REQUIRED_8 = frozenset(
+    ["applies_to", "deny_decision", "guard_id", "reason_code", "required_evidence"]
+)
+_REQUIRED_20 = frozenset(["from", "to"])
+_PROPS_24 = frozenset(["from", "phase", "to"])
+_PROPS_28 = frozenset(
+    ["actions", "artifact_kinds", "known_states", "transition", "transitions"]
+)
+_ENUM_30 = frozenset(["DENY", "STOP"])
+_REQUIRED_32 = frozenset(
+    ["actionable_hint", "confidence", "next_step", "operator_message", "severity"]
+)
+_ENUM_36 = frozenset(["escalate", "hold", "retry", "rollback"])
+_ENUM_39 = frozenset(["critical", "error", "info", "warn"])
+_PROPS_43 = frozenset(
+    [
+        "actionable_hint",
+        "confidence",
+        "next_step",
+        "operator_message",
+        "severity",
+        "unknowns",
+    ]
+)
+_PATTERN_47 = re.compile("^[A-Z0-9_]+$")
+_PROPS_51 = frozenset(
+    [
+        "applies_to",
+        "deny_decision",
+        "feedback",
+        "guard_id",
+        "predicate_ref",
+        "reason_code",
+        "required_evidence",
+    ]
+)
+_REQUIRED_53 = frozenset(["guards", "policy_linkage", "requirements"])
+_REQUIRED_55 = frozenset(["eval", "spec"])
+_REQUIRED_59 = frozenset(["guard_id", "status"])
+_ENUM_61 = frozenset(["ALLOW", "DENY", "STOP"])
+_ENUM_71 = frozenset(["FAIL", "PASS", "SKIP"])
+_PROPS_72 = frozenset(
+    ["decision", "evidence_refs", "guard_id", "notes", "reason_codes", "status"]
+)
+_REQUIRED_76 = frozenset(
+    ["deny_decision", "deny_reason_code", "evidence_kinds", "guard_id"]
+)
+_ENUM_78 = frozenset(["DENY", "STOP"])
+_PATTERN_80 = re.compile("^[A-Z0-9_]+$")
+_ENUM_86 = frozenset(["advisory", "repairable", "stop", "structural"])
+_PROPS_88 = frozenset(
+    [
+        "deny_decision",
+        "deny_reason_code",
+        "evidence_kinds",
+        "guard_id",
+        "guard_kind",
+        "predicate_ref",
+    ]
+)
+_PROPS_89 = frozenset(["eval", "spec"])
+_REQUIRED_91 = frozenset(["reason_codes_ref"])
+_REQUIRED_93 = frozenset(["path", "version"])
+_PROPS_98 = frozenset(["id", "path", "sha256", "version"])
+_PROPS_105 = frozenset(
+    [
+        "control_strategy_ref",
+        "guardrails_bundle_ref",
+        "pattern_catalog_ref",
+        "plant_spec_ref",
+        "rank_policy_ref",
+        "reason_codes_ref",
+        "src_conventions_ref",
+    ]
+)
+_REQUIRED_107 = frozenset(["required_evidence", "unknowns_policy"])
+_REQUIRED_112 = frozenset(
+    ["emit_unknowns_field", "on_unknown_state", "on_unknown_transition", "reason_code"]
+)
+_CONST_114 = "unknowns"
+_ENUM_117 = frozenset(["DENY", "STOP"])
+_ENUM_119 = frozenset(["DENY", "STOP"])
+_PATTERN_121 = re.compile("^[A-Z0-9_]+$")
+_PROPS_122 = frozenset(
+    [
+        "emit_unknowns_field",
+        "max_unknowns",
+        "on_unknown_state",
+        "on_unknown_transition",
+        "reason_code",
+    ]
+)
+_PROPS_123 = frozenset(["required_evidence", "unknowns_policy"])
+_PROPS_124 = frozenset(["guards", "policy_linkage", "requirements"])
+_PROPS_126 = frozenset(["artifact_kind", "bundle_id", "guards", "meta", "version"])
+
+
+def validate(data, path="$"):
+    """Raise ValidationError if data does not conform; return data."""
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_1 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_1 - data.keys())}"
+        )
+    if "artifact_kind" in data:
+        v2 = data["artifact_kind"]
+        if not (isinstance(v2, str) and v2 == _CONST_3):
+            raise ValidationError(
+                f"{path}.artifact_kind was expected to be {_CONST_3!r}"
+            )
+    if "bundle_id" in data:
+        v4 = data["bundle_id"]
+        if not isinstance(v4, str):
+            raise ValidationError(f"{path}.bundle_id is not of type 'string'")
+        if len(v4) < 1:
+            raise ValidationError(f"{path}.bundle_id is shorter than 1")
+    if "guards" in data:
+        v5 = data["guards"]
+        if not isinstance(v5, list):
+            raise ValidationError(f"{path}.guards is not of type 'array'")
+        if len(v5) < 1:
+            raise ValidationError(f"{path}.guards has fewer than 1 items")
+        for i6, v7 in enumerate(v5):
+            if not isinstance(v7, dict):
+                raise ValidationError(f"{path}.guards[{i6}] is not of type 'object'")
+            if not _REQUIRED_8 <= v7.keys():
+                raise ValidationError(
+                    f"{path}.guards[{i6}] is missing required {sorted(_REQUIRED_8 - v7.keys())}"
+                )
+            if "applies_to" in v7:
+                v9 = v7["applies_to"]
+                if not isinstance(v9, dict):
+                    raise ValidationError(
+                        f"{path}.guards[{i6}].applies_to is not of type 'object'"
+                    )
+                if "actions" in v9:
+                    v10 = v9["actions"]
+                    if not isinstance(v10, list):
+                        raise ValidationError(
+                            f"{path}.guards[{i6}].applies_to.actions is not of type 'array'"
+                        )
+                    for i11, v12 in enumerate(v10):
+                        if not isinstance(v12, str):
+                            raise ValidationError(
+                                f"{path}.guards[{i6}].applies_to.actions[{i11}] is not of type 'string'"
+                            )
+                if "artifact_kinds" in v9:
+                    v13 = v9["artifact_kinds"]
+                    if not isinstance(v13, list):
+                        raise ValidationError(
+                            f"{path}.guards[{i6}].applies_to.artifact_kinds is not of type 'array'"
+                        )
+                    for i14, v15 in enumerate(v13):
+                        if not isinstance(v15, str):
+                            raise ValidationError(
+                                f"{path}.guards[{i6}].applies_to.artifact_kinds[{i14}] is not of type 'string'"
+                            )
+                if "known_states" in v9:
+                    v16 = v9["known_states"]
+                    if not isinstance(v16, list):
+                        raise ValidationError(
+                            f"{path}.guards[{i6}].applies_to.known_states is not of type 'array'"
+                        )
+                    if not _unique(v16):
+                        raise ValidationError(
+                            f"{path}.guards[{i6}].applies_to.known_states has non-unique items"
+                        )
+                    for i17, v18 in enumerate(v16):
+                        if not isinstance(v18, str):
+                            raise ValidationError(
+                                f"{path}.guards[{i6}].applies_to.known_states[{i17}] is not of type 'string'"
+                            )
+                        if len(v18) < 1:
+                            raise ValidationError(
+                                f"{path}.guards[{i6}].applies_to.known_states[{i17}] is shorter than 1"
+                            )
+                if "transition" in v9:
+                    v19 = v9["transition"]
+                    _ref_definitions_transition_selector(
+                        v19, f"{path}.guards[{i6}].applies_to.transition"
+                    )
+                if "transitions" in v9:
+                    v25 = v9["transitions"]
+                    if not isinstance(v25, list):
+                        raise ValidationError(
+                            f"{path}.guards[{i6}].applies_to.transitions is not of type 'array'"
+                        )
+                    for i26, v27 in enumerate(v25):
+                        if not isinstance(v27, str):
+                            raise ValidationError(
+                                f"{path}.guards[{i6}].applies_to.transitions[{i26}] is not of type 'string'"
+                            )
+                if v9.keys() - _PROPS_28:
+                    raise ValidationError(
+                        f"{path}.guards[{i6}].applies_to has unexpected properties {sorted(v9.keys() - _PROPS_28)}"
+                    )
+            if "deny_decision" in v7:
+                v29 = v7["deny_decision"]
+                if not isinstance(v29, str):
+                    raise ValidationError(
+                        f"{path}.guards[{i6}].deny_decision is not of type 'string'"
+                    )
+                if not (isinstance(v29, str) and v29 in _ENUM_30):
+                    raise ValidationError(
+                        f"{path}.guards[{i6}].deny_decision is not one of {sorted(_ENUM_30)}"
+                    )
+            if "feedback" in v7:
+                v31 = v7["feedback"]
+                _ref_definitions_guard_feedback(v31, f"{path}.guards[{i6}].feedback")
+            if "guard_id" in v7:
+                v44 = v7["guard_id"]
+                if not isinstance(v44, str):
+                    raise ValidationError(
+                        f"{path}.guards[{i6}].guard_id is not of type 'string'"
+                    )
+                if len(v44) < 1:
+                    raise ValidationError(
+                        f"{path}.guards[{i6}].guard_id is shorter than 1"
+                    )
+            if "predicate_ref" in v7:
+                v45 = v7["predicate_ref"]
+                if not isinstance(v45, str):
+                    raise ValidationError(
+                        f"{path}.guards[{i6}].predicate_ref is not of type 'string'"
+                    )
+            if "reason_code" in v7:
+                v46 = v7["reason_code"]
+                if not isinstance(v46, str):
+                    raise ValidationError(
+                        f"{path}.guards[{i6}].reason_code is not of type 'string'"
+                    )
+                if not _PATTERN_47.search(v46):
+                    raise ValidationError(
+                        f"{path}.guards[{i6}].reason_code does not match {_PATTERN_47.pattern!r}"
+                    )
+            if "required_evidence" in v7:
+                v48 = v7["required_evidence"]
+                if not isinstance(v48, list):
+                    raise ValidationError(
+                        f"{path}.guards[{i6}].required_evidence is not of type 'array'"
+                    )
+                for i49, v50 in enumerate(v48):
+                    if not isinstance(v50, str):
+                        raise ValidationError(
+                            f"{path}.guards[{i6}].required_evidence[{i49}] is not of type 'string'"
+                        )
+            if v7.keys() - _PROPS_51:
+                raise ValidationError(
+                    f"{path}.guards[{i6}] has unexpected properties {sorted(v7.keys() - _PROPS_51)}"
+                )
+    if "meta" in data:
+        v52 = data["meta"]
+        _ref_definitions_meta(v52, f"{path}.meta")
+    if "version" in data:
+        v125 = data["version"]
+        if not isinstance(v125, str):
+            raise ValidationError(f"{path}.version is not of type 'string'")
+        if len(v125) < 1:
+            raise ValidationError(f"{path}.version is shorter than 1")
+    if data.keys() - _PROPS_126:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_126)}"
+        )
+    return data
+
+
+def _ref_definitions_transition_selector(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_20 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_20 - data.keys())}"
+        )
+    if "from" in data:
+        v21 = data["from"]
+        if not isinstance(v21, str):
+            raise ValidationError(f"{path}.from is not of type 'string'")
+        if len(v21) < 1:
+            raise ValidationError(f"{path}.from is shorter than 1")
+    if "phase" in data:
+        v22 = data["phase"]
+        if not isinstance(v22, str):
+            raise ValidationError(f"{path}.phase is not of type 'string'")
+        if len(v22) < 1:
+            raise ValidationError(f"{path}.phase is shorter than 1")
+    if "to" in data:
+        v23 = data["to"]
+        if not isinstance(v23, str):
+            raise ValidationError(f"{path}.to is not of type 'string'")
+        if len(v23) < 1:
+            raise ValidationError(f"{path}.to is shorter than 1")
+    if data.keys() - _PROPS_24:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_24)}"
+        )
+
+
+def _ref_definitions_guard_feedback(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_32 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_32 - data.keys())}"
+        )
+    if "actionable_hint" in data:
+        v33 = data["actionable_hint"]
+        if not isinstance(v33, str):
+            raise ValidationError(f"{path}.actionable_hint is not of type 'string'")
+        if len(v33) < 12:
+            raise ValidationError(f"{path}.actionable_hint is shorter than 12")
+        if len(v33) > 240:
+            raise ValidationError(f"{path}.actionable_hint is longer than 240")
+    if "confidence" in data:
+        v34 = data["confidence"]
+        if not _is_number(v34):
+            raise ValidationError(f"{path}.confidence is not of type 'number'")
+        if v34 < 0:
+            raise ValidationError(f"{path}.confidence violates minimum 0")
+        if v34 > 1:
+            raise ValidationError(f"{path}.confidence violates maximum 1")
+    if "next_step" in data:
+        v35 = data["next_step"]
+        if not isinstance(v35, str):
+            raise ValidationError(f"{path}.next_step is not of type 'string'")
+        if not (isinstance(v35, str) and v35 in _ENUM_36):
+            raise ValidationError(f"{path}.next_step is not one of {sorted(_ENUM_36)}")
+    if "operator_message" in data:
+        v37 = data["operator_message"]
+        if not isinstance(v37, str):
+            raise ValidationError(f"{path}.operator_message is not of type 'string'")
+        if len(v37) < 12:
+            raise ValidationError(f"{path}.operator_message is shorter than 12")
+        if len(v37) > 240:
+            raise ValidationError(f"{path}.operator_message is longer than 240")
+    if "severity" in data:
+        v38 = data["severity"]
+        if not isinstance(v38, str):
+            raise ValidationError(f"{path}.severity is not of type 'string'")
+        if not (isinstance(v38, str) and v38 in _ENUM_39):
+            raise ValidationError(f"{path}.severity is not one of {sorted(_ENUM_39)}")
+    if "unknowns" in data:
+        v40 = data["unknowns"]
+        if not isinstance(v40, list):
+            raise ValidationError(f"{path}.unknowns is not of type 'array'")
+        for i41, v42 in enumerate(v40):
+            if not isinstance(v42, str):
+                raise ValidationError(f"{path}.unknowns[{i41}] is not of type 'string'")
+            if len(v42) < 1:
+                raise ValidationError(f"{path}.unknowns[{i41}] is shorter than 1")
+    if data.keys() - _PROPS_43:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_43)}"
+        )
+
+
+def _ref_definitions_guard_eval(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_59 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_59 - data.keys())}"
+        )
+    if "decision" in data:
+        v60 = data["decision"]
+        if not isinstance(v60, str):
+            raise ValidationError(f"{path}.decision is not of type 'string'")
+        if not (isinstance(v60, str) and v60 in _ENUM_61):
+            raise ValidationError(f"{path}.decision is not one of {sorted(_ENUM_61)}")
+    if "evidence_refs" in data:
+        v62 = data["evidence_refs"]
+        if not isinstance(v62, list):
+            raise ValidationError(f"{path}.evidence_refs is not of type 'array'")
+        for i63, v64 in enumerate(v62):
+            if not isinstance(v64, str):
+                raise ValidationError(
+                    f"{path}.evidence_refs[{i63}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v65 = data["guard_id"]
+        if not isinstance(v65, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v65) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "notes" in data:
+        v66 = data["notes"]
+        if not isinstance(v66, str):
+            raise ValidationError(f"{path}.notes is not of type 'string'")
+    if "reason_codes" in data:
+        v67 = data["reason_codes"]
+        if not isinstance(v67, list):
+            raise ValidationError(f"{path}.reason_codes is not of type 'array'")
+        for i68, v69 in enumerate(v67):
+            if not isinstance(v69, str):
+                raise ValidationError(
+                    f"{path}.reason_codes[{i68}] is not of type 'string'"
+                )
+    if "status" in data:
+        v70 = data["status"]
+        if not isinstance(v70, str):
+            raise ValidationError(f"{path}.status is not of type 'string'")
+        if not (isinstance(v70, str) and v70 in _ENUM_71):
+            raise ValidationError(f"{path}.status is not one of {sorted(_ENUM_71)}")
+    if data.keys() - _PROPS_72:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_72)}"
+        )
+
+
+def _ref_definitions_guard_spec(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_76 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_76 - data.keys())}"
+        )
+    if "deny_decision" in data:
+        v77 = data["deny_decision"]
+        if not isinstance(v77, str):
+            raise ValidationError(f"{path}.deny_decision is not of type 'string'")
+        if not (isinstance(v77, str) and v77 in _ENUM_78):
+            raise ValidationError(
+                f"{path}.deny_decision is not one of {sorted(_ENUM_78)}"
+            )
+    if "deny_reason_code" in data:
+        v79 = data["deny_reason_code"]
+        if not isinstance(v79, str):
+            raise ValidationError(f"{path}.deny_reason_code is not of type 'string'")
+        if not _PATTERN_80.search(v79):
+            raise ValidationError(
+                f"{path}.deny_reason_code does not match {_PATTERN_80.pattern!r}"
+            )
+    if "evidence_kinds" in data:
+        v81 = data["evidence_kinds"]
+        if not isinstance(v81, list):
+            raise ValidationError(f"{path}.evidence_kinds is not of type 'array'")
+        for i82, v83 in enumerate(v81):
+            if not isinstance(v83, str):
+                raise ValidationError(
+                    f"{path}.evidence_kinds[{i82}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v84 = data["guard_id"]
+        if not isinstance(v84, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v84) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "guard_kind" in data:
+        v85 = data["guard_kind"]
+        if not isinstance(v85, str):
+            raise ValidationError(f"{path}.guard_kind is not of type 'string'")
+        if not (isinstance(v85, str) and v85 in _ENUM_86):
+            raise ValidationError(f"{path}.guard_kind is not one of {sorted(_ENUM_86)}")
+    if "predicate_ref" in data:
+        v87 = data["predicate_ref"]
+        if not isinstance(v87, str):
+            raise ValidationError(f"{path}.predicate_ref is not of type 'string'")
+        if len(v87) < 1:
+            raise ValidationError(f"{path}.predicate_ref is shorter than 1")
+    if data.keys() - _PROPS_88:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_88)}"
+        )
+
+
+def _ref_definitions_artifact_ref(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_93 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_93 - data.keys())}"
+        )
+    if "id" in data:
+        v94 = data["id"]
+        if not isinstance(v94, str):
+            raise ValidationError(f"{path}.id is not of type 'string'")
+        if len(v94) < 1:
+            raise ValidationError(f"{path}.id is shorter than 1")
+    if "path" in data:
+        v95 = data["path"]
+        if not isinstance(v95, str):
+            raise ValidationError(f"{path}.path is not of type 'string'")
+        if len(v95) < 1:
+            raise ValidationError(f"{path}.path is shorter than 1")
+    if "sha256" in data:
+        v96 = data["sha256"]
+        if not isinstance(v96, str):
+            raise ValidationError(f"{path}.sha256 is not of type 'string'")
+        if len(v96) < 1:
+            raise ValidationError(f"{path}.sha256 is shorter than 1")
+    if "version" in data:
+        v97 = data["version"]
+        if not isinstance(v97, str):
+            raise ValidationError(f"{path}.version is not of type 'string'")
+        if len(v97) < 1:
+            raise ValidationError(f"{path}.version is shorter than 1")
+    if data.keys() - _PROPS_98:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_98)}"
+        )
+
+
+def _ref_definitions_unknowns_policy(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_112 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_112 - data.keys())}"
+        )
+    if "emit_unknowns_field" in data:
+        v113 = data["emit_unknowns_field"]
+        if not isinstance(v113, str):
+            raise ValidationError(f"{path}.emit_unknowns_field is not of type 'string'")
+        if not (isinstance(v113, str) and v113 == _CONST_114):
+            raise ValidationError(
+                f"{path}.emit_unknowns_field was expected to be {_CONST_114!r}"
+            )
+    if "max_unknowns" in data:
+        v115 = data["max_unknowns"]
+        if not _is_integer(v115):
+            raise ValidationError(f"{path}.max_unknowns is not of type 'integer'")
+        if v115 < 0:
+            raise ValidationError(f"{path}.max_unknowns violates minimum 0")
+    if "on_unknown_state" in data:
+        v116 = data["on_unknown_state"]
+        if not isinstance(v116, str):
+            raise ValidationError(f"{path}.on_unknown_state is not of type 'string'")
+        if not (isinstance(v116, str) and v116 in _ENUM_117):
+            raise ValidationError(
+                f"{path}.on_unknown_state is not one of {sorted(_ENUM_117)}"
+            )
+    if "on_unknown_transition" in data:
+        v118 = data["on_unknown_transition"]
+        if not isinstance(v118, str):
+            raise ValidationError(
+                f"{path}.on_unknown_transition is not of type 'string'"
+            )
+        if not (isinstance(v118, str) and v118 in _ENUM_119):
+            raise ValidationError(
+                f"{path}.on_unknown_transition is not one of {sorted(_ENUM_119)}"
+            )
+    if "reason_code" in data:
+        v120 = data["reason_code"]
+        if not isinstance(v120, str):
+            raise ValidationError(f"{path}.reason_code is not of type 'string'")
+        if not _PATTERN_121.search(v120):
+            raise ValidationError(
+                f"{path}.reason_code does not match {_PATTERN_121.pattern!r}"
+            )
+    if data.keys() - _PROPS_122:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_122)}"
+        )
+
+
+def _ref_definitions_meta(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_53 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_53 - data.keys())}"
+        )
+    if "guards" in data:
+        v54 = data["guards"]
+        if not isinstance(v54, dict):
+            raise ValidationError(f"{path}.guards is not of type 'object'")
+        if not _REQUIRED_55 <= v54.keys():
+            raise ValidationError(
+                f"{path}.guards is missing required {sorted(_REQUIRED_55 - v54.keys())}"
+            )
+        if "eval" in v54:
+            v56 = v54["eval"]
+            if not isinstance(v56, list):
+                raise ValidationError(f"{path}.guards.eval is not of type 'array'")
+            for i57, v58 in enumerate(v56):
+                _ref_definitions_guard_eval(v58, f"{path}.guards.eval[{i57}]")
+        if "spec" in v54:
+            v73 = v54["spec"]
+            if not isinstance(v73, list):
+                raise ValidationError(f"{path}.guards.spec is not of type 'array'")
+            for i74, v75 in enumerate(v73):
+                _ref_definitions_guard_spec(v75, f"{path}.guards.spec[{i74}]")
+        if v54.keys() - _PROPS_89:
+            raise ValidationError(
+                f"{path}.guards has unexpected properties {sorted(v54.keys() - _PROPS_89)}"
+            )
+    if "policy_linkage" in data:
+        v90 = data["policy_linkage"]
+        if not isinstance(v90, dict):
+            raise ValidationError(f"{path}.policy_linkage is not of type 'object'")
+        if not _REQUIRED_91 <= v90.keys():
+            raise ValidationError(
+                f"{path}.policy_linkage is missing required {sorted(_REQUIRED_91 - v90.keys())}"
+            )
+        if "control_strategy_ref" in v90:
+            v92 = v90["control_strategy_ref"]
+            _ref_definitions_artifact_ref(
+                v92, f"{path}.policy_linkage.control_strategy_ref"
+            )
+        if "guardrails_bundle_ref" in v90:
+            v99 = v90["guardrails_bundle_ref"]
+            _ref_definitions_artifact_ref(
+                v99, f"{path}.policy_linkage.guardrails_bundle_ref"
+            )
+        if "pattern_catalog_ref" in v90:
+            v100 = v90["pattern_catalog_ref"]
+            _ref_definitions_artifact_ref(
+                v100, f"{path}.policy_linkage.pattern_catalog_ref"
+            )
+        if "plant_spec_ref" in v90:
+            v101 = v90["plant_spec_ref"]
+            _ref_definitions_artifact_ref(v101, f"{path}.policy_linkage.plant_spec_ref")
+        if "rank_policy_ref" in v90:
+            v102 = v90["rank_policy_ref"]
+            _ref_definitions_artifact_ref(
+                v102, f"{path}.policy_linkage.rank_policy_ref"
+            )
+        if "reason_codes_ref" in v90:
+            v103 = v90["reason_codes_ref"]
+            _ref_definitions_artifact_ref(
+                v103, f"{path}.policy_linkage.reason_codes_ref"
+            )
+        if "src_conventions_ref" in v90:
+            v104 = v90["src_conventions_ref"]
+            _ref_definitions_artifact_ref(
+                v104, f"{path}.policy_linkage.src_conventions_ref"
+            )
+        if v90.keys() - _PROPS_105:
+            raise ValidationError(
+                f"{path}.policy_linkage has unexpected properties {sorted(v90.keys() - _PROPS_105)}"
+            )
+    if "requirements" in data:
+        v106 = data["requirements"]
+        if not isinstance(v106, dict):
+            raise ValidationError(f"{path}.requirements is not of type 'object'")
+        if not _REQUIRED_107 <= v106.keys():
+            raise ValidationError(
+                f"{path}.requirements is missing required {sorted(_REQUIRED_107 - v106.keys())}"
+            )
+        if "required_evidence" in v106:
+            v108 = v106["required_evidence"]
+            if not isinstance(v108, list):
+                raise ValidationError(
+                    f"{path}.requirements.required_evidence is not of type 'array'"
+                )
+            for i109, v110 in enumerate(v108):
+                if not isinstance(v110, str):
+                    raise ValidationError(
+                        f"{path}.requirements.required_evidence[{i109}] is not of type 'string'"
+                    )
+        if "unknowns_policy" in v106:
+            v111 = v106["unknowns_policy"]
+            _ref_definitions_unknowns_policy(
+                v111, f"{path}.requirements.unknowns_policy"
+            )
+        if v106.keys() - _PROPS_123:
+            raise ValidationError(
+                f"{path}.requirements has unexpected properties {sorted(v106.keys() - _PROPS_123)}"
+            )
+    if data.keys() - _PROPS_124:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_124)}"
+        )
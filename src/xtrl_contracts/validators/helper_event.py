@@ -0,0 +1,281 @@
+# generated by tools/contracts/gen.py; never hand-edit
+# source: control/ssot/schemas/helper_event.schema.json
+from __future__ import annotations
+
+import re
+
+
+class ValidationError(ValueError):
+    """Raised by generated validators; the message starts with the data path."""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[k], two[k]) for k in one)
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def _unique(items):
+    for i, a in enumerate(items):
+        for b in items[i + 1 :]:
+            if _equal(a, b):
+                return False
+    return True
+
+
+_REQUIRED_1 = frozenset(
+    [
+        "artifact_kind",
+        "base_ref",
+        "base_sha",
+        "diffstat",
+        "event",
+        "gate_decision_ref",
+        "helper_hash",
+        "helper_path",
+        "packet_id",
+        "prompt_ref",
+        "run_id",
+        "schema_version",
+        "touched_paths",
+        "trigger_reason_code",
+    ]
+)
+_CONST_3 = "helper_event"
+_PATTERN_6 = re.compile("^[a-f0-9]{7,40}$")
+_REQUIRED_8 = frozenset(["files_changed", "lines_added", "lines_removed"])
+_PROPS_12 = frozenset(["files_changed", "lines_added", "lines_removed"])
+_CONST_14 = "helper_created"
+_REQUIRED_16 = frozenset(["path", "sha256"])
+_PATTERN_19 = re.compile("^[a-f0-9]{64}$")
+_PROPS_21 = frozenset(["path", "sha256", "version"])
+_PATTERN_23 = re.compile("^[a-f0-9]{64}$")
+_PATTERN_25 = re.compile("^(?!/)(?!.*\\.\\.)[^\\n]+$")
+_PATTERN_28 = re.compile("^[a-f0-9]{64}$")
+_CONST_32 = "0.1"
+_PATTERN_36 = re.compile("^(?!/)(?!.*\\.\\.)[^\\n]+$")
+_PATTERN_38 = re.compile("^[A-Z0-9_]+$")
+_PROPS_39 = frozenset(
+    [
+        "artifact_kind",
+        "base_ref",
+        "base_sha",
+        "diffstat",
+        "event",
+        "gate_decision_ref",
+        "helper_hash",
+        "helper_path",
+        "packet_id",
+        "patch_hash",
+        "prompt_ref",
+        "run_id",
+        "schema_version",
+        "touched_paths",
+        "trigger_reason_code",
+    ]
+)
+
+
+def validate(data, path="$"):
+    """Raise ValidationError if data does not conform; return data."""
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_1 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_1 - data.keys())}"
+        )
+    if "artifact_kind" in data:
+        v2 = data["artifact_kind"]
+        if not isinstance(v2, str):
+            raise ValidationError(f"{path}.artifact_kind is not of type 'string'")
+        if not (isinstance(v2, str) and v2 == _CONST_3):
+            raise ValidationError(
+                f"{path}.artifact_kind was expected to be {_CONST_3!r}"
+            )
+    if "base_ref" in data:
+        v4 = data["base_ref"]
+        if not isinstance(v4, str):
+            raise ValidationError(f"{path}.base_ref is not of type 'string'")
+        if len(v4) < 1:
+            raise ValidationError(f"{path}.base_ref is shorter than 1")
+    if "base_sha" in data:
+        v5 = data["base_sha"]
+        if not isinstance(v5, str):
+            raise ValidationError(f"{path}.base_sha is not of type 'string'")
+        if not _PATTERN_6.search(v5):
+            raise ValidationError(
+                f"{path}.base_sha does not match {_PATTERN_6.pattern!r}"
+            )
+    if "diffstat" in data:
+        v7 = data["diffstat"]
+        if not isinstance(v7, dict):
+            raise ValidationError(f"{path}.diffstat is not of type 'object'")
+        if not _REQUIRED_8 <= v7.keys():
+            raise ValidationError(
+                f"{path}.diffstat is missing required {sorted(_REQUIRED_8 - v7.keys())}"
+            )
+        if "files_changed" in v7:
+            v9 = v7["files_changed"]
+            if not _is_integer(v9):
+                raise ValidationError(
+                    f"{path}.diffstat.files_changed is not of type 'integer'"
+                )
+            if v9 < 1:
+                raise ValidationError(
+                    f"{path}.diffstat.files_changed violates minimum 1"
+                )
+        if "lines_added" in v7:
+            v10 = v7["lines_added"]
+            if not _is_integer(v10):
+                raise ValidationError(
+                    f"{path}.diffstat.lines_added is not of type 'integer'"
+                )
+            if v10 < 0:
+                raise ValidationError(f"{path}.diffstat.lines_added violates minimum 0")
+        if "lines_removed" in v7:
+            v11 = v7["lines_removed"]
+            if not _is_integer(v11):
+                raise ValidationError(
+                    f"{path}.diffstat.lines_removed is not of type 'integer'"
+                )
+            if v11 < 0:
+                raise ValidationError(
+                    f"{path}.diffstat.lines_removed violates minimum 0"
+                )
+        if v7.keys() - _PROPS_12:
+            raise ValidationError(
+                f"{path}.diffstat has unexpected properties {sorted(v7.keys() - _PROPS_12)}"
+            )
+    if "event" in data:
+        v13 = data["event"]
+        if not isinstance(v13, str):
+            raise ValidationError(f"{path}.event is not of type 'string'")
+        if not (isinstance(v13, str) and v13 == _CONST_14):
+            raise ValidationError(f"{path}.event was expected to be {_CONST_14!r}")
+    if "gate_decision_ref" in data:
+        v15 = data["gate_decision_ref"]
+        _ref_definitions_artifact_ref(v15, f"{path}.gate_decision_ref")
+    if "helper_hash" in data:
+        v22 = data["helper_hash"]
+        if not isinstance(v22, str):
+            raise ValidationError(f"{path}.helper_hash is not of type 'string'")
+        if not _PATTERN_23.search(v22):
+            raise ValidationError(
+                f"{path}.helper_hash does not match {_PATTERN_23.pattern!r}"
+            )
+    if "helper_path" in data:
+        v24 = data["helper_path"]
+        if not isinstance(v24, str):
+            raise ValidationError(f"{path}.helper_path is not of type 'string'")
+        if not _PATTERN_25.search(v24):
+            raise ValidationError(
+                f"{path}.helper_path does not match {_PATTERN_25.pattern!r}"
+            )
+    if "packet_id" in data:
+        v26 = data["packet_id"]
+        if not isinstance(v26, str):
+            raise ValidationError(f"{path}.packet_id is not of type 'string'")
+        if len(v26) < 1:
+            raise ValidationError(f"{path}.packet_id is shorter than 1")
+    if "patch_hash" in data:
+        v27 = data["patch_hash"]
+        if not isinstance(v27, str):
+            raise ValidationError(f"{path}.patch_hash is not of type 'string'")
+        if not _PATTERN_28.search(v27):
+            raise ValidationError(
+                f"{path}.patch_hash does not match {_PATTERN_28.pattern!r}"
+            )
+    if "prompt_ref" in data:
+        v29 = data["prompt_ref"]
+        _ref_definitions_artifact_ref(v29, f"{path}.prompt_ref")
+    if "run_id" in data:
+        v30 = data["run_id"]
+        if not isinstance(v30, str):
+            raise ValidationError(f"{path}.run_id is not of type 'string'")
+        if len(v30) < 1:
+            raise ValidationError(f"{path}.run_id is shorter than 1")
+    if "schema_version" in data:
+        v31 = data["schema_version"]
+        if not isinstance(v31, str):
+            raise ValidationError(f"{path}.schema_version is not of type 'string'")
+        if not (isinstance(v31, str) and v31 == _CONST_32):
+            raise ValidationError(
+                f"{path}.schema_version was expected to be {_CONST_32!r}"
+            )
+    if "touched_paths" in data:
+        v33 = data["touched_paths"]
+        if not isinstance(v33, list):
+            raise ValidationError(f"{path}.touched_paths is not of type 'array'")
+        if len(v33) < 1:
+            raise ValidationError(f"{path}.touched_paths has fewer than 1 items")
+        for i34, v35 in enumerate(v33):
+            if not isinstance(v35, str):
+                raise ValidationError(
+                    f"{path}.touched_paths[{i34}] is not of type 'string'"
+                )
+            if not _PATTERN_36.search(v35):
+                raise ValidationError(
+                    f"{path}.touched_paths[{i34}] does not match {_PATTERN_36.pattern!r}"
+                )
+    if "trigger_reason_code" in data:
+        v37 = data["trigger_reason_code"]
+        if not isinstance(v37, str):
+            raise ValidationError(f"{path}.trigger_reason_code is not of type 'string'")
+        if not _PATTERN_38.search(v37):
+            raise ValidationError(
+                f"{path}.trigger_reason_code does not match {_PATTERN_38.pattern!r}"
+            )
+    if data.keys() - _PROPS_39:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_39)}"
+        )
+    return data
+
+
+def _ref_definitions_artifact_ref(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_16 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_16 - data.keys())}"
+        )
+    if "path" in data:
+        v17 = data["path"]
+        if not isinstance(v17, str):
+            raise ValidationError(f"{path}.path is not of type 'string'")
+        if len(v17) < 1:
+            raise ValidationError(f"{path}.path is shorter than 1")
+    if "sha256" in data:
+        v18 = data["sha256"]
+        if not isinstance(v18, str):
+            raise ValidationError(f"{path}.sha256 is not of type 'string'")
+        if not _PATTERN_19.search(v18):
+            raise ValidationError(
+                f"{path}.sha256 does not match {_PATTERN_19.pattern!r}"
+            )
+    if "version" in data:
+        v20 = data["version"]
+        if not isinstance(v20, str):
+            raise ValidationError(f"{path}.version is not of type 'string'")
+    if data.keys() - _PROPS_21:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_21)}"
+        )
@@ -0,0 +1,175 @@
+# generated by tools/contracts/gen.py; never hand-edit
+# source: control/ssot/schemas/latest_state.schema.json
+from __future__ import annotations
+
+import re
+
+
+class ValidationError(ValueError):
+    """Raised by generated validators; the message starts with the data path."""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[k], two[k]) for k in one)
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def _unique(items):
+    for i, a in enumerate(items):
+        for b in items[i + 1 :]:
+            if _equal(a, b):
+                return False
+    return True
+
+
+_REQUIRED_1 = frozenset(
+    [
+        "artifact_kind",
+        "base_ref",
+        "iteration_id",
+        "last_decision",
+        "ledger_ref",
+        "out_dir",
+        "run_id",
+        "schema_version",
+        "updated_at",
+    ]
+)
+_CONST_3 = "latest_state"
+_ENUM_7 = frozenset(["ALLOW", "DENY", "SKIPPED", "STOP"])
+_REQUIRED_9 = frozenset(["path"])
+_PATTERN_12 = re.compile("^[a-f0-9]{64}$")
+_PROPS_13 = frozenset(["path", "sha256"])
+_CONST_18 = "0.1"
+_PROPS_20 = frozenset(
+    [
+        "artifact_kind",
+        "base_ref",
+        "iteration_id",
+        "last_decision",
+        "ledger_ref",
+        "next_base_ref",
+        "out_dir",
+        "run_id",
+        "schema_version",
+        "updated_at",
+    ]
+)
+
+
+def validate(data, path="$"):
+    """Raise ValidationError if data does not conform; return data."""
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_1 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_1 - data.keys())}"
+        )
+    if "artifact_kind" in data:
+        v2 = data["artifact_kind"]
+        if not isinstance(v2, str):
+            raise ValidationError(f"{path}.artifact_kind is not of type 'string'")
+        if not (isinstance(v2, str) and v2 == _CONST_3):
+            raise ValidationError(
+                f"{path}.artifact_kind was expected to be {_CONST_3!r}"
+            )
+    if "base_ref" in data:
+        v4 = data["base_ref"]
+        if not isinstance(v4, str):
+            raise ValidationError(f"{path}.base_ref is not of type 'string'")
+        if len(v4) < 1:
+            raise ValidationError(f"{path}.base_ref is shorter than 1")
+    if "iteration_id" in data:
+        v5 = data["iteration_id"]
+        if not isinstance(v5, str):
+            raise ValidationError(f"{path}.iteration_id is not of type 'string'")
+        if len(v5) < 1:
+            raise ValidationError(f"{path}.iteration_id is shorter than 1")
+    if "last_decision" in data:
+        v6 = data["last_decision"]
+        if not isinstance(v6, str):
+            raise ValidationError(f"{path}.last_decision is not of type 'string'")
+        if not (isinstance(v6, str) and v6 in _ENUM_7):
+            raise ValidationError(
+                f"{path}.last_decision is not one of {sorted(_ENUM_7)}"
+            )
+    if "ledger_ref" in data:
+        v8 = data["ledger_ref"]
+        if not isinstance(v8, dict):
+            raise ValidationError(f"{path}.ledger_ref is not of type 'object'")
+        if not _REQUIRED_9 <= v8.keys():
+            raise ValidationError(
+                f"{path}.ledger_ref is missing required {sorted(_REQUIRED_9 - v8.keys())}"
+            )
+        if "path" in v8:
+            v10 = v8["path"]
+            if not isinstance(v10, str):
+                raise ValidationError(f"{path}.ledger_ref.path is not of type 'string'")
+            if len(v10) < 1:
+                raise ValidationError(f"{path}.ledger_ref.path is shorter than 1")
+        if "sha256" in v8:
+            v11 = v8["sha256"]
+            if not isinstance(v11, str):
+                raise ValidationError(
+                    f"{path}.ledger_ref.sha256 is not of type 'string'"
+                )
+            if not _PATTERN_12.search(v11):
+                raise ValidationError(
+                    f"{path}.ledger_ref.sha256 does not match {_PATTERN_12.pattern!r}"
+                )
+        if v8.keys() - _PROPS_13:
+            raise ValidationError(
+                f"{path}.ledger_ref has unexpected properties {sorted(v8.keys() - _PROPS_13)}"
+            )
+    if "next_base_ref" in data:
+        v14 = data["next_base_ref"]
+        if not isinstance(v14, str):
+            raise ValidationError(f"{path}.next_base_ref is not of type 'string'")
+    if "out_dir" in data:
+        v15 = data["out_dir"]
+        if not isinstance(v15, str):
+            raise ValidationError(f"{path}.out_dir is not of type 'string'")
+        if len(v15) < 1:
+            raise ValidationError(f"{path}.out_dir is shorter than 1")
+    if "run_id" in data:
+        v16 = data["run_id"]
+        if not isinstance(v16, str):
+            raise ValidationError(f"{path}.run_id is not of type 'string'")
+        if len(v16) < 1:
+            raise ValidationError(f"{path}.run_id is shorter than 1")
+    if "schema_version" in data:
+        v17 = data["schema_version"]
+        if not isinstance(v17, str):
+            raise ValidationError(f"{path}.schema_version is not of type 'string'")
+        if not (isinstance(v17, str) and v17 == _CONST_18):
+            raise ValidationError(
+                f"{path}.schema_version was expected to be {_CONST_18!r}"
+            )
+    if "updated_at" in data:
+        v19 = data["updated_at"]
+        if not isinstance(v19, str):
+            raise ValidationError(f"{path}.updated_at is not of type 'string'")
+    if data.keys() - _PROPS_20:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_20)}"
+        )
+    return data
@@ -0,0 +1,162 @@
+# generated by tools/contracts/gen.py; never hand-edit
+# source: control/ssot/schemas/ledger_entry.schema.json
+from __future__ import annotations
+
+import re
+
+
+class ValidationError(ValueError):
+    """Raised by generated validators; the message starts with the data path."""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[k], two[k]) for k in one)
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def _unique(items):
+    for i, a in enumerate(items):
+        for b in items[i + 1 :]:
+            if _equal(a, b):
+                return False
+    return True
+
+
+_REQUIRED_1 = frozenset(
+    [
+        "artifact_kind",
+        "base_ref",
+        "decision",
+        "iteration_id",
+        "out_dir",
+        "phase",
+        "reason_codes",
+        "run_id",
+        "schema_version",
+        "timestamp",
+    ]
+)
+_CONST_3 = "ledger_entry"
+_ENUM_6 = frozenset(["ALLOW", "DENY", "SKIPPED", "STOP"])
+_ENUM_10 = frozenset(
+    ["CHECK", "EXEC", "GATE", "ITERATE", "PLAN", "PRECHECK", "PROMOTE"]
+)
+_PATTERN_14 = re.compile("^[A-Z0-9_]+$")
+_CONST_17 = "0.1"
+_PROPS_19 = frozenset(
+    [
+        "artifact_kind",
+        "base_ref",
+        "decision",
+        "iteration_id",
+        "out_dir",
+        "phase",
+        "reason_codes",
+        "run_id",
+        "schema_version",
+        "timestamp",
+    ]
+)
+
+
+def validate(data, path="$"):
+    """Raise ValidationError if data does not conform; return data."""
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_1 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_1 - data.keys())}"
+        )
+    if "artifact_kind" in data:
+        v2 = data["artifact_kind"]
+        if not isinstance(v2, str):
+            raise ValidationError(f"{path}.artifact_kind is not of type 'string'")
+        if not (isinstance(v2, str) and v2 == _CONST_3):
+            raise ValidationError(
+                f"{path}.artifact_kind was expected to be {_CONST_3!r}"
+            )
+    if "base_ref" in data:
+        v4 = data["base_ref"]
+        if not isinstance(v4, str):
+            raise ValidationError(f"{path}.base_ref is not of type 'string'")
+        if len(v4) < 1:
+            raise ValidationError(f"{path}.base_ref is shorter than 1")
+    if "decision" in data:
+        v5 = data["decision"]
+        if not isinstance(v5, str):
+            raise ValidationError(f"{path}.decision is not of type 'string'")
+        if not (isinstance(v5, str) and v5 in _ENUM_6):
+            raise ValidationError(f"{path}.decision is not one of {sorted(_ENUM_6)}")
+    if "iteration_id" in data:
+        v7 = data["iteration_id"]
+        if not isinstance(v7, str):
+            raise ValidationError(f"{path}.iteration_id is not of type 'string'")
+        if len(v7) < 1:
+            raise ValidationError(f"{path}.iteration_id is shorter than 1")
+    if "out_dir" in data:
+        v8 = data["out_dir"]
+        if not isinstance(v8, str):
+            raise ValidationError(f"{path}.out_dir is not of type 'string'")
+        if len(v8) < 1:
+            raise ValidationError(f"{path}.out_dir is shorter than 1")
+    if "phase" in data:
+        v9 = data["phase"]
+        if not isinstance(v9, str):
+            raise ValidationError(f"{path}.phase is not of type 'string'")
+        if not (isinstance(v9, str) and v9 in _ENUM_10):
+            raise ValidationError(f"{path}.phase is not one of {sorted(_ENUM_10)}")
+    if "reason_codes" in data:
+        v11 = data["reason_codes"]
+        if not isinstance(v11, list):
+            raise ValidationError(f"{path}.reason_codes is not of type 'array'")
+        for i12, v13 in enumerate(v11):
+            if not isinstance(v13, str):
+                raise ValidationError(
+                    f"{path}.reason_codes[{i12}] is not of type 'string'"
+                )
+            if not _PATTERN_14.search(v13):
+                raise ValidationError(
+                    f"{path}.reason_codes[{i12}] does not match {_PATTERN_14.pattern!r}"
+                )
+    if "run_id" in data:
+        v15 = data["run_id"]
+        if not isinstance(v15, str):
+            raise ValidationError(f"{path}.run_id is not of type 'string'")
+        if len(v15) < 1:
+            raise ValidationError(f"{path}.run_id is shorter than 1")
+    if "schema_version" in data:
+        v16 = data["schema_version"]
+        if not isinstance(v16, str):
+            raise ValidationError(f"{path}.schema_version is not of type 'string'")
+        if not (isinstance(v16, str) and v16 == _CONST_17):
+            raise ValidationError(
+                f"{path}.schema_version was expected to be {_CONST_17!r}"
+            )
+    if "timestamp" in data:
+        v18 = data["timestamp"]
+        if not isinstance(v18, str):
+            raise ValidationError(f"{path}.timestamp is not of type 'string'")
+    if data.keys() - _PROPS_19:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_19)}"
+        )
+    return data
@@ -0,0 +1,400 @@
+# generated by tools/contracts/gen.py; never hand-edit
+# source: control/ssot/schemas/migration_report.schema.json
+from __future__ import annotations
+
+
+class ValidationError(ValueError):
+    """Raised by generated validators; the message starts with the data path."""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[k], two[k]) for k in one)
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def _unique(items):
+    for i, a in enumerate(items):
+        for b in items[i + 1 :]:
+            if _equal(a, b):
+                return False
+    return True
+
+
+_REQUIRED_1 = frozenset(
+    [
+        "artifact_kind",
+        "generated_at",
+        "idempotent",
+        "layout",
+        "mode",
+        "operations",
+        "run_id",
+        "schema_version",
+        "source_root",
+        "summary",
+        "target_root",
+    ]
+)
+_CONST_3 = "migration_report"
+_REQUIRED_7 = frozenset(["directory_mappings", "file_mappings", "required_dirs"])
+_REQUIRED_11 = frozenset(["source", "target"])
+_PROPS_14 = frozenset(["source", "target"])
+_REQUIRED_18 = frozenset(["candidates", "target"])
+_PROPS_23 = frozenset(["candidates", "target"])
+_PROPS_27 = frozenset(["directory_mappings", "file_mappings", "required_dirs"])
+_ENUM_29 = frozenset(["apply", "dry-run"])
+_REQUIRED_33 = frozenset(["action", "path", "status"])
+_ENUM_35 = frozenset(["ensure_dir", "migrate_dir", "migrate_file"])
+_ENUM_40 = frozenset(
+    ["conflict", "copied", "created", "error", "missing_source", "planned", "skipped"]
+)
+_PROPS_42 = frozenset(["action", "note", "path", "source", "status", "target"])
+_CONST_45 = "0.1"
+_REQUIRED_48 = frozenset(
+    ["conflict", "copied", "created", "error", "missing_source", "planned", "skipped"]
+)
+_PROPS_56 = frozenset(
+    ["conflict", "copied", "created", "error", "missing_source", "planned", "skipped"]
+)
+_PROPS_58 = frozenset(
+    [
+        "artifact_kind",
+        "generated_at",
+        "idempotent",
+        "layout",
+        "mode",
+        "operations",
+        "run_id",
+        "schema_version",
+        "source_root",
+        "summary",
+        "target_root",
+    ]
+)
+
+
+def validate(data, path="$"):
+    """Raise ValidationError if data does not conform; return data."""
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_1 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_1 - data.keys())}"
+        )
+    if "artifact_kind" in data:
+        v2 = data["artifact_kind"]
+        if not isinstance(v2, str):
+            raise ValidationError(f"{path}.artifact_kind is not of type 'string'")
+        if not (isinstance(v2, str) and v2 == _CONST_3):
+            raise ValidationError(
+                f"{path}.artifact_kind was expected to be {_CONST_3!r}"
+            )
+    if "generated_at" in data:
+        v4 = data["generated_at"]
+        if not isinstance(v4, str):
+            raise ValidationError(f"{path}.generated_at is not of type 'string'")
+    if "idempotent" in data:
+        v5 = data["idempotent"]
+        if not isinstance(v5, bool):
+            raise ValidationError(f"{path}.idempotent is not of type 'boolean'")
+    if "layout" in data:
+        v6 = data["layout"]
+        if not isinstance(v6, dict):
+            raise ValidationError(f"{path}.layout is not of type 'object'")
+        if not _REQUIRED_7 <= v6.keys():
+            raise ValidationError(
+                f"{path}.layout is missing required {sorted(_REQUIRED_7 - v6.keys())}"
+            )
+        if "directory_mappings" in v6:
+            v8 = v6["directory_mappings"]
+            if not isinstance(v8, list):
+                raise ValidationError(
+                    f"{path}.layout.directory_mappings is not of type 'array'"
+                )
+            for i9, v10 in enumerate(v8):
+                if not isinstance(v10, dict):
+                    raise ValidationError(
+                        f"{path}.layout.directory_mappings[{i9}] is not of type 'object'"
+                    )
+                if not _REQUIRED_11 <= v10.keys():
+                    raise ValidationError(
+                        f"{path}.layout.directory_mappings[{i9}] is missing required {sorted(_REQUIRED_11 - v10.keys())}"
+                    )
+                if "source" in v10:
+                    v12 = v10["source"]
+                    if not isinstance(v12, str):
+                        raise ValidationError(
+                            f"{path}.layout.directory_mappings[{i9}].source is not of type 'string'"
+                        )
+                    if len(v12) < 1:
+                        raise ValidationError(
+                            f"{path}.layout.directory_mappings[{i9}].source is shorter than 1"
+                        )
+                if "target" in v10:
+                    v13 = v10["target"]
+                    if not isinstance(v13, str):
+                        raise ValidationError(
+                            f"{path}.layout.directory_mappings[{i9}].target is not of type 'string'"
+                        )
+                    if len(v13) < 1:
+                        raise ValidationError(
+                            f"{path}.layout.directory_mappings[{i9}].target is shorter than 1"
+                        )
+                if v10.keys() - _PROPS_14:
+                    raise ValidationError(
+                        f"{path}.layout.directory_mappings[{i9}] has unexpected properties {sorted(v10.keys() - _PROPS_14)}"
+                    )
+        if "file_mappings" in v6:
+            v15 = v6["file_mappings"]
+            if not isinstance(v15, list):
+                raise ValidationError(
+                    f"{path}.layout.file_mappings is not of type 'array'"
+                )
+            for i16, v17 in enumerate(v15):
+                if not isinstance(v17, dict):
+                    raise ValidationError(
+                        f"{path}.layout.file_mappings[{i16}] is not of type 'object'"
+                    )
+                if not _REQUIRED_18 <= v17.keys():
+                    raise ValidationError(
+                        f"{path}.layout.file_mappings[{i16}] is missing required {sorted(_REQUIRED_18 - v17.keys())}"
+                    )
+                if "candidates" in v17:
+                    v19 = v17["candidates"]
+                    if not isinstance(v19, list):
+                        raise ValidationError(
+                            f"{path}.layout.file_mappings[{i16}].candidates is not of type 'array'"
+                        )
+                    if len(v19) < 1:
+                        raise ValidationError(
+                            f"{path}.layout.file_mappings[{i16}].candidates has fewer than 1 items"
+                        )
+                    for i20, v21 in enumerate(v19):
+                        if not isinstance(v21, str):
+                            raise ValidationError(
+                                f"{path}.layout.file_mappings[{i16}].candidates[{i20}] is not of type 'string'"
+                            )
+                        if len(v21) < 1:
+                            raise ValidationError(
+                                f"{path}.layout.file_mappings[{i16}].candidates[{i20}] is shorter than 1"
+                            )
+                if "target" in v17:
+                    v22 = v17["target"]
+                    if not isinstance(v22, str):
+                        raise ValidationError(
+                            f"{path}.layout.file_mappings[{i16}].target is not of type 'string'"
+                        )
+                    if len(v22) < 1:
+                        raise ValidationError(
+                            f"{path}.layout.file_mappings[{i16}].target is shorter than 1"
+                        )
+                if v17.keys() - _PROPS_23:
+                    raise ValidationError(
+                        f"{path}.layout.file_mappings[{i16}] has unexpected properties {sorted(v17.keys() - _PROPS_23)}"
+                    )
+        if "required_dirs" in v6:
+            v24 = v6["required_dirs"]
+            if not isinstance(v24, list):
+                raise ValidationError(
+                    f"{path}.layout.required_dirs is not of type 'array'"
+                )
+            for i25, v26 in enumerate(v24):
+                if not isinstance(v26, str):
+                    raise ValidationError(
+                        f"{path}.layout.required_dirs[{i25}] is not of type 'string'"
+                    )
+                if len(v26) < 1:
+                    raise ValidationError(
+                        f"{path}.layout.required_dirs[{i25}] is shorter than 1"
+                    )
+        if v6.keys() - _PROPS_27:
+            raise ValidationError(
+                f"{path}.layout has unexpected properties {sorted(v6.keys() - _PROPS_27)}"
+            )
+    if "mode" in data:
+        v28 = data["mode"]
+        if not isinstance(v28, str):
+            raise ValidationError(f"{path}.mode is not of type 'string'")
+        if not (isinstance(v28, str) and v28 in _ENUM_29):
+            raise ValidationError(f"{path}.mode is not one of {sorted(_ENUM_29)}")
+    if "operations" in data:
+        v30 = data["operations"]
+        if not isinstance(v30, list):
+            raise ValidationError(f"{path}.operations is not of type 'array'")
+        for i31, v32 in enumerate(v30):
+            if not isinstance(v32, dict):
+                raise ValidationError(
+                    f"{path}.operations[{i31}] is not of type 'object'"
+                )
+            if not _REQUIRED_33 <= v32.keys():
+                raise ValidationError(
+                    f"{path}.operations[{i31}] is missing required {sorted(_REQUIRED_33 - v32.keys())}"
+                )
+            if "action" in v32:
+                v34 = v32["action"]
+                if not isinstance(v34, str):
+                    raise ValidationError(
+                        f"{path}.operations[{i31}].action is not of type 'string'"
+                    )
+                if not (isinstance(v34, str) and v34 in _ENUM_35):
+                    raise ValidationError(
+                        f"{path}.operations[{i31}].action is not one of {sorted(_ENUM_35)}"
+                    )
+            if "note" in v32:
+                v36 = v32["note"]
+                if not isinstance(v36, str):
+                    raise ValidationError(
+                        f"{path}.operations[{i31}].note is not of type 'string'"
+                    )
+            if "path" in v32:
+                v37 = v32["path"]
+                if not isinstance(v37, str):
+                    raise ValidationError(
+                        f"{path}.operations[{i31}].path is not of type 'string'"
+                    )
+                if len(v37) < 1:
+                    raise ValidationError(
+                        f"{path}.operations[{i31}].path is shorter than 1"
+                    )
+            if "source" in v32:
+                v38 = v32["source"]
+                if not isinstance(v38, str):
+                    raise ValidationError(
+                        f"{path}.operations[{i31}].source is not of type 'string'"
+                    )
+            if "status" in v32:
+                v39 = v32["status"]
+                if not isinstance(v39, str):
+                    raise ValidationError(
+                        f"{path}.operations[{i31}].status is not of type 'string'"
+                    )
+                if not (isinstance(v39, str) and v39 in _ENUM_40):
+                    raise ValidationError(
+                        f"{path}.operations[{i31}].status is not one of {sorted(_ENUM_40)}"
+                    )
+            if "target" in v32:
+                v41 = v32["target"]
+                if not isinstance(v41, str):
+                    raise ValidationError(
+                        f"{path}.operations[{i31}].target is not of type 'string'"
+                    )
+            if v32.keys() - _PROPS_42:
+                raise ValidationError(
+                    f"{path}.operations[{i31}] has unexpected properties {sorted(v32.keys() - _PROPS_42)}"
+                )
+    if "run_id" in data:
+        v43 = data["run_id"]
+        if not isinstance(v43, str):
+            raise ValidationError(f"{path}.run_id is not of type 'string'")
+        if len(v43) < 1:
+            raise ValidationError(f"{path}.run_id is shorter than 1")
+    if "schema_version" in data:
+        v44 = data["schema_version"]
+        if not isinstance(v44, str):
+            raise ValidationError(f"{path}.schema_version is not of type 'string'")
+        if not (isinstance(v44, str) and v44 == _CONST_45):
+            raise ValidationError(
+                f"{path}.schema_version was expected to be {_CONST_45!r}"
+            )
+    if "source_root" in data:
+        v46 = data["source_root"]
+        if not isinstance(v46, str):
+            raise ValidationError(f"{path}.source_root is not of type 'string'")
+        if len(v46) < 1:
+            raise ValidationError(f"{path}.source_root is shorter than 1")
+    if "summary" in data:
+        v47 = data["summary"]
+        if not isinstance(v47, dict):
+            raise ValidationError(f"{path}.summary is not of type 'object'")
+        if not _REQUIRED_48 <= v47.keys():
+            raise ValidationError(
+                f"{path}.summary is missing required {sorted(_REQUIRED_48 - v47.keys())}"
+            )
+        if "conflict" in v47:
+            v49 = v47["conflict"]
+            if not _is_integer(v49):
+                raise ValidationError(
+                    f"{path}.summary.conflict is not of type 'integer'"
+                )
+            if v49 < 0:
+                raise ValidationError(f"{path}.summary.conflict violates minimum 0")
+        if "copied" in v47:
+            v50 = v47["copied"]
+            if not _is_integer(v50):
+                raise ValidationError(f"{path}.summary.copied is not of type 'integer'")
+            if v50 < 0:
+                raise ValidationError(f"{path}.summary.copied violates minimum 0")
+        if "created" in v47:
+            v51 = v47["created"]
+            if not _is_integer(v51):
+                raise ValidationError(
+                    f"{path}.summary.created is not of type 'integer'"
+                )
+            if v51 < 0:
+                raise ValidationError(f"{path}.summary.created violates minimum 0")
+        if "error" in v47:
+            v52 = v47["error"]
+            if not _is_integer(v52):
+                raise ValidationError(f"{path}.summary.error is not of type 'integer'")
+            if v52 < 0:
+                raise ValidationError(f"{path}.summary.error violates minimum 0")
+        if "missing_source" in v47:
+            v53 = v47["missing_source"]
+            if not _is_integer(v53):
+                raise ValidationError(
+                    f"{path}.summary.missing_source is not of type 'integer'"
+                )
+            if v53 < 0:
+                raise ValidationError(
+                    f"{path}.summary.missing_source violates minimum 0"
+                )
+        if "planned" in v47:
+            v54 = v47["planned"]
+            if not _is_integer(v54):
+                raise ValidationError(
+                    f"{path}.summary.planned is not of type 'integer'"
+                )
+            if v54 < 0:
+                raise ValidationError(f"{path}.summary.planned violates minimum 0")
+        if "skipped" in v47:
+            v55 = v47["skipped"]
+            if not _is_integer(v55):
+                raise ValidationError(
+                    f"{path}.summary.skipped is not of type 'integer'"
+                )
+            if v55 < 0:
+                raise ValidationError(f"{path}.summary.skipped violates minimum 0")
+        if v47.keys() - _PROPS_56:
+            raise ValidationError(
+                f"{path}.summary has unexpected properties {sorted(v47.keys() - _PROPS_56)}"
+            )
+    if "target_root" in data:
+        v57 = data["target_root"]
+        if not isinstance(v57, str):
+            raise ValidationError(f"{path}.target_root is not of type 'string'")
+        if len(v57) < 1:
+            raise ValidationError(f"{path}.target_root is shorter than 1")
+    if data.keys() - _PROPS_58:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_58)}"
+        )
+    return data
@@ -0,0 +1,411 @@
+# generated by tools/contracts/gen.py; never hand-edit
+# source: control/ssot/schemas/next_iter_plan.schema.json
+from __future__ import annotations
+
+import re
+
+
+class ValidationError(ValueError):
+    """Raised by generated validators; the message starts with the data path."""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[k], two[k]) for k in one)
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def _unique(items):
+    for i, a in enumerate(items):
+        for b in items[i + 1 :]:
+            if _equal(a, b):
+                return False
+    return True
+
+
+_REQUIRED_1 = frozenset(
+    [
+        "artifact_kind",
+        "carry_patch",
+        "iteration_id",
+        "meta",
+        "next_base_ref",
+        "restart_mode",
+        "run_id",
+    ]
+)
+_CONST_3 = "next_iter_plan"
+_REQUIRED_7 = frozenset(["guards", "policy_linkage", "requirements"])
+_REQUIRED_9 = frozenset(["eval", "spec"])
+_REQUIRED_13 = frozenset(["guard_id", "status"])
+_ENUM_15 = frozenset(["ALLOW", "DENY", "STOP"])
+_ENUM_25 = frozenset(["FAIL", "PASS", "SKIP"])
+_PROPS_26 = frozenset(
+    ["decision", "evidence_refs", "guard_id", "notes", "reason_codes", "status"]
+)
+_REQUIRED_30 = frozenset(
+    ["deny_decision", "deny_reason_code", "evidence_kinds", "guard_id"]
+)
+_ENUM_32 = frozenset(["DENY", "STOP"])
+_PATTERN_34 = re.compile("^[A-Z0-9_]+$")
+_ENUM_40 = frozenset(["advisory", "repairable", "stop", "structural"])
+_PROPS_42 = frozenset(
+    [
+        "deny_decision",
+        "deny_reason_code",
+        "evidence_kinds",
+        "guard_id",
+        "guard_kind",
+        "predicate_ref",
+    ]
+)
+_PROPS_43 = frozenset(["eval", "spec"])
+_REQUIRED_45 = frozenset(["reason_codes_ref"])
+_REQUIRED_47 = frozenset(["path", "version"])
+_PROPS_52 = frozenset(["id", "path", "sha256", "version"])
+_PROPS_59 = frozenset(
+    [
+        "control_strategy_ref",
+        "guardrails_bundle_ref",
+        "pattern_catalog_ref",
+        "plant_spec_ref",
+        "rank_policy_ref",
+        "reason_codes_ref",
+        "src_conventions_ref",
+    ]
+)
+_REQUIRED_61 = frozenset(["required_evidence"])
+_PROPS_65 = frozenset(["required_evidence"])
+_PROPS_66 = frozenset(["guards", "policy_linkage", "requirements"])
+_ENUM_69 = frozenset(["REITERATE_FROM_CANDIDATE", "REITERATE_FROM_LAST_GOOD", "STOP"])
+_PROPS_72 = frozenset(
+    [
+        "artifact_kind",
+        "carry_patch",
+        "iteration_id",
+        "meta",
+        "next_base_ref",
+        "restart_mode",
+        "run_id",
+        "tighten",
+    ]
+)
+
+
+def validate(data, path="$"):
+    """Raise ValidationError if data does not conform; return data."""
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_1 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_1 - data.keys())}"
+        )
+    if "artifact_kind" in data:
+        v2 = data["artifact_kind"]
+        if not (isinstance(v2, str) and v2 == _CONST_3):
+            raise ValidationError(
+                f"{path}.artifact_kind was expected to be {_CONST_3!r}"
+            )
+    if "carry_patch" in data:
+        v4 = data["carry_patch"]
+        if not isinstance(v4, bool):
+            raise ValidationError(f"{path}.carry_patch is not of type 'boolean'")
+    if "iteration_id" in data:
+        v5 = data["iteration_id"]
+        if not isinstance(v5, str):
+            raise ValidationError(f"{path}.iteration_id is not of type 'string'")
+    if "meta" in data:
+        v6 = data["meta"]
+        _ref_definitions_meta(v6, f"{path}.meta")
+    if "next_base_ref" in data:
+        v67 = data["next_base_ref"]
+        if not isinstance(v67, str):
+            raise ValidationError(f"{path}.next_base_ref is not of type 'string'")
+    if "restart_mode" in data:
+        v68 = data["restart_mode"]
+        if not isinstance(v68, str):
+            raise ValidationError(f"{path}.restart_mode is not of type 'string'")
+        if not (isinstance(v68, str) and v68 in _ENUM_69):
+            raise ValidationError(
+                f"{path}.restart_mode is not one of {sorted(_ENUM_69)}"
+            )
+    if "run_id" in data:
+        v70 = data["run_id"]
+        if not isinstance(v70, str):
+            raise ValidationError(f"{path}.run_id is not of type 'string'")
+    if "tighten" in data:
+        v71 = data["tighten"]
+        if not isinstance(v71, dict):
+            raise ValidationError(f"{path}.tighten is not of type 'object'")
+    if data.keys() - _PROPS_72:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_72)}"
+        )
+    return data
+
+
+def _ref_definitions_guard_eval(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_13 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_13 - data.keys())}"
+        )
+    if "decision" in data:
+        v14 = data["decision"]
+        if not isinstance(v14, str):
+            raise ValidationError(f"{path}.decision is not of type 'string'")
+        if not (isinstance(v14, str) and v14 in _ENUM_15):
+            raise ValidationError(f"{path}.decision is not one of {sorted(_ENUM_15)}")
+    if "evidence_refs" in data:
+        v16 = data["evidence_refs"]
+        if not isinstance(v16, list):
+            raise ValidationError(f"{path}.evidence_refs is not of type 'array'")
+        for i17, v18 in enumerate(v16):
+            if not isinstance(v18, str):
+                raise ValidationError(
+                    f"{path}.evidence_refs[{i17}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v19 = data["guard_id"]
+        if not isinstance(v19, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v19) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "notes" in data:
+        v20 = data["notes"]
+        if not isinstance(v20, str):
+            raise ValidationError(f"{path}.notes is not of type 'string'")
+    if "reason_codes" in data:
+        v21 = data["reason_codes"]
+        if not isinstance(v21, list):
+            raise ValidationError(f"{path}.reason_codes is not of type 'array'")
+        for i22, v23 in enumerate(v21):
+            if not isinstance(v23, str):
+                raise ValidationError(
+                    f"{path}.reason_codes[{i22}] is not of type 'string'"
+                )
+    if "status" in data:
+        v24 = data["status"]
+        if not isinstance(v24, str):
+            raise ValidationError(f"{path}.status is not of type 'string'")
+        if not (isinstance(v24, str) and v24 in _ENUM_25):
+            raise ValidationError(f"{path}.status is not one of {sorted(_ENUM_25)}")
+    if data.keys() - _PROPS_26:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_26)}"
+        )
+
+
+def _ref_definitions_guard_spec(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_30 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_30 - data.keys())}"
+        )
+    if "deny_decision" in data:
+        v31 = data["deny_decision"]
+        if not isinstance(v31, str):
+            raise ValidationError(f"{path}.deny_decision is not of type 'string'")
+        if not (isinstance(v31, str) and v31 in _ENUM_32):
+            raise ValidationError(
+                f"{path}.deny_decision is not one of {sorted(_ENUM_32)}"
+            )
+    if "deny_reason_code" in data:
+        v33 = data["deny_reason_code"]
+        if not isinstance(v33, str):
+            raise ValidationError(f"{path}.deny_reason_code is not of type 'string'")
+        if not _PATTERN_34.search(v33):
+            raise ValidationError(
+                f"{path}.deny_reason_code does not match {_PATTERN_34.pattern!r}"
+            )
+    if "evidence_kinds" in data:
+        v35 = data["evidence_kinds"]
+        if not isinstance(v35, list):
+            raise ValidationError(f"{path}.evidence_kinds is not of type 'array'")
+        for i36, v37 in enumerate(v35):
+            if not isinstance(v37, str):
+                raise ValidationError(
+                    f"{path}.evidence_kinds[{i36}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v38 = data["guard_id"]
+        if not isinstance(v38, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v38) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "guard_kind" in data:
+        v39 = data["guard_kind"]
+        if not isinstance(v39, str):
+            raise ValidationError(f"{path}.guard_kind is not of type 'string'")
+        if not (isinstance(v39, str) and v39 in _ENUM_40):
+            raise ValidationError(f"{path}.guard_kind is not one of {sorted(_ENUM_40)}")
+    if "predicate_ref" in data:
+        v41 = data["predicate_ref"]
+        if not isinstance(v41, str):
+            raise ValidationError(f"{path}.predicate_ref is not of type 'string'")
+        if len(v41) < 1:
+            raise ValidationError(f"{path}.predicate_ref is shorter than 1")
+    if data.keys() - _PROPS_42:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_42)}"
+        )
+
+
+def _ref_definitions_artifact_ref(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_47 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_47 - data.keys())}"
+        )
+    if "id" in data:
+        v48 = data["id"]
+        if not isinstance(v48, str):
+            raise ValidationError(f"{path}.id is not of type 'string'")
+        if len(v48) < 1:
+            raise ValidationError(f"{path}.id is shorter than 1")
+    if "path" in data:
+        v49 = data["path"]
+        if not isinstance(v49, str):
+            raise ValidationError(f"{path}.path is not of type 'string'")
+        if len(v49) < 1:
+            raise ValidationError(f"{path}.path is shorter than 1")
+    if "sha256" in data:
+        v50 = data["sha256"]
+        if not isinstance(v50, str):
+            raise ValidationError(f"{path}.sha256 is not of type 'string'")
+        if len(v50) < 1:
+            raise ValidationError(f"{path}.sha256 is shorter than 1")
+    if "version" in data:
+        v51 = data["version"]
+        if not isinstance(v51, str):
+            raise ValidationError(f"{path}.version is not of type 'string'")
+        if len(v51) < 1:
+            raise ValidationError(f"{path}.version is shorter than 1")
+    if data.keys() - _PROPS_52:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_52)}"
+        )
+
+
+def _ref_definitions_meta(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_7 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_7 - data.keys())}"
+        )
+    if "guards" in data:
+        v8 = data["guards"]
+        if not isinstance(v8, dict):
+            raise ValidationError(f"{path}.guards is not of type 'object'")
+        if not _REQUIRED_9 <= v8.keys():
+            raise ValidationError(
+                f"{path}.guards is missing required {sorted(_REQUIRED_9 - v8.keys())}"
+            )
+        if "eval" in v8:
+            v10 = v8["eval"]
+            if not isinstance(v10, list):
+                raise ValidationError(f"{path}.guards.eval is not of type 'array'")
+            for i11, v12 in enumerate(v10):
+                _ref_definitions_guard_eval(v12, f"{path}.guards.eval[{i11}]")
+        if "spec" in v8:
+            v27 = v8["spec"]
+            if not isinstance(v27, list):
+                raise ValidationError(f"{path}.guards.spec is not of type 'array'")
+            for i28, v29 in enumerate(v27):
+                _ref_definitions_guard_spec(v29, f"{path}.guards.spec[{i28}]")
+        if v8.keys() - _PROPS_43:
+            raise ValidationError(
+                f"{path}.guards has unexpected properties {sorted(v8.keys() - _PROPS_43)}"
+            )
+    if "policy_linkage" in data:
+        v44 = data["policy_linkage"]
+        if not isinstance(v44, dict):
+            raise ValidationError(f"{path}.policy_linkage is not of type 'object'")
+        if not _REQUIRED_45 <= v44.keys():
+            raise ValidationError(
+                f"{path}.policy_linkage is missing required {sorted(_REQUIRED_45 - v44.keys())}"
+            )
+        if "control_strategy_ref" in v44:
+            v46 = v44["control_strategy_ref"]
+            _ref_definitions_artifact_ref(
+                v46, f"{path}.policy_linkage.control_strategy_ref"
+            )
+        if "guardrails_bundle_ref" in v44:
+            v53 = v44["guardrails_bundle_ref"]
+            _ref_definitions_artifact_ref(
+                v53, f"{path}.policy_linkage.guardrails_bundle_ref"
+            )
+        if "pattern_catalog_ref" in v44:
+            v54 = v44["pattern_catalog_ref"]
+            _ref_definitions_artifact_ref(
+                v54, f"{path}.policy_linkage.pattern_catalog_ref"
+            )
+        if "plant_spec_ref" in v44:
+            v55 = v44["plant_spec_ref"]
+            _ref_definitions_artifact_ref(v55, f"{path}.policy_linkage.plant_spec_ref")
+        if "rank_policy_ref" in v44:
+            v56 = v44["rank_policy_ref"]
+            _ref_definitions_artifact_ref(v56, f"{path}.policy_linkage.rank_policy_ref")
+        if "reason_codes_ref" in v44:
+            v57 = v44["reason_codes_ref"]
+            _ref_definitions_artifact_ref(
+                v57, f"{path}.policy_linkage.reason_codes_ref"
+            )
+        if "src_conventions_ref" in v44:
+            v58 = v44["src_conventions_ref"]
+            _ref_definitions_artifact_ref(
+                v58, f"{path}.policy_linkage.src_conventions_ref"
+            )
+        if v44.keys() - _PROPS_59:
+            raise ValidationError(
+                f"{path}.policy_linkage has unexpected properties {sorted(v44.keys() - _PROPS_59)}"
+            )
+    if "requirements" in data:
+        v60 = data["requirements"]
+        if not isinstance(v60, dict):
+            raise ValidationError(f"{path}.requirements is not of type 'object'")
+        if not _REQUIRED_61 <= v60.keys():
+            raise ValidationError(
+                f"{path}.requirements is missing required {sorted(_REQUIRED_61 - v60.keys())}"
+            )
+        if "required_evidence" in v60:
+            v62 = v60["required_evidence"]
+            if not isinstance(v62, list):
+                raise ValidationError(
+                    f"{path}.requirements.required_evidence is not of type 'array'"
+                )
+            for i63, v64 in enumerate(v62):
+                if not isinstance(v64, str):
+                    raise ValidationError(
+                        f"{path}.requirements.required_evidence[{i63}] is not of type 'string'"
+                    )
+        if v60.keys() - _PROPS_65:
+            raise ValidationError(
+                f"{path}.requirements has unexpected properties {sorted(v60.keys() - _PROPS_65)}"
+            )
+    if data.keys() - _PROPS_66:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_66)}"
+        )
@@ -0,0 +1,405 @@
+# generated by tools/contracts/gen.py; never hand-edit
+# source: control/ssot/schemas/packet_pre_contract.schema.json
+from __future__ import annotations
+
+
+class ValidationError(ValueError):
+    """Raised by generated validators; the message starts with the data path."""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[k], two[k]) for k in one)
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def _unique(items):
+    for i, a in enumerate(items):
+        for b in items[i + 1 :]:
+            if _equal(a, b):
+                return False
+    return True
+
+
+_REQUIRED_1 = frozenset(
+    [
+        "actions",
+        "base_ref",
+        "budgets",
+        "component",
+        "constraints",
+        "evidence",
+        "inputs",
+        "mode",
+        "packet_id",
+        "plan_card",
+        "repo",
+        "schema_version",
+    ]
+)
+_REQUIRED_3 = frozenset(["test"])
+_PROPS_7 = frozenset(["test"])
+_REQUIRED_10 = frozenset(["diff_budget", "iteration_budget", "time_minutes"])
+_REQUIRED_12 = frozenset(["max_files_changed", "max_lines_changed"])
+_PROPS_15 = frozenset(["max_files_changed", "max_lines_changed"])
+_PROPS_18 = frozenset(["diff_budget", "iteration_budget", "time_minutes"])
+_REQUIRED_21 = frozenset(
+    ["allowed_paths", "clean_repo_required", "forbidden_paths", "forbidden_patterns"]
+)
+_PROPS_35 = frozenset(
+    [
+        "allowed_paths",
+        "clean_repo_required",
+        "deny_repo_local_roots",
+        "forbidden_paths",
+        "forbidden_patterns",
+    ]
+)
+_REQUIRED_37 = frozenset(["required_files"])
+_PROPS_41 = frozenset(["required_files"])
+_REQUIRED_43 = frozenset(["notes"])
+_PROPS_47 = frozenset(["notes"])
+_ENUM_49 = frozenset(["DRYRUN", "HOTFIX", "NORMAL"])
+_REQUIRED_52 = frozenset(["how", "what", "when", "where", "who", "why"])
+_PROPS_59 = frozenset(["how", "what", "when", "where", "who", "why"])
+_CONST_62 = "xtrl.pre_contract/v0.2"
+_PROPS_63 = frozenset(
+    [
+        "actions",
+        "base_ref",
+        "budgets",
+        "component",
+        "constraints",
+        "evidence",
+        "inputs",
+        "mode",
+        "packet_id",
+        "plan_card",
+        "repo",
+        "schema_version",
+    ]
+)
+
+
+def validate(data, path="$"):
+    """Raise ValidationError if data does not conform; return data."""
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_1 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_1 - data.keys())}"
+        )
+    if "actions" in data:
+        v2 = data["actions"]
+        if not isinstance(v2, dict):
+            raise ValidationError(f"{path}.actions is not of type 'object'")
+        if not _REQUIRED_3 <= v2.keys():
+            raise ValidationError(
+                f"{path}.actions is missing required {sorted(_REQUIRED_3 - v2.keys())}"
+            )
+        if "test" in v2:
+            v4 = v2["test"]
+            if not isinstance(v4, list):
+                raise ValidationError(f"{path}.actions.test is not of type 'array'")
+            if len(v4) < 1:
+                raise ValidationError(f"{path}.actions.test has fewer than 1 items")
+            for i5, v6 in enumerate(v4):
+                if not isinstance(v6, str):
+                    raise ValidationError(
+                        f"{path}.actions.test[{i5}] is not of type 'string'"
+                    )
+        if v2.keys() - _PROPS_7:
+            raise ValidationError(
+                f"{path}.actions has unexpected properties {sorted(v2.keys() - _PROPS_7)}"
+            )
+    if "base_ref" in data:
+        v8 = data["base_ref"]
+        if not isinstance(v8, str):
+            raise ValidationError(f"{path}.base_ref is not of type 'string'")
+        if len(v8) < 1:
+            raise ValidationError(f"{path}.base_ref is shorter than 1")
+    if "budgets" in data:
+        v9 = data["budgets"]
+        if not isinstance(v9, dict):
+            raise ValidationError(f"{path}.budgets is not of type 'object'")
+        if not _REQUIRED_10 <= v9.keys():
+            raise ValidationError(
+                f"{path}.budgets is missing required {sorted(_REQUIRED_10 - v9.keys())}"
+            )
+        if "diff_budget" in v9:
+            v11 = v9["diff_budget"]
+            if not isinstance(v11, dict):
+                raise ValidationError(
+                    f"{path}.budgets.diff_budget is not of type 'object'"
+                )
+            if not _REQUIRED_12 <= v11.keys():
+                raise ValidationError(
+                    f"{path}.budgets.diff_budget is missing required {sorted(_REQUIRED_12 - v11.keys())}"
+                )
+            if "max_files_changed" in v11:
+                v13 = v11["max_files_changed"]
+                if not _is_integer(v13):
+                    raise ValidationError(
+                        f"{path}.budgets.diff_budget.max_files_changed is not of type 'integer'"
+                    )
+                if v13 < 1:
+                    raise ValidationError(
+                        f"{path}.budgets.diff_budget.max_files_changed violates minimum 1"
+                    )
+            if "max_lines_changed" in v11:
+                v14 = v11["max_lines_changed"]
+                if not _is_integer(v14):
+                    raise ValidationError(
+                        f"{path}.budgets.diff_budget.max_lines_changed is not of type 'integer'"
+                    )
+                if v14 < 1:
+                    raise ValidationError(
+                        f"{path}.budgets.diff_budget.max_lines_changed violates minimum 1"
+                    )
+            if v11.keys() - _PROPS_15:
+                raise ValidationError(
+                    f"{path}.budgets.diff_budget has unexpected properties {sorted(v11.keys() - _PROPS_15)}"
+                )
+        if "iteration_budget" in v9:
+            v16 = v9["iteration_budget"]
+            if not _is_integer(v16):
+                raise ValidationError(
+                    f"{path}.budgets.iteration_budget is not of type 'integer'"
+                )
+            if v16 < 1:
+                raise ValidationError(
+                    f"{path}.budgets.iteration_budget violates minimum 1"
+                )
+        if "time_minutes" in v9:
+            v17 = v9["time_minutes"]
+            if not _is_integer(v17):
+                raise ValidationError(
+                    f"{path}.budgets.time_minutes is not of type 'integer'"
+                )
+            if v17 < 1:
+                raise ValidationError(f"{path}.budgets.time_minutes violates minimum 1")
+        if v9.keys() - _PROPS_18:
+            raise ValidationError(
+                f"{path}.budgets has unexpected properties {sorted(v9.keys() - _PROPS_18)}"
+            )
+    if "component" in data:
+        v19 = data["component"]
+        if not isinstance(v19, str):
+            raise ValidationError(f"{path}.component is not of type 'string'")
+        if len(v19) < 1:
+            raise ValidationError(f"{path}.component is shorter than 1")
+    if "constraints" in data:
+        v20 = data["constraints"]
+        if not isinstance(v20, dict):
+            raise ValidationError(f"{path}.constraints is not of type 'object'")
+        if not _REQUIRED_21 <= v20.keys():
+            raise ValidationError(
+                f"{path}.constraints is missing required {sorted(_REQUIRED_21 - v20.keys())}"
+            )
+        if "allowed_paths" in v20:
+            v22 = v20["allowed_paths"]
+            if not isinstance(v22, list):
+                raise ValidationError(
+                    f"{path}.constraints.allowed_paths is not of type 'array'"
+                )
+            if len(v22) < 1:
+                raise ValidationError(
+                    f"{path}.constraints.allowed_paths has fewer than 1 items"
+                )
+            for i23, v24 in enumerate(v22):
+                if not isinstance(v24, str):
+                    raise ValidationError(
+                        f"{path}.constraints.allowed_paths[{i23}] is not of type 'string'"
+                    )
+        if "clean_repo_required" in v20:
+            v25 = v20["clean_repo_required"]
+            if not isinstance(v25, bool):
+                raise ValidationError(
+                    f"{path}.constraints.clean_repo_required is not of type 'boolean'"
+                )
+        if "deny_repo_local_roots" in v20:
+            v26 = v20["deny_repo_local_roots"]
+            if not isinstance(v26, list):
+                raise ValidationError(
+                    f"{path}.constraints.deny_repo_local_roots is not of type 'array'"
+                )
+            for i27, v28 in enumerate(v26):
+                if not isinstance(v28, str):
+                    raise ValidationError(
+                        f"{path}.constraints.deny_repo_local_roots[{i27}] is not of type 'string'"
+                    )
+        if "forbidden_paths" in v20:
+            v29 = v20["forbidden_paths"]
+            if not isinstance(v29, list):
+                raise ValidationError(
+                    f"{path}.constraints.forbidden_paths is not of type 'array'"
+                )
+            for i30, v31 in enumerate(v29):
+                if not isinstance(v31, str):
+                    raise ValidationError(
+                        f"{path}.constraints.forbidden_paths[{i30}] is not of type 'string'"
+                    )
+        if "forbidden_patterns" in v20:
+            v32 = v20["forbidden_patterns"]
+            if not isinstance(v32, list):
+                raise ValidationError(
+                    f"{path}.constraints.forbidden_patterns is not of type 'array'"
+                )
+            for i33, v34 in enumerate(v32):
+                if not isinstance(v34, str):
+                    raise ValidationError(
+                        f"{path}.constraints.forbidden_patterns[{i33}] is not of type 'string'"
+                    )
+        if v20.keys() - _PROPS_35:
+            raise ValidationError(
+                f"{path}.constraints has unexpected properties {sorted(v20.keys() - _PROPS_35)}"
+            )
+    if "evidence" in data:
+        v36 = data["evidence"]
+        if not isinstance(v36, dict):
+            raise ValidationError(f"{path}.evidence is not of type 'object'")
+        if not _REQUIRED_37 <= v36.keys():
+            raise ValidationError(
+                f"{path}.evidence is missing required {sorted(_REQUIRED_37 - v36.keys())}"
+            )
+        if "required_files" in v36:
+            v38 = v36["required_files"]
+            if not isinstance(v38, list):
+                raise ValidationError(
+                    f"{path}.evidence.required_files is not of type 'array'"
+                )
+            if len(v38) < 1:
+                raise ValidationError(
+                    f"{path}.evidence.required_files has fewer than 1 items"
+                )
+            for i39, v40 in enumerate(v38):
+                if not isinstance(v40, str):
+                    raise ValidationError(
+                        f"{path}.evidence.required_files[{i39}] is not of type 'string'"
+                    )
+                if len(v40) < 1:
+                    raise ValidationError(
+                        f"{path}.evidence.required_files[{i39}] is shorter than 1"
+                    )
+        if v36.keys() - _PROPS_41:
+            raise ValidationError(
+                f"{path}.evidence has unexpected properties {sorted(v36.keys() - _PROPS_41)}"
+            )
+    if "inputs" in data:
+        v42 = data["inputs"]
+        if not isinstance(v42, dict):
+            raise ValidationError(f"{path}.inputs is not of type 'object'")
+        if not _REQUIRED_43 <= v42.keys():
+            raise ValidationError(
+                f"{path}.inputs is missing required {sorted(_REQUIRED_43 - v42.keys())}"
+            )
+        if "notes" in v42:
+            v44 = v42["notes"]
+            if not isinstance(v44, list):
+                raise ValidationError(f"{path}.inputs.notes is not of type 'array'")
+            for i45, v46 in enumerate(v44):
+                if not isinstance(v46, str):
+                    raise ValidationError(
+                        f"{path}.inputs.notes[{i45}] is not of type 'string'"
+                    )
+        if v42.keys() - _PROPS_47:
+            raise ValidationError(
+                f"{path}.inputs has unexpected properties {sorted(v42.keys() - _PROPS_47)}"
+            )
+    if "mode" in data:
+        v48 = data["mode"]
+        if not isinstance(v48, str):
+            raise ValidationError(f"{path}.mode is not of type 'string'")
+        if not (isinstance(v48, str) and v48 in _ENUM_49):
+            raise ValidationError(f"{path}.mode is not one of {sorted(_ENUM_49)}")
+    if "packet_id" in data:
+        v50 = data["packet_id"]
+        if not isinstance(v50, str):
+            raise ValidationError(f"{path}.packet_id is not of type 'string'")
+        if len(v50) < 1:
+            raise ValidationError(f"{path}.packet_id is shorter than 1")
+    if "plan_card" in data:
+        v51 = data["plan_card"]
+        if not isinstance(v51, dict):
+            raise ValidationError(f"{path}.plan_card is not of type 'object'")
+        if not _REQUIRED_52 <= v51.keys():
+            raise ValidationError(
+                f"{path}.plan_card is missing required {sorted(_REQUIRED_52 - v51.keys())}"
+            )
+        if "how" in v51:
+            v53 = v51["how"]
+            if not isinstance(v53, str):
+                raise ValidationError(f"{path}.plan_card.how is not of type 'string'")
+            if len(v53) < 1:
+                raise ValidationError(f"{path}.plan_card.how is shorter than 1")
+        if "what" in v51:
+            v54 = v51["what"]
+            if not isinstance(v54, str):
+                raise ValidationError(f"{path}.plan_card.what is not of type 'string'")
+            if len(v54) < 1:
+                raise ValidationError(f"{path}.plan_card.what is shorter than 1")
+        if "when" in v51:
+            v55 = v51["when"]
+            if not isinstance(v55, str):
+                raise ValidationError(f"{path}.plan_card.when is not of type 'string'")
+            if len(v55) < 1:
+                raise ValidationError(f"{path}.plan_card.when is shorter than 1")
+        if "where" in v51:
+            v56 = v51["where"]
+            if not isinstance(v56, str):
+                raise ValidationError(f"{path}.plan_card.where is not of type 'string'")
+            if len(v56) < 1:
+                raise ValidationError(f"{path}.plan_card.where is shorter than 1")
+        if "who" in v51:
+            v57 = v51["who"]
+            if not isinstance(v57, str):
+                raise ValidationError(f"{path}.plan_card.who is not of type 'string'")
+            if len(v57) < 1:
+                raise ValidationError(f"{path}.plan_card.who is shorter than 1")
+        if "why" in v51:
+            v58 = v51["why"]
+            if not isinstance(v58, str):
+                raise ValidationError(f"{path}.plan_card.why is not of type 'string'")
+            if len(v58) < 1:
+                raise ValidationError(f"{path}.plan_card.why is shorter than 1")
+        if v51.keys() - _PROPS_59:
+            raise ValidationError(
+                f"{path}.plan_card has unexpected properties {sorted(v51.keys() - _PROPS_59)}"
+            )
+    if "repo" in data:
+        v60 = data["repo"]
+        if not isinstance(v60, str):
+            raise ValidationError(f"{path}.repo is not of type 'string'")
+        if len(v60) < 1:
+            raise ValidationError(f"{path}.repo is shorter than 1")
+    if "schema_version" in data:
+        v61 = data["schema_version"]
+        if not isinstance(v61, str):
+            raise ValidationError(f"{path}.schema_version is not of type 'string'")
+        if not (isinstance(v61, str) and v61 == _CONST_62):
+            raise ValidationError(
+                f"{path}.schema_version was expected to be {_CONST_62!r}"
+            )
+    if data.keys() - _PROPS_63:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_63)}"
+        )
+    return data
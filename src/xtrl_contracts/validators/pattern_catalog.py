@@ -0,0 +1,474 @@
+# generated by tools/contracts/gen.py; never hand-edit
+# source: control/ssot/schemas/pattern_catalog.schema.json
+from __future__ import annotations
+
+import re
+
+
+class ValidationError(ValueError):
+    """Raised by generated validators; the message starts with the data path."""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[k], two[k]) for k in one)
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def _unique(items):
+    for i, a in enumerate(items):
+        for b in items[i + 1 :]:
+            if _equal(a, b):
+                return False
+    return True
+
+
+_REQUIRED_1 = frozenset(["artifact_kind", "meta", "patterns", "version"])
+_CONST_3 = "pattern_catalog"
+_REQUIRED_5 = frozenset(["guards", "policy_linkage", "requirements"])
+_REQUIRED_7 = frozenset(["eval", "spec"])
+_REQUIRED_11 = frozenset(["guard_id", "status"])
+_ENUM_13 = frozenset(["ALLOW", "DENY", "STOP"])
+_ENUM_23 = frozenset(["FAIL", "PASS", "SKIP"])
+_PROPS_24 = frozenset(
+    ["decision", "evidence_refs", "guard_id", "notes", "reason_codes", "status"]
+)
+_REQUIRED_28 = frozenset(
+    ["deny_decision", "deny_reason_code", "evidence_kinds", "guard_id"]
+)
+_ENUM_30 = frozenset(["DENY", "STOP"])
+_PATTERN_32 = re.compile("^[A-Z0-9_]+$")
+_ENUM_38 = frozenset(["advisory", "repairable", "stop", "structural"])
+_PROPS_40 = frozenset(
+    [
+        "deny_decision",
+        "deny_reason_code",
+        "evidence_kinds",
+        "guard_id",
+        "guard_kind",
+        "predicate_ref",
+    ]
+)
+_PROPS_41 = frozenset(["eval", "spec"])
+_REQUIRED_43 = frozenset(["reason_codes_ref"])
+_REQUIRED_45 = frozenset(["path", "version"])
+_PROPS_50 = frozenset(["id", "path", "sha256", "version"])
+_PROPS_57 = frozenset(
+    [
+        "control_strategy_ref",
+        "guardrails_bundle_ref",
+        "pattern_catalog_ref",
+        "plant_spec_ref",
+        "rank_policy_ref",
+        "reason_codes_ref",
+        "src_conventions_ref",
+    ]
+)
+_REQUIRED_59 = frozenset(["required_evidence"])
+_PROPS_63 = frozenset(["required_evidence"])
+_PROPS_64 = frozenset(["guards", "policy_linkage", "requirements"])
+_PROPS_66 = frozenset([])
+_REQUIRED_69 = frozenset(["prompt_profile_id"])
+_ENUM_72 = frozenset(["REPAIRABLE", "STOP", "STRUCTURAL"])
+_PROPS_83 = frozenset(["allowed_commands", "allowed_paths", "forbidden_paths"])
+_PROPS_86 = frozenset(
+    [
+        "budgets",
+        "deny_default_restart_class",
+        "policy",
+        "prompt_profile_id",
+        "rank_bias",
+    ]
+)
+_PROPS_88 = frozenset(["artifact_kind", "meta", "patterns", "version"])
+
+
+def validate(data, path="$"):
+    """Raise ValidationError if data does not conform; return data."""
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_1 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_1 - data.keys())}"
+        )
+    if "artifact_kind" in data:
+        v2 = data["artifact_kind"]
+        if not (isinstance(v2, str) and v2 == _CONST_3):
+            raise ValidationError(
+                f"{path}.artifact_kind was expected to be {_CONST_3!r}"
+            )
+    if "meta" in data:
+        v4 = data["meta"]
+        _ref_definitions_meta(v4, f"{path}.meta")
+    if "patterns" in data:
+        v65 = data["patterns"]
+        if not isinstance(v65, dict):
+            raise ValidationError(f"{path}.patterns is not of type 'object'")
+        if len(v65) < 1:
+            raise ValidationError(f"{path}.patterns has fewer than 1 properties")
+        for k67, v68 in v65.items():
+            if k67 in _PROPS_66:
+                continue
+            if not isinstance(v68, dict):
+                raise ValidationError(f"{path}.patterns.{k67} is not of type 'object'")
+            if not _REQUIRED_69 <= v68.keys():
+                raise ValidationError(
+                    f"{path}.patterns.{k67} is missing required {sorted(_REQUIRED_69 - v68.keys())}"
+                )
+            if "budgets" in v68:
+                v70 = v68["budgets"]
+                if not isinstance(v70, dict):
+                    raise ValidationError(
+                        f"{path}.patterns.{k67}.budgets is not of type 'object'"
+                    )
+            if "deny_default_restart_class" in v68:
+                v71 = v68["deny_default_restart_class"]
+                if not isinstance(v71, str):
+                    raise ValidationError(
+                        f"{path}.patterns.{k67}.deny_default_restart_class is not of type 'string'"
+                    )
+                if not (isinstance(v71, str) and v71 in _ENUM_72):
+                    raise ValidationError(
+                        f"{path}.patterns.{k67}.deny_default_restart_class is not one of {sorted(_ENUM_72)}"
+                    )
+            if "policy" in v68:
+                v73 = v68["policy"]
+                if not isinstance(v73, dict):
+                    raise ValidationError(
+                        f"{path}.patterns.{k67}.policy is not of type 'object'"
+                    )
+                if "allowed_commands" in v73:
+                    v74 = v73["allowed_commands"]
+                    if not isinstance(v74, list):
+                        raise ValidationError(
+                            f"{path}.patterns.{k67}.policy.allowed_commands is not of type 'array'"
+                        )
+                    for i75, v76 in enumerate(v74):
+                        if not isinstance(v76, str):
+                            raise ValidationError(
+                                f"{path}.patterns.{k67}.policy.allowed_commands[{i75}] is not of type 'string'"
+                            )
+                if "allowed_paths" in v73:
+                    v77 = v73["allowed_paths"]
+                    if not isinstance(v77, list):
+                        raise ValidationError(
+                            f"{path}.patterns.{k67}.policy.allowed_paths is not of type 'array'"
+                        )
+                    for i78, v79 in enumerate(v77):
+                        if not isinstance(v79, str):
+                            raise ValidationError(
+                                f"{path}.patterns.{k67}.policy.allowed_paths[{i78}] is not of type 'string'"
+                            )
+                if "forbidden_paths" in v73:
+                    v80 = v73["forbidden_paths"]
+                    if not isinstance(v80, list):
+                        raise ValidationError(
+                            f"{path}.patterns.{k67}.policy.forbidden_paths is not of type 'array'"
+                        )
+                    for i81, v82 in enumerate(v80):
+                        if not isinstance(v82, str):
+                            raise ValidationError(
+                                f"{path}.patterns.{k67}.policy.forbidden_paths[{i81}] is not of type 'string'"
+                            )
+                if v73.keys() - _PROPS_83:
+                    raise ValidationError(
+                        f"{path}.patterns.{k67}.policy has unexpected properties {sorted(v73.keys() - _PROPS_83)}"
+                    )
+            if "prompt_profile_id" in v68:
+                v84 = v68["prompt_profile_id"]
+                if not isinstance(v84, str):
+                    raise ValidationError(
+                        f"{path}.patterns.{k67}.prompt_profile_id is not of type 'string'"
+                    )
+                if len(v84) < 1:
+                    raise ValidationError(
+                        f"{path}.patterns.{k67}.prompt_profile_id is shorter than 1"
+                    )
+            if "rank_bias" in v68:
+                v85 = v68["rank_bias"]
+                if not isinstance(v85, dict):
+                    raise ValidationError(
+                        f"{path}.patterns.{k67}.rank_bias is not of type 'object'"
+                    )
+            if v68.keys() - _PROPS_86:
+                raise ValidationError(
+                    f"{path}.patterns.{k67} has unexpected properties {sorted(v68.keys() - _PROPS_86)}"
+                )
+    if "version" in data:
+        v87 = data["version"]
+        if not isinstance(v87, str):
+            raise ValidationError(f"{path}.version is not of type 'string'")
+        if len(v87) < 1:
+            raise ValidationError(f"{path}.version is shorter than 1")
+    if data.keys() - _PROPS_88:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_88)}"
+        )
+    return data
+
+
+def _ref_definitions_guard_eval(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_11 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_11 - data.keys())}"
+        )
+    if "decision" in data:
+        v12 = data["decision"]
+        if not isinstance(v12, str):
+            raise ValidationError(f"{path}.decision is not of type 'string'")
+        if not (isinstance(v12, str) and v12 in _ENUM_13):
+            raise ValidationError(f"{path}.decision is not one of {sorted(_ENUM_13)}")
+    if "evidence_refs" in data:
+        v14 = data["evidence_refs"]
+        if not isinstance(v14, list):
+            raise ValidationError(f"{path}.evidence_refs is not of type 'array'")
+        for i15, v16 in enumerate(v14):
+            if not isinstance(v16, str):
+                raise ValidationError(
+                    f"{path}.evidence_refs[{i15}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v17 = data["guard_id"]
+        if not isinstance(v17, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v17) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "notes" in data:
+        v18 = data["notes"]
+        if not isinstance(v18, str):
+            raise ValidationError(f"{path}.notes is not of type 'string'")
+    if "reason_codes" in data:
+        v19 = data["reason_codes"]
+        if not isinstance(v19, list):
+            raise ValidationError(f"{path}.reason_codes is not of type 'array'")
+        for i20, v21 in enumerate(v19):
+            if not isinstance(v21, str):
+                raise ValidationError(
+                    f"{path}.reason_codes[{i20}] is not of type 'string'"
+                )
+    if "status" in data:
+        v22 = data["status"]
+        if not isinstance(v22, str):
+            raise ValidationError(f"{path}.status is not of type 'string'")
+        if not (isinstance(v22, str) and v22 in _ENUM_23):
+            raise ValidationError(f"{path}.status is not one of {sorted(_ENUM_23)}")
+    if data.keys() - _PROPS_24:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_24)}"
+        )
+
+
+def _ref_definitions_guard_spec(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_28 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_28 - data.keys())}"
+        )
+    if "deny_decision" in data:
+        v29 = data["deny_decision"]
+        if not isinstance(v29, str):
+            raise ValidationError(f"{path}.deny_decision is not of type 'string'")
+        if not (isinstance(v29, str) and v29 in _ENUM_30):
+            raise ValidationError(
+                f"{path}.deny_decision is not one of {sorted(_ENUM_30)}"
+            )
+    if "deny_reason_code" in data:
+        v31 = data["deny_reason_code"]
+        if not isinstance(v31, str):
+            raise ValidationError(f"{path}.deny_reason_code is not of type 'string'")
+        if not _PATTERN_32.search(v31):
+            raise ValidationError(
+                f"{path}.deny_reason_code does not match {_PATTERN_32.pattern!r}"
+            )
+    if "evidence_kinds" in data:
+        v33 = data["evidence_kinds"]
+        if not isinstance(v33, list):
+            raise ValidationError(f"{path}.evidence_kinds is not of type 'array'")
+        for i34, v35 in enumerate(v33):
+            if not isinstance(v35, str):
+                raise ValidationError(
+                    f"{path}.evidence_kinds[{i34}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v36 = data["guard_id"]
+        if not isinstance(v36, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v36) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "guard_kind" in data:
+        v37 = data["guard_kind"]
+        if not isinstance(v37, str):
+            raise ValidationError(f"{path}.guard_kind is not of type 'string'")
+        if not (isinstance(v37, str) and v37 in _ENUM_38):
+            raise ValidationError(f"{path}.guard_kind is not one of {sorted(_ENUM_38)}")
+    if "predicate_ref" in data:
+        v39 = data["predicate_ref"]
+        if not isinstance(v39, str):
+            raise ValidationError(f"{path}.predicate_ref is not of type 'string'")
+        if len(v39) < 1:
+            raise ValidationError(f"{path}.predicate_ref is shorter than 1")
+    if data.keys() - _PROPS_40:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_40)}"
+        )
+
+
+def _ref_definitions_artifact_ref(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_45 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_45 - data.keys())}"
+        )
+    if "id" in data:
+        v46 = data["id"]
+        if not isinstance(v46, str):
+            raise ValidationError(f"{path}.id is not of type 'string'")
+        if len(v46) < 1:
+            raise ValidationError(f"{path}.id is shorter than 1")
+    if "path" in data:
+        v47 = data["path"]
+        if not isinstance(v47, str):
+            raise ValidationError(f"{path}.path is not of type 'string'")
+        if len(v47) < 1:
+            raise ValidationError(f"{path}.path is shorter than 1")
+    if "sha256" in data:
+        v48 = data["sha256"]
+        if not isinstance(v48, str):
+            raise ValidationError(f"{path}.sha256 is not of type 'string'")
+        if len(v48) < 1:
+            raise ValidationError(f"{path}.sha256 is shorter than 1")
+    if "version" in data:
+        v49 = data["version"]
+        if not isinstance(v49, str):
+            raise ValidationError(f"{path}.version is not of type 'string'")
+        if len(v49) < 1:
+            raise ValidationError(f"{path}.version is shorter than 1")
+    if data.keys() - _PROPS_50:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_50)}"
+        )
+
+
+def _ref_definitions_meta(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_5 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_5 - data.keys())}"
+        )
+    if "guards" in data:
+        v6 = data["guards"]
+        if not isinstance(v6, dict):
+            raise ValidationError(f"{path}.guards is not of type 'object'")
+        if not _REQUIRED_7 <= v6.keys():
+            raise ValidationError(
+                f"{path}.guards is missing required {sorted(_REQUIRED_7 - v6.keys())}"
+            )
+        if "eval" in v6:
+            v8 = v6["eval"]
+            if not isinstance(v8, list):
+                raise ValidationError(f"{path}.guards.eval is not of type 'array'")
+            for i9, v10 in enumerate(v8):
+                _ref_definitions_guard_eval(v10, f"{path}.guards.eval[{i9}]")
+        if "spec" in v6:
+            v25 = v6["spec"]
+            if not isinstance(v25, list):
+                raise ValidationError(f"{path}.guards.spec is not of type 'array'")
+            for i26, v27 in enumerate(v25):
+                _ref_definitions_guard_spec(v27, f"{path}.guards.spec[{i26}]")
+        if v6.keys() - _PROPS_41:
+            raise ValidationError(
+                f"{path}.guards has unexpected properties {sorted(v6.keys() - _PROPS_41)}"
+            )
+    if "policy_linkage" in data:
+        v42 = data["policy_linkage"]
+        if not isinstance(v42, dict):
+            raise ValidationError(f"{path}.policy_linkage is not of type 'object'")
+        if not _REQUIRED_43 <= v42.keys():
+            raise ValidationError(
+                f"{path}.policy_linkage is missing required {sorted(_REQUIRED_43 - v42.keys())}"
+            )
+        if "control_strategy_ref" in v42:
+            v44 = v42["control_strategy_ref"]
+            _ref_definitions_artifact_ref(
+                v44, f"{path}.policy_linkage.control_strategy_ref"
+            )
+        if "guardrails_bundle_ref" in v42:
+            v51 = v42["guardrails_bundle_ref"]
+            _ref_definitions_artifact_ref(
+                v51, f"{path}.policy_linkage.guardrails_bundle_ref"
+            )
+        if "pattern_catalog_ref" in v42:
+            v52 = v42["pattern_catalog_ref"]
+            _ref_definitions_artifact_ref(
+                v52, f"{path}.policy_linkage.pattern_catalog_ref"
+            )
+        if "plant_spec_ref" in v42:
+            v53 = v42["plant_spec_ref"]
+            _ref_definitions_artifact_ref(v53, f"{path}.policy_linkage.plant_spec_ref")
+        if "rank_policy_ref" in v42:
+            v54 = v42["rank_policy_ref"]
+            _ref_definitions_artifact_ref(v54, f"{path}.policy_linkage.rank_policy_ref")
+        if "reason_codes_ref" in v42:
+            v55 = v42["reason_codes_ref"]
+            _ref_definitions_artifact_ref(
+                v55, f"{path}.policy_linkage.reason_codes_ref"
+            )
+        if "src_conventions_ref" in v42:
+            v56 = v42["src_conventions_ref"]
+            _ref_definitions_artifact_ref(
+                v56, f"{path}.policy_linkage.src_conventions_ref"
+            )
+        if v42.keys() - _PROPS_57:
+            raise ValidationError(
+                f"{path}.policy_linkage has unexpected properties {sorted(v42.keys() - _PROPS_57)}"
+            )
+    if "requirements" in data:
+        v58 = data["requirements"]
+        if not isinstance(v58, dict):
+            raise ValidationError(f"{path}.requirements is not of type 'object'")
+        if not _REQUIRED_59 <= v58.keys():
+            raise ValidationError(
+                f"{path}.requirements is missing required {sorted(_REQUIRED_59 - v58.keys())}"
+            )
+        if "required_evidence" in v58:
+            v60 = v58["required_evidence"]
+            if not isinstance(v60, list):
+                raise ValidationError(
+                    f"{path}.requirements.required_evidence is not of type 'array'"
+                )
+            for i61, v62 in enumerate(v60):
+                if not isinstance(v62, str):
+                    raise ValidationError(
+                        f"{path}.requirements.required_evidence[{i61}] is not of type 'string'"
+                    )
+        if v58.keys() - _PROPS_63:
+            raise ValidationError(
+                f"{path}.requirements has unexpected properties {sorted(v58.keys() - _PROPS_63)}"
+            )
+    if data.keys() - _PROPS_64:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_64)}"
+        )
@@ -0,0 +1,451 @@
+# generated by tools/contracts/gen.py; never hand-edit
+# source: control/ssot/schemas/rank_policy.schema.json
+from __future__ import annotations
+
+import re
+
+
+class ValidationError(ValueError):
+    """Raised by generated validators; the message starts with the data path."""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[k], two[k]) for k in one)
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def _unique(items):
+    for i, a in enumerate(items):
+        for b in items[i + 1 :]:
+            if _equal(a, b):
+                return False
+    return True
+
+
+_REQUIRED_1 = frozenset(["artifact_kind", "meta", "rank_policy_id", "tuple_order"])
+_CONST_3 = "rank_policy"
+_PROPS_9 = frozenset(["forbidden_paths", "max_diff_lines_total"])
+_REQUIRED_11 = frozenset(["guards", "policy_linkage", "requirements"])
+_REQUIRED_13 = frozenset(["eval", "spec"])
+_REQUIRED_17 = frozenset(["guard_id", "status"])
+_ENUM_19 = frozenset(["ALLOW", "DENY", "STOP"])
+_ENUM_29 = frozenset(["FAIL", "PASS", "SKIP"])
+_PROPS_30 = frozenset(
+    ["decision", "evidence_refs", "guard_id", "notes", "reason_codes", "status"]
+)
+_REQUIRED_34 = frozenset(
+    ["deny_decision", "deny_reason_code", "evidence_kinds", "guard_id"]
+)
+_ENUM_36 = frozenset(["DENY", "STOP"])
+_PATTERN_38 = re.compile("^[A-Z0-9_]+$")
+_ENUM_44 = frozenset(["advisory", "repairable", "stop", "structural"])
+_PROPS_46 = frozenset(
+    [
+        "deny_decision",
+        "deny_reason_code",
+        "evidence_kinds",
+        "guard_id",
+        "guard_kind",
+        "predicate_ref",
+    ]
+)
+_PROPS_47 = frozenset(["eval", "spec"])
+_REQUIRED_49 = frozenset(["reason_codes_ref"])
+_REQUIRED_51 = frozenset(["path", "version"])
+_PROPS_56 = frozenset(["id", "path", "sha256", "version"])
+_PROPS_63 = frozenset(
+    [
+        "control_strategy_ref",
+        "guardrails_bundle_ref",
+        "pattern_catalog_ref",
+        "plant_spec_ref",
+        "rank_policy_ref",
+        "reason_codes_ref",
+        "src_conventions_ref",
+    ]
+)
+_REQUIRED_65 = frozenset(["required_evidence"])
+_PROPS_69 = frozenset(["required_evidence"])
+_PROPS_70 = frozenset(["guards", "policy_linkage", "requirements"])
+_REQUIRED_75 = frozenset(["direction", "field"])
+_ENUM_77 = frozenset(["asc", "desc"])
+_ENUM_79 = frozenset(
+    [
+        "checks_failed",
+        "checks_passed",
+        "created_at",
+        "diff_lines_total",
+        "files_touched",
+        "policy_warnings",
+    ]
+)
+_PROPS_80 = frozenset(["direction", "field"])
+_PROPS_81 = frozenset(
+    ["artifact_kind", "hard_filters", "meta", "rank_policy_id", "tuple_order"]
+)
+
+
+def validate(data, path="$"):
+    """Raise ValidationError if data does not conform; return data."""
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_1 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_1 - data.keys())}"
+        )
+    if "artifact_kind" in data:
+        v2 = data["artifact_kind"]
+        if not (isinstance(v2, str) and v2 == _CONST_3):
+            raise ValidationError(
+                f"{path}.artifact_kind was expected to be {_CONST_3!r}"
+            )
+    if "hard_filters" in data:
+        v4 = data["hard_filters"]
+        if not isinstance(v4, dict):
+            raise ValidationError(f"{path}.hard_filters is not of type 'object'")
+        if "forbidden_paths" in v4:
+            v5 = v4["forbidden_paths"]
+            if not isinstance(v5, list):
+                raise ValidationError(
+                    f"{path}.hard_filters.forbidden_paths is not of type 'array'"
+                )
+            for i6, v7 in enumerate(v5):
+                if not isinstance(v7, str):
+                    raise ValidationError(
+                        f"{path}.hard_filters.forbidden_paths[{i6}] is not of type 'string'"
+                    )
+        if "max_diff_lines_total" in v4:
+            v8 = v4["max_diff_lines_total"]
+            if not _is_integer(v8):
+                raise ValidationError(
+                    f"{path}.hard_filters.max_diff_lines_total is not of type 'integer'"
+                )
+            if v8 < 0:
+                raise ValidationError(
+                    f"{path}.hard_filters.max_diff_lines_total violates minimum 0"
+                )
+        if v4.keys() - _PROPS_9:
+            raise ValidationError(
+                f"{path}.hard_filters has unexpected properties {sorted(v4.keys() - _PROPS_9)}"
+            )
+    if "meta" in data:
+        v10 = data["meta"]
+        _ref_definitions_meta(v10, f"{path}.meta")
+    if "rank_policy_id" in data:
+        v71 = data["rank_policy_id"]
+        if not isinstance(v71, str):
+            raise ValidationError(f"{path}.rank_policy_id is not of type 'string'")
+        if len(v71) < 1:
+            raise ValidationError(f"{path}.rank_policy_id is shorter than 1")
+    if "tuple_order" in data:
+        v72 = data["tuple_order"]
+        if not isinstance(v72, list):
+            raise ValidationError(f"{path}.tuple_order is not of type 'array'")
+        if len(v72) < 1:
+            raise ValidationError(f"{path}.tuple_order has fewer than 1 items")
+        for i73, v74 in enumerate(v72):
+            if not isinstance(v74, dict):
+                raise ValidationError(
+                    f"{path}.tuple_order[{i73}] is not of type 'object'"
+                )
+            if not _REQUIRED_75 <= v74.keys():
+                raise ValidationError(
+                    f"{path}.tuple_order[{i73}] is missing required {sorted(_REQUIRED_75 - v74.keys())}"
+                )
+            if "direction" in v74:
+                v76 = v74["direction"]
+                if not isinstance(v76, str):
+                    raise ValidationError(
+                        f"{path}.tuple_order[{i73}].direction is not of type 'string'"
+                    )
+                if not (isinstance(v76, str) and v76 in _ENUM_77):
+                    raise ValidationError(
+                        f"{path}.tuple_order[{i73}].direction is not one of {sorted(_ENUM_77)}"
+                    )
+            if "field" in v74:
+                v78 = v74["field"]
+                if not isinstance(v78, str):
+                    raise ValidationError(
+                        f"{path}.tuple_order[{i73}].field is not of type 'string'"
+                    )
+                if not (isinstance(v78, str) and v78 in _ENUM_79):
+                    raise ValidationError(
+                        f"{path}.tuple_order[{i73}].field is not one of {sorted(_ENUM_79)}"
+                    )
+            if v74.keys() - _PROPS_80:
+                raise ValidationError(
+                    f"{path}.tuple_order[{i73}] has unexpected properties {sorted(v74.keys() - _PROPS_80)}"
+                )
+    if data.keys() - _PROPS_81:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_81)}"
+        )
+    return data
+
+
+def _ref_definitions_guard_eval(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_17 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_17 - data.keys())}"
+        )
+    if "decision" in data:
+        v18 = data["decision"]
+        if not isinstance(v18, str):
+            raise ValidationError(f"{path}.decision is not of type 'string'")
+        if not (isinstance(v18, str) and v18 in _ENUM_19):
+            raise ValidationError(f"{path}.decision is not one of {sorted(_ENUM_19)}")
+    if "evidence_refs" in data:
+        v20 = data["evidence_refs"]
+        if not isinstance(v20, list):
+            raise ValidationError(f"{path}.evidence_refs is not of type 'array'")
+        for i21, v22 in enumerate(v20):
+            if not isinstance(v22, str):
+                raise ValidationError(
+                    f"{path}.evidence_refs[{i21}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v23 = data["guard_id"]
+        if not isinstance(v23, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v23) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "notes" in data:
+        v24 = data["notes"]
+        if not isinstance(v24, str):
+            raise ValidationError(f"{path}.notes is not of type 'string'")
+    if "reason_codes" in data:
+        v25 = data["reason_codes"]
+        if not isinstance(v25, list):
+            raise ValidationError(f"{path}.reason_codes is not of type 'array'")
+        for i26, v27 in enumerate(v25):
+            if not isinstance(v27, str):
+                raise ValidationError(
+                    f"{path}.reason_codes[{i26}] is not of type 'string'"
+                )
+    if "status" in data:
+        v28 = data["status"]
+        if not isinstance(v28, str):
+            raise ValidationError(f"{path}.status is not of type 'string'")
+        if not (isinstance(v28, str) and v28 in _ENUM_29):
+            raise ValidationError(f"{path}.status is not one of {sorted(_ENUM_29)}")
+    if data.keys() - _PROPS_30:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_30)}"
+        )
+
+
+def _ref_definitions_guard_spec(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_34 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_34 - data.keys())}"
+        )
+    if "deny_decision" in data:
+        v35 = data["deny_decision"]
+        if not isinstance(v35, str):
+            raise ValidationError(f"{path}.deny_decision is not of type 'string'")
+        if not (isinstance(v35, str) and v35 in _ENUM_36):
+            raise ValidationError(
+                f"{path}.deny_decision is not one of {sorted(_ENUM_36)}"
+            )
+    if "deny_reason_code" in data:
+        v37 = data["deny_reason_code"]
+        if not isinstance(v37, str):
+            raise ValidationError(f"{path}.deny_reason_code is not of type 'string'")
+        if not _PATTERN_38.search(v37):
+            raise ValidationError(
+                f"{path}.deny_reason_code does not match {_PATTERN_38.pattern!r}"
+            )
+    if "evidence_kinds" in data:
+        v39 = data["evidence_kinds"]
+        if not isinstance(v39, list):
+            raise ValidationError(f"{path}.evidence_kinds is not of type 'array'")
+        for i40, v41 in enumerate(v39):
+            if not isinstance(v41, str):
+                raise ValidationError(
+                    f"{path}.evidence_kinds[{i40}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v42 = data["guard_id"]
+        if not isinstance(v42, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v42) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "guard_kind" in data:
+        v43 = data["guard_kind"]
+        if not isinstance(v43, str):
+            raise ValidationError(f"{path}.guard_kind is not of type 'string'")
+        if not (isinstance(v43, str) and v43 in _ENUM_44):
+            raise ValidationError(f"{path}.guard_kind is not one of {sorted(_ENUM_44)}")
+    if "predicate_ref" in data:
+        v45 = data["predicate_ref"]
+        if not isinstance(v45, str):
+            raise ValidationError(f"{path}.predicate_ref is not of type 'string'")
+        if len(v45) < 1:
+            raise ValidationError(f"{path}.predicate_ref is shorter than 1")
+    if data.keys() - _PROPS_46:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_46)}"
+        )
+
+
+def _ref_definitions_artifact_ref(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_51 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_51 - data.keys())}"
+        )
+    if "id" in data:
+        v52 = data["id"]
+        if not isinstance(v52, str):
+            raise ValidationError(f"{path}.id is not of type 'string'")
+        if len(v52) < 1:
+            raise ValidationError(f"{path}.id is shorter than 1")
+    if "path" in data:
+        v53 = data["path"]
+        if not isinstance(v53, str):
+            raise ValidationError(f"{path}.path is not of type 'string'")
+        if len(v53) < 1:
+            raise ValidationError(f"{path}.path is shorter than 1")
+    if "sha256" in data:
+        v54 = data["sha256"]
+        if not isinstance(v54, str):
+            raise ValidationError(f"{path}.sha256 is not of type 'string'")
+        if len(v54) < 1:
+            raise ValidationError(f"{path}.sha256 is shorter than 1")
+    if "version" in data:
+        v55 = data["version"]
+        if not isinstance(v55, str):
+            raise ValidationError(f"{path}.version is not of type 'string'")
+        if len(v55) < 1:
+            raise ValidationError(f"{path}.version is shorter than 1")
+    if data.keys() - _PROPS_56:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_56)}"
+        )
+
+
+def _ref_definitions_meta(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_11 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_11 - data.keys())}"
+        )
+    if "guards" in data:
+        v12 = data["guards"]
+        if not isinstance(v12, dict):
+            raise ValidationError(f"{path}.guards is not of type 'object'")
+        if not _REQUIRED_13 <= v12.keys():
+            raise ValidationError(
+                f"{path}.guards is missing required {sorted(_REQUIRED_13 - v12.keys())}"
+            )
+        if "eval" in v12:
+            v14 = v12["eval"]
+            if not isinstance(v14, list):
+                raise ValidationError(f"{path}.guards.eval is not of type 'array'")
+            for i15, v16 in enumerate(v14):
+                _ref_definitions_guard_eval(v16, f"{path}.guards.eval[{i15}]")
+        if "spec" in v12:
+            v31 = v12["spec"]
+            if not isinstance(v31, list):
+                raise ValidationError(f"{path}.guards.spec is not of type 'array'")
+            for i32, v33 in enumerate(v31):
+                _ref_definitions_guard_spec(v33, f"{path}.guards.spec[{i32}]")
+        if v12.keys() - _PROPS_47:
+            raise ValidationError(
+                f"{path}.guards has unexpected properties {sorted(v12.keys() - _PROPS_47)}"
+            )
+    if "policy_linkage" in data:
+        v48 = data["policy_linkage"]
+        if not isinstance(v48, dict):
+            raise ValidationError(f"{path}.policy_linkage is not of type 'object'")
+        if not _REQUIRED_49 <= v48.keys():
+            raise ValidationError(
+                f"{path}.policy_linkage is missing required {sorted(_REQUIRED_49 - v48.keys())}"
+            )
+        if "control_strategy_ref" in v48:
+            v50 = v48["control_strategy_ref"]
+            _ref_definitions_artifact_ref(
+                v50, f"{path}.policy_linkage.control_strategy_ref"
+            )
+        if "guardrails_bundle_ref" in v48:
+            v57 = v48["guardrails_bundle_ref"]
+            _ref_definitions_artifact_ref(
+                v57, f"{path}.policy_linkage.guardrails_bundle_ref"
+            )
+        if "pattern_catalog_ref" in v48:
+            v58 = v48["pattern_catalog_ref"]
+            _ref_definitions_artifact_ref(
+                v58, f"{path}.policy_linkage.pattern_catalog_ref"
+            )
+        if "plant_spec_ref" in v48:
+            v59 = v48["plant_spec_ref"]
+            _ref_definitions_artifact_ref(v59, f"{path}.policy_linkage.plant_spec_ref")
+        if "rank_policy_ref" in v48:
+            v60 = v48["rank_policy_ref"]
+            _ref_definitions_artifact_ref(v60, f"{path}.policy_linkage.rank_policy_ref")
+        if "reason_codes_ref" in v48:
+            v61 = v48["reason_codes_ref"]
+            _ref_definitions_artifact_ref(
+                v61, f"{path}.policy_linkage.reason_codes_ref"
+            )
+        if "src_conventions_ref" in v48:
+            v62 = v48["src_conventions_ref"]
+            _ref_definitions_artifact_ref(
+                v62, f"{path}.policy_linkage.src_conventions_ref"
+            )
+        if v48.keys() - _PROPS_63:
+            raise ValidationError(
+                f"{path}.policy_linkage has unexpected properties {sorted(v48.keys() - _PROPS_63)}"
+            )
+    if "requirements" in data:
+        v64 = data["requirements"]
+        if not isinstance(v64, dict):
+            raise ValidationError(f"{path}.requirements is not of type 'object'")
+        if not _REQUIRED_65 <= v64.keys():
+            raise ValidationError(
+                f"{path}.requirements is missing required {sorted(_REQUIRED_65 - v64.keys())}"
+            )
+        if "required_evidence" in v64:
+            v66 = v64["required_evidence"]
+            if not isinstance(v66, list):
+                raise ValidationError(
+                    f"{path}.requirements.required_evidence is not of type 'array'"
+                )
+            for i67, v68 in enumerate(v66):
+                if not isinstance(v68, str):
+                    raise ValidationError(
+                        f"{path}.requirements.required_evidence[{i67}] is not of type 'string'"
+                    )
+        if v64.keys() - _PROPS_69:
+            raise ValidationError(
+                f"{path}.requirements has unexpected properties {sorted(v64.keys() - _PROPS_69)}"
+            )
+    if data.keys() - _PROPS_70:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_70)}"
+        )
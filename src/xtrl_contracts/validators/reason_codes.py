@@ -0,0 +1,238 @@
+# generated by tools/contracts/gen.py; never hand-edit
+# source: control/ssot/schemas/reason_codes.schema.json
+from __future__ import annotations
+
+
+class ValidationError(ValueError):
+    """Raised by generated validators; the message starts with the data path."""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[k], two[k]) for k in one)
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def _unique(items):
+    for i, a in enumerate(items):
+        for b in items[i + 1 :]:
+            if _equal(a, b):
+                return False
+    return True
+
+
+_REQUIRED_1 = frozenset(
+    [
+        "classes_precedence",
+        "codes",
+        "restart_mode_by_class",
+        "schema_version",
+        "version",
+    ]
+)
+_ENUM_5 = frozenset(["advisory", "repairable", "stop", "structural"])
+_REQUIRED_7 = frozenset(
+    [
+        "AMBIGUOUS_STATE_DENIED",
+        "BUDGET_EXHAUSTED",
+        "DIFF_BUDGET_EXCEEDED",
+        "DIRTY_REPO_DENIED",
+        "LINT_FAILED",
+        "MISSING_EVIDENCE_DENIED",
+        "SCHEMA_INVALID",
+        "TESTS_FAILED",
+        "TOUCHED_FORBIDDEN_PATH",
+        "TYPECHECK_FAILED",
+    ]
+)
+_PROPS_8 = frozenset([])
+_REQUIRED_11 = frozenset(["class"])
+_ENUM_13 = frozenset(["advisory", "repairable", "stop", "structural"])
+_PROPS_14 = frozenset(["class"])
+_ENUM_16 = frozenset(
+    [
+        "AMBIGUOUS_STATE_DENIED",
+        "BUDGET_EXHAUSTED",
+        "DIFF_BUDGET_EXCEEDED",
+        "DIRTY_REPO_DENIED",
+        "LINT_FAILED",
+        "MISSING_EVIDENCE_DENIED",
+        "SCHEMA_INVALID",
+        "TESTS_FAILED",
+        "TOUCHED_FORBIDDEN_PATH",
+        "TYPECHECK_FAILED",
+    ]
+)
+_REQUIRED_18 = frozenset(["advisory", "repairable", "stop", "structural"])
+_CONST_20 = "REITERATE_FROM_CANDIDATE"
+_CONST_22 = "REITERATE_FROM_CANDIDATE"
+_CONST_24 = "STOP"
+_CONST_26 = "REITERATE_FROM_LAST_GOOD"
+_PROPS_27 = frozenset(["advisory", "repairable", "stop", "structural"])
+_CONST_29 = "0.1"
+_CONST_31 = "0.1"
+_PROPS_32 = frozenset(
+    [
+        "classes_precedence",
+        "codes",
+        "restart_mode_by_class",
+        "schema_version",
+        "version",
+    ]
+)
+
+
+def validate(data, path="$"):
+    """Raise ValidationError if data does not conform; return data."""
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_1 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_1 - data.keys())}"
+        )
+    if "classes_precedence" in data:
+        v2 = data["classes_precedence"]
+        if not isinstance(v2, list):
+            raise ValidationError(f"{path}.classes_precedence is not of type 'array'")
+        if len(v2) < 4:
+            raise ValidationError(f"{path}.classes_precedence has fewer than 4 items")
+        if len(v2) > 4:
+            raise ValidationError(f"{path}.classes_precedence has more than 4 items")
+        if not _unique(v2):
+            raise ValidationError(f"{path}.classes_precedence has non-unique items")
+        for i3, v4 in enumerate(v2):
+            if not isinstance(v4, str):
+                raise ValidationError(
+                    f"{path}.classes_precedence[{i3}] is not of type 'string'"
+                )
+            if not (isinstance(v4, str) and v4 in _ENUM_5):
+                raise ValidationError(
+                    f"{path}.classes_precedence[{i3}] is not one of {sorted(_ENUM_5)}"
+                )
+    if "codes" in data:
+        v6 = data["codes"]
+        if not isinstance(v6, dict):
+            raise ValidationError(f"{path}.codes is not of type 'object'")
+        if not _REQUIRED_7 <= v6.keys():
+            raise ValidationError(
+                f"{path}.codes is missing required {sorted(_REQUIRED_7 - v6.keys())}"
+            )
+        for k9, v10 in v6.items():
+            if k9 in _PROPS_8:
+                continue
+            if not isinstance(v10, dict):
+                raise ValidationError(f"{path}.codes.{k9} is not of type 'object'")
+            if not _REQUIRED_11 <= v10.keys():
+                raise ValidationError(
+                    f"{path}.codes.{k9} is missing required {sorted(_REQUIRED_11 - v10.keys())}"
+                )
+            if "class" in v10:
+                v12 = v10["class"]
+                if not isinstance(v12, str):
+                    raise ValidationError(
+                        f"{path}.codes.{k9}.class is not of type 'string'"
+                    )
+                if not (isinstance(v12, str) and v12 in _ENUM_13):
+                    raise ValidationError(
+                        f"{path}.codes.{k9}.class is not one of {sorted(_ENUM_13)}"
+                    )
+            if v10.keys() - _PROPS_14:
+                raise ValidationError(
+                    f"{path}.codes.{k9} has unexpected properties {sorted(v10.keys() - _PROPS_14)}"
+                )
+        for k15 in v6:
+            if not (isinstance(k15, str) and k15 in _ENUM_16):
+                raise ValidationError(
+                    f"{path}.codes.{k15} is not one of {sorted(_ENUM_16)}"
+                )
+    if "restart_mode_by_class" in data:
+        v17 = data["restart_mode_by_class"]
+        if not isinstance(v17, dict):
+            raise ValidationError(
+                f"{path}.restart_mode_by_class is not of type 'object'"
+            )
+        if not _REQUIRED_18 <= v17.keys():
+            raise ValidationError(
+                f"{path}.restart_mode_by_class is missing required {sorted(_REQUIRED_18 - v17.keys())}"
+            )
+        if "advisory" in v17:
+            v19 = v17["advisory"]
+            if not isinstance(v19, str):
+                raise ValidationError(
+                    f"{path}.restart_mode_by_class.advisory is not of type 'string'"
+                )
+            if not (isinstance(v19, str) and v19 == _CONST_20):
+                raise ValidationError(
+                    f"{path}.restart_mode_by_class.advisory was expected to be {_CONST_20!r}"
+                )
+        if "repairable" in v17:
+            v21 = v17["repairable"]
+            if not isinstance(v21, str):
+                raise ValidationError(
+                    f"{path}.restart_mode_by_class.repairable is not of type 'string'"
+                )
+            if not (isinstance(v21, str) and v21 == _CONST_22):
+                raise ValidationError(
+                    f"{path}.restart_mode_by_class.repairable was expected to be {_CONST_22!r}"
+                )
+        if "stop" in v17:
+            v23 = v17["stop"]
+            if not isinstance(v23, str):
+                raise ValidationError(
+                    f"{path}.restart_mode_by_class.stop is not of type 'string'"
+                )
+            if not (isinstance(v23, str) and v23 == _CONST_24):
+                raise ValidationError(
+                    f"{path}.restart_mode_by_class.stop was expected to be {_CONST_24!r}"
+                )
+        if "structural" in v17:
+            v25 = v17["structural"]
+            if not isinstance(v25, str):
+                raise ValidationError(
+                    f"{path}.restart_mode_by_class.structural is not of type 'string'"
+                )
+            if not (isinstance(v25, str) and v25 == _CONST_26):
+                raise ValidationError(
+                    f"{path}.restart_mode_by_class.structural was expected to be {_CONST_26!r}"
+                )
+        if v17.keys() - _PROPS_27:
+            raise ValidationError(
+                f"{path}.restart_mode_by_class has unexpected properties {sorted(v17.keys() - _PROPS_27)}"
+            )
+    if "schema_version" in data:
+        v28 = data["schema_version"]
+        if not isinstance(v28, str):
+            raise ValidationError(f"{path}.schema_version is not of type 'string'")
+        if not (isinstance(v28, str) and v28 == _CONST_29):
+            raise ValidationError(
+                f"{path}.schema_version was expected to be {_CONST_29!r}"
+            )
+    if "version" in data:
+        v30 = data["version"]
+        if not isinstance(v30, str):
+            raise ValidationError(f"{path}.version is not of type 'string'")
+        if not (isinstance(v30, str) and v30 == _CONST_31):
+            raise ValidationError(f"{path}.version was expected to be {_CONST_31!r}")
+    if data.keys() - _PROPS_32:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_32)}"
+        )
+    return data
@@ -0,0 +1,489 @@
+# generated by tools/contracts/gen.py; never hand-edit
+# source: control/ssot/schemas/run_manifest.schema.json
+from __future__ import annotations
+
+import re
+
+
+class ValidationError(ValueError):
+    """Raised by generated validators; the message starts with the data path."""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[k], two[k]) for k in one)
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def _unique(items):
+    for i, a in enumerate(items):
+        for b in items[i + 1 :]:
+            if _equal(a, b):
+                return False
+    return True
+
+
+_REQUIRED_1 = frozenset(
+    [
+        "artifact_kind",
+        "base_ref",
+        "budgets",
+        "desired_state_id",
+        "last_good_ref",
+        "meta",
+        "output_root",
+        "pattern",
+        "policy",
+        "repo_root",
+        "run_id",
+    ]
+)
+_CONST_3 = "run_manifest"
+_REQUIRED_9 = frozenset(["guards", "policy_linkage", "requirements"])
+_REQUIRED_11 = frozenset(["eval", "spec"])
+_REQUIRED_15 = frozenset(["guard_id", "status"])
+_ENUM_17 = frozenset(["ALLOW", "DENY", "STOP"])
+_ENUM_27 = frozenset(["FAIL", "PASS", "SKIP"])
+_PROPS_28 = frozenset(
+    ["decision", "evidence_refs", "guard_id", "notes", "reason_codes", "status"]
+)
+_REQUIRED_32 = frozenset(
+    ["deny_decision", "deny_reason_code", "evidence_kinds", "guard_id"]
+)
+_ENUM_34 = frozenset(["DENY", "STOP"])
+_PATTERN_36 = re.compile("^[A-Z0-9_]+$")
+_ENUM_42 = frozenset(["advisory", "repairable", "stop", "structural"])
+_PROPS_44 = frozenset(
+    [
+        "deny_decision",
+        "deny_reason_code",
+        "evidence_kinds",
+        "guard_id",
+        "guard_kind",
+        "predicate_ref",
+    ]
+)
+_PROPS_45 = frozenset(["eval", "spec"])
+_REQUIRED_47 = frozenset(["reason_codes_ref"])
+_REQUIRED_49 = frozenset(["path", "version"])
+_PROPS_54 = frozenset(["id", "path", "sha256", "version"])
+_PROPS_61 = frozenset(
+    [
+        "control_strategy_ref",
+        "guardrails_bundle_ref",
+        "pattern_catalog_ref",
+        "plant_spec_ref",
+        "rank_policy_ref",
+        "reason_codes_ref",
+        "src_conventions_ref",
+    ]
+)
+_REQUIRED_63 = frozenset(["required_evidence"])
+_PROPS_67 = frozenset(["required_evidence"])
+_PROPS_68 = frozenset(["guards", "policy_linkage", "requirements"])
+_REQUIRED_72 = frozenset(["allowed_commands", "allowed_paths", "forbidden_paths"])
+_PROPS_82 = frozenset(["allowed_commands", "allowed_paths", "forbidden_paths"])
+_PROPS_86 = frozenset(
+    [
+        "artifact_kind",
+        "base_ref",
+        "budgets",
+        "desired_state_id",
+        "last_good_ref",
+        "meta",
+        "output_root",
+        "pattern",
+        "policy",
+        "prompt_profile_id",
+        "repo_root",
+        "run_id",
+    ]
+)
+
+
+def validate(data, path="$"):
+    """Raise ValidationError if data does not conform; return data."""
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_1 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_1 - data.keys())}"
+        )
+    if "artifact_kind" in data:
+        v2 = data["artifact_kind"]
+        if not (isinstance(v2, str) and v2 == _CONST_3):
+            raise ValidationError(
+                f"{path}.artifact_kind was expected to be {_CONST_3!r}"
+            )
+    if "base_ref" in data:
+        v4 = data["base_ref"]
+        if not isinstance(v4, str):
+            raise ValidationError(f"{path}.base_ref is not of type 'string'")
+        if len(v4) < 1:
+            raise ValidationError(f"{path}.base_ref is shorter than 1")
+    if "budgets" in data:
+        v5 = data["budgets"]
+        if not isinstance(v5, dict):
+            raise ValidationError(f"{path}.budgets is not of type 'object'")
+    if "desired_state_id" in data:
+        v6 = data["desired_state_id"]
+        if not isinstance(v6, str):
+            raise ValidationError(f"{path}.desired_state_id is not of type 'string'")
+        if len(v6) < 1:
+            raise ValidationError(f"{path}.desired_state_id is shorter than 1")
+    if "last_good_ref" in data:
+        v7 = data["last_good_ref"]
+        if not isinstance(v7, str):
+            raise ValidationError(f"{path}.last_good_ref is not of type 'string'")
+        if len(v7) < 1:
+            raise ValidationError(f"{path}.last_good_ref is shorter than 1")
+    if "meta" in data:
+        v8 = data["meta"]
+        _ref_definitions_meta(v8, f"{path}.meta")
+    if "output_root" in data:
+        v69 = data["output_root"]
+        if not isinstance(v69, str):
+            raise ValidationError(f"{path}.output_root is not of type 'string'")
+        if len(v69) < 1:
+            raise ValidationError(f"{path}.output_root is shorter than 1")
+    if "pattern" in data:
+        v70 = data["pattern"]
+        if not isinstance(v70, str):
+            raise ValidationError(f"{path}.pattern is not of type 'string'")
+        if len(v70) < 1:
+            raise ValidationError(f"{path}.pattern is shorter than 1")
+    if "policy" in data:
+        v71 = data["policy"]
+        if not isinstance(v71, dict):
+            raise ValidationError(f"{path}.policy is not of type 'object'")
+        if not _REQUIRED_72 <= v71.keys():
+            raise ValidationError(
+                f"{path}.policy is missing required {sorted(_REQUIRED_72 - v71.keys())}"
+            )
+        if "allowed_commands" in v71:
+            v73 = v71["allowed_commands"]
+            if not isinstance(v73, list):
+                raise ValidationError(
+                    f"{path}.policy.allowed_commands is not of type 'array'"
+                )
+            for i74, v75 in enumerate(v73):
+                if not isinstance(v75, str):
+                    raise ValidationError(
+                        f"{path}.policy.allowed_commands[{i74}] is not of type 'string'"
+                    )
+        if "allowed_paths" in v71:
+            v76 = v71["allowed_paths"]
+            if not isinstance(v76, list):
+                raise ValidationError(
+                    f"{path}.policy.allowed_paths is not of type 'array'"
+                )
+            for i77, v78 in enumerate(v76):
+                if not isinstance(v78, str):
+                    raise ValidationError(
+                        f"{path}.policy.allowed_paths[{i77}] is not of type 'string'"
+                    )
+        if "forbidden_paths" in v71:
+            v79 = v71["forbidden_paths"]
+            if not isinstance(v79, list):
+                raise ValidationError(
+                    f"{path}.policy.forbidden_paths is not of type 'array'"
+                )
+            for i80, v81 in enumerate(v79):
+                if not isinstance(v81, str):
+                    raise ValidationError(
+                        f"{path}.policy.forbidden_paths[{i80}] is not of type 'string'"
+                    )
+        if v71.keys() - _PROPS_82:
+            raise ValidationError(
+                f"{path}.policy has unexpected properties {sorted(v71.keys() - _PROPS_82)}"
+            )
+    if "prompt_profile_id" in data:
+        v83 = data["prompt_profile_id"]
+        if not isinstance(v83, str):
+            raise ValidationError(f"{path}.prompt_profile_id is not of type 'string'")
+        if len(v83) < 1:
+            raise ValidationError(f"{path}.prompt_profile_id is shorter than 1")
+    if "repo_root" in data:
+        v84 = data["repo_root"]
+        if not isinstance(v84, str):
+            raise ValidationError(f"{path}.repo_root is not of type 'string'")
+        if len(v84) < 1:
+            raise ValidationError(f"{path}.repo_root is shorter than 1")
+    if "run_id" in data:
+        v85 = data["run_id"]
+        if not isinstance(v85, str):
+            raise ValidationError(f"{path}.run_id is not of type 'string'")
+        if len(v85) < 1:
+            raise ValidationError(f"{path}.run_id is shorter than 1")
+    if data.keys() - _PROPS_86:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_86)}"
+        )
+    return data
+
+
+def _ref_definitions_guard_eval(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_15 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_15 - data.keys())}"
+        )
+    if "decision" in data:
+        v16 = data["decision"]
+        if not isinstance(v16, str):
+            raise ValidationError(f"{path}.decision is not of type 'string'")
+        if not (isinstance(v16, str) and v16 in _ENUM_17):
+            raise ValidationError(f"{path}.decision is not one of {sorted(_ENUM_17)}")
+    if "evidence_refs" in data:
+        v18 = data["evidence_refs"]
+        if not isinstance(v18, list):
+            raise ValidationError(f"{path}.evidence_refs is not of type 'array'")
+        for i19, v20 in enumerate(v18):
+            if not isinstance(v20, str):
+                raise ValidationError(
+                    f"{path}.evidence_refs[{i19}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v21 = data["guard_id"]
+        if not isinstance(v21, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v21) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "notes" in data:
+        v22 = data["notes"]
+        if not isinstance(v22, str):
+            raise ValidationError(f"{path}.notes is not of type 'string'")
+    if "reason_codes" in data:
+        v23 = data["reason_codes"]
+        if not isinstance(v23, list):
+            raise ValidationError(f"{path}.reason_codes is not of type 'array'")
+        for i24, v25 in enumerate(v23):
+            if not isinstance(v25, str):
+                raise ValidationError(
+                    f"{path}.reason_codes[{i24}] is not of type 'string'"
+                )
+    if "status" in data:
+        v26 = data["status"]
+        if not isinstance(v26, str):
+            raise ValidationError(f"{path}.status is not of type 'string'")
+        if not (isinstance(v26, str) and v26 in _ENUM_27):
+            raise ValidationError(f"{path}.status is not one of {sorted(_ENUM_27)}")
+    if data.keys() - _PROPS_28:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_28)}"
+        )
+
+
+def _ref_definitions_guard_spec(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_32 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_32 - data.keys())}"
+        )
+    if "deny_decision" in data:
+        v33 = data["deny_decision"]
+        if not isinstance(v33, str):
+            raise ValidationError(f"{path}.deny_decision is not of type 'string'")
+        if not (isinstance(v33, str) and v33 in _ENUM_34):
+            raise ValidationError(
+                f"{path}.deny_decision is not one of {sorted(_ENUM_34)}"
+            )
+    if "deny_reason_code" in data:
+        v35 = data["deny_reason_code"]
+        if not isinstance(v35, str):
+            raise ValidationError(f"{path}.deny_reason_code is not of type 'string'")
+        if not _PATTERN_36.search(v35):
+            raise ValidationError(
+                f"{path}.deny_reason_code does not match {_PATTERN_36.pattern!r}"
+            )
+    if "evidence_kinds" in data:
+        v37 = data["evidence_kinds"]
+        if not isinstance(v37, list):
+            raise ValidationError(f"{path}.evidence_kinds is not of type 'array'")
+        for i38, v39 in enumerate(v37):
+            if not isinstance(v39, str):
+                raise ValidationError(
+                    f"{path}.evidence_kinds[{i38}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v40 = data["guard_id"]
+        if not isinstance(v40, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v40) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "guard_kind" in data:
+        v41 = data["guard_kind"]
+        if not isinstance(v41, str):
+            raise ValidationError(f"{path}.guard_kind is not of type 'string'")
+        if not (isinstance(v41, str) and v41 in _ENUM_42):
+            raise ValidationError(f"{path}.guard_kind is not one of {sorted(_ENUM_42)}")
+    if "predicate_ref" in data:
+        v43 = data["predicate_ref"]
+        if not isinstance(v43, str):
+            raise ValidationError(f"{path}.predicate_ref is not of type 'string'")
+        if len(v43) < 1:
+            raise ValidationError(f"{path}.predicate_ref is shorter than 1")
+    if data.keys() - _PROPS_44:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_44)}"
+        )
+
+
+def _ref_definitions_artifact_ref(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_49 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_49 - data.keys())}"
+        )
+    if "id" in data:
+        v50 = data["id"]
+        if not isinstance(v50, str):
+            raise ValidationError(f"{path}.id is not of type 'string'")
+        if len(v50) < 1:
+            raise ValidationError(f"{path}.id is shorter than 1")
+    if "path" in data:
+        v51 = data["path"]
+        if not isinstance(v51, str):
+            raise ValidationError(f"{path}.path is not of type 'string'")
+        if len(v51) < 1:
+            raise ValidationError(f"{path}.path is shorter than 1")
+    if "sha256" in data:
+        v52 = data["sha256"]
+        if not isinstance(v52, str):
+            raise ValidationError(f"{path}.sha256 is not of type 'string'")
+        if len(v52) < 1:
+            raise ValidationError(f"{path}.sha256 is shorter than 1")
+    if "version" in data:
+        v53 = data["version"]
+        if not isinstance(v53, str):
+            raise ValidationError(f"{path}.version is not of type 'string'")
+        if len(v53) < 1:
+            raise ValidationError(f"{path}.version is shorter than 1")
+    if data.keys() - _PROPS_54:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_54)}"
+        )
+
+
+def _ref_definitions_meta(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_9 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_9 - data.keys())}"
+        )
+    if "guards" in data:
+        v10 = data["guards"]
+        if not isinstance(v10, dict):
+            raise ValidationError(f"{path}.guards is not of type 'object'")
+        if not _REQUIRED_11 <= v10.keys():
+            raise ValidationError(
+                f"{path}.guards is missing required {sorted(_REQUIRED_11 - v10.keys())}"
+            )
+        if "eval" in v10:
+            v12 = v10["eval"]
+            if not isinstance(v12, list):
+                raise ValidationError(f"{path}.guards.eval is not of type 'array'")
+            for i13, v14 in enumerate(v12):
+                _ref_definitions_guard_eval(v14, f"{path}.guards.eval[{i13}]")
+        if "spec" in v10:
+            v29 = v10["spec"]
+            if not isinstance(v29, list):
+                raise ValidationError(f"{path}.guards.spec is not of type 'array'")
+            for i30, v31 in enumerate(v29):
+                _ref_definitions_guard_spec(v31, f"{path}.guards.spec[{i30}]")
+        if v10.keys() - _PROPS_45:
+            raise ValidationError(
+                f"{path}.guards has unexpected properties {sorted(v10.keys() - _PROPS_45)}"
+            )
+    if "policy_linkage" in data:
+        v46 = data["policy_linkage"]
+        if not isinstance(v46, dict):
+            raise ValidationError(f"{path}.policy_linkage is not of type 'object'")
+        if not _REQUIRED_47 <= v46.keys():
+            raise ValidationError(
+                f"{path}.policy_linkage is missing required {sorted(_REQUIRED_47 - v46.keys())}"
+            )
+        if "control_strategy_ref" in v46:
+            v48 = v46["control_strategy_ref"]
+            _ref_definitions_artifact_ref(
+                v48, f"{path}.policy_linkage.control_strategy_ref"
+            )
+        if "guardrails_bundle_ref" in v46:
+            v55 = v46["guardrails_bundle_ref"]
+            _ref_definitions_artifact_ref(
+                v55, f"{path}.policy_linkage.guardrails_bundle_ref"
+            )
+        if "pattern_catalog_ref" in v46:
+            v56 = v46["pattern_catalog_ref"]
+            _ref_definitions_artifact_ref(
+                v56, f"{path}.policy_linkage.pattern_catalog_ref"
+            )
+        if "plant_spec_ref" in v46:
+            v57 = v46["plant_spec_ref"]
+            _ref_definitions_artifact_ref(v57, f"{path}.policy_linkage.plant_spec_ref")
+        if "rank_policy_ref" in v46:
+            v58 = v46["rank_policy_ref"]
+            _ref_definitions_artifact_ref(v58, f"{path}.policy_linkage.rank_policy_ref")
+        if "reason_codes_ref" in v46:
+            v59 = v46["reason_codes_ref"]
+            _ref_definitions_artifact_ref(
+                v59, f"{path}.policy_linkage.reason_codes_ref"
+            )
+        if "src_conventions_ref" in v46:
+            v60 = v46["src_conventions_ref"]
+            _ref_definitions_artifact_ref(
+                v60, f"{path}.policy_linkage.src_conventions_ref"
+            )
+        if v46.keys() - _PROPS_61:
+            raise ValidationError(
+                f"{path}.policy_linkage has unexpected properties {sorted(v46.keys() - _PROPS_61)}"
+            )
+    if "requirements" in data:
+        v62 = data["requirements"]
+        if not isinstance(v62, dict):
+            raise ValidationError(f"{path}.requirements is not of type 'object'")
+        if not _REQUIRED_63 <= v62.keys():
+            raise ValidationError(
+                f"{path}.requirements is missing required {sorted(_REQUIRED_63 - v62.keys())}"
+            )
+        if "required_evidence" in v62:
+            v64 = v62["required_evidence"]
+            if not isinstance(v64, list):
+                raise ValidationError(
+                    f"{path}.requirements.required_evidence is not of type 'array'"
+                )
+            for i65, v66 in enumerate(v64):
+                if not isinstance(v66, str):
+                    raise ValidationError(
+                        f"{path}.requirements.required_evidence[{i65}] is not of type 'string'"
+                    )
+        if v62.keys() - _PROPS_67:
+            raise ValidationError(
+                f"{path}.requirements has unexpected properties {sorted(v62.keys() - _PROPS_67)}"
+            )
+    if data.keys() - _PROPS_68:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_68)}"
+        )
@@ -0,0 +1,526 @@
+# generated by tools/contracts/gen.py; never hand-edit
+# source: control/ssot/schemas/src_conventions.schema.json
+from __future__ import annotations
+
+import re
+
+
+class ValidationError(ValueError):
+    """Raised by generated validators; the message starts with the data path."""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[k], two[k]) for k in one)
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def _unique(items):
+    for i, a in enumerate(items):
+        for b in items[i + 1 :]:
+            if _equal(a, b):
+                return False
+    return True
+
+
+_REQUIRED_1 = frozenset(
+    ["forbidden", "layers", "meta", "package_root", "public_api", "schema_version"]
+)
+_REQUIRED_3 = frozenset(
+    ["cross_layer_imports", "new_top_level_roots", "relative_escape", "star_imports"]
+)
+_PROPS_8 = frozenset(
+    ["cross_layer_imports", "new_top_level_roots", "relative_escape", "star_imports"]
+)
+_REQUIRED_10 = frozenset(["allow_imports", "map"])
+_REQUIRED_14 = frozenset(["from", "to"])
+_PROPS_17 = frozenset(["from", "to"])
+_PROPS_19 = frozenset([])
+_PROPS_22 = frozenset(["allow_imports", "map"])
+_REQUIRED_24 = frozenset(["guards", "policy_linkage", "requirements"])
+_REQUIRED_26 = frozenset(["eval", "spec"])
+_REQUIRED_30 = frozenset(["guard_id", "status"])
+_ENUM_32 = frozenset(["ALLOW", "DENY", "STOP"])
+_ENUM_42 = frozenset(["FAIL", "PASS", "SKIP"])
+_PROPS_43 = frozenset(
+    ["decision", "evidence_refs", "guard_id", "notes", "reason_codes", "status"]
+)
+_REQUIRED_47 = frozenset(
+    ["deny_decision", "deny_reason_code", "evidence_kinds", "guard_id"]
+)
+_ENUM_49 = frozenset(["DENY", "STOP"])
+_PATTERN_51 = re.compile("^[A-Z0-9_]+$")
+_ENUM_57 = frozenset(["advisory", "repairable", "stop", "structural"])
+_PROPS_59 = frozenset(
+    [
+        "deny_decision",
+        "deny_reason_code",
+        "evidence_kinds",
+        "guard_id",
+        "guard_kind",
+        "predicate_ref",
+    ]
+)
+_PROPS_60 = frozenset(["eval", "spec"])
+_REQUIRED_62 = frozenset(["reason_codes_ref"])
+_REQUIRED_64 = frozenset(["path", "version"])
+_PROPS_69 = frozenset(["id", "path", "sha256", "version"])
+_PROPS_76 = frozenset(
+    [
+        "control_strategy_ref",
+        "guardrails_bundle_ref",
+        "pattern_catalog_ref",
+        "plant_spec_ref",
+        "rank_policy_ref",
+        "reason_codes_ref",
+        "src_conventions_ref",
+    ]
+)
+_REQUIRED_78 = frozenset(["required_evidence"])
+_PROPS_82 = frozenset(["required_evidence"])
+_PROPS_83 = frozenset(["guards", "policy_linkage", "requirements"])
+_REQUIRED_85 = frozenset(["path", "pattern"])
+_PROPS_88 = frozenset(["path", "pattern"])
+_REQUIRED_90 = frozenset(["definition", "module"])
+_ENUM_93 = frozenset(["init_exports_only"])
+_PROPS_95 = frozenset(["allow_star_import", "definition", "module"])
+_PROPS_97 = frozenset(
+    ["forbidden", "layers", "meta", "package_root", "public_api", "schema_version"]
+)
+
+
+def validate(data, path="$"):
+    """Raise ValidationError if data does not conform; return data."""
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_1 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_1 - data.keys())}"
+        )
+    if "forbidden" in data:
+        v2 = data["forbidden"]
+        if not isinstance(v2, dict):
+            raise ValidationError(f"{path}.forbidden is not of type 'object'")
+        if not _REQUIRED_3 <= v2.keys():
+            raise ValidationError(
+                f"{path}.forbidden is missing required {sorted(_REQUIRED_3 - v2.keys())}"
+            )
+        if "cross_layer_imports" in v2:
+            v4 = v2["cross_layer_imports"]
+            if not isinstance(v4, bool):
+                raise ValidationError(
+                    f"{path}.forbidden.cross_layer_imports is not of type 'boolean'"
+                )
+        if "new_top_level_roots" in v2:
+            v5 = v2["new_top_level_roots"]
+            if not isinstance(v5, bool):
+                raise ValidationError(
+                    f"{path}.forbidden.new_top_level_roots is not of type 'boolean'"
+                )
+        if "relative_escape" in v2:
+            v6 = v2["relative_escape"]
+            if not isinstance(v6, bool):
+                raise ValidationError(
+                    f"{path}.forbidden.relative_escape is not of type 'boolean'"
+                )
+        if "star_imports" in v2:
+            v7 = v2["star_imports"]
+            if not isinstance(v7, bool):
+                raise ValidationError(
+                    f"{path}.forbidden.star_imports is not of type 'boolean'"
+                )
+        if v2.keys() - _PROPS_8:
+            raise ValidationError(
+                f"{path}.forbidden has unexpected properties {sorted(v2.keys() - _PROPS_8)}"
+            )
+    if "layers" in data:
+        v9 = data["layers"]
+        if not isinstance(v9, dict):
+            raise ValidationError(f"{path}.layers is not of type 'object'")
+        if not _REQUIRED_10 <= v9.keys():
+            raise ValidationError(
+                f"{path}.layers is missing required {sorted(_REQUIRED_10 - v9.keys())}"
+            )
+        if "allow_imports" in v9:
+            v11 = v9["allow_imports"]
+            if not isinstance(v11, list):
+                raise ValidationError(
+                    f"{path}.layers.allow_imports is not of type 'array'"
+                )
+            for i12, v13 in enumerate(v11):
+                if not isinstance(v13, dict):
+                    raise ValidationError(
+                        f"{path}.layers.allow_imports[{i12}] is not of type 'object'"
+                    )
+                if not _REQUIRED_14 <= v13.keys():
+                    raise ValidationError(
+                        f"{path}.layers.allow_imports[{i12}] is missing required {sorted(_REQUIRED_14 - v13.keys())}"
+                    )
+                if "from" in v13:
+                    v15 = v13["from"]
+                    if not isinstance(v15, str):
+                        raise ValidationError(
+                            f"{path}.layers.allow_imports[{i12}].from is not of type 'string'"
+                        )
+                if "to" in v13:
+                    v16 = v13["to"]
+                    if not isinstance(v16, str):
+                        raise ValidationError(
+                            f"{path}.layers.allow_imports[{i12}].to is not of type 'string'"
+                        )
+                if v13.keys() - _PROPS_17:
+                    raise ValidationError(
+                        f"{path}.layers.allow_imports[{i12}] has unexpected properties {sorted(v13.keys() - _PROPS_17)}"
+                    )
+        if "map" in v9:
+            v18 = v9["map"]
+            if not isinstance(v18, dict):
+                raise ValidationError(f"{path}.layers.map is not of type 'object'")
+            for k20, v21 in v18.items():
+                if k20 in _PROPS_19:
+                    continue
+                if not isinstance(v21, str):
+                    raise ValidationError(
+                        f"{path}.layers.map.{k20} is not of type 'string'"
+                    )
+        if v9.keys() - _PROPS_22:
+            raise ValidationError(
+                f"{path}.layers has unexpected properties {sorted(v9.keys() - _PROPS_22)}"
+            )
+    if "meta" in data:
+        v23 = data["meta"]
+        _ref_definitions_meta(v23, f"{path}.meta")
+    if "package_root" in data:
+        v84 = data["package_root"]
+        if not isinstance(v84, dict):
+            raise ValidationError(f"{path}.package_root is not of type 'object'")
+        if not _REQUIRED_85 <= v84.keys():
+            raise ValidationError(
+                f"{path}.package_root is missing required {sorted(_REQUIRED_85 - v84.keys())}"
+            )
+        if "path" in v84:
+            v86 = v84["path"]
+            if not isinstance(v86, str):
+                raise ValidationError(
+                    f"{path}.package_root.path is not of type 'string'"
+                )
+        if "pattern" in v84:
+            v87 = v84["pattern"]
+            if not isinstance(v87, str):
+                raise ValidationError(
+                    f"{path}.package_root.pattern is not of type 'string'"
+                )
+        if v84.keys() - _PROPS_88:
+            raise ValidationError(
+                f"{path}.package_root has unexpected properties {sorted(v84.keys() - _PROPS_88)}"
+            )
+    if "public_api" in data:
+        v89 = data["public_api"]
+        if not isinstance(v89, dict):
+            raise ValidationError(f"{path}.public_api is not of type 'object'")
+        if not _REQUIRED_90 <= v89.keys():
+            raise ValidationError(
+                f"{path}.public_api is missing required {sorted(_REQUIRED_90 - v89.keys())}"
+            )
+        if "allow_star_import" in v89:
+            v91 = v89["allow_star_import"]
+            if not isinstance(v91, bool):
+                raise ValidationError(
+                    f"{path}.public_api.allow_star_import is not of type 'boolean'"
+                )
+        if "definition" in v89:
+            v92 = v89["definition"]
+            if not isinstance(v92, str):
+                raise ValidationError(
+                    f"{path}.public_api.definition is not of type 'string'"
+                )
+            if not (isinstance(v92, str) and v92 in _ENUM_93):
+                raise ValidationError(
+                    f"{path}.public_api.definition is not one of {sorted(_ENUM_93)}"
+                )
+        if "module" in v89:
+            v94 = v89["module"]
+            if not isinstance(v94, str):
+                raise ValidationError(
+                    f"{path}.public_api.module is not of type 'string'"
+                )
+        if v89.keys() - _PROPS_95:
+            raise ValidationError(
+                f"{path}.public_api has unexpected properties {sorted(v89.keys() - _PROPS_95)}"
+            )
+    if "schema_version" in data:
+        v96 = data["schema_version"]
+        if not isinstance(v96, str):
+            raise ValidationError(f"{path}.schema_version is not of type 'string'")
+    if data.keys() - _PROPS_97:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_97)}"
+        )
+    return data
+
+
+def _ref_definitions_guard_eval(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_30 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_30 - data.keys())}"
+        )
+    if "decision" in data:
+        v31 = data["decision"]
+        if not isinstance(v31, str):
+            raise ValidationError(f"{path}.decision is not of type 'string'")
+        if not (isinstance(v31, str) and v31 in _ENUM_32):
+            raise ValidationError(f"{path}.decision is not one of {sorted(_ENUM_32)}")
+    if "evidence_refs" in data:
+        v33 = data["evidence_refs"]
+        if not isinstance(v33, list):
+            raise ValidationError(f"{path}.evidence_refs is not of type 'array'")
+        for i34, v35 in enumerate(v33):
+            if not isinstance(v35, str):
+                raise ValidationError(
+                    f"{path}.evidence_refs[{i34}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v36 = data["guard_id"]
+        if not isinstance(v36, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v36) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "notes" in data:
+        v37 = data["notes"]
+        if not isinstance(v37, str):
+            raise ValidationError(f"{path}.notes is not of type 'string'")
+    if "reason_codes" in data:
+        v38 = data["reason_codes"]
+        if not isinstance(v38, list):
+            raise ValidationError(f"{path}.reason_codes is not of type 'array'")
+        for i39, v40 in enumerate(v38):
+            if not isinstance(v40, str):
+                raise ValidationError(
+                    f"{path}.reason_codes[{i39}] is not of type 'string'"
+                )
+    if "status" in data:
+        v41 = data["status"]
+        if not isinstance(v41, str):
+            raise ValidationError(f"{path}.status is not of type 'string'")
+        if not (isinstance(v41, str) and v41 in _ENUM_42):
+            raise ValidationError(f"{path}.status is not one of {sorted(_ENUM_42)}")
+    if data.keys() - _PROPS_43:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_43)}"
+        )
+
+
+def _ref_definitions_guard_spec(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_47 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_47 - data.keys())}"
+        )
+    if "deny_decision" in data:
+        v48 = data["deny_decision"]
+        if not isinstance(v48, str):
+            raise ValidationError(f"{path}.deny_decision is not of type 'string'")
+        if not (isinstance(v48, str) and v48 in _ENUM_49):
+            raise ValidationError(
+                f"{path}.deny_decision is not one of {sorted(_ENUM_49)}"
+            )
+    if "deny_reason_code" in data:
+        v50 = data["deny_reason_code"]
+        if not isinstance(v50, str):
+            raise ValidationError(f"{path}.deny_reason_code is not of type 'string'")
+        if not _PATTERN_51.search(v50):
+            raise ValidationError(
+                f"{path}.deny_reason_code does not match {_PATTERN_51.pattern!r}"
+            )
+    if "evidence_kinds" in data:
+        v52 = data["evidence_kinds"]
+        if not isinstance(v52, list):
+            raise ValidationError(f"{path}.evidence_kinds is not of type 'array'")
+        for i53, v54 in enumerate(v52):
+            if not isinstance(v54, str):
+                raise ValidationError(
+                    f"{path}.evidence_kinds[{i53}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v55 = data["guard_id"]
+        if not isinstance(v55, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v55) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "guard_kind" in data:
+        v56 = data["guard_kind"]
+        if not isinstance(v56, str):
+            raise ValidationError(f"{path}.guard_kind is not of type 'string'")
+        if not (isinstance(v56, str) and v56 in _ENUM_57):
+            raise ValidationError(f"{path}.guard_kind is not one of {sorted(_ENUM_57)}")
+    if "predicate_ref" in data:
+        v58 = data["predicate_ref"]
+        if not isinstance(v58, str):
+            raise ValidationError(f"{path}.predicate_ref is not of type 'string'")
+        if len(v58) < 1:
+            raise ValidationError(f"{path}.predicate_ref is shorter than 1")
+    if data.keys() - _PROPS_59:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_59)}"
+        )
+
+
+def _ref_definitions_artifact_ref(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_64 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_64 - data.keys())}"
+        )
+    if "id" in data:
+        v65 = data["id"]
+        if not isinstance(v65, str):
+            raise ValidationError(f"{path}.id is not of type 'string'")
+        if len(v65) < 1:
+            raise ValidationError(f"{path}.id is shorter than 1")
+    if "path" in data:
+        v66 = data["path"]
+        if not isinstance(v66, str):
+            raise ValidationError(f"{path}.path is not of type 'string'")
+        if len(v66) < 1:
+            raise ValidationError(f"{path}.path is shorter than 1")
+    if "sha256" in data:
+        v67 = data["sha256"]
+        if not isinstance(v67, str):
+            raise ValidationError(f"{path}.sha256 is not of type 'string'")
+        if len(v67) < 1:
+            raise ValidationError(f"{path}.sha256 is shorter than 1")
+    if "version" in data:
+        v68 = data["version"]
+        if not isinstance(v68, str):
+            raise ValidationError(f"{path}.version is not of type 'string'")
+        if len(v68) < 1:
+            raise ValidationError(f"{path}.version is shorter than 1")
+    if data.keys() - _PROPS_69:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_69)}"
+        )
+
+
+def _ref_definitions_meta(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_24 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_24 - data.keys())}"
+        )
+    if "guards" in data:
+        v25 = data["guards"]
+        if not isinstance(v25, dict):
+            raise ValidationError(f"{path}.guards is not of type 'object'")
+        if not _REQUIRED_26 <= v25.keys():
+            raise ValidationError(
+                f"{path}.guards is missing required {sorted(_REQUIRED_26 - v25.keys())}"
+            )
+        if "eval" in v25:
+            v27 = v25["eval"]
+            if not isinstance(v27, list):
+                raise ValidationError(f"{path}.guards.eval is not of type 'array'")
+            for i28, v29 in enumerate(v27):
+                _ref_definitions_guard_eval(v29, f"{path}.guards.eval[{i28}]")
+        if "spec" in v25:
+            v44 = v25["spec"]
+            if not isinstance(v44, list):
+                raise ValidationError(f"{path}.guards.spec is not of type 'array'")
+            for i45, v46 in enumerate(v44):
+                _ref_definitions_guard_spec(v46, f"{path}.guards.spec[{i45}]")
+        if v25.keys() - _PROPS_60:
+            raise ValidationError(
+                f"{path}.guards has unexpected properties {sorted(v25.keys() - _PROPS_60)}"
+            )
+    if "policy_linkage" in data:
+        v61 = data["policy_linkage"]
+        if not isinstance(v61, dict):
+            raise ValidationError(f"{path}.policy_linkage is not of type 'object'")
+        if not _REQUIRED_62 <= v61.keys():
+            raise ValidationError(
+                f"{path}.policy_linkage is missing required {sorted(_REQUIRED_62 - v61.keys())}"
+            )
+        if "control_strategy_ref" in v61:
+            v63 = v61["control_strategy_ref"]
+            _ref_definitions_artifact_ref(
+                v63, f"{path}.policy_linkage.control_strategy_ref"
+            )
+        if "guardrails_bundle_ref" in v61:
+            v70 = v61["guardrails_bundle_ref"]
+            _ref_definitions_artifact_ref(
+                v70, f"{path}.policy_linkage.guardrails_bundle_ref"
+            )
+        if "pattern_catalog_ref" in v61:
+            v71 = v61["pattern_catalog_ref"]
+            _ref_definitions_artifact_ref(
+                v71, f"{path}.policy_linkage.pattern_catalog_ref"
+            )
+        if "plant_spec_ref" in v61:
+            v72 = v61["plant_spec_ref"]
+            _ref_definitions_artifact_ref(v72, f"{path}.policy_linkage.plant_spec_ref")
+        if "rank_policy_ref" in v61:
+            v73 = v61["rank_policy_ref"]
+            _ref_definitions_artifact_ref(v73, f"{path}.policy_linkage.rank_policy_ref")
+        if "reason_codes_ref" in v61:
+            v74 = v61["reason_codes_ref"]
+            _ref_definitions_artifact_ref(
+                v74, f"{path}.policy_linkage.reason_codes_ref"
+            )
+        if "src_conventions_ref" in v61:
+            v75 = v61["src_conventions_ref"]
+            _ref_definitions_artifact_ref(
+                v75, f"{path}.policy_linkage.src_conventions_ref"
+            )
+        if v61.keys() - _PROPS_76:
+            raise ValidationError(
+                f"{path}.policy_linkage has unexpected properties {sorted(v61.keys() - _PROPS_76)}"
+            )
+    if "requirements" in data:
+        v77 = data["requirements"]
+        if not isinstance(v77, dict):
+            raise ValidationError(f"{path}.requirements is not of type 'object'")
+        if not _REQUIRED_78 <= v77.keys():
+            raise ValidationError(
+                f"{path}.requirements is missing required {sorted(_REQUIRED_78 - v77.keys())}"
+            )
+        if "required_evidence" in v77:
+            v79 = v77["required_evidence"]
+            if not isinstance(v79, list):
+                raise ValidationError(
+                    f"{path}.requirements.required_evidence is not of type 'array'"
+                )
+            for i80, v81 in enumerate(v79):
+                if not isinstance(v81, str):
+                    raise ValidationError(
+                        f"{path}.requirements.required_evidence[{i80}] is not of type 'string'"
+                    )
+        if v77.keys() - _PROPS_82:
+            raise ValidationError(
+                f"{path}.requirements has unexpected properties {sorted(v77.keys() - _PROPS_82)}"
+            )
+    if data.keys() - _PROPS_83:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_83)}"
+        )
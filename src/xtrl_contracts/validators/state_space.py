@@ -0,0 +1,739 @@
+# generated by tools/contracts/gen.py; never hand-edit
+# source: control/ssot/schemas/state_space.schema.json
+from __future__ import annotations
+
+import re
+
+
+class ValidationError(ValueError):
+    """Raised by generated validators; the message starts with the data path."""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[k], two[k]) for k in one)
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def _unique(items):
+    for i, a in enumerate(items):
+        for b in items[i + 1 :]:
+            if _equal(a, b):
+                return False
+    return True
+
+
+_REQUIRED_1 = frozenset(
+    [
+        "contract",
+        "generated_at_utc",
+        "latest",
+        "meta",
+        "repo",
+        "schema_version",
+        "state_resolution",
+        "transition_evaluation",
+    ]
+)
+_REQUIRED_3 = frozenset(["actions", "allowed_paths", "budgets"])
+_PROPS_11 = frozenset(["actions", "allowed_paths", "budgets"])
+_REQUIRED_13 = frozenset(["decision", "reason_codes"])
+_PROPS_18 = frozenset(["decision", "reason_codes"])
+_REQUIRED_21 = frozenset(["ledger_tail", "state_latest_path"])
+_PROPS_24 = frozenset(["ledger_tail", "state_latest_path"])
+_REQUIRED_26 = frozenset(["guards", "policy_linkage", "requirements"])
+_REQUIRED_28 = frozenset(["eval", "spec"])
+_REQUIRED_32 = frozenset(["guard_id", "status"])
+_ENUM_34 = frozenset(["ALLOW", "DENY", "STOP"])
+_ENUM_44 = frozenset(["FAIL", "PASS", "SKIP"])
+_PROPS_45 = frozenset(
+    ["decision", "evidence_refs", "guard_id", "notes", "reason_codes", "status"]
+)
+_REQUIRED_49 = frozenset(
+    ["deny_decision", "deny_reason_code", "evidence_kinds", "guard_id"]
+)
+_ENUM_51 = frozenset(["DENY", "STOP"])
+_PATTERN_53 = re.compile("^[A-Z0-9_]+$")
+_ENUM_59 = frozenset(["advisory", "repairable", "stop", "structural"])
+_PROPS_61 = frozenset(
+    [
+        "deny_decision",
+        "deny_reason_code",
+        "evidence_kinds",
+        "guard_id",
+        "guard_kind",
+        "predicate_ref",
+    ]
+)
+_PROPS_62 = frozenset(["eval", "spec"])
+_REQUIRED_64 = frozenset(["reason_codes_ref"])
+_REQUIRED_66 = frozenset(["path", "version"])
+_PROPS_71 = frozenset(["id", "path", "sha256", "version"])
+_PROPS_78 = frozenset(
+    [
+        "control_strategy_ref",
+        "guardrails_bundle_ref",
+        "pattern_catalog_ref",
+        "plant_spec_ref",
+        "rank_policy_ref",
+        "reason_codes_ref",
+        "src_conventions_ref",
+    ]
+)
+_REQUIRED_80 = frozenset(["required_evidence"])
+_PROPS_84 = frozenset(["required_evidence"])
+_PROPS_85 = frozenset(["guards", "policy_linkage", "requirements"])
+_REQUIRED_87 = frozenset(["base_ref", "clean", "head_sha", "repo_key", "repo_root"])
+_PROPS_93 = frozenset(["base_ref", "clean", "head_sha", "repo_key", "repo_root"])
+_REQUIRED_96 = frozenset(["candidates", "status", "unknowns"])
+_REQUIRED_100 = frozenset(["confidence", "state_id"])
+_PROPS_103 = frozenset(["confidence", "state_id"])
+_ENUM_106 = frozenset(["AMBIGUOUS", "RESOLVED", "UNKNOWN"])
+_REQUIRED_110 = frozenset(["key", "needed_by"])
+_PROPS_113 = frozenset(["key", "needed_by"])
+_PROPS_114 = frozenset(["candidates", "state_id", "status", "unknowns"])
+_REQUIRED_116 = frozenset(["admissible", "denied"])
+_REQUIRED_123 = frozenset(
+    ["decision", "evidence_refs", "reason_codes", "transition_id", "violated_guards"]
+)
+_ENUM_125 = frozenset(["DENY", "STOP"])
+_PROPS_136 = frozenset(
+    ["decision", "evidence_refs", "reason_codes", "transition_id", "violated_guards"]
+)
+_PROPS_137 = frozenset(["admissible", "denied"])
+_PROPS_138 = frozenset(
+    [
+        "contract",
+        "decision_digest",
+        "generated_at_utc",
+        "latest",
+        "meta",
+        "repo",
+        "schema_version",
+        "state_resolution",
+        "transition_evaluation",
+    ]
+)
+
+
+def validate(data, path="$"):
+    """Raise ValidationError if data does not conform; return data."""
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_1 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_1 - data.keys())}"
+        )
+    if "contract" in data:
+        v2 = data["contract"]
+        if not isinstance(v2, dict):
+            raise ValidationError(f"{path}.contract is not of type 'object'")
+        if not _REQUIRED_3 <= v2.keys():
+            raise ValidationError(
+                f"{path}.contract is missing required {sorted(_REQUIRED_3 - v2.keys())}"
+            )
+        if "actions" in v2:
+            v4 = v2["actions"]
+            if not isinstance(v4, list):
+                raise ValidationError(f"{path}.contract.actions is not of type 'array'")
+            for i5, v6 in enumerate(v4):
+                if not isinstance(v6, str):
+                    raise ValidationError(
+                        f"{path}.contract.actions[{i5}] is not of type 'string'"
+                    )
+        if "allowed_paths" in v2:
+            v7 = v2["allowed_paths"]
+            if not isinstance(v7, list):
+                raise ValidationError(
+                    f"{path}.contract.allowed_paths is not of type 'array'"
+                )
+            for i8, v9 in enumerate(v7):
+                if not isinstance(v9, str):
+                    raise ValidationError(
+                        f"{path}.contract.allowed_paths[{i8}] is not of type 'string'"
+                    )
+        if "budgets" in v2:
+            v10 = v2["budgets"]
+            if not isinstance(v10, dict):
+                raise ValidationError(
+                    f"{path}.contract.budgets is not of type 'object'"
+                )
+        if v2.keys() - _PROPS_11:
+            raise ValidationError(
+                f"{path}.contract has unexpected properties {sorted(v2.keys() - _PROPS_11)}"
+            )
+    if "decision_digest" in data:
+        v12 = data["decision_digest"]
+        if not isinstance(v12, dict):
+            raise ValidationError(f"{path}.decision_digest is not of type 'object'")
+        if not _REQUIRED_13 <= v12.keys():
+            raise ValidationError(
+                f"{path}.decision_digest is missing required {sorted(_REQUIRED_13 - v12.keys())}"
+            )
+        if "decision" in v12:
+            v14 = v12["decision"]
+            if not isinstance(v14, str):
+                raise ValidationError(
+                    f"{path}.decision_digest.decision is not of type 'string'"
+                )
+        if "reason_codes" in v12:
+            v15 = v12["reason_codes"]
+            if not isinstance(v15, list):
+                raise ValidationError(
+                    f"{path}.decision_digest.reason_codes is not of type 'array'"
+                )
+            for i16, v17 in enumerate(v15):
+                if not isinstance(v17, str):
+                    raise ValidationError(
+                        f"{path}.decision_digest.reason_codes[{i16}] is not of type 'string'"
+                    )
+        if v12.keys() - _PROPS_18:
+            raise ValidationError(
+                f"{path}.decision_digest has unexpected properties {sorted(v12.keys() - _PROPS_18)}"
+            )
+    if "generated_at_utc" in data:
+        v19 = data["generated_at_utc"]
+        if not isinstance(v19, str):
+            raise ValidationError(f"{path}.generated_at_utc is not of type 'string'")
+    if "latest" in data:
+        v20 = data["latest"]
+        if not isinstance(v20, dict):
+            raise ValidationError(f"{path}.latest is not of type 'object'")
+        if not _REQUIRED_21 <= v20.keys():
+            raise ValidationError(
+                f"{path}.latest is missing required {sorted(_REQUIRED_21 - v20.keys())}"
+            )
+        if "ledger_tail" in v20:
+            v22 = v20["ledger_tail"]
+            if not isinstance(v22, list):
+                raise ValidationError(
+                    f"{path}.latest.ledger_tail is not of type 'array'"
+                )
+        if "state_latest_path" in v20:
+            v23 = v20["state_latest_path"]
+            if not isinstance(v23, str):
+                raise ValidationError(
+                    f"{path}.latest.state_latest_path is not of type 'string'"
+                )
+        if v20.keys() - _PROPS_24:
+            raise ValidationError(
+                f"{path}.latest has unexpected properties {sorted(v20.keys() - _PROPS_24)}"
+            )
+    if "meta" in data:
+        v25 = data["meta"]
+        _ref_definitions_meta(v25, f"{path}.meta")
+    if "repo" in data:
+        v86 = data["repo"]
+        if not isinstance(v86, dict):
+            raise ValidationError(f"{path}.repo is not of type 'object'")
+        if not _REQUIRED_87 <= v86.keys():
+            raise ValidationError(
+                f"{path}.repo is missing required {sorted(_REQUIRED_87 - v86.keys())}"
+            )
+        if "base_ref" in v86:
+            v88 = v86["base_ref"]
+            if not isinstance(v88, str):
+                raise ValidationError(f"{path}.repo.base_ref is not of type 'string'")
+        if "clean" in v86:
+            v89 = v86["clean"]
+            if not isinstance(v89, bool):
+                raise ValidationError(f"{path}.repo.clean is not of type 'boolean'")
+        if "head_sha" in v86:
+            v90 = v86["head_sha"]
+            if not isinstance(v90, str):
+                raise ValidationError(f"{path}.repo.head_sha is not of type 'string'")
+        if "repo_key" in v86:
+            v91 = v86["repo_key"]
+            if not isinstance(v91, str):
+                raise ValidationError(f"{path}.repo.repo_key is not of type 'string'")
+        if "repo_root" in v86:
+            v92 = v86["repo_root"]
+            if not isinstance(v92, str):
+                raise ValidationError(f"{path}.repo.repo_root is not of type 'string'")
+        if v86.keys() - _PROPS_93:
+            raise ValidationError(
+                f"{path}.repo has unexpected properties {sorted(v86.keys() - _PROPS_93)}"
+            )
+    if "schema_version" in data:
+        v94 = data["schema_version"]
+        if not isinstance(v94, str):
+            raise ValidationError(f"{path}.schema_version is not of type 'string'")
+    if "state_resolution" in data:
+        v95 = data["state_resolution"]
+        if not isinstance(v95, dict):
+            raise ValidationError(f"{path}.state_resolution is not of type 'object'")
+        if not _REQUIRED_96 <= v95.keys():
+            raise ValidationError(
+                f"{path}.state_resolution is missing required {sorted(_REQUIRED_96 - v95.keys())}"
+            )
+        if "candidates" in v95:
+            v97 = v95["candidates"]
+            if not isinstance(v97, list):
+                raise ValidationError(
+                    f"{path}.state_resolution.candidates is not of type 'array'"
+                )
+            for i98, v99 in enumerate(v97):
+                if not isinstance(v99, dict):
+                    raise ValidationError(
+                        f"{path}.state_resolution.candidates[{i98}] is not of type 'object'"
+                    )
+                if not _REQUIRED_100 <= v99.keys():
+                    raise ValidationError(
+                        f"{path}.state_resolution.candidates[{i98}] is missing required {sorted(_REQUIRED_100 - v99.keys())}"
+                    )
+                if "confidence" in v99:
+                    v101 = v99["confidence"]
+                    if not _is_number(v101):
+                        raise ValidationError(
+                            f"{path}.state_resolution.candidates[{i98}].confidence is not of type 'number'"
+                        )
+                    if v101 < 0:
+                        raise ValidationError(
+                            f"{path}.state_resolution.candidates[{i98}].confidence violates minimum 0"
+                        )
+                    if v101 > 1:
+                        raise ValidationError(
+                            f"{path}.state_resolution.candidates[{i98}].confidence violates maximum 1"
+                        )
+                if "state_id" in v99:
+                    v102 = v99["state_id"]
+                    if not isinstance(v102, str):
+                        raise ValidationError(
+                            f"{path}.state_resolution.candidates[{i98}].state_id is not of type 'string'"
+                        )
+                    if len(v102) < 1:
+                        raise ValidationError(
+                            f"{path}.state_resolution.candidates[{i98}].state_id is shorter than 1"
+                        )
+                if v99.keys() - _PROPS_103:
+                    raise ValidationError(
+                        f"{path}.state_resolution.candidates[{i98}] has unexpected properties {sorted(v99.keys() - _PROPS_103)}"
+                    )
+        if "state_id" in v95:
+            v104 = v95["state_id"]
+            if not isinstance(v104, str):
+                raise ValidationError(
+                    f"{path}.state_resolution.state_id is not of type 'string'"
+                )
+        if "status" in v95:
+            v105 = v95["status"]
+            if not isinstance(v105, str):
+                raise ValidationError(
+                    f"{path}.state_resolution.status is not of type 'string'"
+                )
+            if not (isinstance(v105, str) and v105 in _ENUM_106):
+                raise ValidationError(
+                    f"{path}.state_resolution.status is not one of {sorted(_ENUM_106)}"
+                )
+        if "unknowns" in v95:
+            v107 = v95["unknowns"]
+            if not isinstance(v107, list):
+                raise ValidationError(
+                    f"{path}.state_resolution.unknowns is not of type 'array'"
+                )
+            for i108, v109 in enumerate(v107):
+                if not isinstance(v109, dict):
+                    raise ValidationError(
+                        f"{path}.state_resolution.unknowns[{i108}] is not of type 'object'"
+                    )
+                if not _REQUIRED_110 <= v109.keys():
+                    raise ValidationError(
+                        f"{path}.state_resolution.unknowns[{i108}] is missing required {sorted(_REQUIRED_110 - v109.keys())}"
+                    )
+                if "key" in v109:
+                    v111 = v109["key"]
+                    if not isinstance(v111, str):
+                        raise ValidationError(
+                            f"{path}.state_resolution.unknowns[{i108}].key is not of type 'string'"
+                        )
+                    if len(v111) < 1:
+                        raise ValidationError(
+                            f"{path}.state_resolution.unknowns[{i108}].key is shorter than 1"
+                        )
+                if "needed_by" in v109:
+                    v112 = v109["needed_by"]
+                    if not isinstance(v112, str):
+                        raise ValidationError(
+                            f"{path}.state_resolution.unknowns[{i108}].needed_by is not of type 'string'"
+                        )
+                    if len(v112) < 1:
+                        raise ValidationError(
+                            f"{path}.state_resolution.unknowns[{i108}].needed_by is shorter than 1"
+                        )
+                if v109.keys() - _PROPS_113:
+                    raise ValidationError(
+                        f"{path}.state_resolution.unknowns[{i108}] has unexpected properties {sorted(v109.keys() - _PROPS_113)}"
+                    )
+        if v95.keys() - _PROPS_114:
+            raise ValidationError(
+                f"{path}.state_resolution has unexpected properties {sorted(v95.keys() - _PROPS_114)}"
+            )
+    if "transition_evaluation" in data:
+        v115 = data["transition_evaluation"]
+        if not isinstance(v115, dict):
+            raise ValidationError(
+                f"{path}.transition_evaluation is not of type 'object'"
+            )
+        if not _REQUIRED_116 <= v115.keys():
+            raise ValidationError(
+                f"{path}.transition_evaluation is missing required {sorted(_REQUIRED_116 - v115.keys())}"
+            )
+        if "admissible" in v115:
+            v117 = v115["admissible"]
+            if not isinstance(v117, list):
+                raise ValidationError(
+                    f"{path}.transition_evaluation.admissible is not of type 'array'"
+                )
+            for i118, v119 in enumerate(v117):
+                if not isinstance(v119, str):
+                    raise ValidationError(
+                        f"{path}.transition_evaluation.admissible[{i118}] is not of type 'string'"
+                    )
+        if "denied" in v115:
+            v120 = v115["denied"]
+            if not isinstance(v120, list):
+                raise ValidationError(
+                    f"{path}.transition_evaluation.denied is not of type 'array'"
+                )
+            for i121, v122 in enumerate(v120):
+                if not isinstance(v122, dict):
+                    raise ValidationError(
+                        f"{path}.transition_evaluation.denied[{i121}] is not of type 'object'"
+                    )
+                if not _REQUIRED_123 <= v122.keys():
+                    raise ValidationError(
+                        f"{path}.transition_evaluation.denied[{i121}] is missing required {sorted(_REQUIRED_123 - v122.keys())}"
+                    )
+                if "decision" in v122:
+                    v124 = v122["decision"]
+                    if not isinstance(v124, str):
+                        raise ValidationError(
+                            f"{path}.transition_evaluation.denied[{i121}].decision is not of type 'string'"
+                        )
+                    if not (isinstance(v124, str) and v124 in _ENUM_125):
+                        raise ValidationError(
+                            f"{path}.transition_evaluation.denied[{i121}].decision is not one of {sorted(_ENUM_125)}"
+                        )
+                if "evidence_refs" in v122:
+                    v126 = v122["evidence_refs"]
+                    if not isinstance(v126, list):
+                        raise ValidationError(
+                            f"{path}.transition_evaluation.denied[{i121}].evidence_refs is not of type 'array'"
+                        )
+                    for i127, v128 in enumerate(v126):
+                        if not isinstance(v128, str):
+                            raise ValidationError(
+                                f"{path}.transition_evaluation.denied[{i121}].evidence_refs[{i127}] is not of type 'string'"
+                            )
+                if "reason_codes" in v122:
+                    v129 = v122["reason_codes"]
+                    if not isinstance(v129, list):
+                        raise ValidationError(
+                            f"{path}.transition_evaluation.denied[{i121}].reason_codes is not of type 'array'"
+                        )
+                    for i130, v131 in enumerate(v129):
+                        if not isinstance(v131, str):
+                            raise ValidationError(
+                                f"{path}.transition_evaluation.denied[{i121}].reason_codes[{i130}] is not of type 'string'"
+                            )
+                if "transition_id" in v122:
+                    v132 = v122["transition_id"]
+                    if not isinstance(v132, str):
+                        raise ValidationError(
+                            f"{path}.transition_evaluation.denied[{i121}].transition_id is not of type 'string'"
+                        )
+                    if len(v132) < 1:
+                        raise ValidationError(
+                            f"{path}.transition_evaluation.denied[{i121}].transition_id is shorter than 1"
+                        )
+                if "violated_guards" in v122:
+                    v133 = v122["violated_guards"]
+                    if not isinstance(v133, list):
+                        raise ValidationError(
+                            f"{path}.transition_evaluation.denied[{i121}].violated_guards is not of type 'array'"
+                        )
+                    for i134, v135 in enumerate(v133):
+                        if not isinstance(v135, str):
+                            raise ValidationError(
+                                f"{path}.transition_evaluation.denied[{i121}].violated_guards[{i134}] is not of type 'string'"
+                            )
+                if v122.keys() - _PROPS_136:
+                    raise ValidationError(
+                        f"{path}.transition_evaluation.denied[{i121}] has unexpected properties {sorted(v122.keys() - _PROPS_136)}"
+                    )
+        if v115.keys() - _PROPS_137:
+            raise ValidationError(
+                f"{path}.transition_evaluation has unexpected properties {sorted(v115.keys() - _PROPS_137)}"
+            )
+    if data.keys() - _PROPS_138:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_138)}"
+        )
+    return data
+
+
+def _ref_definitions_guard_eval(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_32 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_32 - data.keys())}"
+        )
+    if "decision" in data:
+        v33 = data["decision"]
+        if not isinstance(v33, str):
+            raise ValidationError(f"{path}.decision is not of type 'string'")
+        if not (isinstance(v33, str) and v33 in _ENUM_34):
+            raise ValidationError(f"{path}.decision is not one of {sorted(_ENUM_34)}")
+    if "evidence_refs" in data:
+        v35 = data["evidence_refs"]
+        if not isinstance(v35, list):
+            raise ValidationError(f"{path}.evidence_refs is not of type 'array'")
+        for i36, v37 in enumerate(v35):
+            if not isinstance(v37, str):
+                raise ValidationError(
+                    f"{path}.evidence_refs[{i36}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v38 = data["guard_id"]
+        if not isinstance(v38, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v38) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "notes" in data:
+        v39 = data["notes"]
+        if not isinstance(v39, str):
+            raise ValidationError(f"{path}.notes is not of type 'string'")
+    if "reason_codes" in data:
+        v40 = data["reason_codes"]
+        if not isinstance(v40, list):
+            raise ValidationError(f"{path}.reason_codes is not of type 'array'")
+        for i41, v42 in enumerate(v40):
+            if not isinstance(v42, str):
+                raise ValidationError(
+                    f"{path}.reason_codes[{i41}] is not of type 'string'"
+                )
+    if "status" in data:
+        v43 = data["status"]
+        if not isinstance(v43, str):
+            raise ValidationError(f"{path}.status is not of type 'string'")
+        if not (isinstance(v43, str) and v43 in _ENUM_44):
+            raise ValidationError(f"{path}.status is not one of {sorted(_ENUM_44)}")
+    if data.keys() - _PROPS_45:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_45)}"
+        )
+
+
+def _ref_definitions_guard_spec(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_49 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_49 - data.keys())}"
+        )
+    if "deny_decision" in data:
+        v50 = data["deny_decision"]
+        if not isinstance(v50, str):
+            raise ValidationError(f"{path}.deny_decision is not of type 'string'")
+        if not (isinstance(v50, str) and v50 in _ENUM_51):
+            raise ValidationError(
+                f"{path}.deny_decision is not one of {sorted(_ENUM_51)}"
+            )
+    if "deny_reason_code" in data:
+        v52 = data["deny_reason_code"]
+        if not isinstance(v52, str):
+            raise ValidationError(f"{path}.deny_reason_code is not of type 'string'")
+        if not _PATTERN_53.search(v52):
+            raise ValidationError(
+                f"{path}.deny_reason_code does not match {_PATTERN_53.pattern!r}"
+            )
+    if "evidence_kinds" in data:
+        v54 = data["evidence_kinds"]
+        if not isinstance(v54, list):
+            raise ValidationError(f"{path}.evidence_kinds is not of type 'array'")
+        for i55, v56 in enumerate(v54):
+            if not isinstance(v56, str):
+                raise ValidationError(
+                    f"{path}.evidence_kinds[{i55}] is not of type 'string'"
+                )
+    if "guard_id" in data:
+        v57 = data["guard_id"]
+        if not isinstance(v57, str):
+            raise ValidationError(f"{path}.guard_id is not of type 'string'")
+        if len(v57) < 1:
+            raise ValidationError(f"{path}.guard_id is shorter than 1")
+    if "guard_kind" in data:
+        v58 = data["guard_kind"]
+        if not isinstance(v58, str):
+            raise ValidationError(f"{path}.guard_kind is not of type 'string'")
+        if not (isinstance(v58, str) and v58 in _ENUM_59):
+            raise ValidationError(f"{path}.guard_kind is not one of {sorted(_ENUM_59)}")
+    if "predicate_ref" in data:
+        v60 = data["predicate_ref"]
+        if not isinstance(v60, str):
+            raise ValidationError(f"{path}.predicate_ref is not of type 'string'")
+        if len(v60) < 1:
+            raise ValidationError(f"{path}.predicate_ref is shorter than 1")
+    if data.keys() - _PROPS_61:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_61)}"
+        )
+
+
+def _ref_definitions_artifact_ref(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_66 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_66 - data.keys())}"
+        )
+    if "id" in data:
+        v67 = data["id"]
+        if not isinstance(v67, str):
+            raise ValidationError(f"{path}.id is not of type 'string'")
+        if len(v67) < 1:
+            raise ValidationError(f"{path}.id is shorter than 1")
+    if "path" in data:
+        v68 = data["path"]
+        if not isinstance(v68, str):
+            raise ValidationError(f"{path}.path is not of type 'string'")
+        if len(v68) < 1:
+            raise ValidationError(f"{path}.path is shorter than 1")
+    if "sha256" in data:
+        v69 = data["sha256"]
+        if not isinstance(v69, str):
+            raise ValidationError(f"{path}.sha256 is not of type 'string'")
+        if len(v69) < 1:
+            raise ValidationError(f"{path}.sha256 is shorter than 1")
+    if "version" in data:
+        v70 = data["version"]
+        if not isinstance(v70, str):
+            raise ValidationError(f"{path}.version is not of type 'string'")
+        if len(v70) < 1:
+            raise ValidationError(f"{path}.version is shorter than 1")
+    if data.keys() - _PROPS_71:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_71)}"
+        )
+
+
+def _ref_definitions_meta(data, path):
+    if not isinstance(data, dict):
+        raise ValidationError(f"{path} is not of type 'object'")
+    if not _REQUIRED_26 <= data.keys():
+        raise ValidationError(
+            f"{path} is missing required {sorted(_REQUIRED_26 - data.keys())}"
+        )
+    if "guards" in data:
+        v27 = data["guards"]
+        if not isinstance(v27, dict):
+            raise ValidationError(f"{path}.guards is not of type 'object'")
+        if not _REQUIRED_28 <= v27.keys():
+            raise ValidationError(
+                f"{path}.guards is missing required {sorted(_REQUIRED_28 - v27.keys())}"
+            )
+        if "eval" in v27:
+            v29 = v27["eval"]
+            if not isinstance(v29, list):
+                raise ValidationError(f"{path}.guards.eval is not of type 'array'")
+            for i30, v31 in enumerate(v29):
+                _ref_definitions_guard_eval(v31, f"{path}.guards.eval[{i30}]")
+        if "spec" in v27:
+            v46 = v27["spec"]
+            if not isinstance(v46, list):
+                raise ValidationError(f"{path}.guards.spec is not of type 'array'")
+            for i47, v48 in enumerate(v46):
+                _ref_definitions_guard_spec(v48, f"{path}.guards.spec[{i47}]")
+        if v27.keys() - _PROPS_62:
+            raise ValidationError(
+                f"{path}.guards has unexpected properties {sorted(v27.keys() - _PROPS_62)}"
+            )
+    if "policy_linkage" in data:
+        v63 = data["policy_linkage"]
+        if not isinstance(v63, dict):
+            raise ValidationError(f"{path}.policy_linkage is not of type 'object'")
+        if not _REQUIRED_64 <= v63.keys():
+            raise ValidationError(
+                f"{path}.policy_linkage is missing required {sorted(_REQUIRED_64 - v63.keys())}"
+            )
+        if "control_strategy_ref" in v63:
+            v65 = v63["control_strategy_ref"]
+            _ref_definitions_artifact_ref(
+                v65, f"{path}.policy_linkage.control_strategy_ref"
+            )
+        if "guardrails_bundle_ref" in v63:
+            v72 = v63["guardrails_bundle_ref"]
+            _ref_definitions_artifact_ref(
+                v72, f"{path}.policy_linkage.guardrails_bundle_ref"
+            )
+        if "pattern_catalog_ref" in v63:
+            v73 = v63["pattern_catalog_ref"]
+            _ref_definitions_artifact_ref(
+                v73, f"{path}.policy_linkage.pattern_catalog_ref"
+            )
+        if "plant_spec_ref" in v63:
+            v74 = v63["plant_spec_ref"]
+            _ref_definitions_artifact_ref(v74, f"{path}.policy_linkage.plant_spec_ref")
+        if "rank_policy_ref" in v63:
+            v75 = v63["rank_policy_ref"]
+            _ref_definitions_artifact_ref(v75, f"{path}.policy_linkage.rank_policy_ref")
+        if "reason_codes_ref" in v63:
+            v76 = v63["reason_codes_ref"]
+            _ref_definitions_artifact_ref(
+                v76, f"{path}.policy_linkage.reason_codes_ref"
+            )
+        if "src_conventions_ref" in v63:
+            v77 = v63["src_conventions_ref"]
+            _ref_definitions_artifact_ref(
+                v77, f"{path}.policy_linkage.src_conventions_ref"
+            )
+        if v63.keys() - _PROPS_78:
+            raise ValidationError(
+                f"{path}.policy_linkage has unexpected properties {sorted(v63.keys() - _PROPS_78)}"
+            )
+    if "requirements" in data:
+        v79 = data["requirements"]
+        if not isinstance(v79, dict):
+            raise ValidationError(f"{path}.requirements is not of type 'object'")
+        if not _REQUIRED_80 <= v79.keys():
+            raise ValidationError(
+                f"{path}.requirements is missing required {sorted(_REQUIRED_80 - v79.keys())}"
+            )
+        if "required_evidence" in v79:
+            v81 = v79["required_evidence"]
+            if not isinstance(v81, list):
+                raise ValidationError(
+                    f"{path}.requirements.required_evidence is not of type 'array'"
+                )
+            for i82, v83 in enumerate(v81):
+                if not isinstance(v83, str):
+                    raise ValidationError(
+                        f"{path}.requirements.required_evidence[{i82}] is not of type 'string'"
+                    )
+        if v79.keys() - _PROPS_84:
+            raise ValidationError(
+                f"{path}.requirements has unexpected properties {sorted(v79.keys() - _PROPS_84)}"
+            )
+    if data.keys() - _PROPS_85:
+        raise ValidationError(
+            f"{path} has unexpected properties {sorted(data.keys() - _PROPS_85)}"
+        )
@@ -0,0 +1,61 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import _util
+
+
+def test_write_json_reports_created_updated_skipped(tmp_path: Path):
+    path = tmp_path / "state" / "artifact.json"
+    _util.reset_write_stats()
+
+    assert _util.write_json(path, {"v": 1}) == "created"
+    mtime = path.stat().st_mtime_ns
+    assert _util.write_json(path, {"v": 1}) == "skipped"
+    assert path.stat().st_mtime_ns == mtime
+    assert _util.write_json(path, {"v": 2}) == "updated"
+    assert _util.load_json(path) == {"v": 2}
+
+    assert _util.write_stats() == {"created": 1, "updated": 1, "skipped": 1}
+    assert sorted(p.name for p in path.parent.iterdir()) == ["artifact.json"]
+
+
+def test_same_size_different_content_is_rewritten(tmp_path: Path):
+    path = tmp_path / "artifact.json"
+    _util.write_file_atomic(path, b"aaaa")
+    # Rewritten behind our back, same size: the digest check catches it.
+    path.write_bytes(b"bbbb")
+    assert _util.write_file_atomic(path, b"aaaa") == "updated"
+    assert path.read_bytes() == b"aaaa"
+
+
+def test_failed_write_leaves_original_and_no_temp(tmp_path: Path, monkeypatch):
+    path = tmp_path / "artifact.json"
+    _util.write_json(path, {"v": 1})
+    before = path.read_bytes()
+
+    def boom(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(_util.os, "replace", boom)
+    with pytest.raises(OSError):
+        _util.write_json(path, {"v": 2})
+    assert path.read_bytes() == before
+    assert [p.name for p in tmp_path.iterdir()] == ["artifact.json"]
+
+
+def test_fsync_policy_and_mode_preserved(tmp_path: Path, monkeypatch):
+    path = tmp_path / "run.sh"
+    _util.write_file_atomic(path, b"#!/bin/sh\n", fsync="full")
+    os.chmod(path, 0o755)
+    monkeypatch.setenv("XTRL_FSYNC", "file")
+    assert _util.write_file_atomic(path, b"#!/bin/sh\ntrue\n") == "updated"
+    assert path.stat().st_mode & 0o777 == 0o755
+
+    with pytest.raises(ValueError):
+        _util.write_file_atomic(path, b"x", fsync="sometimes")
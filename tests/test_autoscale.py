@@ -0,0 +1,145 @@
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SSOT = ROOT / "control" / "ssot"
+sys.path.insert(0, str(ROOT / "tools"))
+
+import _util
+import autoscale
+import worker_run_candidate as worker
+from claims import ClaimEngine
+
+FAKE_CODEX = """#!{python}
+import sys, time
+out = sys.argv[sys.argv.index("-o") + 1]
+time.sleep(0.3)
+with open({example!r}) as src, open(out, "w") as dst:
+    dst.write(src.read())
+"""
+
+IDLE = {"load_per_cpu": 0.1, "mem_available_mb": 8192.0}
+
+
+def fake_run(out: Path, name: str, elapsed=None, cached=False, age=0.0) -> None:
+    run = out / name
+    run.mkdir(parents=True)
+    manifest = run / "run_manifest.json"
+    manifest.write_text("{}", encoding="utf-8")
+    started = time.time() - age
+    os.utime(manifest, (started, started))
+    if elapsed is not None:
+        check = {"name": "codex", "elapsed_s": elapsed, "cached": cached}
+        _util.write_json(run / "evidence.json", {"checks": [check]})
+
+
+def scaler(tmp_path: Path, signals=IDLE, **config) -> autoscale.Autoscaler:
+    cfg = {
+        "min_workers": 1,
+        "max_workers": 4,
+        "interval_seconds": 0.0,
+        "recent_runs": 2,
+    }
+    return autoscale.Autoscaler(
+        autoscale.AutoscaleConfig(**dict(cfg, **config)),
+        out_root=tmp_path / "out",
+        log_path=tmp_path / "autoscale.jsonl",
+        sample=lambda: dict(signals),
+    )
+
+
+def log_lines(tmp_path: Path) -> list[dict]:
+    path = tmp_path / "autoscale.jsonl"
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_recent_run_durations_skip_running_cached_and_old(tmp_path: Path):
+    out = tmp_path / "out"
+    fake_run(out, "a", 10.0, age=30)
+    fake_run(out, "b", 20.0, age=20)
+    fake_run(out, "c", None, age=10)  # still running
+    fake_run(out, "d", 0.0, cached=True, age=5)
+    fake_run(out, "e", 99.0, age=7200)
+    assert autoscale.recent_run_durations(out, 3600, 50) == [10.0, 20.0]
+    assert autoscale.recent_run_durations(out, 3600, 2) == []
+    assert autoscale.recent_run_durations(tmp_path / "missing", 3600, 50) == []
+
+
+def test_scales_up_when_idle_with_backlog(tmp_path: Path):
+    s = scaler(tmp_path)
+    assert s.decide(2, busy=2, backlog=3) == 3
+    assert s.decide(3, busy=2, backlog=3) == 3  # a slot is free: hold
+    assert s.decide(3, busy=3, backlog=0) == 3  # nothing waiting: hold
+    assert s.decide(4, busy=4, backlog=1) == 4  # at max_workers
+    [record] = log_lines(tmp_path)
+    assert record["from"] == 2 and record["to"] == 3 and record["reason"] == "idle"
+    assert record["load_per_cpu"] == 0.1
+
+
+def test_scales_down_on_memory_load_and_slowdown(tmp_path: Path):
+    def decide(load, free_mb, current):
+        signals = {"load_per_cpu": load, "mem_available_mb": free_mb}
+        return scaler(tmp_path, signals).decide(current, current, 5)
+
+    assert decide(0.1, 10.0, 3) == 2
+    assert decide(4.0, None, 3) == 2
+    assert decide(4.0, None, 1) == 1  # at min_workers
+
+    out = tmp_path / "out"
+    for i, elapsed in enumerate([10.0, 10.0, 11.0, 10.0, 30.0, 32.0]):
+        fake_run(out, f"run-{i}", elapsed, age=60 - i)
+    assert scaler(tmp_path).decide(3, 3, 5) == 2
+    reasons = [r["reason"] for r in log_lines(tmp_path)]
+    assert reasons == ["memory", "load", "slowdown"]
+    assert log_lines(tmp_path)[-1]["recent_run_s"] == 31.0
+
+
+def test_decisions_are_rate_limited(tmp_path: Path):
+    s = scaler(tmp_path, interval_seconds=60.0)
+    assert s.decide(1, 1, 5) == 2
+    assert s.decide(2, 2, 5) == 2
+    assert s.decisions == 1
+
+
+def test_supervisor_follows_the_autoscaler(tmp_path: Path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    codex = bin_dir / "codex"
+    codex.write_text(
+        FAKE_CODEX.format(
+            python=sys.executable,
+            example=str(SSOT / "examples" / "patch_proposal.example.json"),
+        ),
+        encoding="utf-8",
+    )
+    codex.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("CODEX_STATE", str(tmp_path / "state"))
+    _util.ensure_state_layout()
+
+    queue = _util.load_json(SSOT / "examples" / "work_queue.example.json")
+    queue["work_items"] = [
+        dict(queue["work_items"][0], work_item_id=f"wi-{i}", objective_slice=str(i))
+        for i in range(8)
+    ]
+    engine = ClaimEngine(queue["work_items"], _util.state_root() / "locks")
+    s = scaler(tmp_path, max_workers=3)
+    s.out_root = _util.state_root() / "out"
+    result = worker.supervise(
+        queue,
+        engine,
+        1,
+        8,
+        "w",
+        "p",
+        tmp_path / "candidate_set.json",
+        autoscaler=s,
+    )
+    assert result["errors"] == [] and len(result["candidates"]) == 8
+    assert result["autoscale"]["peak"] == 3
+    assert [(r["from"], r["to"]) for r in log_lines(tmp_path)][:2] == [(1, 2), (2, 3)]
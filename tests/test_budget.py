@@ -0,0 +1,198 @@
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SSOT = ROOT / "control" / "ssot"
+sys.path.insert(0, str(ROOT / "tools"))
+
+import _util
+import budget
+import worker_run_candidate as worker
+
+FAKE_CODEX = """#!{python}
+import sys
+out = sys.argv[sys.argv.index("-o") + 1]
+print('{{"type": "item.started", "item": {{"type": "command_execution"}}}}')
+with open({example!r}) as src, open(out, "w") as dst:
+    dst.write(src.read())
+"""
+
+
+def item(work_item_id: str = "wi-1", minutes=None) -> dict:
+    wi = {"work_item_id": work_item_id}
+    if minutes is not None:
+        wi["budgets"] = {"max_codex_minutes": minutes}
+    return wi
+
+
+def ledger(tmp_path: Path, **limits) -> budget.BudgetLedger:
+    return budget.BudgetLedger(
+        "q-1",
+        dict(budget.budget_limits(), **limits),
+        tmp_path / "budget_ledger.json",
+    )
+
+
+def test_limits_from_control_strategy():
+    strategy = _util.load_json(SSOT / "examples" / "control_strategy.example.json")
+    limits = budget.budget_limits(strategy, 90)
+    assert limits == {
+        "max_iterations": 50,
+        "max_codex_minutes": 90,
+        "max_tool_calls_per_iter": 20,
+    }
+    assert budget.budget_limits()["max_iterations"] is None
+
+
+def test_max_iterations_counts_reservations_and_runs(tmp_path: Path):
+    led = ledger(tmp_path, max_iterations=2)
+    first = led.reserve(item())
+    second = led.reserve(item())
+    with pytest.raises(budget.BudgetExhausted):
+        led.reserve(item())
+
+    # A cancelled reservation gives its iteration back; a reconciled one does not.
+    led.cancel(first)
+    led.reconcile(second, 12.5, tool_calls=3)
+    led.reserve(item())
+    with pytest.raises(budget.BudgetExhausted) as exc:
+        led.reserve(item())
+    assert exc.value.reason_code == "BUDGET_EXHAUSTED"
+
+    summary = led.summary()
+    assert summary["spent"] == {"runs": 1, "codex_seconds": 12.5, "tool_calls": 3}
+    assert summary["reserved"] == 1 and summary["refused"] == 2
+
+
+def test_queue_minutes_reserve_item_budget_until_reconciled(tmp_path: Path):
+    led = ledger(tmp_path, max_codex_minutes=10)
+    res = led.reserve(item(minutes=6))
+    with pytest.raises(budget.BudgetExhausted):
+        led.reserve(item(minutes=6))
+    led.reconcile(res, 60.0)  # used one of its six minutes
+    led.reserve(item(minutes=6))
+    assert led.summary()["spent"]["codex_seconds"] == 60.0
+
+
+def test_expired_reservation_is_charged_in_full(tmp_path: Path):
+    led = ledger(tmp_path)
+    res = led.reserve(item(minutes=2))
+    data = _util.load_json(led.path)
+    data["reserved"][res.reservation_id]["expires_at"] = time.time() - 1
+    _util.write_json(led.path, data)
+    assert led.summary()["spent"] == {
+        "runs": 1,
+        "codex_seconds": 120.0,
+        "tool_calls": 0,
+    }
+    led.reconcile(res, 1.0)  # too late: already charged
+    assert led.summary()["spent"]["codex_seconds"] == 120.0
+
+
+def test_new_queue_starts_a_fresh_ledger(tmp_path: Path):
+    ledger(tmp_path).reconcile(ledger(tmp_path).reserve(item()), 5.0)
+    other = budget.BudgetLedger("q-2", budget.budget_limits(), ledger(tmp_path).path)
+    assert other.summary()["spent"]["runs"] == 0
+
+
+def test_limits_are_fixed_when_the_ledger_is_created(tmp_path: Path):
+    ledger(tmp_path, max_iterations=1).reserve(item())
+    later = ledger(tmp_path, max_iterations=5)
+    with pytest.raises(budget.BudgetExhausted):
+        later.reserve(item())
+    assert later.summary()["limits"]["max_iterations"] == 1
+
+
+def test_concurrent_reservations_never_overrun(tmp_path: Path):
+    granted: list[budget.Reservation] = []
+
+    def reserve_all() -> None:
+        led = ledger(tmp_path, max_iterations=7)
+        for _ in range(5):
+            try:
+                granted.append(led.reserve(item()))
+            except budget.BudgetExhausted:
+                pass
+
+    threads = [threading.Thread(target=reserve_all) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(granted) == 7
+    assert ledger(tmp_path).summary()["refused"] == 13
+
+
+def test_tool_calls_are_counted_from_events():
+    progress = worker.CodexProgress()
+    for event in (
+        {"type": "item.started", "item": {"type": "command_execution"}},
+        {"type": "item.completed", "item": {"type": "command_execution"}},
+        {"type": "item.started", "item": {"type": "agent_message"}},
+        {"msg": {"type": "exec_command_begin"}},
+    ):
+        progress.record(json.dumps(event).encode())
+    assert progress.tool_calls == 2
+
+
+def fake_codex(tmp_path: Path, monkeypatch) -> None:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "codex"
+    script.write_text(
+        FAKE_CODEX.format(
+            python=sys.executable,
+            example=str(SSOT / "examples" / "patch_proposal.example.json"),
+        ),
+        encoding="utf-8",
+    )
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("CODEX_STATE", str(tmp_path / "state"))
+
+
+def test_run_candidate_reserves_and_reconciles(tmp_path: Path, monkeypatch):
+    fake_codex(tmp_path, monkeypatch)
+    queue = _util.load_json(SSOT / "examples" / "work_queue.example.json")
+    wi = queue["work_items"][0]
+    cand_path = tmp_path / "candidate_set.json"
+    led = budget.BudgetLedger(
+        queue["queue_id"], dict(budget.budget_limits(), max_iterations=1)
+    )
+
+    assert worker.run_candidate(queue, wi, "w", "p", cand_path, ledger=led)
+    spent = led.summary()["spent"]
+    assert spent["runs"] == 1 and spent["tool_calls"] == 1
+    assert spent["codex_seconds"] > 0
+    assert led.path == _util.state_root() / "queue" / "budget_ledger.json"
+
+    with pytest.raises(budget.BudgetExhausted):
+        worker.run_candidate(queue, wi, "w", "p", cand_path, ledger=led)
+    assert len(list(_util.iter_candidate_set(cand_path))) == 1
+
+
+def test_diff_over_max_patch_lines_is_denied_and_recorded(tmp_path: Path, monkeypatch):
+    fake_codex(tmp_path, monkeypatch)
+    queue = _util.load_json(SSOT / "examples" / "work_queue.example.json")
+    wi = queue["work_items"][0]
+    cand_path = tmp_path / "candidate_set.json"
+    led = budget.BudgetLedger(queue["queue_id"], budget.budget_limits())
+
+    # The example patch changes two lines: within 200, over 1.
+    ok = worker.run_candidate(queue, wi, "w", "p", cand_path, ledger=led)
+    wi = dict(wi, budgets=dict(wi["budgets"], max_patch_lines=1))
+    over = worker.run_candidate(queue, wi, "w", "p", cand_path, ledger=led)
+    out = _util.state_root() / "out"
+    assert _util.load_json(out / ok / "gate_worker.json")["decision"] == "PROMOTE"
+    gate = _util.load_json(out / over / "gate_worker.json")
+    assert gate["decision"] == "DENY"
+    assert gate["reason_codes"] == ["DIFF_BUDGET_EXCEEDED"]
+    assert led.summary()["diff_budget_exceeded"] == {
+        wi["work_item_id"]: {"runs": 1, "max_diff_lines": 2}
+    }
@@ -0,0 +1,155 @@
+import copy
+import json
+import multiprocessing as mp
+import sys
+import threading
+from pathlib import Path
+
+import jsonschema
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SSOT = ROOT / "control" / "ssot"
+sys.path.insert(0, str(ROOT / "tools"))
+
+import _util
+
+pytestmark = pytest.mark.skipif(_util.fcntl is None, reason="needs fcntl")
+
+TEMPLATE = json.loads(
+    (SSOT / "examples" / "candidate_set.example.json").read_text(encoding="utf-8")
+)["candidates"][0]
+
+
+def entry(candidate_id: str) -> dict:
+    candidate = copy.deepcopy(TEMPLATE)
+    candidate["candidate_id"] = candidate_id
+    return {"queue_id": "q-1", "base_ref": "abc123", "candidate": candidate}
+
+
+def ids(path: Path) -> list[str]:
+    return [c["candidate_id"] for c in _util.iter_candidate_set(path)]
+
+
+def test_append_then_compact(tmp_path: Path):
+    path = tmp_path / "queue" / "candidate_set.json"
+    log, segment, _ = _util.candidate_log_paths(path)
+    for i in range(3):
+        _util.append_candidate(path, entry(f"c{i}"))
+
+    # Appends leave the compacted set alone; readers see it plus the log.
+    cand_set = _util.load_json(path)
+    _util.validate_artifact("candidate_set", cand_set)
+    assert cand_set["candidates"] == []
+    assert len(log.read_bytes().splitlines()) == 3
+    assert ids(path) == ["c0", "c1", "c2"]
+
+    assert _util.compact_candidate_log(path) == 3
+    assert not log.exists() and not segment.exists()
+    cand_set = _util.load_json(path)
+    _util.validate_artifact("candidate_set", cand_set)
+    assert [c["candidate_id"] for c in cand_set["candidates"]] == ["c0", "c1", "c2"]
+    assert _util.compact_candidate_log(path) == 0
+
+    _util.append_candidate(path, entry("c3"))
+    assert ids(path) == ["c0", "c1", "c2", "c3"]
+
+
+def test_invalid_candidate_is_rejected_before_append(tmp_path: Path):
+    path = tmp_path / "candidate_set.json"
+    bad = entry("c0")
+    bad["candidate"]["metrics"]["files_touched"] = -1
+    with pytest.raises(jsonschema.ValidationError):
+        _util.append_candidate(path, bad)
+    assert not _util.candidate_log_paths(path)[0].exists()
+
+
+def test_readers_skip_an_unfinished_append(tmp_path: Path):
+    path = tmp_path / "candidate_set.json"
+    _util.append_candidate(path, entry("c0"))
+    log = _util.candidate_log_paths(path)[0]
+    with log.open("ab") as f:
+        f.write(json.dumps(entry("c1")).encode()[:40])
+    assert ids(path) == ["c0"]
+
+
+def test_malformed_log_line_is_skipped_and_quarantined(tmp_path: Path):
+    path = tmp_path / "candidate_set.json"
+    _util.append_candidate(path, entry("c0"))
+    log = _util.candidate_log_paths(path)[0]
+    # A torn append (its writer died) with later appends after it.
+    torn = json.dumps(entry("cx")).encode()[:40]
+    with log.open("ab") as f:
+        f.write(torn)
+    _util.append_candidate(path, entry("c1"))
+    with log.open("ab") as f:
+        f.write(b"garbage\n")
+    _util.append_candidate(path, entry("c2"))
+    assert ids(path) == ["c0", "c2"]
+
+    assert _util.compact_candidate_log(path) == 2
+    assert ids(path) == ["c0", "c2"]
+    rejected = _util.candidate_rejected_path(path).read_bytes().splitlines()
+    assert len(rejected) == 2 and rejected[0].startswith(torn)
+    assert rejected[1] == b"garbage"
+
+
+def test_interrupted_compaction_is_recovered_without_duplicates(tmp_path: Path):
+    path = tmp_path / "candidate_set.json"
+    for i in range(3):
+        _util.append_candidate(path, entry(f"c{i}"))
+    log, segment, _ = _util.candidate_log_paths(path)
+    # Crash after the set was replaced but before the segment was removed.
+    lines = log.read_bytes()
+    _util.compact_candidate_log(path)
+    segment.write_bytes(lines)
+    _util.append_candidate(path, entry("c3"))
+    assert ids(path) == ["c0", "c1", "c2", "c0", "c1", "c2", "c3"]
+
+    assert _util.compact_candidate_log(path) == 0
+    assert _util.compact_candidate_log(path) == 1
+    assert ids(path) == ["c0", "c1", "c2", "c3"]
+
+
+def test_compaction_can_wait_for_a_running_one(tmp_path: Path):
+    path = tmp_path / "candidate_set.json"
+    _util.append_candidate(path, entry("c0"))
+    running = _util.shared_lock(path.with_suffix(".compact.lock")).acquire()
+    assert _util.compact_candidate_log(path) == 0
+    timer = threading.Timer(0.2, running.release)
+    timer.start()
+    try:
+        assert _util.compact_candidate_log(path, wait=True) == 1
+    finally:
+        timer.join()
+    assert [c["candidate_id"] for c in _util.load_json(path)["candidates"]] == ["c0"]
+
+
+def test_log_compacts_itself_past_threshold(tmp_path: Path):
+    path = tmp_path / "candidate_set.json"
+    for i in range(5):
+        _util.append_candidate(path, entry(f"c{i}"), compact_bytes=1500)
+    log = _util.candidate_log_paths(path)[0]
+    compacted = _util.load_json(path)["candidates"]
+    assert compacted
+    assert len(compacted) + len(log.read_bytes().splitlines()) == 5
+    assert ids(path) == [f"c{i}" for i in range(5)]
+
+
+def append_many(path: Path, worker: int, count: int) -> None:
+    for i in range(count):
+        _util.append_candidate(path, entry(f"w{worker}-{i}"), compact_bytes=4096)
+
+
+def test_concurrent_appends_are_not_lost(tmp_path: Path):
+    path = tmp_path / "candidate_set.json"
+    procs = [mp.Process(target=append_many, args=(path, w, 25)) for w in range(8)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+        assert p.exitcode == 0
+    seen = ids(path)
+    assert sorted(seen) == sorted(f"w{w}-{i}" for w in range(8) for i in range(25))
+    _util.compact_candidate_log(path)
+    assert len(_util.load_json(path)["candidates"]) == 200
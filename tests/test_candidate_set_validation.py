@@ -0,0 +1,101 @@
+import copy
+import json
+import sys
+from pathlib import Path
+
+import jsonschema
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SSOT = ROOT / "control" / "ssot"
+sys.path.insert(0, str(ROOT / "tools"))
+
+import _util
+
+
+@pytest.fixture(autouse=True)
+def jsonschema_path(monkeypatch):
+    # The sidecar only applies when validation falls back to jsonschema.
+    monkeypatch.setenv("XTRL_GENERATED_VALIDATORS", "0")
+
+
+def candidate_set(n: int) -> dict:
+    example = json.loads(
+        (SSOT / "examples" / "candidate_set.example.json").read_text(encoding="utf-8")
+    )
+    template = example["candidates"][0]
+    example["candidates"] = []
+    for i in range(n):
+        entry = copy.deepcopy(template)
+        entry["candidate_id"] = f"cand-{i:03d}"
+        example["candidates"].append(entry)
+    return example
+
+
+def test_only_new_or_changed_entries_are_revalidated(tmp_path: Path):
+    sidecar = tmp_path / "candidate_set.validated.json"
+    cand_set = candidate_set(5)
+
+    assert _util.validate_candidate_set(cand_set, sidecar) == 5
+    assert _util.validate_candidate_set(cand_set, sidecar) == 0
+
+    cand_set["candidates"][1]["metrics"]["files_touched"] = 9
+    cand_set["candidates"].append(dict(cand_set["candidates"][0], candidate_id="new"))
+    assert _util.validate_candidate_set(cand_set, sidecar) == 2
+    assert _util.validate_candidate_set(cand_set, sidecar) == 0
+
+    # No sidecar: every entry is checked.
+    assert _util.validate_candidate_set(cand_set) == 6
+
+
+def test_invalid_entry_raises_full_document_error(tmp_path: Path):
+    sidecar = tmp_path / "candidate_set.validated.json"
+    cand_set = candidate_set(3)
+    _util.validate_candidate_set(cand_set, sidecar)
+
+    cand_set["candidates"][2]["metrics"]["files_touched"] = -1
+    with pytest.raises(jsonschema.ValidationError) as exc:
+        _util.validate_candidate_set(cand_set, sidecar)
+    assert list(exc.value.absolute_path) == [
+        "candidates",
+        2,
+        "metrics",
+        "files_touched",
+    ]
+
+
+def test_envelope_is_checked_on_every_call(tmp_path: Path):
+    sidecar = tmp_path / "candidate_set.validated.json"
+    cand_set = candidate_set(2)
+    _util.validate_candidate_set(cand_set, sidecar)
+
+    del cand_set["meta"]
+    with pytest.raises(jsonschema.ValidationError):
+        _util.validate_candidate_set(cand_set, sidecar)
+    with pytest.raises(jsonschema.ValidationError):
+        _util.validate_candidate_set(dict(cand_set, candidates={}), sidecar)
+
+
+def test_stale_or_corrupt_sidecar_is_ignored(tmp_path: Path):
+    sidecar = tmp_path / "candidate_set.validated.json"
+    cand_set = candidate_set(2)
+
+    sidecar.write_text("{not json", encoding="utf-8")
+    assert _util.validate_candidate_set(cand_set, sidecar) == 2
+
+    cached = json.loads(sidecar.read_text(encoding="utf-8"))
+    cached["schema_digest"] = "0" * 64
+    sidecar.write_text(json.dumps(cached), encoding="utf-8")
+    assert _util.validate_candidate_set(cand_set, sidecar) == 2
+
+
+def test_generated_validator_checks_whole_document(tmp_path: Path, monkeypatch):
+    monkeypatch.delenv("XTRL_GENERATED_VALIDATORS")
+    sidecar = tmp_path / "candidate_set.validated.json"
+    cand_set = candidate_set(3)
+
+    assert _util.validate_candidate_set(cand_set, sidecar) == 3
+    assert not sidecar.exists()
+    cand_set["candidates"][0]["metrics"]["files_touched"] = -1
+    with pytest.raises(jsonschema.ValidationError):
+        _util.validate_candidate_set(cand_set, sidecar)
@@ -0,0 +1,64 @@
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SSOT = ROOT / "control" / "ssot"
+sys.path.insert(0, str(ROOT / "tools"))
+
+import _util
+import worker_run_candidate
+
+
+def test_canonical_digest_matches_write_json_bytes(tmp_path: Path):
+    obj = {"b": [1, 2.5, None], "a": {"z": "é", "y": True}}
+    path = tmp_path / "artifact.json"
+    _util.write_json(path, obj)
+
+    file_digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    assert _util.canonical_digest(obj) == file_digest
+    assert _util.canonical_digest(json.loads(path.read_text())) == file_digest
+    assert _util.sha256_file_cached(path) == file_digest
+
+
+def test_canonical_digest_tracks_mutation_and_memo_is_by_identity():
+    obj = {"candidates": [{"candidate_id": "c1"}]}
+    first = _util.canonical_digest(obj)
+    obj["candidates"].append({"candidate_id": "c2"})
+    # Not memoised by default: a mutated object gets its new digest.
+    second = _util.canonical_digest(obj)
+    assert second != first
+    assert second == _util.canonical_digest(dict(obj))
+
+    frozen = {"type": "object"}
+    digest = _util.canonical_digest(frozen, memo=True)
+    assert _util._DIGEST_CACHE[id(frozen)] == (frozen, digest)
+    assert _util.canonical_digest(frozen, memo=True) == digest
+    assert _util.canonical_digest({"type": "object"}) == digest
+
+
+def test_sha256_file_cached_tracks_rewrites(tmp_path: Path):
+    path = tmp_path / "artifact.json"
+    _util.write_json(path, {"v": 1})
+    before = _util.sha256_file_cached(path)
+
+    path.write_text('{"v": 22}\n', encoding="utf-8")
+    assert _util.sha256_file_cached(path) != before
+    assert (
+        _util.sha256_file_cached(path) == hashlib.sha256(path.read_bytes()).hexdigest()
+    )
+
+
+def test_worker_evidence_references_inputs_by_digest(tmp_path: Path):
+    _util.write_json(tmp_path / "run_manifest.json", {"run_id": "cand-1"})
+    (tmp_path / "codex_events.jsonl").write_text("{}\n", encoding="utf-8")
+
+    evidence = worker_run_candidate.make_evidence_stub(
+        "cand-1", "origin/main", "wi-001", 0, tmp_path
+    )
+    _util.validate_artifact("evidence_capsule", evidence)
+    assert evidence["inputs_hashes"] == {
+        "run_manifest": "sha256:" + _util.canonical_digest({"run_id": "cand-1"})
+    }
+    assert set(evidence["hash_manifest"]) == {"codex_events"}
@@ -0,0 +1,73 @@
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import _util
+from claims import ClaimEngine, lease_seconds_for
+
+pytestmark = pytest.mark.skipif(_util.fcntl is None, reason="needs fcntl")
+
+
+def item(wid: str, priority: int, max_workers: int = 1, **extra) -> dict:
+    return {
+        "work_item_id": wid,
+        "priority": priority,
+        "max_workers": max_workers,
+        **extra,
+    }
+
+
+def test_claims_follow_priority_and_max_workers(tmp_path: Path):
+    engine = ClaimEngine(
+        [item("a", 2), item("b", 0, max_workers=2), item("c", 2)], tmp_path
+    )
+    leases = [engine.claim() for _ in range(4)]
+    assert [lease.work_item_id for lease in leases] == ["b", "b", "a", "c"]
+    assert engine.claim() is None
+    assert engine.pending()
+
+    # Releasing a slot on the most urgent item makes it next again.
+    engine.release(leases[1])
+    again = engine.claim()
+    assert again.work_item_id == "b" and again.slot == leases[1].slot
+    for lease in [leases[0], leases[2], leases[3], again]:
+        engine.release(lease)
+    assert not engine.pending()
+    assert engine.snapshot()["active"] == 0
+    assert not list(tmp_path.glob("claim_*"))
+
+
+def test_slots_held_elsewhere_are_parked_and_retried(tmp_path: Path):
+    other = _util.FlockLock(tmp_path / "claim_a.0.lock").acquire()
+    engine = ClaimEngine([item("a", 0), item("b", 1)], tmp_path, retry_seconds=0.05)
+    assert engine.claim().work_item_id == "b"
+    assert engine.claim() is None
+    assert engine.snapshot()["parked"] == 1
+    assert engine.pending()
+
+    other.release()
+    time.sleep(0.06)
+    assert engine.claim().work_item_id == "a"
+
+
+def test_expired_leases_are_released(tmp_path: Path):
+    engine = ClaimEngine([item("a", 0)], tmp_path, lease_seconds=0.05)
+    lease = engine.claim()
+    assert engine.claim() is None
+    time.sleep(0.06)
+    assert engine.reap() == [lease] and lease.expired
+    fresh = engine.claim()
+    assert fresh is not None and fresh.slot == lease.slot
+    engine.release(lease)  # late release of the expired lease: no-op
+    assert engine.snapshot()["active"] == 1
+    assert engine.snapshot()["expired"] == 1
+
+
+def test_lease_length_follows_codex_budget():
+    assert lease_seconds_for(item("a", 0, budgets={"max_codex_minutes": 5})) == 360
+    assert lease_seconds_for(item("a", 0, budgets={}), default=42) == 42
@@ -0,0 +1,183 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SSOT = ROOT / "control" / "ssot"
+sys.path.insert(0, str(ROOT / "tools"))
+
+import _util
+import budget
+import codex_cache
+import worker_run_candidate as worker
+
+# Stand-in for codex-cli: counts its runs, emits one tool call, writes the
+# example PatchProposal.
+FAKE_CODEX = """#!{python}
+import sys
+out = sys.argv[sys.argv.index("-o") + 1]
+with open({count!r}, "a") as f:
+    f.write("run\\n")
+print('{{"type": "item.started", "item": {{"type": "command_execution"}}}}')
+print('{{"type": "turn.completed"}}')
+with open({example!r}) as src, open(out, "w") as dst:
+    dst.write(src.read())
+"""
+
+SCHEMA = Path(_util.read_registry_schema("patch_proposal"))
+
+
+@pytest.fixture
+def codex_runs(tmp_path: Path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    count = tmp_path / "codex_runs.txt"
+    script = bin_dir / "codex"
+    script.write_text(
+        FAKE_CODEX.format(
+            python=sys.executable,
+            count=str(count),
+            example=str(SSOT / "examples" / "patch_proposal.example.json"),
+        ),
+        encoding="utf-8",
+    )
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("CODEX_STATE", str(tmp_path / "state"))
+    return lambda: len(count.read_text().splitlines()) if count.exists() else 0
+
+
+def queue_and_item() -> tuple[dict, dict]:
+    queue = _util.load_json(SSOT / "examples" / "work_queue.example.json")
+    return queue, queue["work_items"][0]
+
+
+def test_key_covers_objective_base_ref_profile_prompt_and_schema(tmp_path: Path):
+    cache = codex_cache.CodexCache(tmp_path, prompt_profiles={"fix": "pp_fix_v1"})
+    wi = {"objective_slice": "o", "pattern": "fix"}
+    key = cache.key_for(wi, "main", "p", SCHEMA)
+    assert key == cache.key_for(dict(wi), "main", "p", SCHEMA)
+
+    other_schema = tmp_path / "schema.json"
+    other_schema.write_text("{}", encoding="utf-8")
+    variants = [
+        cache.key_for(dict(wi, objective_slice="o2"), "main", "p", SCHEMA),
+        cache.key_for(wi, "other", "p", SCHEMA),
+        cache.key_for(wi, "main", "p2", SCHEMA),
+        cache.key_for(wi, "main", "p", other_schema),
+        codex_cache.CodexCache(tmp_path, prompt_profiles={"fix": "pp_fix_v2"}).key_for(
+            wi, "main", "p", SCHEMA
+        ),
+    ]
+    assert len({key, *variants}) == 6
+
+
+def test_prompt_profiles_from_catalog():
+    catalog = _util.load_json(SSOT / "examples" / "pattern_catalog.example.json")
+    profiles = codex_cache.prompt_profiles(catalog)
+    assert profiles["fix"] == "pp_fix_v1"
+    assert codex_cache.prompt_profiles(None) == {}
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path: Path):
+    out = tmp_path / "out"
+    out.mkdir()
+    example = SSOT / "examples" / "patch_proposal.example.json"
+    (out / "patch_proposal.json").write_bytes(example.read_bytes())
+    cache = codex_cache.CodexCache(tmp_path / "cache", max_entries=2)
+    summary = {"events": 1, "last_event_type": "x", "returncode": 0}
+    cache.put("a", out, summary)
+    time.sleep(0.01)
+    cache.put("b", out, summary)
+    time.sleep(0.01)
+    assert cache.get("a", out) == summary  # "a" is now the most recent
+    time.sleep(0.01)
+    cache.put("c", out, summary)
+
+    assert sorted(p.name for p in (tmp_path / "cache").iterdir()) == ["a", "c"]
+    assert cache.get("b", out) is None
+    cache.put("c", out, summary)  # already stored: no-op
+    assert cache.stats == {"hits": 1, "misses": 1, "stores": 3, "evictions": 1}
+
+
+def test_entry_without_valid_patch_is_a_miss(tmp_path: Path):
+    out = tmp_path / "out"
+    out.mkdir()
+    example = SSOT / "examples" / "patch_proposal.example.json"
+    (out / "patch_proposal.json").write_bytes(example.read_bytes())
+    (out / "codex_events.jsonl").write_text("{}\n", encoding="utf-8")
+    cache = codex_cache.CodexCache(tmp_path / "cache")
+    summary = {"events": 1, "last_event_type": "x", "returncode": 0}
+    cache.put("a", out, summary)
+    cache.put("b", out, summary)
+
+    fresh = tmp_path / "fresh"
+    fresh.mkdir()
+    # Evicted halfway (patch gone, summary still there): not a hit.
+    (tmp_path / "cache" / "a" / "patch_proposal.json").unlink()
+    assert cache.get("a", fresh) is None
+    # A stamp that breaks the proposal: a miss, and nothing left behind.
+    assert cache.get("b", fresh, stamp={"candidate_id": 1}) is None
+    assert not list(fresh.iterdir())
+    assert cache.get("b", fresh, stamp={"candidate_id": "c-2"}) == summary
+    assert _util.load_json(fresh / "patch_proposal.json")["candidate_id"] == "c-2"
+    assert cache.stats["hits"] == 1 and cache.stats["misses"] == 2
+
+
+def test_hit_reuses_patch_and_summary_without_codex(codex_runs, tmp_path: Path):
+    queue, wi = queue_and_item()
+    cand_path = tmp_path / "candidate_set.json"
+    cache = codex_cache.CodexCache()
+    led = budget.BudgetLedger(queue["queue_id"], budget.budget_limits())
+
+    first = worker.run_candidate(
+        queue, wi, "w", "p", cand_path, ledger=led, cache=cache
+    )
+    second = worker.run_candidate(
+        queue, wi, "w", "p", cand_path, ledger=led, cache=cache
+    )
+    assert codex_runs() == 1
+    assert cache.stats["hits"] == 1 and cache.stats["stores"] == 1
+
+    out = _util.state_root() / "out"
+    reused = _util.load_json(out / second / "patch_proposal.json")
+    # Re-stamped for the new run; otherwise the cached proposal.
+    assert reused["candidate_id"] == second
+    assert reused["work_item_id"] == wi["work_item_id"]
+    assert dict(reused, candidate_id="x") == dict(
+        _util.load_json(out / first / "patch_proposal.json"), candidate_id="x"
+    )
+    check = _util.load_json(out / second / "evidence.json")["checks"][0]
+    assert check["cached"] is True
+    assert check["events"] == 2 and check["tool_calls"] == 1
+    evidence = _util.load_json(out / second / "evidence.json")
+    assert evidence["touched_paths"] == ["src/example.py"]
+    assert evidence["diff_summary"]["insertions"] == 1
+    assert _util.load_json(out / second / "gate_worker.json")["decision"] == "PROMOTE"
+    # The hit released its reservation: only the real run was charged.
+    assert led.summary()["spent"]["runs"] == 1 and led.summary()["reserved"] == 0
+
+    # A different prompt misses; no cache always runs codex.
+    worker.run_candidate(queue, wi, "w", "p2", cand_path, cache=cache)
+    worker.run_candidate(queue, wi, "w", "p", cand_path)
+    assert codex_runs() == 3
+    assert len(list(_util.iter_candidate_set(cand_path))) == 4
+
+
+def test_abandoned_runs_are_not_cached(codex_runs, tmp_path: Path):
+    queue, wi = queue_and_item()
+    cache = codex_cache.CodexCache()
+    progress = worker.CodexProgress()
+    progress.cancel("lease_expired")
+    cand_path = tmp_path / "candidate_set.json"
+    assert (
+        worker.run_candidate(
+            queue, wi, "w", "p", cand_path, None, progress, None, cache
+        )
+        is None
+    )
+    worker.run_candidate(queue, wi, "w", "p", cand_path, cache=cache)
+    assert cache.stats["hits"] == 0 and cache.stats["stores"] == 1
@@ -0,0 +1,140 @@
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SSOT = ROOT / "control" / "ssot"
+sys.path.insert(0, str(ROOT / "tools"))
+
+import _util
+import worker_run_candidate as worker
+
+# Stand-in for codex-cli; behaviour picked by $FAKE_CODEX_MODE.
+FAKE_CODEX = """#!{python}
+import json, os, signal, sys, time
+mode = os.environ.get("FAKE_CODEX_MODE", "ok")
+out = sys.argv[sys.argv.index("-o") + 1]
+def emit(kind):
+    print(json.dumps({{"type": kind}}), flush=True)
+if mode == "stubborn":
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+emit("thread.started")
+print("warning: not json", flush=True)
+if mode == "ok":
+    for _ in range(3):
+        time.sleep(0.1)
+        emit("item.completed")
+    with open({example!r}) as src, open(out, "w") as dst:
+        dst.write(src.read())
+    emit("turn.completed")
+elif mode == "chatty":
+    while True:
+        emit("item.completed")
+        time.sleep(0.01)
+else:
+    time.sleep(60)
+"""
+
+
+@pytest.fixture
+def codex(tmp_path: Path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "codex"
+    script.write_text(
+        FAKE_CODEX.format(
+            python=sys.executable,
+            example=str(SSOT / "examples" / "patch_proposal.example.json"),
+        ),
+        encoding="utf-8",
+    )
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    def run(mode: str, **kwargs):
+        monkeypatch.setenv("FAKE_CODEX_MODE", mode)
+        progress = kwargs.pop("progress", None) or worker.CodexProgress()
+        rc = worker.run_codex(
+            prompt="Objective: x",
+            output_schema_path=Path(_util.read_registry_schema("patch_proposal")),
+            out_json=tmp_path / "patch_proposal.json",
+            out_events_jsonl=tmp_path / "codex_events.jsonl",
+            cwd=tmp_path,
+            progress=progress,
+            **kwargs,
+        )
+        return rc, progress
+
+    return run
+
+
+def test_events_are_streamed_and_counted_live(codex, tmp_path: Path):
+    progress = worker.CodexProgress()
+    seen_mid_run = []
+
+    def watch():
+        while progress.returncode is None:
+            if progress.events:
+                seen_mid_run.append(progress.events)
+            time.sleep(0.02)
+
+    watcher = threading.Thread(target=watch)
+    watcher.start()
+    rc, _ = codex("ok", progress=progress)
+    watcher.join()
+
+    assert rc == 0 and progress.stop_reason is None
+    assert seen_mid_run and seen_mid_run[0] < 5
+    assert progress.events == 5
+    assert progress.last_event_type == "turn.completed"
+    lines = (tmp_path / "codex_events.jsonl").read_text().splitlines()
+    assert len(lines) == 6 and "not json" in lines[1]
+
+
+def test_wall_clock_budget_terminates(codex):
+    start = time.monotonic()
+    rc, progress = codex("sleep", max_seconds=0.3)
+    assert time.monotonic() - start < 5
+    assert rc < 0
+    assert progress.stop_reason == "max_codex_minutes"
+    assert progress.summary()["events"] == 1
+
+
+def test_stubborn_codex_is_killed_after_grace(codex):
+    rc, progress = codex("stubborn", max_seconds=0.2, grace_seconds=0.3)
+    assert rc == -9
+    assert progress.stop_reason == "max_codex_minutes"
+
+
+def test_event_budget_terminates(codex):
+    rc, progress = codex("chatty", max_events=20)
+    assert rc < 0
+    assert progress.stop_reason == "max_codex_events"
+    assert progress.events > 20
+
+
+def test_budget_stop_is_recorded_as_budget_exhausted(codex, tmp_path, monkeypatch):
+    monkeypatch.setenv("CODEX_STATE", str(tmp_path / "state"))
+    monkeypatch.setenv("FAKE_CODEX_MODE", "sleep")
+    queue = _util.load_json(SSOT / "examples" / "work_queue.example.json")
+    wi = dict(queue["work_items"][0], budgets={"max_codex_minutes": 0.005})
+    cand_path = tmp_path / "candidate_set.json"
+
+    cid = worker.run_candidate(queue, wi, "w", "prompt", cand_path)
+    out_dir = _util.state_root() / "out" / cid
+    gate = _util.load_json(out_dir / "gate_worker.json")
+    assert gate["decision"] == "DENY"
+    assert gate["reason_codes"] == ["BUDGET_EXHAUSTED"]
+    check = _util.load_json(out_dir / "evidence.json")["checks"][0]
+    assert check["stop_reason"] == "max_codex_minutes"
+    assert [c["candidate_id"] for c in _util.iter_candidate_set(cand_path)] == [cid]
+
+    # Cancelled for other reasons (shutdown, lease expiry): abandoned.
+    progress = worker.CodexProgress()
+    threading.Timer(0.2, progress.cancel, args=("lease_expired",)).start()
+    wi = dict(wi, budgets={})
+    assert worker.run_candidate(queue, wi, "w", "p", cand_path, None, progress) is None
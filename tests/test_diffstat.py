@@ -0,0 +1,184 @@
+import io
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SSOT = ROOT / "control" / "ssot"
+sys.path.insert(0, str(ROOT / "tools"))
+
+import _util
+import diffstat
+
+GIT_DIFF = """\
+diff --git a/src/app.py b/src/app.py
+index 1111111..2222222 100644
+--- a/src/app.py
++++ b/src/app.py
+@@ -1,3 +1,4 @@
+ import os
+--- not a header, a removed line
++++ not a header, an added line
++diff --git a/also b/content
+ x = 1
+\\ No newline at end of file
+diff --git a/docs/new.md b/docs/new.md
+new file mode 100644
+index 0000000..3333333
+--- /dev/null
++++ b/docs/new.md
+@@ -0,0 +1,2 @@
++# New
++
+diff --git a/old.txt b/old.txt
+deleted file mode 100644
+index 4444444..0000000
+--- a/old.txt
++++ /dev/null
+@@ -1 +0,0 @@
+-gone
+diff --git a/lib/a.py b/lib/b.py
+similarity index 90%
+rename from lib/a.py
+rename to lib/b.py
+index 5555555..6666666 100644
+--- a/lib/a.py
++++ b/lib/b.py
+@@ -3,1 +3,1 @@
+-old
++new
+diff --git a/img/logo.png b/img/logo.png
+index 7777777..8888888 100644
+Binary files a/img/logo.png and b/img/logo.png differ
+diff --git "a/sp ace/\\303\\251.txt" "b/sp ace/\\303\\251.txt"
+index 9999999..aaaaaaa 100644
+--- "a/sp ace/\\303\\251.txt"
++++ "b/sp ace/\\303\\251.txt"
+@@ -1 +1 @@
+-a
++b
+"""
+
+
+def parse(text: str) -> diffstat.DiffStats:
+    return diffstat.parse_unified_diff(io.StringIO(text))
+
+
+def test_git_diff_files_counts_and_markers():
+    stats = parse(GIT_DIFF)
+    files = {f["path"]: f for f in stats.summary()["files"]}
+    assert files["src/app.py"] == {
+        "path": "src/app.py",
+        "status": "modified",
+        "added": 2,
+        "removed": 1,
+        "binary": False,
+    }
+    assert files["docs/new.md"]["status"] == "added"
+    assert files["docs/new.md"]["added"] == 2
+    assert files["old.txt"]["status"] == "deleted"
+    assert files["lib/b.py"]["status"] == "renamed"
+    assert files["lib/b.py"]["old_path"] == "lib/a.py"
+    assert files["img/logo.png"]["binary"] is True
+    assert files["sp ace/é.txt"]["added"] == 1
+
+    assert stats.metrics() == {"diff_lines_total": 10, "files_touched": 6}
+    summary = stats.summary()
+    assert summary["insertions"] == 6 and summary["deletions"] == 4
+    assert summary["binary_files"] == 1
+    assert stats.touched_paths == sorted(
+        [
+            "docs/new.md",
+            "img/logo.png",
+            "lib/a.py",
+            "lib/b.py",
+            "old.txt",
+            "src/app.py",
+            "sp ace/é.txt",
+        ]
+    )
+
+
+def test_plain_diff_u():
+    text = """\
+--- a.txt\t2024-01-01 00:00:00
++++ a.txt\t2024-01-02 00:00:00
+@@ -1,2 +1,2 @@
+-one
++uno
+ two
+--- b.txt
++++ b.txt
+@@ -5 +5,2 @@
+ five
++six
+"""
+    stats = parse(text)
+    assert [(f.path, f.added, f.removed) for f in stats.files] == [
+        ("a.txt", 1, 1),
+        ("b.txt", 1, 0),
+    ]
+
+
+def test_matches_git_numstat(tmp_path: Path):
+    def git(*args: str) -> str:
+        return subprocess.run(
+            ["git", "-C", str(tmp_path), *args],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+
+    git("init", "-q")
+    git("config", "user.email", "t@example.com")
+    git("config", "user.name", "t")
+    for i in range(5):
+        (tmp_path / f"f{i}.txt").write_text(
+            "".join(f"line {n}\n" for n in range(200)), encoding="utf-8"
+        )
+    git("add", ".")
+    git("commit", "-qm", "base")
+    for i in range(5):
+        path = tmp_path / f"f{i}.txt"
+        lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+        lines[i * 10 : i * 10 + 3] = ["--- changed\n", "+++ too\n"]
+        lines.append("tail\n")
+        path.write_text("".join(lines), encoding="utf-8")
+    (tmp_path / "f0.txt").rename(tmp_path / "moved.txt")
+    git("add", "-A")
+
+    stats = parse(git("diff", "--cached", "-M"))
+    numstat = {}
+    for row in git("diff", "--cached", "-M", "--numstat").splitlines():
+        added, removed, path = row.split("\t")
+        numstat[path] = (int(added), int(removed))
+    parsed = {}
+    for f in stats.files:
+        key = f.path
+        if f.status == "renamed":
+            key = f"{f.old_path} => {f.new_path}"
+        parsed[key] = (f.added, f.removed)
+    assert parsed == numstat
+
+
+def test_patch_diff_stats_reads_proposal_and_patch_file(tmp_path: Path):
+    patch = _util.load_json(SSOT / "examples" / "patch_proposal.example.json")
+    stats = diffstat.patch_diff_stats(patch)
+    assert stats.metrics() == {"diff_lines_total": 2, "files_touched": 1}
+    assert stats.touched_paths == ["src/example.py"]
+
+    (tmp_path / "change.patch").write_text(GIT_DIFF, encoding="utf-8")
+    del patch["unified_diff"]
+    patch["patch_path"] = "change.patch"
+    assert diffstat.patch_diff_stats(patch, tmp_path).metrics()["files_touched"] == 6
+
+
+def test_large_diff_is_parsed_in_one_pass():
+    hunk = "@@ -1,3 +1,3 @@\n ctx\n-old\n+new\n ctx\n"
+    text = "".join(
+        f"diff --git a/f{i}.py b/f{i}.py\n--- a/f{i}.py\n+++ b/f{i}.py\n" + hunk * 20
+        for i in range(2000)
+    )
+    assert len(text) > 1_000_000
+    stats = parse(text)
+    assert stats.metrics() == {"diff_lines_total": 80000, "files_touched": 2000}
@@ -0,0 +1,73 @@
+import copy
+import json
+import sys
+from pathlib import Path
+
+import jsonschema
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SSOT = ROOT / "control" / "ssot"
+sys.path.insert(0, str(ROOT / "tools"))
+sys.path.insert(0, str(ROOT / "tools" / "contracts"))
+
+import _util
+from validator_codegen import compile_schema
+
+KINDS = sorted(json.loads((SSOT / "registry.json").read_text())["artifacts"])
+REPLACEMENTS = ["", "x", 0, -1, 1.5, True, None, [], {}]
+
+
+def load(path: Path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def compiled(schema: dict):
+    ns: dict = {}
+    # The generator's own output, as gen.py would write it to a module.
+    exec(compile(compile_schema(schema), "<generated>", "exec"), ns)  # noqa: S102
+    return ns["validate"], ns["ValidationError"]
+
+
+def mutations(doc: dict):
+    yield doc
+    for key in doc:
+        dropped = copy.deepcopy(doc)
+        del dropped[key]
+        yield dropped
+        for value in REPLACEMENTS:
+            replaced = copy.deepcopy(doc)
+            replaced[key] = value
+            yield replaced
+    extra = copy.deepcopy(doc)
+    extra["unexpected_key"] = 1
+    yield extra
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_generated_validator_agrees_with_draft7(kind: str):
+    schema = load(ROOT / _util.load_registry()["artifacts"][kind]["schema"])
+    example = load(SSOT / "examples" / f"{kind}.example.json")
+    validate, error = compiled(schema)
+    draft7 = jsonschema.Draft7Validator(schema)
+
+    for doc in mutations(example):
+        try:
+            validate(doc)
+            verdict = True
+        except error:
+            verdict = False
+        assert verdict == draft7.is_valid(doc), json.dumps(doc)[:200]
+
+
+def test_committed_generated_validators_are_fresh_and_used():
+    _util.invalidate_validator_cache()
+    for kind in KINDS:
+        assert _util.get_generated_validator(kind) is not None, kind
+
+    example = load(SSOT / "examples" / "work_queue.example.json")
+    _util.validate_artifact("work_queue", example)
+    example["work_items"] = []
+    # Failures are re-raised by jsonschema with its canonical error.
+    with pytest.raises(jsonschema.ValidationError):
+        _util.validate_artifact("work_queue", example)
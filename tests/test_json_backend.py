@@ -0,0 +1,99 @@
+import json
+import math
+import random
+import struct
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import _util
+
+requires_orjson = pytest.mark.skipif(_util.orjson is None, reason="needs orjson")
+
+STRINGS = ["", "a", "é", " ", "\x7f", "\x00\x1f", 'q"\\/', "1e5", ": 1e5", "日本"]
+
+
+def random_float(rng: random.Random) -> float:
+    while True:
+        x = struct.unpack("d", struct.pack("Q", rng.getrandbits(64)))[0]
+        if math.isfinite(x):
+            return x
+
+
+def random_value(rng: random.Random, depth: int = 0):
+    roll = rng.random()
+    if depth > 3 or roll < 0.5:
+        return rng.choice(
+            [
+                lambda: rng.choice(STRINGS) + str(rng.randint(0, 9)),
+                lambda: rng.randint(-(2**70), 2**70),
+                lambda: rng.randint(-1000, 1000),
+                lambda: random_float(rng),
+                lambda: rng.uniform(-1e6, 1e6),
+                lambda: rng.choice([True, False, None]),
+            ]
+        )()
+    if roll < 0.75:
+        return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return {
+        rng.choice(STRINGS) + str(i): random_value(rng, depth + 1)
+        for i in range(rng.randint(0, 4))
+    }
+
+
+@requires_orjson
+@pytest.mark.parametrize("compact", [False, True])
+def test_orjson_output_is_byte_identical_to_stdlib(compact: bool, monkeypatch):
+    rng = random.Random(1234)
+    for _ in range(3000):
+        obj = random_value(rng)
+        monkeypatch.delenv("XTRL_JSON_BACKEND", raising=False)
+        fast = _util.encode_json(obj, compact=compact)
+        monkeypatch.setenv("XTRL_JSON_BACKEND", "stdlib")
+        assert fast == _util.encode_json(obj, compact=compact), repr(obj)
+
+
+@requires_orjson
+@pytest.mark.parametrize("compact", [False, True])
+def test_non_finite_floats_encode_like_stdlib(compact: bool, monkeypatch):
+    nan, inf = float("nan"), float("inf")
+    for obj in [nan, [inf, None], {"a": {"b": [-inf]}, "c": None}, (1.5, nan)]:
+        monkeypatch.delenv("XTRL_JSON_BACKEND", raising=False)
+        fast = _util.encode_json(obj, compact=compact)
+        monkeypatch.setenv("XTRL_JSON_BACKEND", "stdlib")
+        assert fast == _util.encode_json(obj, compact=compact)
+        assert b"NaN" in fast or b"Infinity" in fast
+
+
+@requires_orjson
+def test_load_json_round_trips_through_both_backends(tmp_path: Path, monkeypatch):
+    rng = random.Random(99)
+    path = tmp_path / "artifact.json"
+    for _ in range(500):
+        obj = random_value(rng)
+        path.write_bytes(_util.encode_json(obj))
+        monkeypatch.delenv("XTRL_JSON_BACKEND", raising=False)
+        fast = _util.load_json(path)
+        monkeypatch.setenv("XTRL_JSON_BACKEND", "stdlib")
+        slow = _util.load_json(path)
+        assert json.dumps(fast) == json.dumps(slow)
+        assert type(fast) is type(slow)
+
+
+def test_compact_encoding_follows_registry_kind(tmp_path: Path):
+    example = json.loads(
+        (ROOT / "control/ssot/examples/candidate_set.example.json").read_text()
+    )
+    _util.write_json(tmp_path / "cs.json", example, kind="candidate_set")
+    _util.write_json(tmp_path / "wq.json", example, kind="work_queue")
+
+    assert _util.json_encoding("candidate_set") == "compact"
+    assert (tmp_path / "cs.json").read_bytes() == (
+        json.dumps(example, sort_keys=True, separators=(",", ":")) + "\n"
+    ).encode()
+    assert (tmp_path / "wq.json").read_bytes() == _util.canonical_json_bytes(example)
+    assert _util.load_json(tmp_path / "cs.json") == example
@@ -0,0 +1,152 @@
+import copy
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SSOT = ROOT / "control" / "ssot"
+sys.path.insert(0, str(ROOT / "tools"))
+
+import _util
+
+LINEARIZER = ROOT / "tools" / "promote_linearizer.py"
+TEMPLATE = json.loads(
+    (SSOT / "examples" / "candidate_set.example.json").read_text(encoding="utf-8")
+)["candidates"][0]
+
+
+def load(path: Path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def append(cands: Path, candidate_id: str, diff_lines: int) -> None:
+    candidate = copy.deepcopy(TEMPLATE)
+    candidate["candidate_id"] = candidate_id
+    candidate["metrics"]["diff_lines_total"] = diff_lines
+    queue = load(SSOT / "examples" / "work_queue.example.json")
+    entry = {
+        "queue_id": queue["queue_id"],
+        "base_ref": queue["base_ref"],
+        "candidate": candidate,
+    }
+    _util.append_candidate(cands, entry, compact_bytes=None)
+
+
+def wait_for_selection(state: Path, candidate_id: str, timeout: float = 10.0) -> float:
+    path = state / "promote" / "selection.json"
+    start = time.monotonic()
+    while time.monotonic() - start < timeout:
+        try:
+            if load(path)["candidate"]["candidate_id"] == candidate_id:
+                return time.monotonic() - start
+        except (FileNotFoundError, ValueError):
+            pass
+        time.sleep(0.005)
+    pytest.fail(f"selection never became {candidate_id}")
+
+
+def test_daemon_follows_appends_compaction_and_policy_changes(
+    tmp_path: Path, monkeypatch
+):
+    state = tmp_path / "xtrlv2"
+    queue_dir = state / "queue"
+    queue_dir.mkdir(parents=True)
+    for kind in ("work_queue", "rank_policy"):
+        (queue_dir / f"{kind}.json").write_text(
+            (SSOT / "examples" / f"{kind}.example.json").read_text(encoding="utf-8"),
+            encoding="utf-8",
+        )
+    monkeypatch.setenv("CODEX_STATE", str(tmp_path))
+    cands = queue_dir / "candidate_set.json"
+    append(cands, "cand-a", 40)
+    append(cands, "cand-b", 30)
+
+    daemon = subprocess.Popen(
+        [sys.executable, str(LINEARIZER), "--daemon", "--poll-seconds", "0.01"],
+        env={**os.environ, "CODEX_STATE": str(tmp_path)},
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        wait_for_selection(state, "cand-b")
+        # A second linearizer is refused while the daemon holds promote.lock.
+        other = subprocess.run(
+            [sys.executable, str(LINEARIZER), "--daemon"],
+            env={**os.environ, "CODEX_STATE": str(tmp_path)},
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        assert other.returncode == 5
+
+        append(cands, "cand-c", 20)
+        assert wait_for_selection(state, "cand-c") < 2.0
+        _util.compact_candidate_log(cands)
+        append(cands, "cand-d", 90)  # worse: no new selection
+        append(cands, "cand-e", 10)
+        wait_for_selection(state, "cand-e")
+        assert load(state / "promote" / "selection.json")["snapshot_generation"] is None
+
+        # Same content rewritten: no reload. New content: re-rank from scratch.
+        policy_path = queue_dir / "rank_policy.json"
+        policy = load(policy_path)
+        policy_path.write_bytes(policy_path.read_bytes())
+        os.utime(policy_path, (time.time() + 5, time.time() + 5))
+        time.sleep(0.1)
+        policy["tuple_order"] = [{"field": "diff_lines_total", "direction": "desc"}]
+        _util.write_json(policy_path, policy)
+        wait_for_selection(state, "cand-d")
+    finally:
+        daemon.send_signal(signal.SIGTERM)
+        out, err = daemon.communicate(timeout=10)
+    assert daemon.returncode == 0, err
+    lines = out.splitlines()
+    assert lines[:4] == [
+        "Selected candidate: cand-b",
+        "Selected candidate: cand-c",
+        "Selected candidate: cand-e",
+        "Selected candidate: cand-d",
+    ]
+    stats = json.loads(lines[-1])
+    assert stats["reloads"] == 2
+    assert stats["selections"] == 4
+    assert stats["ingested"] == 5 + 5
+    assert stats["rejected"] == 0
+
+
+def test_candidate_tail_reads_only_new_entries(tmp_path: Path):
+    cands = tmp_path / "candidate_set.json"
+    append(cands, "cand-a", 1)
+    tail = _util.CandidateTail(cands)
+    assert [c["candidate_id"] for c in tail.poll()] == ["cand-a"]
+    assert tail.poll() == []
+    append(cands, "cand-b", 1)
+    # Half-written append: not returned until its newline lands.
+    log = _util.candidate_log_paths(cands)[0]
+    with open(log, "ab") as f:
+        f.write(b'{"candidate": {"candidate_id"')
+    assert [c["candidate_id"] for c in tail.poll()] == ["cand-b"]
+    with open(log, "ab") as f:
+        f.write(b': "bad"}}\n')
+    assert tail.poll() == [] and tail.rejected[0]["candidate_id"] == "bad"
+    # A malformed line between appends is skipped, not fatal.
+    with open(log, "ab") as f:
+        f.write(b"garbage\n")
+    append(cands, "cand-d", 1)
+    assert [c["candidate_id"] for c in tail.poll()] == ["cand-d"]
+    assert tail.rejected[1]["error"] == "malformed candidate log line"
+    log.write_bytes(
+        log.read_bytes().replace(b'{"candidate": {"candidate_id": "bad"}}\n', b"")
+    )
+    _util.compact_candidate_log(cands)
+    append(cands, "cand-c", 1)
+    assert [c["candidate_id"] for c in tail.poll()] == ["cand-c"]
+    assert tail.envelope["base_ref"]
+    tail.close()
@@ -0,0 +1,136 @@
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import _util
+
+pytestmark = pytest.mark.skipif(_util.fcntl is None, reason="needs fcntl")
+
+
+def test_second_holder_gets_lock_busy_and_release_unlinks(tmp_path: Path):
+    path = tmp_path / "locks" / "item.lock"
+    _util.reset_lock_stats()
+    with _util.FlockLock(path) as lock:
+        assert lock.holder()["pid"] == os.getpid()
+        with pytest.raises(_util.LockBusy) as exc:
+            _util.FlockLock(path).acquire()
+        assert f"pid={os.getpid()}" in str(exc.value)
+        # Callers that predate LockBusy still catch it.
+        assert isinstance(exc.value, FileExistsError)
+    assert not path.exists()
+    stats = _util.lock_stats()
+    assert stats["acquired"] == 1
+    assert stats["contended"] == 1
+    assert stats["timeouts"] == 1
+
+
+def test_bounded_wait_acquires_after_release(tmp_path: Path):
+    path = tmp_path / "item.lock"
+    _util.reset_lock_stats()
+    first = _util.FlockLock(path).acquire()
+    timer = threading.Timer(0.1, first.release)
+    timer.start()
+    try:
+        with _util.FlockLock(path, timeout=5):
+            pass
+    finally:
+        timer.join()
+    stats = _util.lock_stats()
+    assert stats["acquired"] == 2
+    assert stats["contended"] == 1
+    assert stats["timeouts"] == 0
+    assert stats["wait_seconds"] >= 0.05
+
+
+def test_dead_holder_releases_immediately(tmp_path: Path):
+    path = tmp_path / "item.lock"
+    ready = tmp_path / "ready"
+    holder = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            (
+                "import sys, time; sys.path.insert(0, sys.argv[1]); import _util;"
+                " from pathlib import Path;"
+                " _util.FlockLock(Path(sys.argv[2])).acquire();"
+                " Path(sys.argv[3]).touch(); time.sleep(60)"
+            ),
+            str(ROOT / "tools"),
+            str(path),
+            str(ready),
+        ]
+    )
+    try:
+        deadline = time.monotonic() + 10
+        while not ready.exists():
+            assert time.monotonic() < deadline, "holder never took the lock"
+            time.sleep(0.01)
+        with pytest.raises(_util.LockBusy):
+            _util.FlockLock(path).acquire()
+    finally:
+        holder.send_signal(signal.SIGKILL)
+        holder.wait()
+    # No TTL to wait out: the kernel dropped the dead holder's lock.
+    with _util.FlockLock(path, timeout=0):
+        pass
+
+
+def test_expired_lease_is_reported_and_heartbeat_extends_it(tmp_path: Path):
+    path = tmp_path / "item.lock"
+    _util.reset_lock_stats()
+    with _util.FlockLock(path, lease_seconds=0.05, heartbeat=False):
+        time.sleep(0.1)
+        with pytest.raises(_util.LockBusy) as exc:
+            _util.FlockLock(path).acquire()
+        assert "lease expired" in str(exc.value)
+    assert _util.lock_stats()["expired_leases_seen"] == 1
+
+    with _util.FlockLock(path, lease_seconds=0.3) as lock:
+        first = lock.holder()["expires_at"]
+        time.sleep(0.25)
+        assert lock.holder()["expires_at"] > first
+        assert lock.holder()["expires_at"] > time.time()
+        with pytest.raises(_util.LockBusy) as exc:
+            _util.FlockLock(path).acquire()
+        assert "lease expired" not in str(exc.value)
+
+
+def test_atomic_lock_backends(tmp_path: Path, monkeypatch):
+    path = tmp_path / "item.lock"
+    with _util.AtomicLock(path) as lock:
+        assert lock.backend == "flock"
+        with pytest.raises(FileExistsError):
+            _util.AtomicLock(path).__enter__()
+    assert not path.exists()
+
+    monkeypatch.setenv("XTRL_LOCK_BACKEND", "excl")
+    with _util.AtomicLock(path) as lock:
+        assert lock.backend == "excl"
+        assert "pid=" in path.read_text(encoding="utf-8")
+        with pytest.raises(FileExistsError):
+            _util.AtomicLock(path).__enter__()
+        lock.renew()
+    assert not path.exists()
+
+    with pytest.raises(ValueError):
+        _util.AtomicLock(path, backend="nfs")
+
+
+def test_holder_record_is_fixed_size_json(tmp_path: Path):
+    path = tmp_path / "item.lock"
+    with _util.FlockLock(path, lease_seconds=60, heartbeat=False) as lock:
+        lock.renew()
+        data = path.read_bytes()
+        assert len(data) == 256
+        record = json.loads(data)
+        assert set(record) == {"expires_at", "host", "pid", "renewed_at"}
@@ -0,0 +1,227 @@
+"""Several "nodes" (processes with their own XTRL_NODE_ID) on one state root,
+coordinating through the link lock backend as hosts sharing NFS would."""
+
+import copy
+import itertools
+import json
+import multiprocessing as mp
+import os
+import signal
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SSOT = ROOT / "control" / "ssot"
+sys.path.insert(0, str(ROOT / "tools"))
+
+import _util
+import budget
+from claims import ClaimEngine
+
+TEMPLATE = json.loads(
+    (SSOT / "examples" / "candidate_set.example.json").read_text(encoding="utf-8")
+)["candidates"][0]
+
+
+def entry(candidate_id: str) -> dict:
+    candidate = copy.deepcopy(TEMPLATE)
+    candidate["candidate_id"] = candidate_id
+    return {"queue_id": "q-1", "base_ref": "abc123", "candidate": candidate}
+
+
+def node(state: str, name: str, items: int, claims: int) -> None:
+    os.environ.update(CODEX_STATE=state, XTRL_NODE_ID=name, XTRL_LOCK_BACKEND="link")
+    _util.CANDIDATE_SPOOL_COMPACT_ENTRIES = 4
+    root = Path(state)
+    work_items = [{"work_item_id": f"wi-{i}", "priority": 0} for i in range(items)]
+    engine = ClaimEngine(work_items, root / "locks", retry_seconds=0.005)
+    held = []
+    while len(held) < claims:
+        lease = engine.claim()
+        if lease is None:
+            time.sleep(0.005)
+            continue
+        start = time.time()
+        cid = f"{lease.work_item_id}.{name}.{len(held)}"
+        _util.append_candidate(root / "queue" / "candidate_set.json", entry(cid))
+        time.sleep(0.01)
+        held.append((lease.work_item_id, start, time.time()))
+        engine.release(lease)
+    with open(root / f"{name}.claims.json", "w", encoding="utf-8") as f:
+        json.dump(held, f)
+
+
+def hold_and_die(path: str, name: str, lease: float, ready: str) -> None:
+    os.environ.update(XTRL_NODE_ID=name)
+    _util.LinkLock(Path(path), lease_seconds=lease, heartbeat=False).acquire()
+    Path(ready).touch()
+    os.kill(os.getpid(), signal.SIGKILL)
+
+
+def test_nodes_claim_exclusively_and_publish_every_candidate(
+    tmp_path: Path, monkeypatch
+):
+    state = tmp_path / "state"
+    (state / "queue").mkdir(parents=True)
+    procs = [
+        mp.Process(target=node, args=(str(state), f"node-{n}", 3, 8)) for n in range(4)
+    ]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(60)
+        assert p.exitcode == 0
+
+    held, expected = [], []
+    for n in range(4):
+        claims = json.loads((state / f"node-{n}.claims.json").read_text())
+        held += claims
+        expected += [f"{item}.node-{n}.{k}" for k, (item, _, _) in enumerate(claims)]
+    assert len(held) == 32
+    by_item: dict = {}
+    for item, start, end in held:
+        by_item.setdefault(item, []).append((start, end))
+    for spans in by_item.values():
+        spans.sort()
+        assert all(a[1] <= b[0] for a, b in itertools.pairwise(spans))
+
+    monkeypatch.setenv("CODEX_STATE", str(state))
+    monkeypatch.setenv("XTRL_LOCK_BACKEND", "link")
+    cands = state / "queue" / "candidate_set.json"
+    assert sorted(c["candidate_id"] for c in _util.iter_candidate_set(cands)) == sorted(
+        expected
+    )
+    _util.compact_candidate_log(cands)
+    compacted = [c["candidate_id"] for c in _util.load_json(cands)["candidates"]]
+    assert sorted(compacted) == sorted(expected)
+    assert not list(_util.candidate_spool_dir(cands).iterdir())
+    # Only the fencing token counters outlive their locks.
+    assert {p.suffix for p in (state / "locks").iterdir()} == {".token"}
+
+
+def test_crashed_holder_is_broken_after_its_lease(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(_util, "NODE_CLOCK_SKEW_SECONDS", 0.0)
+    monkeypatch.setenv("XTRL_NODE_ID", "node-a")
+    path = tmp_path / "item.lock"
+    _util.reset_lock_stats()
+
+    def crash(name: str, lease: float) -> None:
+        ready = tmp_path / f"{name}.ready"
+        p = mp.Process(target=hold_and_die, args=(str(path), name, lease, str(ready)))
+        p.start()
+        p.join(30)
+        assert p.exitcode == -signal.SIGKILL and ready.exists()
+
+    # Another node's dead holder: its pid means nothing here, wait out the lease.
+    crash("node-b", 0.3)
+    assert _util.LinkLock(path).holder()["node"] == "node-b"
+    with pytest.raises(_util.LockBusy) as exc:
+        _util.LinkLock(path).acquire()
+    assert "node=node-b" in str(exc.value)
+    time.sleep(0.35)
+    with _util.LinkLock(path) as lock:
+        assert lock.token == 2
+        assert lock.holder()["node"] == "node-a"
+
+    # A dead holder on this node is broken at once.
+    crash("node-a", 60.0)
+    with _util.LinkLock(path) as lock:
+        assert lock.token == 4
+    assert _util.lock_stats()["broken"] == 2
+    assert sorted(p.name for p in tmp_path.iterdir() if "lock" in p.name) == [
+        "item.lock.token"
+    ]
+
+
+def test_heartbeat_keeps_a_live_holder(tmp_path: Path):
+    path = tmp_path / "item.lock"
+    with _util.LinkLock(path, lease_seconds=0.3) as lock:
+        first = lock.holder()["expires_at"]
+        time.sleep(0.5)
+        assert lock.holder()["expires_at"] > first
+        with pytest.raises(_util.LockBusy):
+            _util.LinkLock(path).acquire()
+        assert not lock.lost
+    assert not path.exists()
+
+
+def test_stale_holder_is_fenced_off(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(_util, "NODE_CLOCK_SKEW_SECONDS", 0.0)
+    path = tmp_path / "promote.lock"
+    selection = tmp_path / "selection.json"
+    _util.reset_lock_stats()
+    old = _util.LinkLock(path, lease_seconds=0.05, heartbeat=False).acquire()
+    time.sleep(0.1)  # e.g. stalled on a slow mount past its lease
+    monkeypatch.setenv("XTRL_LOCK_BACKEND", "link")
+    with _util.AtomicLock(path, timeout=5) as new:
+        assert (old.token, new.token) == (1, 2)
+        assert _util.check_fence(selection, new.token)
+        old.renew()
+        assert old.lost and not old.owned()
+        assert not _util.check_fence(selection, old.token)
+        old.release()  # must not remove the new holder's lock
+        assert _util.LinkLock(path).holder()["token"] == 2
+    assert _util.check_fence(selection, None)
+    assert _util.lock_stats()["fenced"] == 1
+    assert (tmp_path / "selection.json.fence").read_text() == "2\n"
+
+
+def test_fenced_ledger_update_is_redone(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XTRL_LOCK_BACKEND", "link")
+    _util.reset_lock_stats()
+    led = budget.BudgetLedger("q-1", budget.budget_limits(), tmp_path / "ledger.json")
+    led.reserve({"work_item_id": "wi-1"})
+    load = led._load
+    calls = []
+
+    def load_then_lose_lock():
+        ledger = load()
+        if not calls:
+            # While we hold the lock it is broken, and the new holder (a
+            # newer token) refuses a run.
+            newer = dict(ledger, refused=ledger["refused"] + 1)
+            _util.write_json(led.path, newer)
+            _util.check_fence(led.path, 3)  # we hold token 2
+        calls.append(1)
+        return ledger
+
+    monkeypatch.setattr(led, "_load", load_then_lose_lock)
+    led.reserve({"work_item_id": "wi-2"})
+    # Our stale write was dropped and redone on the newer ledger.
+    assert len(calls) == 2 and _util.lock_stats()["fenced"] == 1
+    summary = led.summary()
+    assert summary["reserved"] == 2 and summary["refused"] == 1
+
+
+def test_fenced_snapshot_publish_is_discarded(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XTRL_LOCK_BACKEND", "link")
+    _util.write_json(tmp_path / "queue" / "work_queue.json", {"queue_id": "q1"})
+    first = _util.publish_snapshot(root=tmp_path)
+    # A newer snapshot.lock holder has published meanwhile.
+    _util.check_fence(tmp_path / "snapshots" / "current", 10)
+    assert _util.publish_snapshot(root=tmp_path) == first
+    assert sorted(p.name for p in (tmp_path / "snapshots").iterdir()) == [
+        "current",
+        "current.fence",
+        "gen-00000001",
+    ]
+
+
+def test_spool_keeps_append_order(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XTRL_LOCK_BACKEND", "link")
+    cands = tmp_path / "candidate_set.json"
+    order = [f"cand-{c}" for c in "zqamx"]
+    for i, cid in enumerate(order):
+        _util.append_candidate(cands, entry(cid))
+        spooled = _util.candidate_spool_dir(cands)
+        # Distinct mtimes even on coarse-timestamp filesystems.
+        for path in spooled.iterdir():
+            if json.loads(path.read_text())["candidate"]["candidate_id"] == cid:
+                os.utime(path, ns=(i * 10**9, i * 10**9))
+    assert [c["candidate_id"] for c in _util.iter_candidate_set(cands)] == order
+    _util.compact_candidate_log(cands)
+    compacted = [c["candidate_id"] for c in _util.load_json(cands)["candidates"]]
+    assert compacted == order
@@ -0,0 +1,125 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SSOT = ROOT / "control" / "ssot"
+sys.path.insert(0, str(ROOT / "tools"))
+
+import pathpolicy
+import rank
+from worker_run_candidate import worker_gate_stub
+
+
+def load(name: str) -> dict:
+    return json.loads(
+        (SSOT / "examples" / f"{name}.example.json").read_text(encoding="utf-8")
+    )
+
+
+@pytest.mark.parametrize(
+    "pattern, matches, misses",
+    [
+        ("src/", ["src", "src/a.py", "src/x/y/z.py"], ["srcx/a.py", "lib/src/a"]),
+        (".git", [".git", ".git/HEAD"], [".github/workflows/ci.yml"]),
+        ("tools/**", ["tools/a.py", "tools/bench/b.py"], ["tools", "toolsx/a"]),
+        ("*.md", ["README.md", "x.md/inner"], ["docs/a.md", "README.mdx"]),
+        ("**/*.md", ["README.md", "docs/a/b.md"], ["docs/a.txt"]),
+        ("docs/**/index.*", ["docs/index.html", "docs/a/b/index.md"], ["index.md"]),
+        (
+            "src/*/test_?.py",
+            ["src/a/test_1.py"],
+            ["src/test_1.py", "src/a/b/test_1.py"],
+        ),
+        ("tests/[!_]*", ["tests/test_a.py"], ["tests/_util.py"]),
+        ("v[0-9]/*", ["v1/a", "v2/b/c"], ["vx/a", "v1"]),
+        ("/", ["a", "a/b"], []),
+        ("./state/", ["state/x.json"], ["stately"]),
+    ],
+)
+def test_pattern_semantics(pattern, matches, misses):
+    policy = pathpolicy.PathPolicy(forbidden=[pattern])
+    for path in matches:
+        assert policy.check(path) == "forbidden", (pattern, path)
+    for path in misses:
+        assert policy.check(path) is None, (pattern, path)
+
+
+def test_allowed_forbidden_and_outside():
+    wi_policy = load("work_queue")["work_items"][0]["policy"]
+    hard = load("rank_policy")["hard_filters"]
+    policy = pathpolicy.policy_path_policy(hard, wi_policy)
+    assert policy.violations(
+        [
+            "src/a.py",
+            "tests/test_a.py",
+            "./src/../tests/b.py",
+            "src/state/ok.py",
+            "state/queue.json",
+            "docs/a.md",
+            "../escape.py",
+            "/etc/passwd",
+            "src/../../x",
+        ]
+    ) == [
+        ("state/queue.json", "forbidden"),
+        ("docs/a.md", "not_allowed"),
+        ("../escape.py", "outside"),
+        ("/etc/passwd", "outside"),
+        ("src/../../x", "outside"),
+    ]
+    # Forbidden wins over allowed; no allowed list allows everything else.
+    assert pathpolicy.PathPolicy(["src/"], ["src/gen/**"]).check("src/gen/a") == (
+        "forbidden"
+    )
+    assert pathpolicy.PathPolicy([], ["src/gen/"]).check("docs/a") is None
+    contract = load("packet_pre_contract")["constraints"]
+    policy = pathpolicy.policy_path_policy(contract)
+    assert policy.check("tools/rank.py") is None
+    assert policy.check(".git/config") == "forbidden"
+    assert policy.check("setup.py") == "not_allowed"
+    with pytest.raises(ValueError):
+        pathpolicy.policy_path_policy(wi_policy, contract)
+
+
+def test_compiled_policies_are_cached():
+    a = pathpolicy.compile_path_policy(["src/"], [".git/"])
+    assert pathpolicy.compile_path_policy(("src/",), (".git/",)) is a
+    assert pathpolicy.compile_path_policy(["src/"], []) is not a
+
+
+def test_hard_filters_use_touched_paths_from_evidence(tmp_path: Path):
+    rank_policy = load("rank_policy")
+    work_item = load("work_queue")["work_items"][0]
+    cand = dict(load("candidate_set")["candidates"][0])
+    cand["metrics"] = {"diff_lines_total": 1}
+    evidence = tmp_path / "evidence.json"
+    cand["evidence_path"] = str(evidence)
+
+    # Evidence missing, or without touched_paths: not rejected for paths.
+    assert rank.passes_hard_filters(rank_policy, cand, work_item)
+    evidence.write_text(json.dumps({"touched_paths": ["src/a.py"]}))
+    assert rank.passes_hard_filters(rank_policy, cand, work_item)
+    evidence.write_text(json.dumps({"touched_paths": ["src/a.py", "state/x"]}))
+    assert not rank.passes_hard_filters(rank_policy, cand)
+    evidence.write_text(json.dumps({"touched_paths": ["docs/a.md"]}))
+    assert rank.passes_hard_filters(rank_policy, cand)
+    assert not rank.passes_hard_filters(rank_policy, cand, work_item)
+    assert rank.passes_hard_filters(
+        rank_policy, cand, work_item, touched_paths=["tests/t.py"]
+    )
+
+
+def test_worker_gate_denies_path_violations(tmp_path: Path):
+    gate = worker_gate_stub(
+        "cand-1", "wi-1", 0, tmp_path, None, [("state/x", "forbidden")]
+    )
+    assert (gate["decision"], gate["reason_codes"]) == (
+        "DENY",
+        ["TOUCHED_FORBIDDEN_PATH"],
+    )
+    assert worker_gate_stub("cand-1", "wi-1", 0, tmp_path, None, [])["decision"] == (
+        "PROMOTE"
+    )
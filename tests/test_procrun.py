@@ -0,0 +1,133 @@
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import _util
+import procrun
+import worker_run_candidate as worker
+
+
+def python(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+def run_json(code: str, limits=None) -> dict:
+    proc = procrun.spawn(python(code), limits, stdout=subprocess.PIPE)
+    out = proc.stdout.read()
+    proc.stdout.close()
+    procrun.wait(proc)
+    assert proc.returncode == 0
+    return json.loads(out)
+
+
+def test_rusage_is_the_childs_own():
+    burn = "import time\nt = time.process_time()\nwhile time.process_time() - t < 0.3: pass"
+    rc, ru = procrun.run(python(burn))
+    assert rc == 0
+    assert ru["cpu_user_s"] + ru["cpu_system_s"] >= 0.25
+    assert ru["max_rss_kb"] > 0
+
+
+def test_own_process_group_nice_and_affinity():
+    limits = procrun.ProcLimits(nice=5, pin_cpus=True)
+    cpus = sorted(os.sched_getaffinity(0))
+    slot = limits.for_slot(len(cpus) + 1)
+    assert slot.cpus == (cpus[1 % len(cpus)],)
+    info = run_json(
+        "import json, os; print(json.dumps({'pgid': os.getpgid(0), 'pid': os.getpid(),"
+        " 'nice': os.nice(0), 'cpus': sorted(os.sched_getaffinity(0))}))",
+        slot,
+    )
+    assert info["pgid"] == info["pid"]
+    assert info["nice"] == os.nice(0) + 5
+    assert info["cpus"] == list(slot.cpus)
+    assert procrun.ProcLimits().for_slot(3) == procrun.ProcLimits()
+
+
+def test_rlimits_are_applied():
+    limits = procrun.ProcLimits(open_files=32, memory_bytes=512 * 2**20)
+    info = run_json(
+        "import json, resource; print(json.dumps([resource.getrlimit(r) for r in"
+        " (resource.RLIMIT_NOFILE, resource.RLIMIT_AS)]))",
+        limits,
+    )
+    assert info == [[32, 32], [512 * 2**20, 512 * 2**20]]
+
+    rc, _ = procrun.run(python("x = bytearray(1024 * 2**20)"), limits)
+    assert rc != 0
+
+
+def test_cpu_limit_stops_runaway_child():
+    start = time.monotonic()
+    rc, ru = procrun.run(python("while True: pass"), procrun.ProcLimits(cpu_seconds=1))
+    assert rc in (-signal.SIGXCPU, -signal.SIGKILL)
+    assert time.monotonic() - start < 10
+    assert ru["cpu_user_s"] + ru["cpu_system_s"] >= 0.9
+
+
+def test_missing_command_under_limits_exits_127():
+    rc, _ = procrun.run(
+        ["no-such-command-xtrl"],
+        procrun.ProcLimits(nice=1),
+        stderr=subprocess.DEVNULL,
+    )
+    assert rc == 127
+
+
+def test_timeout_kills_the_whole_group(tmp_path: Path):
+    pidfile = tmp_path / "grandchild.pid"
+    code = (
+        "import subprocess, sys, time\n"
+        "p = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+        f"open({str(pidfile)!r}, 'w').write(str(p.pid))\n"
+        "time.sleep(60)\n"
+    )
+    with pytest.raises(subprocess.TimeoutExpired):
+        procrun.run(python(code), timeout=1.0)
+    grandchild = int(pidfile.read_text())
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        try:
+            state = (
+                Path(f"/proc/{grandchild}/stat").read_text().split(")")[1].split()[0]
+            )
+        except FileNotFoundError:
+            break
+        if state == "Z":  # killed, waiting for its new parent to reap it
+            break
+        time.sleep(0.05)
+    else:
+        pytest.fail("grandchild survived the group kill")
+
+
+def test_run_codex_records_rusage(tmp_path: Path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    codex = bin_dir / "codex"
+    codex.write_text(
+        f'#!{sys.executable}\nprint(\'{{"type": "turn.completed"}}\')\n',
+        encoding="utf-8",
+    )
+    codex.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    progress = worker.CodexProgress()
+    rc = worker.run_codex(
+        prompt="Objective: x",
+        output_schema_path=Path(_util.read_registry_schema("patch_proposal")),
+        out_json=tmp_path / "patch_proposal.json",
+        out_events_jsonl=tmp_path / "codex_events.jsonl",
+        cwd=tmp_path,
+        progress=progress,
+        limits=procrun.ProcLimits(open_files=64, nice=1),
+    )
+    assert rc == 0 and progress.events == 1
+    assert progress.summary()["rusage"]["max_rss_kb"] > 0
@@ -0,0 +1,144 @@
+import json
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SSOT = ROOT / "control" / "ssot"
+sys.path.insert(0, str(ROOT / "tools"))
+
+import rank
+
+POLICY = json.loads(
+    (SSOT / "examples" / "rank_policy.example.json").read_text(encoding="utf-8")
+)
+BACKENDS = [
+    "array",
+    pytest.param(
+        "numpy",
+        marks=pytest.mark.skipif(rank.np is None, reason="numpy not installed"),
+    ),
+]
+
+
+def random_candidates(rng: random.Random, n: int) -> list[dict]:
+    out = []
+    for i in range(n):
+        metrics = {
+            "checks_passed": rng.randint(0, 3),
+            "diff_lines_total": rng.randint(0, 5),
+            "files_touched": rng.randint(0, 2),
+        }
+        if rng.random() < 0.7:
+            metrics["checks_failed"] = rng.randint(0, 1)
+        cand = {"candidate_id": f"c{i}", "metrics": metrics}
+        if rng.random() < 0.9:
+            cand["created_at"] = f"2026-01-0{rng.randint(1, 3)}"
+        out.append(cand)
+    return out
+
+
+def expected(policy: dict, cands: list[dict], k: int) -> list[str]:
+    key = rank.build_rank_key(policy)
+    return [c["candidate_id"] for c in sorted(cands, key=key)[:k]]
+
+
+def top(table: rank.RankTable, k: int) -> list[str]:
+    return [c["candidate_id"] for c in table.top(k)]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_top_k_matches_sorting_by_build_rank_key(backend):
+    rng = random.Random(7)
+    directions = [
+        POLICY,
+        dict(POLICY, tuple_order=[{"field": "created_at", "direction": "desc"}]),
+        dict(
+            POLICY,
+            tuple_order=[
+                {"field": "files_touched", "direction": "desc"},
+                {"field": "created_at", "direction": "desc"},
+                {"field": "diff_lines_total", "direction": "asc"},
+            ],
+        ),
+    ]
+    for policy in directions:
+        cands = random_candidates(rng, 500)
+        table = rank.RankTable(policy, backend=backend)
+        table.extend(cands)
+        one_by_one = rank.RankTable(policy, backend=backend)
+        for cand in cands:
+            one_by_one.add(cand)
+        assert len(table) == len(one_by_one) == 500
+        for k in (1, 3, 50, 500, 600):
+            assert top(table, k) == top(one_by_one, k) == expected(policy, cands, k)
+    assert rank.RankTable(POLICY, backend=backend).top_k(3) == []
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_keep_prunes_without_changing_the_result(backend):
+    cands = random_candidates(random.Random(3), 20000)
+    table = rank.RankTable(POLICY, keep=5, backend=backend)
+    table.extend(cands)
+    one_by_one = rank.RankTable(POLICY, keep=5, backend=backend)
+    for cand in cands:
+        one_by_one.add(cand)
+    assert len(table) < 4096 and len(one_by_one) < 4096
+    assert top(table, 5) == top(one_by_one, 5) == expected(POLICY, cands, 5)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_prune_keeps_equal_strings_tied(backend):
+    policy = dict(
+        POLICY,
+        tuple_order=[
+            {"field": "created_at", "direction": "asc"},
+            {"field": "checks_passed", "direction": "desc"},
+        ],
+    )
+    cands = [
+        {
+            "candidate_id": "r0",
+            "created_at": "2026-01-01",
+            "metrics": {"checks_passed": 1},
+        },
+        {
+            "candidate_id": "r1",
+            "created_at": "2026-01-01",
+            "metrics": {"checks_passed": 9},
+        },
+    ]
+    cands += [
+        {"candidate_id": f"r{i}", "created_at": "2026-01-02", "metrics": {}}
+        for i in range(2, 5002)
+    ]
+    table = rank.RankTable(policy, keep=2, backend=backend)
+    for cand in cands:
+        table.add(cand)
+    assert len(table) < 4096
+    assert top(table, 2) == expected(policy, cands, 2) == ["r1", "r0"]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_values_outside_int64_fall_back_to_exact_comparison(backend):
+    cands = random_candidates(random.Random(5), 200)
+    cands[10]["metrics"]["checks_passed"] = 2**70
+    cands[20]["metrics"]["diff_lines_total"] = 0.5
+    cands[30]["metrics"]["files_touched"] = True
+    for table in (rank.RankTable(POLICY, backend=backend) for _ in range(2)):
+        table.extend(cands[:100])
+        for cand in cands[100:]:
+            table.add(cand)
+        assert table._kinds[:3] == ["any", "int", "any"]
+        assert top(table, 200) == expected(POLICY, cands, 200)
+        assert top(table, 1) == ["c10"]
+        cands = cands[::-1]
+
+
+def test_backend_selection(monkeypatch):
+    monkeypatch.setenv("XTRL_RANK_BACKEND", "array")
+    assert rank.rank_backend() == "array"
+    with pytest.raises(ValueError):
+        rank.RankTable(POLICY, backend="gpu")
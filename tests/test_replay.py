@@ -0,0 +1,210 @@
+import copy
+import json
+import os
+import shlex
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SSOT = ROOT / "control" / "ssot"
+sys.path.insert(0, str(ROOT / "tools"))
+
+import _util
+from replay import Replayer, replay_name
+
+LINEARIZER = ROOT / "tools" / "promote_linearizer.py"
+
+# check.py fails unless src/mod.py's VALUE is positive, after sleeping SLEEP.
+CHECK = """import time
+from src import mod
+time.sleep(getattr(mod, "SLEEP", 0))
+assert mod.VALUE > 0
+"""
+
+
+def load(name: str) -> dict:
+    return json.loads(
+        (SSOT / "examples" / f"{name}.example.json").read_text(encoding="utf-8")
+    )
+
+
+def git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(repo), *args], check=True, capture_output=True, text=True
+    ).stdout
+
+
+def make_repo(path: Path) -> str:
+    (path / "src").mkdir(parents=True)
+    (path / "src" / "__init__.py").write_text("")
+    (path / "src" / "mod.py").write_text("VALUE = 0\n")
+    (path / "check.py").write_text(CHECK)
+    git(path, "init", "-q")
+    git(path, "add", ".")
+    git(
+        path,
+        "-c",
+        "user.name=t",
+        "-c",
+        "user.email=t@t",
+        "commit",
+        "-q",
+        "-m",
+        "base",
+    )
+    return git(path, "rev-parse", "HEAD").strip()
+
+
+def diff_for(repo: Path, files: dict) -> str:
+    for name, text in files.items():
+        (repo / name).parent.mkdir(parents=True, exist_ok=True)
+        (repo / name).write_text(text)
+    git(repo, "add", "-N", ".")
+    out = git(repo, "diff")
+    git(repo, "reset", "-q")
+    git(repo, "checkout", "-q", ".")
+    git(repo, "clean", "-qfd")
+    return out
+
+
+@pytest.mark.parametrize("pool", [0, 3])
+def test_replay_selects_best_passing_candidate_and_cancels_the_rest(
+    tmp_path: Path, pool: int
+):
+    repo = tmp_path / "repo"
+    sha = make_repo(repo)
+    state = tmp_path / "xtrlv2"
+    queue_dir = state / "queue"
+    queue_dir.mkdir(parents=True)
+
+    queue = load("work_queue")
+    queue["base_ref"] = f"origin/main@{sha}"
+    queue["work_items"][0]["policy"]["allowed_commands"] = [
+        f"{shlex.quote(sys.executable)} check.py"
+    ]
+    _util.write_json(queue_dir / "work_queue.json", queue)
+    policy = load("rank_policy")
+    policy["tuple_order"] = [{"field": "diff_lines_total", "direction": "asc"}]
+    _util.write_json(queue_dir / "rank_policy.json", policy)
+
+    diffs = {
+        "cand-1-fails": diff_for(repo, {"src/mod.py": "VALUE = -1\n"}),
+        "cand-2-forbidden": diff_for(repo, {"state/x.py": "VALUE = 1\n"}),
+        "cand-3-conflicts": "--- a/src/mod.py\n+++ b/src/mod.py\n@@ -1 +1 @@\n"
+        "-VALUE = 7\n+VALUE = 8\n",
+        "cand-4-passes": diff_for(repo, {"src/mod.py": "VALUE = 1\n"}),
+        "cand-5-slow": diff_for(repo, {"src/mod.py": "VALUE = 1\nSLEEP = 60\n"}),
+    }
+    template = load("candidate_set")["candidates"][0]
+    for rank_, (cid, diff) in enumerate(diffs.items()):
+        patch = dict(load("patch_proposal"), candidate_id=cid, unified_diff=diff)
+        patch_path = tmp_path / "out" / cid / "patch_proposal.json"
+        _util.write_json(patch_path, patch)
+        candidate = copy.deepcopy(template)
+        candidate.update(candidate_id=cid, patch_proposal_path=str(patch_path))
+        candidate["evidence_path"] = str(tmp_path / "out" / cid / "evidence.json")
+        candidate["metrics"]["diff_lines_total"] = rank_
+        entry = {"queue_id": queue["queue_id"], "base_ref": queue["base_ref"]}
+        _util.append_candidate(
+            queue_dir / "candidate_set.json", dict(entry, candidate=candidate)
+        )
+
+    start = time.monotonic()
+    proc = subprocess.run(
+        [
+            sys.executable,
+            str(LINEARIZER),
+            "--replay",
+            "--repo",
+            str(repo),
+            "--top-k",
+            "5",
+            "--replay-workers",
+            "5",
+            "--worktree-pool",
+            str(pool),
+        ],
+        env={**os.environ, "CODEX_STATE": str(tmp_path)},
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert time.monotonic() - start < 30
+    assert proc.stdout.strip() == "Selected candidate: cand-4-passes"
+
+    selection = _util.load_json(state / "promote" / "selection.json")
+    assert selection["candidate"]["candidate_id"] == "cand-4-passes"
+    replay = selection["replay"]
+    assert replay["base_sha"] == sha
+    assert [
+        (r["candidate_id"], r["status"], r["reason_codes"])
+        for r in replay["results"][:4]
+    ] == [
+        ("cand-1-fails", "failed", ["TESTS_FAILED"]),
+        ("cand-2-forbidden", "failed", ["TOUCHED_FORBIDDEN_PATH"]),
+        ("cand-3-conflicts", "failed", ["AMBIGUOUS_STATE_DENIED"]),
+        ("cand-4-passes", "passed", []),
+    ]
+    assert replay["results"][4]["status"] in ("cancelled", "skipped")
+    gate = _util.load_json(
+        state / "promote" / "replay" / replay_name("cand-4-passes") / "gate.json"
+    )
+    assert gate["decision"] == "PROMOTE"
+    slots = sorted((state / "worktrees").glob("pool/*/slot-?"))
+    if pool:
+        # Warm worktrees stay, reset to base_ref, for the next replay.
+        assert 1 <= len(slots) <= pool
+        for slot in slots:
+            assert git(slot, "rev-parse", "HEAD").strip() == sha
+            assert git(slot, "status", "--porcelain", "--ignored") == ""
+        assert replay["worktree_pool"]["leases"] >= 4
+    else:
+        # Worktrees are gone, from disk and from git's bookkeeping.
+        assert not list((state / "worktrees").iterdir())
+    assert len(git(repo, "worktree", "list").splitlines()) == 1 + len(slots)
+    # The base checkout was never touched.
+    assert (repo / "src" / "mod.py").read_text() == "VALUE = 0\n"
+
+
+def test_no_passing_candidate(tmp_path: Path):
+    repo = tmp_path / "repo"
+    sha = make_repo(repo)
+    work_item = dict(load("work_queue")["work_items"][0], work_item_id="wi-1")
+    work_item["policy"] = dict(
+        work_item["policy"], allowed_commands=["no-such-command-xyz"]
+    )
+    patch_path = tmp_path / "patch.json"
+    _util.write_json(patch_path, dict(load("patch_proposal"), unified_diff=""))
+    replayer = Replayer(
+        repo,
+        sha,
+        {"wi-1": work_item},
+        worktrees=tmp_path / "wt",
+        out_dir=tmp_path / "out",
+    )
+    cands = [
+        {
+            "candidate_id": "a",
+            "work_item_id": "wi-1",
+            "patch_proposal_path": str(patch_path),
+        },
+        {"candidate_id": "b", "work_item_id": "wi-unknown"},
+    ]
+    winner, results = replayer.run(cands)
+    assert winner is None
+    assert [(r["status"], r["reason_codes"]) for r in results] == [
+        ("failed", ["TESTS_FAILED"]),
+        ("failed", ["AMBIGUOUS_STATE_DENIED"]),
+    ]
+    assert results[0]["checks"][0]["rc"] == 127
+
+
+def test_replay_names_do_not_collide():
+    assert replay_name("a/b") != replay_name("a_b")
+    assert replay_name("a/b").startswith("a_b-")
+    assert replay_name("cand-1") == replay_name("cand-1")
@@ -0,0 +1,85 @@
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import jsonschema
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SSOT = ROOT / "control" / "ssot"
+sys.path.insert(0, str(ROOT / "tools"))
+sys.path.insert(0, str(ROOT / "tools" / "contracts"))
+
+import _util
+from schema_bundle import bundle_schema
+
+KINDS = sorted(json.loads((SSOT / "registry.json").read_text())["artifacts"])
+
+
+def load(path: Path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_committed_bundle_is_fresh_and_ref_free():
+    _util.invalidate_validator_cache()
+    for kind in KINDS:
+        schema = _util.bundled_schema(kind)
+        assert schema is not None, kind
+        assert "$ref" not in json.dumps(schema), kind
+        example = load(SSOT / "examples" / f"{kind}.example.json")
+        jsonschema.Draft7Validator(schema).validate(example)
+
+
+def test_bundle_inlines_file_refs_and_keeps_recursive_refs(tmp_path: Path):
+    (tmp_path / "common.json").write_text(
+        json.dumps({"definitions": {"id": {"type": "string", "minLength": 1}}}),
+        encoding="utf-8",
+    )
+    schema = {
+        "type": "object",
+        "properties": {
+            "id": {"$ref": "common.json#/definitions/id"},
+            "enum": {"$ref": "#/definitions/node"},
+        },
+        "definitions": {
+            "node": {
+                "type": "object",
+                "properties": {"child": {"$ref": "#/definitions/node"}},
+            }
+        },
+    }
+    bundled = bundle_schema(schema, tmp_path / "root.schema.json")
+
+    assert bundled["properties"]["id"] == {"type": "string", "minLength": 1}
+    node = bundled["properties"]["enum"]
+    assert node["properties"]["child"] == {"$ref": "#/definitions/node"}
+    assert "node" in bundled["definitions"]
+
+    validator = jsonschema.Draft7Validator(bundled)
+    assert validator.is_valid({"id": "a", "enum": {"child": {"child": {}}}})
+    assert not validator.is_valid({"id": "", "enum": {}})
+    assert not validator.is_valid({"enum": {"child": {"child": 1}}})
+
+
+def test_bundle_is_ignored_for_kinds_whose_source_changed(tmp_path: Path, monkeypatch):
+    shutil.copytree(SSOT, tmp_path / "control" / "ssot")
+    monkeypatch.setattr(_util, "repo_root", lambda: tmp_path)
+    _util.invalidate_validator_cache()
+    try:
+        assert _util.bundled_schema("work_queue") is not None
+
+        schema_path = (
+            tmp_path / "control" / "ssot" / "schemas" / "work_queue.schema.json"
+        )
+        schema = load(schema_path)
+        schema["properties"]["queue_id"]["maxLength"] = 3
+        schema_path.write_text(json.dumps(schema, indent=2) + "\n", encoding="utf-8")
+
+        assert _util.bundled_schema("work_queue") is None
+        assert _util.bundled_schema("rank_policy") is not None
+        example = load(SSOT / "examples" / "work_queue.example.json")
+        with pytest.raises(jsonschema.ValidationError):
+            _util.get_validator("work_queue").validate(example)
+    finally:
+        _util.invalidate_validator_cache()
@@ -0,0 +1,179 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SSOT = ROOT / "control" / "ssot"
+sys.path.insert(0, str(ROOT / "tools"))
+
+import _util
+
+pytestmark = pytest.mark.skipif(_util.fcntl is None, reason="needs fcntl")
+
+QUEUE = "queue/work_queue.json"
+CANDS = "queue/candidate_set.json"
+
+
+def test_publish_and_open_snapshot(tmp_path: Path):
+    assert _util.open_snapshot(tmp_path) is None
+    _util.write_json(tmp_path / QUEUE, {"queue_id": "q1"})
+    _util.write_json(tmp_path / CANDS, {"queue_id": "q1", "candidates": []})
+
+    first = _util.publish_snapshot(root=tmp_path)
+    assert first.generation == 1
+    assert _util.open_snapshot(tmp_path) == first
+    assert os.readlink(tmp_path / "snapshots" / "current") == "gen-00000001"
+    assert not (first.file("ledger/latest.json")).exists()
+
+    # Live rewrites never reach a published generation.
+    _util.write_json(tmp_path / QUEUE, {"queue_id": "q2"})
+    _util.write_json(tmp_path / CANDS, {"queue_id": "q2", "candidates": [1]})
+    assert first.load(QUEUE) == {"queue_id": "q1"}
+
+    # Only the candidate set is refreshed; the queue carries over.
+    second = _util.publish_snapshot([CANDS], root=tmp_path)
+    assert second.generation == 2
+    assert second.load(QUEUE) == {"queue_id": "q1"}
+    assert second.load(CANDS) == {"queue_id": "q2", "candidates": [1]}
+    assert first.load(CANDS) == {"queue_id": "q1", "candidates": []}
+
+    # refresh_changed also picks up the rewritten queue, and publishes
+    # nothing once the current generation matches the live files.
+    third = _util.publish_snapshot([], root=tmp_path, refresh_changed=True)
+    assert third.generation == 3
+    assert third.load(QUEUE) == {"queue_id": "q2"}
+    assert _util.publish_snapshot([], root=tmp_path, refresh_changed=True) == third
+
+    with pytest.raises(ValueError):
+        _util.publish_snapshot(["queue/other.json"], root=tmp_path)
+
+
+def test_old_generations_pruned_after_grace(tmp_path: Path, monkeypatch):
+    _util.write_json(tmp_path / QUEUE, {"queue_id": "q"})
+    for _ in range(3):
+        _util.publish_snapshot(root=tmp_path, keep=2)
+    # Superseded just now: still inside the grace period.
+    assert len(list((tmp_path / "snapshots").glob("gen-*"))) == 3
+
+    monkeypatch.setattr(_util, "SNAPSHOT_GRACE_SECONDS", -1.0)
+    _util.publish_snapshot(root=tmp_path, keep=2)
+    names = sorted(p.name for p in (tmp_path / "snapshots").iterdir())
+    assert names == ["current", "gen-00000003", "gen-00000004"]
+
+
+def test_readers_see_consistent_generations_during_publishes(tmp_path: Path):
+    stop = threading.Event()
+    errors: list = []
+
+    def writer() -> None:
+        try:
+            for i in range(60):
+                _util.write_json(tmp_path / QUEUE, {"queue_id": f"q{i}"})
+                _util.write_json(tmp_path / CANDS, {"queue_id": f"q{i}"})
+                _util.publish_snapshot(root=tmp_path)
+        except Exception as exc:  # noqa: BLE001
+            errors.append(exc)
+        finally:
+            stop.set()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    reads = 0
+    while not stop.is_set():
+        snapshot = _util.open_snapshot(tmp_path)
+        if snapshot is None:
+            continue
+        queue = json.loads(snapshot.file(QUEUE).read_bytes())
+        cands = json.loads(snapshot.file(CANDS).read_bytes())
+        assert queue["queue_id"] == cands["queue_id"]
+        reads += 1
+    thread.join()
+    assert not errors
+    assert reads > 0
+    assert _util.open_snapshot(tmp_path).generation == 60
+
+
+def run_linearizer(codex_state: Path) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(ROOT / "tools" / "promote_linearizer.py"), "--dry-run"],
+        env={**os.environ, "CODEX_STATE": str(codex_state)},
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def test_linearizer_and_doctor_read_the_snapshot(tmp_path: Path):
+    state = tmp_path / "xtrlv2"
+    for kind in ("work_queue", "rank_policy", "candidate_set"):
+        _util.write_json(
+            state / "queue" / f"{kind}.json",
+            _util.load_json(SSOT / "examples" / f"{kind}.example.json"),
+        )
+    _util.publish_snapshot(root=state)
+
+    proc = run_linearizer(tmp_path)
+    assert proc.returncode == 0, proc.stderr
+    selection = _util.load_json(state / "promote" / "selection.json")
+    assert selection["snapshot_generation"] == 1
+
+    # A later (here: broken) rewrite of the live queue is not what readers see
+    # until the next publish.
+    _util.write_json(state / QUEUE, {"artifact_kind": "work_queue"})
+
+    proc = subprocess.run(
+        [
+            sys.executable,
+            str(ROOT / "tools" / "migration" / "state_doctor.py"),
+            "--state-root",
+            str(state),
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    payload = json.loads(proc.stdout)
+    assert payload["snapshot_generation"] == 1
+    # Only the live queue is broken; the snapshot copy validates.
+    assert [a["path"] for a in payload["invalid_artifacts"]] == [QUEUE]
+
+
+def test_compaction_publishes_live_queue_changes(tmp_path: Path):
+    state = tmp_path / "xtrlv2"
+    queue = _util.load_json(SSOT / "examples" / "work_queue.example.json")
+    policy = _util.load_json(SSOT / "examples" / "rank_policy.example.json")
+    cands = _util.load_json(SSOT / "examples" / "candidate_set.example.json")
+    candidate = cands["candidates"][0]
+    _util.write_json(state / QUEUE, queue)
+    _util.write_json(state / "queue" / "rank_policy.json", policy)
+    _util.write_json(state / CANDS, dict(cands, candidates=[]))
+
+    def append(cid: str) -> None:
+        entry = {"queue_id": queue["queue_id"], "base_ref": queue["base_ref"]}
+        _util.append_candidate(
+            state / CANDS, dict(entry, candidate=dict(candidate, candidate_id=cid))
+        )
+
+    append("cand-a")
+    proc = run_linearizer(tmp_path)
+    assert proc.returncode == 0, proc.stderr
+    assert _util.open_snapshot(state).generation == 1
+
+    # A new queue (new base_ref) replaces the live queue and candidate set.
+    queue["base_ref"] = "origin/NEW"
+    _util.write_json(state / QUEUE, queue)
+    _util.write_json(state / CANDS, dict(cands, base_ref="origin/NEW", candidates=[]))
+    append("cand-b")
+    proc = run_linearizer(tmp_path)
+    assert proc.returncode == 0, proc.stderr
+    snapshot = _util.open_snapshot(state)
+    assert snapshot.generation == 2
+    assert snapshot.load(QUEUE)["base_ref"] == "origin/NEW"
+    selection = _util.load_json(state / "promote" / "selection.json")
+    assert selection["snapshot_generation"] == 2
+    assert selection["candidate"]["candidate_id"] == "cand-b"
@@ -0,0 +1,165 @@
+import copy
+import json
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import jsonschema
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SSOT = ROOT / "control" / "ssot"
+sys.path.insert(0, str(ROOT / "tools"))
+
+import _util
+
+LINEARIZER = ROOT / "tools" / "promote_linearizer.py"
+
+
+def load(path: Path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def random_element(rng: random.Random, depth: int = 0):
+    roll = rng.random()
+    if depth > 2 or roll < 0.4:
+        return rng.choice(
+            [
+                rng.randint(-(10**12), 10**12),
+                rng.uniform(-1e3, 1e3),
+                's[{,:}]\\"é\n',
+                True,
+                None,
+            ]
+        )
+    if roll < 0.7:
+        return [random_element(rng, depth + 1) for _ in range(rng.randint(0, 3))]
+    return {f"k{i}": random_element(rng, depth + 1) for i in range(rng.randint(0, 3))}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_iter_json_array_matches_json_load(tmp_path: Path, chunk_size, indent):
+    rng = random.Random(chunk_size)
+    doc = {
+        "a_before": {"nested": [1, 2, {"x": "]"}]},
+        "items": [random_element(rng) for _ in range(200)],
+        "z_after": 12345678901,
+    }
+    path = tmp_path / "doc.json"
+    path.write_text(json.dumps(doc, indent=indent), encoding="utf-8")
+
+    envelope: dict = {}
+    items = list(
+        _util.iter_json_array(path, "items", envelope=envelope, chunk_size=chunk_size)
+    )
+    assert items == doc["items"]
+    assert envelope == {"a_before": doc["a_before"], "z_after": doc["z_after"]}
+
+
+def test_iter_json_array_edge_cases(tmp_path: Path):
+    path = tmp_path / "doc.json"
+
+    path.write_text('{"items": [] }', encoding="utf-8")
+    assert list(_util.iter_json_array(path, "items")) == []
+
+    path.write_text("{}", encoding="utf-8")
+    with pytest.raises(KeyError):
+        list(_util.iter_json_array(path, "items"))
+
+    path.write_text('{"items": {"a": 1}}', encoding="utf-8")
+    with pytest.raises(TypeError):
+        list(_util.iter_json_array(path, "items"))
+
+    for bad in ['{"items": [1, 2', '{"items": [1 2]}', '{"items": []} x', "[1]"]:
+        path.write_text(bad, encoding="utf-8")
+        with pytest.raises(json.JSONDecodeError):
+            list(_util.iter_json_array(path, "items", chunk_size=4))
+
+
+def candidate_set(n: int) -> dict:
+    example = load(SSOT / "examples" / "candidate_set.example.json")
+    template = example["candidates"][0]
+    example["candidates"] = []
+    for i in range(n):
+        entry = copy.deepcopy(template)
+        entry["candidate_id"] = f"cand-{i:03d}"
+        example["candidates"].append(entry)
+    return example
+
+
+@pytest.mark.parametrize("generated", ["1", "0"])
+def test_iter_candidate_set_validates_entries_and_envelope(
+    tmp_path: Path, monkeypatch, generated
+):
+    monkeypatch.setenv("XTRL_GENERATED_VALIDATORS", generated)
+    path = tmp_path / "candidate_set.json"
+    cand_set = candidate_set(4)
+    _util.write_json(path, cand_set)
+
+    envelope: dict = {}
+    assert (
+        list(_util.iter_candidate_set(path, envelope=envelope))
+        == cand_set["candidates"]
+    )
+    assert envelope["queue_id"] == cand_set["queue_id"]
+
+    cand_set["candidates"][3]["metrics"]["files_touched"] = -1
+    _util.write_json(path, cand_set)
+    with pytest.raises(jsonschema.ValidationError) as exc:
+        list(_util.iter_candidate_set(path))
+    assert list(exc.value.absolute_path) == [
+        "candidates",
+        3,
+        "metrics",
+        "files_touched",
+    ]
+
+    cand_set["candidates"][3]["metrics"]["files_touched"] = 1
+    path.write_text(
+        json.dumps(dict(cand_set, candidates=["oops"] + cand_set["candidates"])),
+        encoding="utf-8",
+    )
+    with pytest.raises(jsonschema.ValidationError) as exc:
+        list(_util.iter_candidate_set(path))
+    assert list(exc.value.absolute_path) == ["candidates", 0]
+
+    del cand_set["meta"]
+    _util.write_json(path, cand_set)
+    with pytest.raises(jsonschema.ValidationError):
+        list(_util.iter_candidate_set(path))
+
+    del cand_set["candidates"]
+    _util.write_json(path, cand_set)
+    with pytest.raises(jsonschema.ValidationError):
+        list(_util.iter_candidate_set(path))
+
+
+def test_linearizer_selects_best_candidate_from_stream(tmp_path: Path):
+    queue_dir = tmp_path / "xtrlv2" / "queue"
+    queue_dir.mkdir(parents=True)
+    for kind in ("work_queue", "rank_policy"):
+        (queue_dir / f"{kind}.json").write_text(
+            (SSOT / "examples" / f"{kind}.example.json").read_text(encoding="utf-8"),
+            encoding="utf-8",
+        )
+    cand_set = candidate_set(5)
+    for i, entry in enumerate(cand_set["candidates"]):
+        entry["metrics"]["diff_lines_total"] = [40, 7, 900, 7, 12][i]
+    _util.write_json(queue_dir / "candidate_set.json", cand_set)
+
+    proc = subprocess.run(
+        [sys.executable, str(LINEARIZER), "--dry-run", "--top-k", "3"],
+        env={**os.environ, "CODEX_STATE": str(tmp_path)},
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert proc.returncode == 0, proc.stderr
+    # cand-002 fails max_diff_lines_total; cand-001 and cand-003 tie, first wins.
+    assert proc.stdout.strip() == "Selected candidate: cand-001"
+    selection = load(tmp_path / "xtrlv2" / "promote" / "selection.json")
+    assert selection["candidate"]["candidate_id"] == "cand-001"
+    assert selection["ranked_candidate_ids"] == ["cand-001", "cand-003", "cand-004"]
@@ -0,0 +1,56 @@
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import jsonschema
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SSOT = ROOT / "control" / "ssot"
+sys.path.insert(0, str(ROOT / "tools"))
+
+import _util
+
+
+def load(path: Path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+@pytest.fixture
+def tmp_repo(tmp_path: Path, monkeypatch):
+    shutil.copytree(SSOT, tmp_path / "control" / "ssot")
+    monkeypatch.setattr(_util, "repo_root", lambda: tmp_path)
+    _util.invalidate_validator_cache()
+    yield tmp_path
+    _util.invalidate_validator_cache()
+
+
+def test_validator_is_cached_and_rebuilt_on_schema_change(tmp_repo: Path):
+    first = _util.get_validator("work_queue")
+    assert _util.get_validator("work_queue") is first
+
+    schema_path = tmp_repo / "control" / "ssot" / "schemas" / "work_queue.schema.json"
+    schema = load(schema_path)
+    schema["properties"]["queue_id"]["maxLength"] = 3
+    schema_path.write_text(json.dumps(schema, indent=2) + "\n", encoding="utf-8")
+    st = schema_path.stat()
+    os.utime(schema_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    rebuilt = _util.get_validator("work_queue")
+    assert rebuilt is not first
+    example = load(SSOT / "examples" / "work_queue.example.json")
+    with pytest.raises(jsonschema.ValidationError):
+        _util.validate_artifact("work_queue", example)
+
+
+def test_invalidate_and_validate_many(tmp_repo: Path):
+    first = _util.get_validator("rank_policy")
+    _util.invalidate_validator_cache("rank_policy")
+    assert _util.get_validator("rank_policy") is not first
+
+    example = load(SSOT / "examples" / "rank_policy.example.json")
+    assert _util.validate_many("rank_policy", [example, example]) == 2
+    with pytest.raises(jsonschema.ValidationError):
+        _util.validate_many("rank_policy", [example, {"artifact_kind": "x"}])
@@ -0,0 +1,192 @@
+import copy
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SSOT = ROOT / "control" / "ssot"
+WORKER = ROOT / "tools" / "worker_run_candidate.py"
+
+# Stand-in for codex-cli: logs start/end of each run, writes the example
+# PatchProposal to the -o path, optionally sleeps.
+FAKE_CODEX = """#!{python}
+import json, os, sys, time
+args = sys.argv[1:]
+out = args[args.index("-o") + 1]
+objective = args[-1].splitlines()[0]
+log = os.environ["FAKE_CODEX_LOG"]
+def record(event):
+    with open(log, "a") as f:
+        f.write(json.dumps([event, objective, time.time(), os.getpid()]) + "\\n")
+record("start")
+time.sleep(float(os.environ.get("FAKE_CODEX_SLEEP", "0")))
+with open({example!r}) as src, open(out, "w") as dst:
+    dst.write(src.read())
+print(json.dumps({{"type": "done"}}))
+record("end")
+"""
+
+
+def load(path: Path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def setup_state(tmp_path: Path, items: list[dict]) -> dict:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    codex = bin_dir / "codex"
+    codex.write_text(
+        FAKE_CODEX.format(
+            python=sys.executable,
+            example=str(SSOT / "examples" / "patch_proposal.example.json"),
+        ),
+        encoding="utf-8",
+    )
+    codex.chmod(0o755)
+
+    queue = load(SSOT / "examples" / "work_queue.example.json")
+    template = queue["work_items"][0]
+    queue["work_items"] = [dict(copy.deepcopy(template), **item) for item in items]
+    queue_dir = tmp_path / "xtrlv2" / "queue"
+    queue_dir.mkdir(parents=True)
+    (queue_dir / "work_queue.json").write_text(json.dumps(queue), encoding="utf-8")
+    return {
+        **os.environ,
+        "PATH": f"{bin_dir}{os.pathsep}{os.environ['PATH']}",
+        "CODEX_STATE": str(tmp_path),
+        "FAKE_CODEX_LOG": str(tmp_path / "codex.log"),
+    }
+
+
+def runs(tmp_path: Path) -> list[list]:
+    log = tmp_path / "codex.log"
+    if not log.exists():
+        return []
+    return [json.loads(line) for line in log.read_text().splitlines()]
+
+
+def max_overlap(events: list[list], objective: str | None = None) -> int:
+    current = peak = 0
+    for event, obj, _, _ in sorted(events, key=lambda e: (e[2], e[0] == "start")):
+        if objective is not None and obj != f"Objective: {objective}":
+            continue
+        current += 1 if event == "start" else -1
+        peak = max(peak, current)
+    return peak
+
+
+def candidate_ids(tmp_path: Path) -> list[str]:
+    sys.path.insert(0, str(ROOT / "tools"))
+    import _util
+
+    path = tmp_path / "xtrlv2" / "queue" / "candidate_set.json"
+    return [c["candidate_id"] for c in _util.iter_candidate_set(path)]
+
+
+def test_pool_respects_max_workers_and_priority(tmp_path: Path):
+    env = setup_state(
+        tmp_path,
+        [
+            {
+                "work_item_id": "wi-low",
+                "objective_slice": "low",
+                "priority": 5,
+                "max_workers": 1,
+            },
+            {
+                "work_item_id": "wi-high",
+                "objective_slice": "high",
+                "priority": 0,
+                "max_workers": 2,
+            },
+        ],
+    )
+    env["FAKE_CODEX_SLEEP"] = "0.5"
+    proc = subprocess.run(
+        [
+            sys.executable,
+            str(WORKER),
+            "--workers",
+            "4",
+            "--max-runs",
+            "6",
+            "--no-codex-cache",
+        ],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert proc.returncode == 0, proc.stderr
+    result = json.loads(proc.stdout)
+    assert result["errors"] == [] and not result["stopped"]
+    assert len(result["candidates"]) == 6
+    assert sorted(candidate_ids(tmp_path)) == result["candidates"]
+
+    events = runs(tmp_path)
+    # 3 slots in total: 2 on wi-high, 1 on wi-low.
+    assert max_overlap(events, "high") == 2
+    assert max_overlap(events, "low") == 1
+    assert max_overlap(events) == 3
+
+
+def test_single_run_takes_most_urgent_item(tmp_path: Path):
+    env = setup_state(
+        tmp_path,
+        [
+            {"work_item_id": "wi-low", "objective_slice": "low", "priority": 3},
+            {"work_item_id": "wi-high", "objective_slice": "high", "priority": 1},
+        ],
+    )
+    for _ in range(2):
+        proc = subprocess.run(
+            [sys.executable, str(WORKER), "--no-codex-cache"],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        assert proc.returncode == 0, proc.stderr
+    assert [e[1] for e in runs(tmp_path) if e[0] == "start"] == [
+        "Objective: high",
+        "Objective: high",
+    ]
+    ids = candidate_ids(tmp_path)
+    assert len(set(ids)) == 2
+
+
+def test_sigterm_stops_pool_without_candidates(tmp_path: Path):
+    env = setup_state(
+        tmp_path,
+        [{"work_item_id": "wi-1", "objective_slice": "slow", "max_workers": 3}],
+    )
+    env["FAKE_CODEX_SLEEP"] = "60"
+    proc = subprocess.Popen(
+        [sys.executable, str(WORKER), "--workers", "3"],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    deadline = time.monotonic() + 20
+    while len(runs(tmp_path)) < 3:
+        assert time.monotonic() < deadline, "codex runs never started"
+        time.sleep(0.05)
+    proc.send_signal(signal.SIGTERM)
+    stdout, stderr = proc.communicate(timeout=20)
+    assert proc.returncode == 128 + signal.SIGTERM, stderr
+    result = json.loads(stdout)
+    assert result["stopped"] and result["candidates"] == []
+
+    for _, _, _, pid in runs(tmp_path):
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            continue
+        raise AssertionError(f"codex pid {pid} still running")
+    assert not (tmp_path / "xtrlv2" / "queue" / "candidate_set.json").exists()
+    assert not list((tmp_path / "xtrlv2" / "locks").glob("claim_*"))
@@ -0,0 +1,164 @@
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "tools"))
+
+import _util
+from worktree_pool import WorktreeError, WorktreePool, add_worktree
+
+
+def git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def commit(repo: Path, name: str, text: str) -> str:
+    (repo / name).write_text(text)
+    git(repo, "add", name)
+    git(repo, "commit", "-q", "-m", name)
+    return git(repo, "rev-parse", "HEAD").strip()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    path = tmp_path / "repo"
+    path.mkdir()
+    git(path, "init", "-q")
+    (path / ".gitignore").write_text("*.pyc\n")
+    git(path, "add", ".gitignore")
+    commit(path, "a.txt", "one\n")
+    return path
+
+
+def test_lease_reuses_warm_worktrees_and_resets_on_release(repo: Path, tmp_path: Path):
+    first = git(repo, "rev-parse", "HEAD").strip()
+    second = commit(repo, "b.txt", "two\n")
+    pool = WorktreePool(repo, 2, root=tmp_path / "pool")
+
+    lease = pool.lease(first)
+    assert lease.sha == first and not (lease.path / "b.txt").exists()
+    # A run leaves edits, untracked and ignored files behind.
+    (lease.path / "a.txt").write_text("edited\n")
+    (lease.path / "new.txt").write_text("x")
+    (lease.path / "cache.pyc").write_text("x")
+    pool.release(lease, base_ref=second)
+    assert git(lease.path, "status", "--porcelain", "--ignored") == ""
+    assert (lease.path / "b.txt").exists()
+
+    # Released at `second`: the next lease of it needs no reset at all.
+    again = pool.lease(second)
+    assert again.path == lease.path
+    assert pool.stats["warm"] == 1
+    pool.release(again)
+    # Leasing a different commit reuses the checkout with a reset.
+    third = pool.lease(first)
+    assert third.path == lease.path and not (third.path / "b.txt").exists()
+    pool.release(third)
+    assert pool.stats["created"] == 1
+    assert _util.load_json(tmp_path / "pool" / "slot-0.json")["leases"] == 3
+
+    with pytest.raises(WorktreeError):
+        pool.lease("no-such-ref")
+
+
+def test_slots_are_exclusive_and_waiters_get_freed_slots(repo: Path, tmp_path: Path):
+    pool = WorktreePool(repo, 2, root=tmp_path / "pool", retry_seconds=0.01)
+    pool.warm("HEAD")
+    assert pool.stats["created"] == 2
+    held = [pool.lease("HEAD"), pool.lease("HEAD")]
+    assert {lease.slot for lease in held} == {0, 1}
+    with pytest.raises(_util.LockBusy):
+        pool.lease("HEAD", timeout=0.05)
+
+    active, peak = [0], [0]
+    mutex = threading.Lock()
+
+    def use() -> None:
+        lease = pool.lease("HEAD")
+        with mutex:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        (lease.path / "scratch").write_text("x")
+        time.sleep(0.02)
+        with mutex:
+            active[0] -= 1
+        pool.release(lease)
+
+    threads = [threading.Thread(target=use) for _ in range(6)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    for lease in held:
+        pool.release(lease)
+    for t in threads:
+        t.join(10)
+    assert peak[0] <= 2
+    assert pool.stats["leases"] == 8 and pool.stats["created"] == 2
+
+
+def test_dirty_or_broken_worktrees_are_evicted(repo: Path, tmp_path: Path):
+    # Inside the repo, as with the default state root.
+    root = repo / "state" / "pool"
+    pool = WorktreePool(repo, 1, root=root)
+    lease = pool.lease("HEAD")
+    # Corrupt: the checkout's .git link is gone. git run there would find the
+    # enclosing repo, whose uncommitted work must survive the reset.
+    (lease.path / ".git").unlink()
+    (repo / "a.txt").write_text("uncommitted\n")
+    pool.release(lease)
+    assert pool.stats["evicted"] == 1 and not lease.path.exists()
+    assert (repo / "a.txt").read_text() == "uncommitted\n"
+
+    lease = pool.lease("HEAD")
+    assert pool.stats["created"] == 2
+    assert (lease.path / "a.txt").read_text() == "one\n"
+    pool.release(lease)
+    # Removed behind the pool's back: re-created on the next lease.
+    shutil.rmtree(lease.path)
+    lease = pool.lease("HEAD")
+    assert (lease.path / "a.txt").exists() and pool.stats["created"] == 3
+    pool.release(lease)
+    assert _util.load_json(root / "slot-0.json")["evictions"] == 1
+    assert len(git(repo, "worktree", "list").splitlines()) == 2
+
+
+def test_default_pool_dir_is_per_repository(repo: Path, tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("CODEX_STATE", str(tmp_path / "codex"))
+    other = tmp_path / "other"
+    other.mkdir()
+    git(other, "init", "-q")
+    commit(other, "a.txt", "other\n")
+
+    pools = [WorktreePool(path, 1) for path in (repo, other)]
+    assert pools[0].root != pools[1].root
+    assert pools[0].root.parent == _util.state_root() / "worktrees" / "pool"
+    assert WorktreePool(repo / ".." / "repo", 1).root == pools[0].root
+    leases = [pool.lease("HEAD") for pool in pools]
+    assert (leases[0].path / "a.txt").read_text() == "one\n"
+    assert (leases[1].path / "a.txt").read_text() == "other\n"
+    for pool, lease in zip(pools, leases):
+        pool.release(lease)
+
+
+def test_worktree_add_waits_for_other_processes(repo: Path, tmp_path: Path):
+    # Another process's `git worktree add/remove` holds the repo's lock file.
+    held = _util.shared_lock(repo / ".git" / "xtrl-worktree.lock").acquire()
+    path = tmp_path / "wt"
+    adder = threading.Thread(target=add_worktree, args=(repo, path, "HEAD"))
+    adder.start()
+    time.sleep(0.2)
+    assert not path.exists()
+    held.release()
+    adder.join(10)
+    assert (path / "a.txt").read_text() == "one\n"
@@ -1,15 +1,34 @@
 from __future__ import annotations
 
+import hashlib
+import importlib.util
 import json
+import math
 import os
+import random
+import re
+import shutil
+import socket
+import threading
 import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import IO, Any
 
 import jsonschema
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None
 
+
+@cache
 def repo_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
@@ -30,20 +49,864 @@ def state_root() -> Path:
     return repo_root() / "state"
 
 
+# Optional accelerated JSON backend. Output stays byte-identical to the stdlib
+# encoder: whenever orjson's bytes could differ (non-ASCII or DEL characters,
+# floats it spells differently such as 1e16 vs 1e+16, integers past 64 bits,
+# unsupported types, NaN/Infinity, which orjson writes as null) the stdlib
+# path is used instead. XTRL_JSON_BACKEND=stdlib disables it.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# orjson spells floats below 1e-4 or from 1e16 differently from json.dumps.
+_EXPONENT_CANDIDATE = re.compile(rb"e[-0-9]")
+_MANTISSA_BYTES = frozenset(b"0123456789.-")
+_TOKEN_START_BYTES = frozenset(b" \n:,[")
+# Integer runs this long may exceed 64 bits; orjson would load them as float.
+_DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+_LONG_DIGIT_RUN = b"0" * 19
+
+
+def _orjson_float_risk(data: bytes) -> bool:
+    """Whether data may hold a float token orjson formats unlike json.dumps.
+
+    Conservative: number-like text inside strings also counts.
+    """
+    if b"0.0000" in data:
+        return True
+    for match in _EXPONENT_CANDIDATE.finditer(data):
+        end = start = match.start()
+        while start > 0 and data[start - 1] in _MANTISSA_BYTES:
+            start -= 1
+        if start < end and (start == 0 or data[start - 1] in _TOKEN_START_BYTES):
+            return True
+    return False
+
+
+def _has_nonfinite_float(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_nonfinite_float(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_nonfinite_float(v) for v in obj)
+    return False
+
+
+def _use_orjson() -> bool:
+    return orjson is not None and os.environ.get("XTRL_JSON_BACKEND") != "stdlib"
+
+
 def load_json(path: Path) -> Any:
+    if _use_orjson():
+        data = path.read_bytes()
+        if _LONG_DIGIT_RUN not in data.translate(_DIGITS_TO_ZERO):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass  # NaN, lone surrogates, ...: let the stdlib decide
+        return json.loads(data.decode("utf-8"))
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def write_json(path: Path, obj: Any) -> None:
+def encode_json(obj: Any, *, compact: bool = False) -> bytes:
+    """Serialise obj with sorted keys and a trailing newline.
+
+    Canonical form is indent=2; compact form has no whitespace. Either way the
+    bytes equal json.dumps output, whichever backend produced them.
+    """
+    if _use_orjson():
+        option = (
+            orjson.OPT_SORT_KEYS
+            | orjson.OPT_APPEND_NEWLINE
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        try:
+            data = orjson.dumps(obj, option=option)
+        except orjson.JSONEncodeError:
+            data = None
+        if (
+            data is not None
+            and data.isascii()
+            and b"\x7f" not in data
+            and not _orjson_float_risk(data)
+            # Only a null in the output can be a NaN/Infinity orjson dropped.
+            and (b"null" not in data or not _has_nonfinite_float(obj))
+        ):
+            return data
+    if compact:
+        text = json.dumps(obj, sort_keys=True, separators=(",", ":"))
+    else:
+        text = json.dumps(obj, indent=2, sort_keys=True)
+    return (text + "\n").encode("utf-8")
+
+
+def canonical_json_bytes(obj: Any) -> bytes:
+    """The exact bytes write_json stores for obj (sorted keys, indent=2, newline)."""
+    return encode_json(obj)
+
+
+def json_encoding(kind: str) -> str:
+    """Registry-declared on-disk encoding for kind: "canonical" or "compact".
+
+    Compact is for machine-only artifacts (large, never hand-edited).
+    """
+    meta = load_registry()["artifacts"].get(kind, {})
+    return meta.get("encoding", "canonical")
+
+
+# Counts of write_file_atomic outcomes in this process; see write_stats().
+_WRITE_STATS = {"created": 0, "updated": 0, "skipped": 0}
+FSYNC_POLICIES = ("none", "file", "full")
+
+
+def write_stats() -> dict[str, int]:
+    """Return a copy of the created/updated/skipped write counters."""
+    return dict(_WRITE_STATS)
+
+
+def reset_write_stats() -> None:
+    for key in _WRITE_STATS:
+        _WRITE_STATS[key] = 0
+
+
+def write_file_atomic(path: Path, data: bytes, *, fsync: str | None = None) -> str:
+    """Write data to path via a temp file + rename; skip if content is unchanged.
+
+    Readers never observe a partially written file. An existing file with the
+    same size and sha256 is left untouched (no rewrite, no mtime change).
+    fsync policy (default $XTRL_FSYNC, else "none"): "file" syncs the temp file
+    before the rename, "full" also syncs the directory after it.
+    Returns "created", "updated" or "skipped".
+    """
+    policy = fsync or os.environ.get("XTRL_FSYNC", "none")
+    if policy not in FSYNC_POLICIES:
+        raise ValueError(f"unknown fsync policy: {policy}")
+    digest = hashlib.sha256(data).hexdigest()
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        st = None
+    if (
+        st is not None
+        and st.st_size == len(data)
+        and sha256_file_cached(path) == digest
+    ):
+        _WRITE_STATS["skipped"] += 1
+        return "skipped"
+
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(obj, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{os.urandom(4).hex()}.tmp")
+    fd = os.open(tmp, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if policy != "none":
+                f.flush()
+                os.fsync(f.fileno())
+        if st is not None:
+            os.chmod(tmp, st.st_mode & 0o7777)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    if policy == "full":
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    # The file's digest is known now; spare sha256_file_cached a re-read.
+    _SHA256_CACHE[path] = (file_identity(path), digest)
+    status = "created" if st is None else "updated"
+    _WRITE_STATS[status] += 1
+    return status
+
+
+def write_json(
+    path: Path,
+    obj: Any,
+    *,
+    kind: str | None = None,
+    compact: bool | None = None,
+    fsync: str | None = None,
+) -> str:
+    """Write obj as JSON; canonical unless compact, or kind's registry encoding.
+
+    Atomic and skip-if-unchanged (see write_file_atomic, which gives the return
+    value). canonical_digest(obj) equals the file digest only for canonical files.
+    """
+    if compact is None:
+        compact = kind is not None and json_encoding(kind) == "compact"
+    return write_file_atomic(path, encode_json(obj, compact=compact), fsync=fsync)
+
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WS = re.compile(r"[ \t\n\r]*")
+_NUMBER_TAIL = frozenset(".eE+-")
+
+
+class _JsonStream:
+    """Character source for incremental decoding with JSONDecoder.raw_decode."""
+
+    def __init__(self, f: Any, chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append more input (at least as much as is buffered); False at EOF."""
+        if self.eof:
+            return False
+        chunk = self.f.read(max(self.chunk_size, len(self.buf) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def skip_ws(self) -> None:
+        while True:
+            self.pos = _JSON_WS.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) or not self.fill():
+                return
+
+    def value(self) -> Any:
+        self.skip_ws()
+        while True:
+            try:
+                obj, end = _JSON_DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number cut at the buffer edge ("12" of "125", "1." of "1.5")
+            # decodes early; read on and decode again.
+            if (end == len(self.buf) or self.buf[end] in _NUMBER_TAIL) and self.fill():
+                continue
+            self.pos = end
+            return obj
+
+    def char(self) -> str:
+        self.skip_ws()
+        if self.pos >= len(self.buf):
+            raise json.JSONDecodeError("Unexpected end of data", self.buf, self.pos)
+        self.pos += 1
+        return self.buf[self.pos - 1]
+
+    def expect(self, expected: str) -> None:
+        if self.char() != expected:
+            raise json.JSONDecodeError(
+                f"Expecting {expected!r}", self.buf, self.pos - 1
+            )
+
+
+def iter_json_array(
+    path: Path | IO[str],
+    key: str,
+    *,
+    envelope: dict | None = None,
+    chunk_size: int = 1 << 16,
+) -> Iterator[Any]:
+    """Yield the elements of the top-level array `key` of a JSON object file.
+
+    Reads chunk_size characters at a time and decodes one element at a time, so
+    memory stays bounded by the largest element rather than the file. Other
+    top-level members are decoded whole and stored into envelope, if given;
+    members after the array appear there only once iteration is finished.
+    Raises KeyError if there is no such member, TypeError if it is not an array.
+    path may also be a text file already open for reading; it is not closed.
+    """
+    opened = (
+        path.open(encoding="utf-8") if isinstance(path, Path) else nullcontext(path)
+    )
+    with opened as f:
+        stream = _JsonStream(f, chunk_size)
+        stream.expect("{")
+        found = False
+        stream.skip_ws()
+        sep = ","
+        if stream.buf[stream.pos : stream.pos + 1] == "}":
+            stream.pos += 1
+            sep = "}"
+        while sep == ",":
+            name = stream.value()
+            if not isinstance(name, str):
+                raise json.JSONDecodeError(
+                    "Expecting property name", stream.buf, stream.pos
+                )
+            stream.expect(":")
+            stream.skip_ws()
+            if name == key and not found:
+                found = True
+                if stream.buf[stream.pos : stream.pos + 1] != "[":
+                    raise TypeError(f"{path}: {key!r} is not an array")
+                stream.pos += 1
+                stream.skip_ws()
+                if stream.buf[stream.pos : stream.pos + 1] == "]":
+                    stream.pos += 1
+                else:
+                    while True:
+                        yield stream.value()
+                        end = stream.char()
+                        if end == "]":
+                            break
+                        if end != ",":
+                            raise json.JSONDecodeError(
+                                "Expecting ',' delimiter", stream.buf, stream.pos - 1
+                            )
+            else:
+                member = stream.value()
+                if envelope is not None:
+                    envelope[name] = member
+            sep = stream.char()
+            if sep not in ",}":
+                raise json.JSONDecodeError(
+                    "Expecting ',' delimiter", stream.buf, stream.pos - 1
+                )
+        stream.skip_ws()
+        if stream.pos < len(stream.buf):
+            raise json.JSONDecodeError("Extra data", stream.buf, stream.pos)
+    if not found:
+        raise KeyError(key)
+
+
+# Process-wide caches for the SSOT registry and compiled validators. Entries are
+# keyed by file identity (mtime_ns, size) so edits to a schema on disk are picked
+# up on the next call without an explicit invalidate. Resolved paths are reused
+# for as long as the registry/hashes snapshot they were derived from is current.
+_REGISTRY_CACHE: dict[Path, tuple[tuple[int, int], dict]] = {}
+_VALIDATOR_CACHE: dict[str, tuple[dict, Path | None, tuple | None, Any]] = {}
+_SHA256_CACHE: dict[Path, tuple[tuple[int, int], str]] = {}
+_CODEGEN_CACHE: dict[Path, tuple[tuple[int, int], dict[str, dict]]] = {}
+_GENERATED_CACHE: dict[str, tuple[dict, dict, Path, Path, tuple, Any]] = {}
+_BUNDLE_CACHE: dict[Path, tuple[tuple[int, int], dict]] = {}
+_BUNDLE_FRESH: dict[Path, tuple[dict, tuple[int, int]]] = {}
+_ENTRY_VALIDATOR_CACHE: dict[str, tuple[Any, Any, str]] = {}
+# canonical_digest memo: id(obj) -> (obj, digest). Holding obj keeps its id from
+# being reused while the entry lives; bounded, oldest entries evicted first.
+_DIGEST_CACHE: OrderedDict[int, tuple[Any, str]] = OrderedDict()
+DIGEST_CACHE_MAX = 4096
+
+CODEGEN_HASHES = Path("tools") / "contracts" / "codegen_hashes.json"
+SCHEMA_BUNDLE = Path("control") / "ssot" / "registry.bundle.json"
+
+
+@lru_cache(maxsize=8)
+def _ssot_files(root: Path) -> tuple[Path, Path, Path]:
+    return (
+        root / "control" / "ssot" / "registry.json",
+        root / CODEGEN_HASHES,
+        root / SCHEMA_BUNDLE,
+    )
+
+
+def file_identity(path: Path) -> tuple[int, int]:
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _load_cached(cache: dict, path: Path, parse: Any) -> Any:
+    ident = file_identity(path)
+    hit = cache.get(path)
+    if hit is not None and hit[0] == ident:
+        return hit[1]
+    value = parse(load_json(path))
+    cache[path] = (ident, value)
+    return value
+
+
+def load_registry() -> dict:
+    """Return the parsed SSOT registry, re-reading only when the file changes."""
+    registry_path = _ssot_files(repo_root())[0]
+    return _load_cached(_REGISTRY_CACHE, registry_path, lambda obj: obj)
+
+
+def _bundle_source_fresh(
+    bundle: dict, path: Path, meta: dict, bundle_mtime_ns: int
+) -> bool:
+    """Whether a bundled source file still matches what the bundle recorded.
+
+    Cheap when the source is older than the bundle; otherwise fall back to sha256
+    (e.g. after a checkout rewrote mtimes).
+    """
+    ident = file_identity(path)
+    hit = _BUNDLE_FRESH.get(path)
+    if hit is not None and hit[0] is bundle and hit[1] == ident:
+        return True
+    if ident[1] != meta["size"]:
+        return False
+    if ident[0] > bundle_mtime_ns and sha256_file_cached(path) != meta["sha256"]:
+        return False
+    _BUNDLE_FRESH[path] = (bundle, ident)
+    return True
+
+
+def bundled_schema(kind: str) -> dict | None:
+    """Return the $ref-resolved schema for kind from registry.bundle.json.
+
+    Returns None when the bundle is missing, disabled (XTRL_SCHEMA_BUNDLE=0), or
+    stale for this kind: registry.json or the kind's source schema no longer match
+    the size/sha256 recorded at build time (tools/contracts/gen.py).
+    """
+    if os.environ.get("XTRL_SCHEMA_BUNDLE", "1") == "0":
+        return None
+    registry_path, _, bundle_path = _ssot_files(repo_root())
+    try:
+        bundle = _load_cached(_BUNDLE_CACHE, bundle_path, lambda obj: obj)
+        bundle_mtime_ns = _BUNDLE_CACHE[bundle_path][0][0]
+        meta = bundle["artifacts"].get(kind)
+        if meta is None:
+            return None
+        if not _bundle_source_fresh(
+            bundle, registry_path, bundle["registry"], bundle_mtime_ns
+        ):
+            return None
+        if not _bundle_source_fresh(
+            bundle, repo_root() / meta["schema"], meta, bundle_mtime_ns
+        ):
+            return None
+    except FileNotFoundError:
+        return None
+    return bundle["schemas"][kind]
+
+
+def get_validator(kind: str) -> jsonschema.Draft7Validator:
+    """Return a cached Draft7Validator for an artifact kind.
+
+    Built from the pre-resolved schema bundle when it is fresh for kind, else from
+    the source schema. The validator is rebuilt when the registry points at a
+    different schema file or the schema file's mtime/size changes.
+    """
+    hit = _VALIDATOR_CACHE.get(kind)
+    bundled = bundled_schema(kind)
+    if bundled is not None:
+        if hit is not None and hit[0] is bundled:
+            return hit[3]
+        validator = jsonschema.Draft7Validator(bundled)
+        _VALIDATOR_CACHE[kind] = (bundled, None, None, validator)
+        return validator
+
+    registry = load_registry()
+    if hit is not None and hit[0] is registry:
+        schema_path = hit[1]
+    else:
+        schema_path = repo_root() / registry["artifacts"][kind]["schema"]
+    ident = file_identity(schema_path)
+    if hit is not None and hit[1] == schema_path and hit[2] == ident:
+        return hit[3]
+    validator = jsonschema.Draft7Validator(load_json(schema_path))
+    _VALIDATOR_CACHE[kind] = (registry, schema_path, ident, validator)
+    return validator
+
+
+def sha256_file_cached(path: Path) -> str:
+    """sha256 hex of a file's bytes, memoised by (mtime_ns, size).
+
+    For files written by write_json this equals canonical_digest of the object.
+    """
+    ident = file_identity(path)
+    hit = _SHA256_CACHE.get(path)
+    if hit is not None and hit[0] == ident:
+        return hit[1]
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    _SHA256_CACHE[path] = (ident, digest)
+    return digest
+
+
+def canonical_digest(obj: Any, *, memo: bool = False) -> str:
+    """sha256 hex of canonical_json_bytes(obj), i.e. of the file write_json writes.
+
+    memo=True memoises by object identity, for objects that are never mutated
+    after they are first hashed (e.g. loaded schemas); a mutated object would
+    keep its old digest. For files, sha256_file_cached is keyed by stat instead.
+    """
+    if memo:
+        hit = _DIGEST_CACHE.get(id(obj))
+        if hit is not None and hit[0] is obj:
+            _DIGEST_CACHE.move_to_end(id(obj))
+            return hit[1]
+    digest = hashlib.sha256(canonical_json_bytes(obj)).hexdigest()
+    if memo:
+        _DIGEST_CACHE[id(obj)] = (obj, digest)
+        if len(_DIGEST_CACHE) > DIGEST_CACHE_MAX:
+            _DIGEST_CACHE.popitem(last=False)
+    return digest
+
+
+def sha256_ref(digest: str) -> str:
+    """Format a hex digest the way artifacts reference it ("sha256:<hex>")."""
+    return f"sha256:{digest}"
+
+
+def _codegen_validator_entries() -> dict[str, dict]:
+    hashes_path = _ssot_files(repo_root())[1]
+    return _load_cached(
+        _CODEGEN_CACHE,
+        hashes_path,
+        lambda obj: {e["kind"]: e for e in obj.get("validators", [])},
+    )
+
+
+def get_generated_validator(kind: str) -> Any:
+    """Return the generated validator module for kind, or None.
+
+    Generated modules (tools/contracts/gen.py) are only used when both the source
+    schema and the module still match the sha256 recorded in codegen_hashes.json.
+    Set XTRL_GENERATED_VALIDATORS=0 to force the jsonschema path.
+    """
+    if os.environ.get("XTRL_GENERATED_VALIDATORS", "1") == "0":
+        return None
+    try:
+        entries = _codegen_validator_entries()
+        registry = load_registry()
+        hit = _GENERATED_CACHE.get(kind)
+        if hit is not None and hit[0] is entries and hit[1] is registry:
+            schema_path, module_path = hit[2], hit[3]
+        else:
+            entry = entries.get(kind)
+            schema_rel = registry["artifacts"][kind]["schema"]
+            if entry is None or entry["schema"] != schema_rel:
+                return None
+            schema_path = repo_root() / schema_rel
+            module_path = repo_root() / entry["output"]
+        idents = (file_identity(schema_path), file_identity(module_path))
+    except FileNotFoundError:
+        return None
+
+    if hit is not None and hit[2:5] == (schema_path, module_path, idents):
+        return hit[5]
+
+    entry = entries[kind]
+    module = None
+    if (
+        sha256_file_cached(schema_path) == entry["schema_sha256"]
+        and sha256_file_cached(module_path) == entry["output_sha256"]
+    ):
+        spec = importlib.util.spec_from_file_location(
+            f"_xtrl_generated_validator_{kind}", module_path
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    _GENERATED_CACHE[kind] = (
+        entries,
+        registry,
+        schema_path,
+        module_path,
+        idents,
+        module,
+    )
+    return module
+
+
+def invalidate_validator_cache(kind: str | None = None) -> None:
+    """Drop cached validators (all kinds when kind is None) and the registry."""
+    if kind is None:
+        _VALIDATOR_CACHE.clear()
+        _REGISTRY_CACHE.clear()
+        _GENERATED_CACHE.clear()
+        _CODEGEN_CACHE.clear()
+        _BUNDLE_CACHE.clear()
+        _BUNDLE_FRESH.clear()
+        _ENTRY_VALIDATOR_CACHE.clear()
+        _DIGEST_CACHE.clear()
+    else:
+        _VALIDATOR_CACHE.pop(kind, None)
+        _GENERATED_CACHE.pop(kind, None)
+        _ENTRY_VALIDATOR_CACHE.pop(kind, None)
 
 
 def validate_artifact(kind: str, obj: Any) -> None:
-    registry = load_json(ssot_root() / "registry.json")
-    meta = registry["artifacts"][kind]
-    schema = load_json(repo_root() / meta["schema"])
-    jsonschema.Draft7Validator(schema).validate(obj)
+    generated = get_generated_validator(kind)
+    if generated is not None:
+        try:
+            generated.validate(obj)
+            return
+        except generated.ValidationError:
+            pass  # re-run through jsonschema for the canonical error
+    get_validator(kind).validate(obj)
+
+
+def validate_many(kind: str, objs: Iterable[Any]) -> int:
+    """Validate a batch of artifacts of one kind; return the number validated.
+
+    Raises jsonschema.ValidationError on the first invalid object.
+    """
+    generated = get_generated_validator(kind)
+    validator = get_validator(kind)
+    count = 0
+    for obj in objs:
+        if generated is not None:
+            try:
+                generated.validate(obj)
+                count += 1
+                continue
+            except generated.ValidationError:
+                pass
+        validator.validate(obj)
+        count += 1
+    return count
+
+
+def _candidate_entry_validator() -> tuple[Any, str]:
+    """Validator for one CandidateSet.candidates[i], plus its sub-schema digest."""
+    validator = get_validator("candidate_set")
+    hit = _ENTRY_VALIDATOR_CACHE.get("candidate_set")
+    if hit is not None and hit[0] is validator:
+        return hit[1], hit[2]
+    items = validator.schema["properties"]["candidates"]["items"]
+    entry_validator = validator.evolve(schema=items)
+    digest = canonical_digest(items, memo=True)
+    _ENTRY_VALIDATOR_CACHE["candidate_set"] = (validator, entry_validator, digest)
+    return entry_validator, digest
+
+
+class _CandidateEntryChecker:
+    """Per-entry CandidateSet validation, shared by the in-memory and streaming paths.
+
+    Uses the generated validate_candidate when usable (cheaper than digesting
+    an entry). Otherwise entries go through Draft7 on the item sub-schema,
+    skipping those whose candidate_id + digest the cache_path sidecar recorded
+    on an earlier run.
+    """
+
+    def __init__(self, cache_path: Path | None):
+        self.cache_path = cache_path
+        self.entry_validator, self.schema_digest = _candidate_entry_validator()
+        generated = get_generated_validator("candidate_set")
+        self.fast = getattr(generated, "validate_candidate", None)
+        self.validated = 0
+        self.seen: dict[str, str] = {}
+        self.entries: dict[str, str] = {}
+        if self.fast is None and cache_path is not None and cache_path.exists():
+            try:
+                cached = load_json(cache_path)
+            except ValueError:
+                cached = {}
+            if (
+                isinstance(cached, dict)
+                and cached.get("schema_digest") == self.schema_digest
+            ):
+                self.seen = cached.get("entries") or {}
+
+    def check(self, index: int, entry: Any) -> None:
+        if self.fast is not None:
+            try:
+                self.fast(entry)
+            except ValueError:
+                self.raise_error(index, entry)
+            self.validated += 1
+            return
+        digest = canonical_digest(entry)
+        cid = entry.get("candidate_id") if isinstance(entry, dict) else None
+        if not isinstance(cid, str) or self.seen.get(cid) != digest:
+            if not self.entry_validator.is_valid(entry):
+                self.raise_error(index, entry)
+            self.validated += 1
+        if isinstance(cid, str):
+            self.entries[cid] = digest
+
+    def raise_error(self, index: int, entry: Any) -> None:
+        """Raise jsonschema's error for entry, pathed as in the whole document."""
+        error = next(self.entry_validator.iter_errors(entry), None)
+        if error is None:
+            return
+        error.relative_path.extendleft([index, "candidates"])
+        error.relative_schema_path.extendleft(["items", "candidates", "properties"])
+        raise error
+
+    def finish(self) -> int:
+        if (
+            self.fast is None
+            and self.cache_path is not None
+            and (self.validated or self.entries != self.seen)
+        ):
+            write_json(
+                self.cache_path,
+                {"schema_digest": self.schema_digest, "entries": self.entries},
+                compact=True,
+            )
+        return self.validated
+
+
+def validate_candidate_set(cand_set: Any, cache_path: Path | None = None) -> int:
+    """Validate a CandidateSet, checking each candidate entry at most once.
+
+    The envelope (everything except the entries) is validated on every call.
+    Without a generated validator, entries are validated against the candidates
+    item sub-schema and remembered by candidate_id + entry digest in cache_path,
+    a JSON sidecar tied to the sub-schema digest; only new or changed entries are
+    re-validated. Returns the number of entries validated. Errors carry the same
+    path as validate_artifact would report.
+    """
+    candidates = cand_set.get("candidates") if isinstance(cand_set, dict) else None
+    if not isinstance(candidates, list):
+        validate_artifact("candidate_set", cand_set)
+        return 0
+    validate_artifact("candidate_set", dict(cand_set, candidates=[]))
+    checker = _CandidateEntryChecker(cache_path)
+    for index, entry in enumerate(candidates):
+        checker.check(index, entry)
+    return checker.finish()
+
+
+def iter_candidate_set(
+    path: Path, cache_path: Path | None = None, envelope: dict | None = None
+) -> Iterator[dict]:
+    """Stream a CandidateSet file's entries, validated as by validate_candidate_set.
+
+    Each entry is checked before it is yielded; the envelope (collected into
+    envelope, if given) is checked once the entries are exhausted. Entries
+    still in the file's candidate log or spool (see append_candidate) follow
+    the compacted ones, so readers see every complete append; malformed log
+    lines are skipped (compaction quarantines them, see
+    candidate_rejected_path).
+    """
+    envelope = {} if envelope is None else envelope
+    checker = _CandidateEntryChecker(cache_path)
+    index = 0
+    # Spool before set: compaction replaces the set before removing spool files.
+    spooled = _read_candidate_spool(candidate_spool_dir(path))
+    with _open_candidate_files(path) as (f, logs):
+        try:
+            for entry in iter_json_array(f, "candidates", envelope=envelope):
+                checker.check(index, entry)
+                spooled.pop(entry.get("candidate_id"), None)
+                yield entry
+                index += 1
+        except (KeyError, TypeError):
+            # No candidates array: report it the way whole-document validation does.
+            validate_artifact("candidate_set", load_json(path))
+            raise
+        validate_artifact("candidate_set", dict(envelope, candidates=[]))
+        for log in logs:
+            for record in _read_candidate_log(log):
+                checker.check(index, record["candidate"])
+                yield record["candidate"]
+                index += 1
+    for _, record in spooled.values():
+        checker.check(index, record["candidate"])
+        yield record["candidate"]
+        index += 1
+    checker.finish()
+
+
+class CandidateTail:
+    """Incremental reader of a CandidateSet: poll() returns entries not seen
+    before, validated as by iter_candidate_set.
+
+    The set file (with its log and spool) is re-streamed only when it is
+    replaced, i.e. after a compaction; in between, only the bytes appended to
+    the candidate log since the last poll and new spool files are read. The
+    log is followed through compaction's rename by its open file. Entries are
+    deduplicated by candidate_id. An invalid entry in the set file (or its
+    envelope) raises as in iter_candidate_set; invalid appended entries and
+    malformed log lines are skipped and listed in rejected. envelope holds the
+    set's envelope.
+    """
+
+    def __init__(self, path: Path, cache_path: Path | None = None):
+        self.path = path
+        self.cache_path = cache_path
+        self.envelope: dict = {}
+        self.seen: set[str] = set()
+        self.rejected: list[dict] = []
+        self._set_id: tuple[int, int, int] | None = None
+        self._log: IO[bytes] | None = None
+        self._log_ino: int | None = None
+        self._partial = b""
+        self._spool_id: int | None = None
+        self._checker = _CandidateEntryChecker(None)
+
+    def close(self) -> None:
+        if self._log is not None:
+            self._log.close()
+            self._log = self._log_ino = None
+
+    def _new(self, out: list[dict], candidate: Any, check: bool) -> None:
+        cid = candidate.get("candidate_id") if isinstance(candidate, dict) else None
+        if cid in self.seen:
+            return
+        if check:
+            try:
+                self._checker.check(len(self.seen), candidate)
+            except jsonschema.ValidationError as exc:
+                self.rejected.append({"candidate_id": cid, "error": exc.message})
+                return
+        self.seen.add(cid)
+        out.append(candidate)
+
+    def poll(self) -> list[dict]:
+        out: list[dict] = []
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return out
+        set_id = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if set_id != self._set_id:
+            self.envelope.clear()
+            for candidate in iter_candidate_set(
+                self.path, self.cache_path, self.envelope
+            ):
+                self._new(out, candidate, check=False)
+            self._set_id = set_id
+        self._tail_log(out)
+        spool = candidate_spool_dir(self.path)
+        try:
+            spool_id = os.stat(spool).st_mtime_ns
+        except FileNotFoundError:
+            spool_id = None
+        if spool_id is not None and spool_id != self._spool_id:
+            self._spool_id = spool_id
+            for _, record in _read_candidate_spool(spool).values():
+                self._new(out, record["candidate"], check=True)
+        return out
+
+    def _read_log(self, out: list[dict]) -> None:
+        lines = (self._partial + self._log.read()).split(b"\n")
+        self._partial = lines.pop()  # an append still being written
+        for line in lines:
+            record = _parse_candidate_log_line(line)
+            if record is None:
+                self.rejected.append(
+                    {"candidate_id": None, "error": "malformed candidate log line"}
+                )
+                continue
+            self._new(out, record["candidate"], check=True)
+
+    def _tail_log(self, out: list[dict]) -> None:
+        log = candidate_log_paths(self.path)[0]
+        if self._log is not None:
+            self._read_log(out)
+        try:
+            ino = os.stat(log).st_ino
+        except FileNotFoundError:
+            ino = None
+        if ino == self._log_ino:
+            return
+        if self._log is not None:
+            # Compaction renamed the log aside under its exclusive lock, so
+            # every append to it has finished: read the rest, then follow the
+            # new log from its start.
+            self._read_log(out)
+            self.close()
+            self._partial = b""
+        if ino is None:
+            return
+        try:
+            # Held across polls to follow the log through compaction's rename.
+            self._log = open(log, "rb")  # noqa: SIM115
+        except FileNotFoundError:
+            return
+        self._log_ino = os.fstat(self._log.fileno()).st_ino
+        self._read_log(out)
 
 
 @dataclass(frozen=True)
@@ -77,20 +940,760 @@ def release_lock(lock: Lock) -> None:
     lock.path.unlink(missing_ok=True)
 
 
-def append_candidate(candidate_set_path: Path, candidate_entry: dict) -> None:
-    """Append candidate entry to candidate_set.json (create if missing)."""
-    if candidate_set_path.exists():
-        obj = load_json(candidate_set_path)
-    else:
-        obj = {
-            "artifact_kind": "candidate_set",
-            "queue_id": candidate_entry.get("queue_id", ""),
-            "base_ref": candidate_entry.get("base_ref", ""),
-            "candidates": [],
+class LockBusy(FileExistsError):
+    """The lock was still held when the allowed wait ran out."""
+
+
+# Per-process lock counters; see lock_stats().
+_LOCK_STATS: dict[str, float] = {
+    "acquired": 0,
+    "contended": 0,
+    "timeouts": 0,
+    "wait_seconds": 0.0,
+    "expired_leases_seen": 0,
+    "broken": 0,
+    "fenced": 0,
+}
+_LOCK_RECORD_SIZE = 256
+
+
+def lock_stats() -> dict[str, float]:
+    """Copy of the lock counters: acquisitions, how many had to wait (contended),
+    gave up (timeouts), total seconds spent waiting, held locks seen with an
+    expired lease, stale link locks broken, and writes refused by check_fence."""
+    return dict(_LOCK_STATS)
+
+
+def reset_lock_stats() -> None:
+    for key in _LOCK_STATS:
+        _LOCK_STATS[key] = 0
+
+
+class FlockLock:
+    """Exclusive lock held with fcntl.flock; the kernel drops it if the holder dies.
+
+    timeout: None waits indefinitely, 0 tries once, otherwise polls with backoff
+    for up to that many seconds before raising LockBusy.
+
+    lease_seconds: optional liveness lease. The holder record in the lock file
+    carries an expiry, renewed by renew() and, with heartbeat=True, by a
+    background thread every lease_seconds / 3. A held lock whose lease has
+    expired means a live but stalled holder; waiters count it and name the pid
+    in LockBusy. The lock itself is only ever released by its holder or the
+    kernel, so two waiters can never both "break" it.
+
+    The lock file is unlinked on release; acquirers re-check that the path
+    still names the inode they locked.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        timeout: float | None = 0,
+        lease_seconds: float | None = None,
+        heartbeat: bool = True,
+    ):
+        self.path = path
+        self.timeout = timeout
+        self.lease_seconds = lease_seconds
+        self.heartbeat = heartbeat
+        self.fd: int | None = None
+        self._stop: threading.Event | None = None
+        self._thread: threading.Thread | None = None
+
+    def _try_lock(self) -> bool:
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        try:
+            same = os.stat(self.path).st_ino == os.fstat(fd).st_ino
+        except FileNotFoundError:
+            same = False
+        if not same:  # released (unlinked) between our open and flock
+            os.close(fd)
+            return False
+        self.fd = fd
+        return True
+
+    def holder(self) -> dict | None:
+        """The current holder record, if readable."""
+        try:
+            return json.loads(self.path.read_bytes() or b"null")
+        except (OSError, ValueError):
+            return None
+
+    def acquire(self) -> FlockLock:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        start = time.monotonic()
+        delay = 0.005
+        contended = False
+        while not self._try_lock():
+            if not contended:
+                contended = True
+                _LOCK_STATS["contended"] += 1
+            waited = time.monotonic() - start
+            if self.timeout is not None and waited >= self.timeout:
+                _LOCK_STATS["timeouts"] += 1
+                _LOCK_STATS["wait_seconds"] += waited
+                raise LockBusy(self._busy_message())
+            pause = delay * (0.5 + random.random())
+            if self.timeout is not None:
+                pause = min(pause, self.timeout - waited)
+            time.sleep(max(pause, 0))
+            delay = min(delay * 2, 0.1)
+        _LOCK_STATS["acquired"] += 1
+        _LOCK_STATS["wait_seconds"] += time.monotonic() - start
+        self.renew()
+        if self.lease_seconds and self.heartbeat:
+            self._stop = threading.Event()
+            self._thread = threading.Thread(
+                target=self._beat, name=f"lease:{self.path.name}", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def _busy_message(self) -> str:
+        record = self.holder() or {}
+        expires_at = record.get("expires_at")
+        note = ""
+        if expires_at is not None and expires_at < time.time():
+            _LOCK_STATS["expired_leases_seen"] += 1
+            note = f" (lease expired {time.time() - expires_at:.1f}s ago)"
+        return f"lock held: {self.path} pid={record.get('pid')}{note}"
+
+    def renew(self) -> None:
+        """Rewrite the holder record, extending the lease if there is one."""
+        if self.fd is None:
+            return
+        now = time.time()
+        record = {"pid": os.getpid(), "host": socket.gethostname(), "renewed_at": now}
+        if self.lease_seconds:
+            record["expires_at"] = now + self.lease_seconds
+        data = json.dumps(record, sort_keys=True).encode("utf-8")
+        os.pwrite(self.fd, data.ljust(_LOCK_RECORD_SIZE - 1) + b"\n", 0)
+
+    def _beat(self) -> None:
+        while not self._stop.wait(self.lease_seconds / 3):
+            self.renew()
+
+    def release(self) -> None:
+        if self._stop is not None:
+            self._stop.set()
+            self._thread.join()
+            self._stop = self._thread = None
+        if self.fd is not None:
+            self.path.unlink(missing_ok=True)
+            os.close(self.fd)
+            self.fd = None
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+
+# LinkLock: for state roots shared by several hosts (NFS), where flock and
+# O_EXCL cannot be trusted across clients but link() and rename() are atomic.
+LINK_LEASE_SECONDS = 60.0
+# Slack for clocks of different hosts when judging another host's lease.
+NODE_CLOCK_SKEW_SECONDS = 30.0
+
+
+def node_id() -> str:
+    """This node's name in lock records: $XTRL_NODE_ID, else the hostname."""
+    return os.environ.get("XTRL_NODE_ID") or socket.gethostname()
+
+
+def _pid_alive(pid: Any) -> bool:
+    if not isinstance(pid, int):
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class LinkLock:
+    """Exclusive lock that is safe on NFS: link() of a private file to the lock.
+
+    Same interface as FlockLock (timeout, lease_seconds, heartbeat, LockBusy).
+    The acquirer writes its holder record {file, node, host, pid, token,
+    expires_at} to a uniquely named file next to the lock and link()s it to the
+    lock path; it holds the lock iff its file then has two links (the NFS recipe:
+    a retried LINK reply can report failure for a link that was made). The
+    lease (default LINK_LEASE_SECONDS) is renewed in place by a heartbeat.
+
+    A holder is stale when its lease expired more than NODE_CLOCK_SKEW_SECONDS
+    ago, or when it is on this node and its pid is gone. A waiter breaks a
+    stale lock by rename()ing it aside (only one waiter can) and puts it back
+    if the record changed in the meantime.
+
+    Each acquisition takes the next fencing token from <lock>.token. A holder
+    whose lock was broken may still be running; writes it makes should go
+    through check_fence(), which rejects tokens older than the newest seen.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        timeout: float | None = 0,
+        lease_seconds: float | None = None,
+        heartbeat: bool = True,
+    ):
+        self.path = path
+        self.timeout = timeout
+        self.lease_seconds = lease_seconds or LINK_LEASE_SECONDS
+        self.heartbeat = heartbeat
+        self.token: int | None = None
+        self.lost = False
+        self._own: Path | None = None
+        self._ino: int | None = None
+        self._stop: threading.Event | None = None
+        self._thread: threading.Thread | None = None
+
+    def _record(self, own: Path) -> bytes:
+        now = time.time()
+        record = {
+            "file": own.name,
+            "node": node_id(),
+            "host": socket.gethostname(),
+            "pid": os.getpid(),
+            "token": self.token,
+            "renewed_at": now,
+            "expires_at": now + self.lease_seconds,
         }
+        data = json.dumps(record, sort_keys=True).encode("utf-8")
+        return data.ljust(_LOCK_RECORD_SIZE - 1) + b"\n"
+
+    def _try_lock(self) -> bool:
+        # A stale holder broken on the first attempt is replaced on the second.
+        return self._try_link() or (self._break_if_stale() and self._try_link())
+
+    def _try_link(self) -> bool:
+        own = self.path.with_name(
+            f"{self.path.name}.{node_id()}.{os.getpid()}.{uuid.uuid4().hex[:8]}"
+        )
+        fd = os.open(own, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            os.write(fd, self._record(own))
+        finally:
+            os.close(fd)
+        error: OSError | None = None
+        try:
+            os.link(own, self.path)
+        except FileExistsError:
+            pass
+        except OSError as exc:
+            error = exc
+        st = os.stat(own)
+        if st.st_nlink == 2:
+            self._own, self._ino = own, st.st_ino
+            return True
+        own.unlink()
+        if error is not None:
+            raise error
+        return False
+
+    def holder(self) -> dict | None:
+        """The current holder record, if readable."""
+        try:
+            return json.loads(self.path.read_bytes() or b"null")
+        except (OSError, ValueError):
+            return None
+
+    def _stale(self, record: dict | None) -> bool:
+        if record is None:  # being written, or garbage: judge by its age
+            try:
+                age = time.time() - self.path.stat().st_mtime
+            except FileNotFoundError:
+                return False
+            return age > self.lease_seconds + NODE_CLOCK_SKEW_SECONDS
+        expires_at = record.get("expires_at")
+        if (
+            isinstance(expires_at, (int, float))
+            and expires_at + NODE_CLOCK_SKEW_SECONDS < time.time()
+        ):
+            return True
+        return record.get("node") == node_id() and not _pid_alive(record.get("pid"))
+
+    def _break_if_stale(self) -> bool:
+        """Remove a stale holder's lock; True if the lock path was freed."""
+        record = self.holder()
+        if not self._stale(record):
+            return False
+        aside = self.path.with_name(f"{self.path.name}.broken.{uuid.uuid4().hex[:8]}")
+        try:
+            os.rename(self.path, aside)
+        except FileNotFoundError:
+            return True  # released, or another waiter broke it first
+        try:
+            moved = json.loads(aside.read_bytes() or b"null")
+        except (OSError, ValueError):
+            moved = None
+        restored = False
+        if moved != record:  # renewed or re-acquired since we looked
+            try:
+                os.link(aside, self.path)
+                restored = True
+            except FileExistsError:
+                pass
+        else:
+            _LOCK_STATS["broken"] += 1
+            _LOCK_STATS["expired_leases_seen"] += 1
+            if isinstance(moved, dict) and moved.get("file"):
+                # The dead holder's own link to the record.
+                self.path.with_name(moved["file"]).unlink(missing_ok=True)
+        aside.unlink(missing_ok=True)
+        return not restored
+
+    def acquire(self) -> LinkLock:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        start = time.monotonic()
+        delay = 0.005
+        contended = False
+        while not self._try_lock():
+            if not contended:
+                contended = True
+                _LOCK_STATS["contended"] += 1
+            waited = time.monotonic() - start
+            if self.timeout is not None and waited >= self.timeout:
+                _LOCK_STATS["timeouts"] += 1
+                _LOCK_STATS["wait_seconds"] += waited
+                record = self.holder() or {}
+                raise LockBusy(
+                    f"lock held: {self.path} node={record.get('node')}"
+                    f" pid={record.get('pid')}"
+                )
+            pause = delay * (0.5 + random.random())
+            if self.timeout is not None:
+                pause = min(pause, self.timeout - waited)
+            time.sleep(max(pause, 0))
+            delay = min(delay * 2, 0.1)
+        _LOCK_STATS["acquired"] += 1
+        _LOCK_STATS["wait_seconds"] += time.monotonic() - start
+        self.lost = False
+        self.token = _next_token(self.path.with_name(self.path.name + ".token"))
+        self.renew()
+        if self.heartbeat:
+            self._stop = threading.Event()
+            self._thread = threading.Thread(
+                target=self._beat, name=f"lease:{self.path.name}", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def owned(self) -> bool:
+        """True while the lock path still names this holder's file."""
+        if self._own is None:
+            return False
+        try:
+            if os.stat(self.path).st_ino != self._ino:
+                return False
+        except FileNotFoundError:
+            return False
+        # Our file may have been removed by a breaker and its inode reused.
+        record = self.holder()
+        return record is None or record.get("file") == self._own.name
+
+    def renew(self) -> None:
+        """Rewrite the holder record with a fresh lease; sets lost if the lock
+        was broken meanwhile."""
+        if self._own is None:
+            return
+        if not self.owned():
+            self.lost = True
+            return
+        fd = os.open(self._own, os.O_WRONLY)
+        try:
+            data = self._record(self._own)
+            os.pwrite(fd, data, 0)
+            os.ftruncate(fd, len(data))
+        finally:
+            os.close(fd)
+
+    def _beat(self) -> None:
+        while not self._stop.wait(self.lease_seconds / 3):
+            self.renew()
+
+    def release(self) -> None:
+        if self._stop is not None:
+            self._stop.set()
+            self._thread.join()
+            self._stop = self._thread = None
+        if self._own is not None:
+            if self.owned():
+                self.path.unlink(missing_ok=True)
+            self._own.unlink(missing_ok=True)
+            self._own = self._ino = None
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+
+def _next_token(counter: Path) -> int:
+    """Increment a fencing token counter; call only while holding its lock."""
+    try:
+        token = int(counter.read_text(encoding="ascii") or 0) + 1
+    except FileNotFoundError:
+        token = 1
+    write_file_atomic(counter, f"{token}\n".encode("ascii"))
+    return token
+
+
+def check_fence(resource: Path, token: int | None) -> bool:
+    """Admit a write to resource by a lock holder with fencing token `token`.
+
+    Returns False if a newer token has already written resource (the caller's
+    lock was broken and someone else holds it now): discard the write.
+    Otherwise records token in <resource>.fence and returns True. All writers
+    of one resource must hold the same lock. token None (flock) always passes.
+    """
+    if token is None:
+        return True
+    fence = resource.with_name(resource.name + ".fence")
+    try:
+        last = int(fence.read_text(encoding="ascii") or 0)
+    except FileNotFoundError:
+        last = 0
+    if token < last:
+        _LOCK_STATS["fenced"] += 1
+        return False
+    if token > last:
+        write_file_atomic(fence, f"{token}\n".encode("ascii"))
+    return True
+
+
+def lock_backend() -> str:
+    """$XTRL_LOCK_BACKEND (flock, excl or link), else flock where available.
+
+    "link" means the state root is shared between hosts: locks are LinkLocks
+    and candidates are published as spool files instead of log appends.
+    """
+    backend = os.environ.get("XTRL_LOCK_BACKEND") or (
+        "flock" if fcntl is not None else "excl"
+    )
+    if backend not in ("flock", "excl", "link"):
+        raise ValueError(f"unknown lock backend: {backend!r}")
+    return backend
 
-    obj.setdefault("candidates", []).append(candidate_entry)
-    write_json(candidate_set_path, obj)
+
+def shared_lock(path: Path, **kwargs: Any) -> Any:
+    """An unacquired FlockLock, or LinkLock when lock_backend() is "link"."""
+    if lock_backend() == "link":
+        return LinkLock(path, **kwargs)
+    return FlockLock(path, **kwargs)
+
+
+# Candidate log: appends go to <candidate_set>.log.jsonl, one compact JSON line
+# {"queue_id", "base_ref", "candidate"} per O_APPEND write, instead of rewriting
+# candidate_set.json. compact_candidate_log() folds the log into the set.
+CANDIDATE_LOG_COMPACT_BYTES = 1 << 20
+# With the link lock backend (state root shared between hosts, where O_APPEND
+# and flock are not reliable), each append is instead a file
+# <candidate_set>.spool/<candidate_id>.json written by rename, and compaction
+# merges the spool once it holds this many entries.
+CANDIDATE_SPOOL_COMPACT_ENTRIES = 256
+
+
+def candidate_log_paths(candidate_set_path: Path) -> tuple[Path, Path, Path]:
+    """(log, segment being compacted, lock file) for a candidate set."""
+    return (
+        candidate_set_path.with_suffix(".log.jsonl"),
+        candidate_set_path.with_suffix(".compacting.jsonl"),
+        candidate_set_path.with_suffix(".log.lock"),
+    )
+
+
+@contextmanager
+def _candidate_log_lock(lock_path: Path, exclusive: bool) -> Iterator[None]:
+    """flock on the log's lock file: shared for appends and reads, exclusive
+    for compaction's rename/replace steps. A no-op without fcntl, where
+    compaction must not run next to appenders."""
+    if fcntl is None:
+        yield
+        return
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o666)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        yield
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def _open_candidate_files(path: Path) -> Iterator[tuple[IO[str], list[IO[bytes]]]]:
+    """Open a candidate set and its pending log files as one consistent view."""
+    log, segment, lock_path = candidate_log_paths(path)
+    files: list[IO] = []
+    try:
+        if log.exists() or segment.exists():
+            with _candidate_log_lock(lock_path, exclusive=False):
+                files.append(path.open(encoding="utf-8"))
+                for tail in (segment, log):
+                    try:
+                        files.append(tail.open("rb"))
+                    except FileNotFoundError:
+                        pass
+        else:
+            files.append(path.open(encoding="utf-8"))
+        yield files[0], files[1:]
+    finally:
+        for f in files:
+            f.close()
+
+
+def candidate_spool_dir(candidate_set_path: Path) -> Path:
+    return candidate_set_path.with_suffix(".spool")
+
+
+def _read_candidate_spool(spool: Path) -> dict[str, tuple[Path, dict]]:
+    """Spool records by candidate_id (path, record), in append order: by spool
+    file mtime, so ties in ranking break by insertion as with the log."""
+    records: dict[str, tuple[Path, dict]] = {}
+    files = []
+    try:
+        with os.scandir(spool) as it:
+            for d in it:
+                if d.name.startswith(".") or not d.name.endswith(".json"):
+                    continue  # a write in progress
+                try:
+                    files.append((d.stat().st_mtime_ns, d.name))
+                except FileNotFoundError:
+                    continue
+    except FileNotFoundError:
+        return records
+    for _, name in sorted(files):
+        try:
+            record = load_json(spool / name)
+        except FileNotFoundError:
+            continue  # merged meanwhile; the set read after this has it
+        records[record["candidate"]["candidate_id"]] = (spool / name, record)
+    return records
+
+
+def candidate_rejected_path(candidate_set_path: Path) -> Path:
+    """Where compaction quarantines malformed candidate log lines."""
+    return candidate_set_path.with_suffix(".rejected.jsonl")
+
+
+def _parse_candidate_log_line(line: bytes) -> dict | None:
+    """A log line's record, or None if it is malformed (e.g. a torn append
+    that a later append was written after)."""
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(record, dict) or not isinstance(record.get("candidate"), dict):
+        return None
+    return record
+
+
+def _read_candidate_log(
+    f: IO[bytes], malformed: list[bytes] | None = None
+) -> Iterator[dict]:
+    """Complete records of a candidate log; malformed lines are skipped (and
+    collected into malformed, if given)."""
+    for line in f:
+        if not line.endswith(b"\n"):
+            break  # an append still being written
+        record = _parse_candidate_log_line(line)
+        if record is None:
+            if malformed is not None:
+                malformed.append(line)
+            continue
+        yield record
+
+
+def append_candidate(
+    candidate_set_path: Path,
+    entry: dict,
+    *,
+    compact_bytes: int | None = CANDIDATE_LOG_COMPACT_BYTES,
+) -> None:
+    """Append {"queue_id", "base_ref", "candidate"} to a candidate set's log.
+
+    The candidate is validated first, then written as one O_APPEND line, so
+    concurrent appenders never lose each other's entries and an append costs
+    O(1). Creates an empty candidate_set.json on first use. Once the log
+    reaches compact_bytes, the appender compacts it (skipped if another
+    compaction is running; None disables this). With the link lock backend
+    the entry goes to the candidate spool instead, compacted at
+    CANDIDATE_SPOOL_COMPACT_ENTRIES.
+    """
+    fast = getattr(get_generated_validator("candidate_set"), "validate_candidate", None)
+    entry_validator = _candidate_entry_validator()[0]
+    if fast is None:
+        entry_validator.validate(entry["candidate"])
+    else:
+        try:
+            fast(entry["candidate"])
+        except ValueError:
+            entry_validator.validate(entry["candidate"])  # jsonschema's error
+    if lock_backend() == "link":
+        _spool_candidate(candidate_set_path, entry, compact=compact_bytes is not None)
+        return
+    log, _, lock_path = candidate_log_paths(candidate_set_path)
+    log.parent.mkdir(parents=True, exist_ok=True)
+    if not candidate_set_path.exists():
+        with _candidate_log_lock(lock_path, exclusive=True):
+            if not candidate_set_path.exists():
+                write_json(
+                    candidate_set_path,
+                    _empty_candidate_set(entry),
+                    kind="candidate_set",
+                )
+    line = encode_json(entry, compact=True)  # one line, newline-terminated
+    with _candidate_log_lock(lock_path, exclusive=False):
+        fd = os.open(log, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+        try:
+            written = os.write(fd, line)
+            while written < len(line):
+                written += os.write(fd, line[written:])
+            size = os.fstat(fd).st_size
+        finally:
+            os.close(fd)
+    if compact_bytes is not None and size >= compact_bytes:
+        compact_candidate_log(candidate_set_path)
+
+
+def _empty_candidate_set(entry: dict) -> dict:
+    return {
+        "artifact_kind": "candidate_set",
+        "queue_id": entry["queue_id"],
+        "base_ref": entry["base_ref"],
+        "candidates": [],
+        "meta": default_meta(),
+    }
+
+
+def _spool_candidate(candidate_set_path: Path, entry: dict, compact: bool) -> None:
+    """append_candidate for the link backend: one spool file per candidate."""
+    spool = candidate_spool_dir(candidate_set_path)
+    spool.mkdir(parents=True, exist_ok=True)
+    if not candidate_set_path.exists():
+        compact_lock = candidate_set_path.with_suffix(".compact.lock")
+        with shared_lock(compact_lock, timeout=None):
+            if not candidate_set_path.exists():
+                write_json(
+                    candidate_set_path,
+                    _empty_candidate_set(entry),
+                    kind="candidate_set",
+                )
+    name = hashlib.sha256(entry["candidate"]["candidate_id"].encode()).hexdigest()
+    write_json(spool / f"{name[:32]}.json", entry, compact=True)
+    if compact and len(os.listdir(spool)) >= CANDIDATE_SPOOL_COMPACT_ENTRIES:
+        compact_candidate_log(candidate_set_path)
+
+
+def _compact_candidate_spool(candidate_set_path: Path, token: int | None) -> int | None:
+    """compact_candidate_log's spool merge (compact lock held, fencing token
+    `token`); None if there was nothing to merge or the write was fenced off.
+
+    The set is replaced before the merged spool files are removed, so a reader
+    that lists the spool and then opens the set misses nothing.
+    """
+    records = _read_candidate_spool(candidate_spool_dir(candidate_set_path))
+    if not records:
+        return None
+    cand_set = load_json(candidate_set_path)
+    candidates = cand_set["candidates"]
+    seen = {c["candidate_id"] for c in candidates}
+    added = 0
+    for candidate_id, (_, record) in records.items():
+        if candidate_id not in seen:
+            candidates.append(record["candidate"])
+            added += 1
+    if not check_fence(candidate_set_path, token):
+        return None  # our lock was broken; the new holder merges these
+    if added:
+        write_json(candidate_set_path, cand_set, kind="candidate_set")
+    for path, _ in records.values():
+        path.unlink(missing_ok=True)
+    return added
+
+
+def compact_candidate_log(candidate_set_path: Path, *, wait: bool = False) -> int:
+    """Fold the candidate log into candidate_set.json; return entries added.
+
+    The log is renamed aside under the exclusive lock (appenders then start a
+    new one), merged without blocking appenders, and the set is replaced and
+    the segment removed under the exclusive lock again. A segment left by a
+    crashed compaction is merged first, skipping candidate_ids already in the
+    set. Returns 0 without waiting if another compaction holds the lock,
+    unless wait is set: then it waits for that compaction and merges what
+    was appended since, so callers see the whole log folded in. For
+    the live state candidate set, a snapshot generation is published after,
+    also refreshing the live queue, rank policy and ledger files that changed.
+    With the link lock backend the candidate spool is merged instead.
+    """
+    try:
+        compactor = shared_lock(
+            candidate_set_path.with_suffix(".compact.lock"),
+            timeout=None if wait else 0,
+        ).acquire()
+    except LockBusy:
+        return 0
+    try:
+        if isinstance(compactor, LinkLock):
+            added = _compact_candidate_spool(candidate_set_path, compactor.token)
+        else:
+            added = _compact_candidate_segment(candidate_set_path)
+    finally:
+        compactor.release()
+    live = state_root() / "queue" / "candidate_set.json"
+    if candidate_set_path.resolve() == live.resolve():
+        # Also picks up live rewrites of the queue, rank policy and ledger
+        # since the last generation, so snapshot readers never lag behind.
+        publish_snapshot(
+            [] if added is None else ["queue/candidate_set.json"],
+            refresh_changed=True,
+        )
+    return added or 0
+
+
+def _compact_candidate_segment(candidate_set_path: Path) -> int | None:
+    """compact_candidate_log's log merge (compact lock held); None if the log
+    was empty."""
+    log, segment, lock_path = candidate_log_paths(candidate_set_path)
+    recovering = segment.exists()
+    if not recovering:
+        with _candidate_log_lock(lock_path, exclusive=True):
+            if not log.exists() or log.stat().st_size == 0:
+                return None
+            os.rename(log, segment)
+    cand_set = load_json(candidate_set_path)
+    candidates = cand_set["candidates"]
+    seen = {c["candidate_id"] for c in candidates} if recovering else set()
+    added = 0
+    malformed: list[bytes] = []
+    with segment.open("rb") as f:
+        for record in _read_candidate_log(f, malformed):
+            candidate = record["candidate"]
+            if candidate["candidate_id"] in seen:
+                continue
+            candidates.append(candidate)
+            added += 1
+    if malformed:
+        with candidate_rejected_path(candidate_set_path).open("ab") as f:
+            f.writelines(malformed)
+    with _candidate_log_lock(lock_path, exclusive=True):
+        write_json(candidate_set_path, cand_set, kind="candidate_set")
+        segment.unlink()
+    return added
 
 
 def ensure_state_layout() -> None:
@@ -99,29 +1702,239 @@ def ensure_state_layout() -> None:
         (state_root() / sub).mkdir(parents=True, exist_ok=True)
 
 
+def default_meta() -> dict:
+    """Minimal `meta` block for artifacts written by the tools.
+
+    Links the reason-code catalog by path, version and sha256; no requirements
+    or guards.
+    """
+    reason_codes = ssot_root() / "reason_codes.json"
+    return {
+        "policy_linkage": {
+            "reason_codes_ref": {
+                "path": str(reason_codes.relative_to(repo_root())),
+                "version": load_json(reason_codes)["version"],
+                "sha256": sha256_file_cached(reason_codes),
+            }
+        },
+        "requirements": {"required_evidence": []},
+        "guards": {"spec": [], "eval": []},
+    }
+
+
 def now_iso() -> str:
     # fixed format; caller can override
     return time.strftime("%Y-%m-%dT%H:%M:%S%z", time.localtime())
 
 
 def read_registry_schema(kind: str) -> str:
-    registry = load_json(ssot_root() / "registry.json")
-    return str(repo_root() / registry["artifacts"][kind]["schema"])
+    return str(repo_root() / load_registry()["artifacts"][kind]["schema"])
 
 
 class AtomicLock:
-    """Context-manager wrapper around acquire_lock/release_lock."""
+    """Context-manager lock: FlockLock where fcntl exists, else acquire_lock.
 
-    def __init__(self, path: Path, ttl_seconds: int = 3600):
+    backend ("flock", "excl" or "link") defaults to lock_backend(). "link" is a
+    LinkLock, for state roots shared between hosts. timeout and lease_seconds
+    apply to flock and link; all backends raise FileExistsError (LockBusy for
+    flock and link) when the lock is held. token is the link backend's fencing
+    token while held (see check_fence), else None.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: int = 3600,
+        *,
+        backend: str | None = None,
+        timeout: float | None = 0,
+        lease_seconds: float | None = None,
+    ):
         self.path = path
         self.ttl_seconds = ttl_seconds
-        self._lock: Optional[Lock] = None
+        self.backend = backend or lock_backend()
+        if self.backend not in ("flock", "excl", "link"):
+            raise ValueError(f"unknown lock backend: {self.backend!r}")
+        self.timeout = timeout
+        self.lease_seconds = lease_seconds
+        self._lock: Lock | None = None
+        self._flock: Any | None = None
+
+    @property
+    def token(self) -> int | None:
+        return getattr(self._flock, "token", None)
+
+    def renew(self) -> None:
+        """Heartbeat: extend the lease (flock, link) or refresh the TTL mtime (excl)."""
+        if self._flock is not None:
+            self._flock.renew()
+        elif self._lock is not None:
+            os.utime(self._lock.path)
 
     def __enter__(self):
-        self._lock = acquire_lock(self.path, ttl_seconds=self.ttl_seconds)
+        if self.backend in ("flock", "link"):
+            cls = LinkLock if self.backend == "link" else FlockLock
+            self._flock = cls(
+                self.path, timeout=self.timeout, lease_seconds=self.lease_seconds
+            ).acquire()
+        else:
+            self._lock = acquire_lock(self.path, ttl_seconds=self.ttl_seconds)
         return self
 
     def __exit__(self, exc_type, exc, tb):
+        if self._flock is not None:
+            self._flock.release()
+            self._flock = None
         if self._lock:
             release_lock(self._lock)
         return False
+
+
+# Shared state files captured by every snapshot generation, relative to the
+# state root, with their artifact kinds. Generations hard-link these files, so
+# writers must replace them (write_json: temp file + rename), never rewrite
+# them in place: an in-place write would change published generations too,
+# and would not be seen as a change by publish_snapshot(refresh_changed=True).
+SNAPSHOT_FILES = {
+    "queue/work_queue.json": "work_queue",
+    "queue/rank_policy.json": "rank_policy",
+    "queue/candidate_set.json": "candidate_set",
+    "ledger/latest.json": "latest_state",
+}
+SNAPSHOT_KEEP = 4
+SNAPSHOT_GRACE_SECONDS = 5.0
+_GENERATION_RE = re.compile(r"gen-(\d{8})")
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """One published generation of the shared state files; never modified."""
+
+    generation: int
+    path: Path
+
+    def file(self, rel: str) -> Path:
+        return self.path / rel
+
+    def load(self, rel: str) -> Any:
+        return load_json(self.path / rel)
+
+
+def open_snapshot(root: Path | None = None) -> Snapshot | None:
+    """The current snapshot generation, or None if none has been published.
+
+    Lock-free: resolves the snapshots/current symlink once, so every file read
+    through the returned Snapshot comes from the same generation. A generation
+    stays on disk for SNAPSHOT_KEEP publishes and at least
+    SNAPSHOT_GRACE_SECONDS after it was superseded, so open the files promptly;
+    files already open stay readable after the generation is pruned.
+    """
+    snap_dir = (root or state_root()) / "snapshots"
+    try:
+        name = os.readlink(snap_dir / "current")
+    except FileNotFoundError:
+        return None
+    m = _GENERATION_RE.fullmatch(name)
+    if m is None:
+        raise ValueError(f"bad snapshot link: {snap_dir / 'current'} -> {name}")
+    return Snapshot(int(m.group(1)), snap_dir / name)
+
+
+def _same_file_version(live: Path, published: Path) -> bool:
+    """True if published holds the live file's current version: the same
+    inode (hard link), or for a copy the same size and mtime."""
+    try:
+        a, b = live.stat(), published.stat()
+    except FileNotFoundError:
+        # A live file that went away carries over; a new one is a change.
+        return not live.exists()
+    if (a.st_dev, a.st_ino) == (b.st_dev, b.st_ino):
+        return True
+    return (a.st_size, a.st_mtime_ns) == (b.st_size, b.st_mtime_ns)
+
+
+def publish_snapshot(
+    paths: Iterable[str] | None = None,
+    *,
+    root: Path | None = None,
+    keep: int = SNAPSHOT_KEEP,
+    refresh_changed: bool = False,
+) -> Snapshot:
+    """Publish a new snapshot generation and atomically make it current.
+
+    paths (default: all of SNAPSHOT_FILES) are taken from the live state root;
+    the other files carry over from the current generation (or from the live
+    root for the first one). With refresh_changed, every other file whose live
+    version differs from the current generation's is refreshed as well, and
+    no generation is published if nothing needs refreshing (the current one
+    is returned). Files are hard-linked where the filesystem allows, which is
+    safe because write_json replaces files instead of rewriting them; anything
+    else writing these files must also replace, not rewrite in place.
+    The generation is built as a hidden directory, renamed into place, then
+    snapshots/current is swapped with a symlink rename. Publishers serialise on
+    locks/snapshot.lock; readers (open_snapshot) take no lock. The publish is
+    fenced (check_fence on snapshots/current): a publisher whose link lock was
+    broken discards its generation and returns the current one.
+    """
+    root = root or state_root()
+    refresh = set(SNAPSHOT_FILES if paths is None else paths)
+    unknown = refresh - SNAPSHOT_FILES.keys()
+    if unknown:
+        raise ValueError(f"not snapshot files: {sorted(unknown)}")
+    snap_dir = root / "snapshots"
+    snap_dir.mkdir(parents=True, exist_ok=True)
+    with shared_lock(root / "locks" / "snapshot.lock", timeout=None) as lock:
+        previous = open_snapshot(root)
+        if refresh_changed and previous is not None:
+            refresh.update(
+                rel
+                for rel in SNAPSHOT_FILES
+                if not _same_file_version(root / rel, previous.file(rel))
+            )
+            if not refresh:
+                return previous
+        generation = (previous.generation if previous else 0) + 1
+        name = f"gen-{generation:08d}"
+        tmp = snap_dir / f".{name}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)  # left by a crashed publisher
+        tmp.mkdir()
+        for rel in SNAPSHOT_FILES:
+            if rel in refresh or previous is None:
+                src = root / rel
+            else:
+                src = previous.file(rel)
+            if not src.exists():
+                continue
+            dst = tmp / rel
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(src, dst)
+            except OSError:
+                shutil.copy2(src, dst)
+        if not check_fence(snap_dir / "current", getattr(lock, "token", None)):
+            shutil.rmtree(tmp, ignore_errors=True)
+            return open_snapshot(root)
+        os.rename(tmp, snap_dir / name)
+        link_tmp = snap_dir / f".current.{os.getpid()}.tmp"
+        link_tmp.unlink(missing_ok=True)
+        os.symlink(name, link_tmp)
+        os.replace(link_tmp, snap_dir / "current")
+        if os.environ.get("XTRL_FSYNC", "none") == "full":
+            dir_fd = os.open(snap_dir, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        _prune_snapshots(snap_dir, keep)
+    return Snapshot(generation, snap_dir / name)
+
+
+def _prune_snapshots(snap_dir: Path, keep: int) -> None:
+    """Drop generations beyond the newest `keep` once their successor is older
+    than SNAPSHOT_GRACE_SECONDS, so slow readers can finish."""
+    gens = sorted(p for p in snap_dir.iterdir() if _GENERATION_RE.fullmatch(p.name))
+    cutoff = time.time() - SNAPSHOT_GRACE_SECONDS
+    for i in range(len(gens) - max(keep, 1)):
+        old, successor = gens[i], gens[i + 1]
+        if successor.stat().st_mtime < cutoff:
+            shutil.rmtree(old, ignore_errors=True)
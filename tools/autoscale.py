@@ -0,0 +1,182 @@
+"""Adaptive concurrency for the worker supervisor.
+
+An Autoscaler picks the number of concurrent codex runs between
+min_workers and max_workers from what the host and recent runs show:
+
+- memory: MemAvailable below min_free_mb -> scale down
+- load: 1-minute load average per CPU above max_load -> scale down
+- slowdown: the last few runs took slowdown_ratio x longer than the window's
+  median -> scale down (runs are thrashing each other)
+- idle: load per CPU below idle_load, memory fine, every running slot busy
+  and items waiting to be claimed -> scale up
+- otherwise hold
+
+It moves one step per decision, at most once per interval_seconds.
+Run durations come from state_root()/out/*/: a run starts when its
+run_manifest.json is written and its duration is the codex check's
+elapsed_s in evidence.json, so runs of other workers on the same state root
+count too. Each change is appended to a JSONL log with the signals behind it.
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from _util import encode_json, load_json, state_root
+
+
+@dataclass(frozen=True)
+class AutoscaleConfig:
+    min_workers: int = 1
+    max_workers: int = os.cpu_count() or 1
+    interval_seconds: float = 5.0
+    max_load: float = 1.5
+    idle_load: float = 0.7
+    min_free_mb: float = 1024.0
+    slowdown_ratio: float = 1.5
+    # Runs considered: written within window_seconds, newest history_runs.
+    window_seconds: float = 3600.0
+    history_runs: int = 50
+    recent_runs: int = 5
+
+
+def host_load() -> dict[str, float | None]:
+    """1-minute load average per CPU and MemAvailable in MiB (None if unknown)."""
+    try:
+        load = os.getloadavg()[0] / (os.cpu_count() or 1)
+    except OSError:
+        load = None
+    free_mb = None
+    try:
+        with open("/proc/meminfo", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    free_mb = int(line.split()[1]) / 1024
+                    break
+    except OSError:
+        pass
+    return {"load_per_cpu": load, "mem_available_mb": free_mb}
+
+
+def recent_run_durations(
+    out_root: Path, window_seconds: float, limit: int, now: float | None = None
+) -> list[float]:
+    """Codex durations of finished runs under out_root, oldest first."""
+    now = time.time() if now is None else now
+    started = []
+    try:
+        it = os.scandir(out_root)
+    except FileNotFoundError:
+        return []
+    with it:
+        for d in it:
+            try:
+                mtime = os.stat(os.path.join(d.path, "run_manifest.json")).st_mtime
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            if now - mtime <= window_seconds:
+                started.append((mtime, d.path))
+    started.sort()
+    durations = []
+    for _, path in started[-limit:]:
+        try:
+            checks = load_json(Path(path) / "evidence.json")["checks"]
+        except (FileNotFoundError, ValueError, KeyError):
+            continue  # still running, or no evidence
+        elapsed = next(
+            (c.get("elapsed_s") for c in checks if c.get("name") == "codex"), None
+        )
+        if isinstance(elapsed, (int, float)) and not next(
+            (c.get("cached") for c in checks if c.get("name") == "codex"), False
+        ):
+            durations.append(float(elapsed))
+    return durations
+
+
+class Autoscaler:
+    """Decide the supervisor's target concurrency; see the module docstring."""
+
+    def __init__(
+        self,
+        config: AutoscaleConfig,
+        *,
+        out_root: Path | None = None,
+        log_path: Path | None = None,
+        sample: Callable[[], dict[str, float | None]] = host_load,
+    ):
+        self.config = config
+        self.out_root = out_root or state_root() / "out"
+        self.log_path = log_path
+        self.sample = sample
+        self.last_decision_at: float | None = None
+        self.decisions = 0
+
+    def clamp(self, workers: int) -> int:
+        return max(self.config.min_workers, min(self.config.max_workers, workers))
+
+    def _reason(self, busy: int, current: int, backlog: int) -> tuple[int, str, dict]:
+        cfg = self.config
+        signals: dict[str, Any] = dict(self.sample())
+        durations = recent_run_durations(
+            self.out_root, cfg.window_seconds, cfg.history_runs
+        )
+        signals["runs_observed"] = len(durations)
+        if len(durations) > cfg.recent_runs:
+            baseline = statistics.median(durations)
+            recent = statistics.median(durations[-cfg.recent_runs :])
+            signals["median_run_s"] = round(baseline, 3)
+            signals["recent_run_s"] = round(recent, 3)
+            slow = recent > baseline * cfg.slowdown_ratio
+        else:
+            slow = False
+        load = signals["load_per_cpu"]
+        free_mb = signals["mem_available_mb"]
+        if free_mb is not None and free_mb < cfg.min_free_mb:
+            return -1, "memory", signals
+        if load is not None and load > cfg.max_load:
+            return -1, "load", signals
+        if slow:
+            return -1, "slowdown", signals
+        if busy >= current and backlog > 0 and (load is None or load < cfg.idle_load):
+            return 1, "idle", signals
+        return 0, "hold", signals
+
+    def decide(self, current: int, busy: int, backlog: int) -> int:
+        """New target concurrency given `busy` running slots of `current` and
+        `backlog` items waiting to be claimed."""
+        now = time.monotonic()
+        if (
+            self.last_decision_at is not None
+            and now - self.last_decision_at < self.config.interval_seconds
+        ):
+            return current
+        self.last_decision_at = now
+        step, reason, signals = self._reason(busy, current, backlog)
+        target = self.clamp(current + step)
+        if target != current:
+            self.decisions += 1
+            self._log(
+                {
+                    "at": time.time(),
+                    "from": current,
+                    "to": target,
+                    "reason": reason,
+                    "busy": busy,
+                    "backlog": backlog,
+                    **signals,
+                }
+            )
+        return target
+
+    def _log(self, record: dict[str, Any]) -> None:
+        if self.log_path is None:
+            return
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, "ab") as f:
+            f.write(encode_json(record, compact=True))
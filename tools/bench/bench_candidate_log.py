@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""Concurrent candidate appends: whole-file rewrite vs append-only candidate log.
+
+--workers processes each append --per-worker candidates to one CandidateSet.
+"rewrite" is the previous append_candidate (load, append, write_json, no lock);
+"log" is the current append_candidate (one O_APPEND line, periodic compaction).
+Prints a JSON summary: appends per second and candidates lost per mode.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import multiprocessing as mp
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from _util import (
+    append_candidate,
+    compact_candidate_log,
+    default_meta,
+    iter_candidate_set,
+    load_json,
+    ssot_root,
+    write_json,
+)
+
+
+def make_entry(template: dict, candidate_id: str) -> dict:
+    candidate = copy.deepcopy(template)
+    candidate["candidate_id"] = candidate_id
+    return {"queue_id": "q-bench", "base_ref": "abc123", "candidate": candidate}
+
+
+def rewrite_append(path: Path, entry: dict) -> None:
+    obj = load_json(path)
+    obj["candidates"].append(entry["candidate"])
+    write_json(path, obj, kind="candidate_set")
+
+
+def worker(mode: str, path: Path, template: dict, wid: int, count: int) -> None:
+    for i in range(count):
+        entry = make_entry(template, f"w{wid:02d}-{i:05d}")
+        if mode == "rewrite":
+            rewrite_append(path, entry)
+        else:
+            append_candidate(path, entry)
+
+
+def run(mode: str, workers: int, per_worker: int, template: dict) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "candidate_set.json"
+        envelope = make_entry(template, "seed")
+        write_json(
+            path,
+            {
+                "artifact_kind": "candidate_set",
+                "queue_id": envelope["queue_id"],
+                "base_ref": envelope["base_ref"],
+                "candidates": [],
+                "meta": default_meta(),
+            },
+            kind="candidate_set",
+        )
+        procs = [
+            mp.Process(target=worker, args=(mode, path, template, w, per_worker))
+            for w in range(workers)
+        ]
+        start = time.perf_counter()
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+        elapsed = time.perf_counter() - start
+        if mode == "log":
+            compact_candidate_log(path)
+        stored = sum(1 for _ in iter_candidate_set(path))
+    total = workers * per_worker
+    return {
+        f"{mode}_appends_per_s": round(total / elapsed),
+        f"{mode}_lost": total - stored,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--per-worker", type=int, default=50)
+    args = parser.parse_args()
+
+    template = load_json(ssot_root() / "examples" / "candidate_set.example.json")[
+        "candidates"
+    ][0]
+    result: dict = {"workers": args.workers, "per_worker": args.per_worker}
+    for mode in ("rewrite", "log"):
+        result.update(run(mode, args.workers, args.per_worker, template))
+    print(json.dumps(result, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""Full vs incremental CandidateSet validation on a large synthetic set.
+
+Builds N candidates from the control/ssot example and times, per run,
+validate_artifact on the whole document against validate_candidate_set with a
+warm sidecar (plus --changed new entries per run). Prints a JSON summary.
+The sidecar path is only taken with XTRL_GENERATED_VALIDATORS=0; otherwise the
+generated validator checks the whole document and both columns are full runs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from _util import (
+    load_json,
+    ssot_root,
+    validate_artifact,
+    validate_candidate_set,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=5000)
+    parser.add_argument("--changed", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    cand_set = load_json(ssot_root() / "examples" / "candidate_set.example.json")
+    template = cand_set["candidates"][0]
+    cand_set["candidates"] = []
+    for i in range(args.candidates):
+        entry = copy.deepcopy(template)
+        entry["candidate_id"] = f"cand-{i:07d}"
+        cand_set["candidates"].append(entry)
+
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        validate_artifact("candidate_set", cand_set)
+    full_ms = (time.perf_counter() - start) / args.rounds * 1e3
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sidecar = Path(tmp) / "candidate_set.validated.json"
+        validate_candidate_set(cand_set, sidecar)
+        validated = 0
+        start = time.perf_counter()
+        for r in range(args.rounds):
+            for i in range(args.changed):
+                entry = copy.deepcopy(template)
+                entry["candidate_id"] = f"new-{r}-{i}"
+                cand_set["candidates"].append(entry)
+            validated += validate_candidate_set(cand_set, sidecar)
+        incremental_ms = (time.perf_counter() - start) / args.rounds * 1e3
+
+    result = {
+        "candidates": args.candidates,
+        "changed_per_run": args.changed,
+        "rounds": args.rounds,
+        "entries_validated_incremental": validated,
+        "full_ms_per_run": round(full_ms, 2),
+        "incremental_ms_per_run": round(incremental_ms, 2),
+        "speedup": round(full_ms / incremental_ms, 2) if incremental_ms else None,
+    }
+    print(json.dumps(result, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+"""Throughput of diffstat.parse_unified_diff on multi-megabyte diffs.
+
+Builds synthetic git diffs of increasing size (many files, many hunks) and
+parses each from a StringIO, as the worker does for a PatchProposal's
+unified_diff. Time per MiB should stay flat as the diff grows.
+Prints a JSON summary.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import sys
+import time
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from diffstat import parse_unified_diff
+
+
+def synthetic_diff(files: int, hunks: int) -> str:
+    hunk = (
+        "@@ -10,7 +10,8 @@ def f():\n"
+        + " ctx\n" * 3
+        + "-old\n+new\n+more\n"
+        + " ctx\n" * 3
+    )
+    return "".join(
+        f"diff --git a/src/m{i}.py b/src/m{i}.py\n"
+        f"index 1111111..2222222 100644\n"
+        f"--- a/src/m{i}.py\n+++ b/src/m{i}.py\n" + hunk * hunks
+        for i in range(files)
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--hunks", type=int, default=20)
+    parser.add_argument("--scales", default="1,4,16")
+    args = parser.parse_args()
+
+    runs = []
+    for scale in (int(s) for s in args.scales.split(",")):
+        text = synthetic_diff(args.files * scale, args.hunks)
+        mib = len(text) / 2**20
+        start = time.perf_counter()
+        stats = parse_unified_diff(io.StringIO(text))
+        elapsed = time.perf_counter() - start
+        runs.append(
+            {
+                "diff_mib": round(mib, 1),
+                "files": len(stats.files),
+                "diff_lines_total": stats.metrics()["diff_lines_total"],
+                "parse_ms": round(elapsed * 1e3, 1),
+                "ms_per_mib": round(elapsed * 1e3 / mib, 1),
+            }
+        )
+    print(json.dumps({"runs": runs}, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""Throughput of generated validators vs jsonschema.Draft7Validator.
+
+Both sides are pre-built; this measures validation only, over the
+control/ssot/examples corpus, and prints a JSON summary.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from _util import (
+    get_generated_validator,
+    get_validator,
+    load_json,
+    load_registry,
+    ssot_root,
+)
+
+
+def throughput(fns: list[tuple[Callable[[Any], Any], Any]], rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for fn, obj in fns:
+            fn(obj)
+    elapsed = time.perf_counter() - start
+    return rounds * len(fns) / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    jsonschema_fns = []
+    generated_fns = []
+    missing = []
+    for kind in sorted(load_registry()["artifacts"]):
+        obj = load_json(ssot_root() / "examples" / f"{kind}.example.json")
+        generated = get_generated_validator(kind)
+        if generated is None:
+            missing.append(kind)
+            continue
+        jsonschema_fns.append((get_validator(kind).validate, obj))
+        generated_fns.append((generated.validate, obj))
+
+    draft7_per_s = throughput(jsonschema_fns, args.rounds)
+    generated_per_s = throughput(generated_fns, args.rounds)
+    result = {
+        "kinds": len(generated_fns),
+        "kinds_without_generated_validator": missing,
+        "rounds": args.rounds,
+        "draft7_validations_per_s": round(draft7_per_s, 1),
+        "generated_validations_per_s": round(generated_per_s, 1),
+        "speedup": round(generated_per_s / draft7_per_s, 2),
+    }
+    print(json.dumps(result, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
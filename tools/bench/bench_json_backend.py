@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""load_json/write_json cost: stdlib vs orjson backend, canonical vs compact.
+
+Builds a synthetic multi-megabyte CandidateSet from the control/ssot example and
+times write_json + load_json under each backend and encoding. Prints a JSON
+summary (ms per round trip, bytes on disk).
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+import _util
+from _util import load_json, ssot_root, write_json
+
+
+def round_trip_ms(path: Path, obj: object, compact: bool, rounds: int) -> tuple:
+    write_s = load_s = 0.0
+    for _ in range(rounds):
+        path.unlink(missing_ok=True)  # time real writes, not unchanged-skips
+        start = time.perf_counter()
+        write_json(path, obj, compact=compact)
+        write_s += time.perf_counter() - start
+        start = time.perf_counter()
+        load_json(path)
+        load_s += time.perf_counter() - start
+    return write_s / rounds * 1e3, load_s / rounds * 1e3, path.stat().st_size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    cand_set = load_json(ssot_root() / "examples" / "candidate_set.example.json")
+    template = cand_set["candidates"][0]
+    cand_set["candidates"] = []
+    for i in range(args.candidates):
+        entry = copy.deepcopy(template)
+        entry["candidate_id"] = f"cand-{i:07d}"
+        entry["metrics"]["diff_lines_total"] = i % 977
+        cand_set["candidates"].append(entry)
+
+    backends = ["stdlib"] + (["orjson"] if _util.orjson is not None else [])
+    result: dict = {"candidates": args.candidates, "rounds": args.rounds}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "candidate_set.json"
+        for backend in backends:
+            os.environ["XTRL_JSON_BACKEND"] = backend
+            for encoding in ("canonical", "compact"):
+                write_ms, load_ms, size = round_trip_ms(
+                    path, cand_set, encoding == "compact", args.rounds
+                )
+                result[f"{backend}_{encoding}_write_ms"] = round(write_ms, 2)
+                result[f"{backend}_{encoding}_load_ms"] = round(load_ms, 2)
+                result[f"{encoding}_bytes"] = size
+    os.environ.pop("XTRL_JSON_BACKEND", None)
+    print(json.dumps(result, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""Top-k selection with rank.RankTable vs sorting by build_rank_key.
+
+Builds N synthetic candidates (RankPolicy example tuple_order, with the
+created_at tie-breaker in play) and times: a full sort by build_rank_key,
+heapq.nsmallest with build_rank_key, and RankTable ingest plus top_k for each
+available backend (numpy, array). Checks that every method picks the same
+candidates. Prints a JSON summary.
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from _util import load_json, ssot_root
+from rank import RankTable, build_rank_key, np
+
+
+def synthetic_candidates(n: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "candidate_id": f"cand-{i:07d}",
+            "created_at": f"2026-01-01T{rng.randrange(24):02d}:{rng.randrange(60):02d}",
+            "metrics": {
+                "checks_passed": rng.randrange(20),
+                "checks_failed": rng.randrange(3),
+                "diff_lines_total": rng.randrange(500),
+                "files_touched": rng.randrange(10),
+                "policy_warnings": rng.randrange(2),
+            },
+        }
+        for i in range(n)
+    ]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, round((time.perf_counter() - start) * 1e3, 1)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=1_000_000)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    policy = load_json(ssot_root() / "examples" / "rank_policy.example.json")
+    cands = synthetic_candidates(args.candidates, args.seed)
+    key = build_rank_key(policy)
+
+    def ids(ranked):
+        return [c["candidate_id"] for c in ranked]
+
+    expected, sort_ms = timed(lambda: ids(sorted(cands, key=key)[: args.k]))
+    nsmallest, nsmallest_ms = timed(
+        lambda: ids(heapq.nsmallest(args.k, cands, key=key))
+    )
+    assert nsmallest == expected
+    result = {
+        "candidates": args.candidates,
+        "k": args.k,
+        "sorted_build_rank_key_ms": sort_ms,
+        "nsmallest_build_rank_key_ms": nsmallest_ms,
+        "rank_table": {},
+    }
+    for backend in ("numpy", "array") if np is not None else ("array",):
+        table = RankTable(policy, backend=backend)
+        _, ingest_ms = timed(lambda table=table: table.extend(cands))
+        top, top_k_ms = timed(lambda table=table: ids(table.top(args.k)))
+        assert top == expected, backend
+        result["rank_table"][backend] = {"ingest_ms": ingest_ms, "top_k_ms": top_k_ms}
+    print(json.dumps(result, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
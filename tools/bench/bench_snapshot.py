@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+"""Consistent reads next to a busy writer: shared lock vs snapshot generations.
+
+One writer process rewrites queue/work_queue.json + queue/candidate_set.json
+in a loop; --readers processes each read both files for --seconds. "locked"
+readers and writer hold one flock around each read/write pair; "snapshot"
+readers use open_snapshot() and the writer publishes a generation per pair.
+Prints a JSON summary (consistent pair reads per second, inconsistent reads).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing as mp
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from _util import FlockLock, open_snapshot, publish_snapshot, write_json
+
+QUEUE = "queue/work_queue.json"
+CANDS = "queue/candidate_set.json"
+
+
+def writer(root: Path, mode: str, stop) -> None:
+    lock = root / "locks" / "state.lock"
+    i = 0
+    while not stop.is_set():
+        i += 1
+        if mode == "locked":
+            with FlockLock(lock, timeout=None):
+                write_json(root / QUEUE, {"queue_id": f"q{i}"})
+                write_json(root / CANDS, {"queue_id": f"q{i}", "candidates": []})
+        else:
+            write_json(root / QUEUE, {"queue_id": f"q{i}"})
+            write_json(root / CANDS, {"queue_id": f"q{i}", "candidates": []})
+            publish_snapshot(root=root)
+
+
+def reader(root: Path, mode: str, seconds: float, out) -> None:
+    lock = root / "locks" / "state.lock"
+    reads = torn = 0
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        if mode == "locked":
+            with FlockLock(lock, timeout=None):
+                queue = json.loads((root / QUEUE).read_bytes())
+                cands = json.loads((root / CANDS).read_bytes())
+        else:
+            snapshot = open_snapshot(root)
+            queue = json.loads(snapshot.file(QUEUE).read_bytes())
+            cands = json.loads(snapshot.file(CANDS).read_bytes())
+        reads += 1
+        torn += queue["queue_id"] != cands["queue_id"]
+    out.put((reads, torn))
+
+
+def run(mode: str, readers: int, seconds: float) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        write_json(root / QUEUE, {"queue_id": "q0"})
+        write_json(root / CANDS, {"queue_id": "q0", "candidates": []})
+        publish_snapshot(root=root)
+        stop, out = mp.Event(), mp.Queue()
+        w = mp.Process(target=writer, args=(root, mode, stop))
+        w.start()
+        procs = [
+            mp.Process(target=reader, args=(root, mode, seconds, out))
+            for _ in range(readers)
+        ]
+        for p in procs:
+            p.start()
+        results = [out.get() for _ in procs]
+        for p in procs:
+            p.join()
+        stop.set()
+        w.join()
+    reads = sum(r for r, _ in results)
+    return {
+        f"{mode}_reads_per_s": round(reads / seconds),
+        f"{mode}_torn_reads": sum(t for _, t in results),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    result: dict = {"readers": args.readers, "seconds": args.seconds}
+    for mode in ("locked", "snapshot"):
+        result.update(run(mode, args.readers, args.seconds))
+    print(json.dumps(result, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
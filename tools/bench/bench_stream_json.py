@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""Peak memory and time: load_json vs iter_json_array over a large CandidateSet.
+
+Writes N synthetic candidates to a temp file, then walks every entry both ways.
+Peak memory is traced with tracemalloc in a separate pass from the timing pass.
+Prints a JSON summary.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from _util import iter_json_array, load_json, ssot_root, write_json
+
+
+def measure(fn: Callable[[], int]) -> tuple[float, float, int]:
+    start = time.perf_counter()
+    count = fn()
+    elapsed_ms = (time.perf_counter() - start) * 1e3
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed_ms, peak / 2**20, count
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=50000)
+    args = parser.parse_args()
+
+    cand_set = load_json(ssot_root() / "examples" / "candidate_set.example.json")
+    template = cand_set["candidates"][0]
+    cand_set["candidates"] = []
+    for i in range(args.candidates):
+        entry = copy.deepcopy(template)
+        entry["candidate_id"] = f"cand-{i:07d}"
+        cand_set["candidates"].append(entry)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "candidate_set.json"
+        write_json(path, cand_set)
+        del cand_set, entry
+
+        def whole() -> int:
+            return sum(1 for _ in load_json(path)["candidates"])
+
+        def streamed() -> int:
+            return sum(1 for _ in iter_json_array(path, "candidates"))
+
+        load_ms, load_peak_mib, count = measure(whole)
+        stream_ms, stream_peak_mib, _ = measure(streamed)
+        size = path.stat().st_size
+
+    result = {
+        "candidates": count,
+        "file_mib": round(size / 2**20, 1),
+        "load_json_ms": round(load_ms, 1),
+        "load_json_peak_mib": round(load_peak_mib, 1),
+        "iter_json_array_ms": round(stream_ms, 1),
+        "iter_json_array_peak_mib": round(stream_peak_mib, 2),
+    }
+    print(json.dumps(result, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
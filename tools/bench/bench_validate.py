@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""Per-call cost of validate_artifact: uncached setup vs cached validator.
+
+Runs every registry kind against its example under control/ssot/examples and
+prints a JSON summary (microseconds per call). Also reports cold start: the
+time to build and first-use a validator for every kind, from the source
+schemas vs from the pre-resolved registry.bundle.json.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+import jsonschema
+from _util import (
+    get_validator,
+    invalidate_validator_cache,
+    load_json,
+    load_registry,
+    repo_root,
+    ssot_root,
+    validate_artifact,
+)
+
+
+def validate_uncached(kind: str, obj: Any) -> None:
+    """The pre-cache code path: re-read registry + schema, rebuild validator."""
+    registry = load_json(ssot_root() / "registry.json")
+    meta = registry["artifacts"][kind]
+    schema = load_json(repo_root() / meta["schema"])
+    jsonschema.Draft7Validator(schema).validate(obj)
+
+
+def time_per_call(
+    fn: Callable[[str, Any], None], corpus: list[tuple[str, Any]], rounds: int
+) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for kind, obj in corpus:
+            fn(kind, obj)
+    elapsed = time.perf_counter() - start
+    return elapsed / (rounds * len(corpus)) * 1e6
+
+
+def cold_start_ms(corpus: list[tuple[str, Any]], bundle: bool, rounds: int) -> float:
+    """Mean ms to build and first-use validators for every kind from empty caches."""
+    previous = os.environ.get("XTRL_SCHEMA_BUNDLE")
+    os.environ["XTRL_SCHEMA_BUNDLE"] = "1" if bundle else "0"
+    try:
+        total = 0.0
+        for _ in range(rounds):
+            invalidate_validator_cache()
+            start = time.perf_counter()
+            for kind, obj in corpus:
+                get_validator(kind).validate(obj)
+            total += time.perf_counter() - start
+    finally:
+        if previous is None:
+            os.environ.pop("XTRL_SCHEMA_BUNDLE", None)
+        else:
+            os.environ["XTRL_SCHEMA_BUNDLE"] = previous
+        invalidate_validator_cache()
+    return total / rounds * 1e3
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    corpus = [
+        (kind, load_json(ssot_root() / "examples" / f"{kind}.example.json"))
+        for kind in sorted(load_registry()["artifacts"])
+    ]
+
+    cold_sources_ms = cold_start_ms(corpus, bundle=False, rounds=args.rounds)
+    cold_bundle_ms = cold_start_ms(corpus, bundle=True, rounds=args.rounds)
+
+    invalidate_validator_cache()
+    uncached_us = time_per_call(validate_uncached, corpus, args.rounds)
+    cached_us = time_per_call(validate_artifact, corpus, args.rounds)
+
+    result = {
+        "kinds": len(corpus),
+        "rounds": args.rounds,
+        "uncached_us_per_call": round(uncached_us, 2),
+        "cached_us_per_call": round(cached_us, 2),
+        "speedup": round(uncached_us / cached_us, 2) if cached_us else None,
+        "cold_start_sources_ms": round(cold_sources_ms, 2),
+        "cold_start_bundle_ms": round(cold_bundle_ms, 2),
+    }
+    print(json.dumps(result, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""Checkout cost: fresh git worktree per run vs a warm WorktreePool lease.
+
+Builds a synthetic repository of N files in a temporary directory, then
+times R runs of each method. Fresh: `git worktree add` + `git worktree
+remove`. Pool: lease + release, where each run dirties its checkout (edits
+one tracked file, adds an untracked one) so release does a real reset and
+clean. Prints a JSON summary.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parents[1]
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+from worktree_pool import WorktreePool, add_worktree, remove_worktree
+
+
+def make_repo(path: Path, files: int) -> None:
+    path.mkdir()
+    for i in range(files):
+        sub = path / f"pkg{i % 100:02d}"
+        sub.mkdir(exist_ok=True)
+        (sub / f"mod{i}.py").write_text(f"VALUE = {i}\n" * 20)
+    for args in (
+        ["init", "-q"],
+        ["add", "."],
+        ["-c", "user.name=b", "-c", "user.email=b@b", "commit", "-q", "-m", "base"],
+    ):
+        subprocess.run(["git", "-C", str(path), *args], check=True)
+
+
+def dirty(path: Path) -> None:
+    (path / "pkg00" / "mod0.py").write_text("edited\n")
+    (path / "scratch.txt").write_text("x")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = Path(tmp) / "repo"
+        make_repo(repo, args.files)
+
+        start = time.perf_counter()
+        for i in range(args.runs):
+            path = Path(tmp) / "fresh" / f"run-{i}"
+            add_worktree(repo, path, "HEAD")
+            dirty(path)
+            remove_worktree(repo, path)
+        fresh_ms = (time.perf_counter() - start) * 1e3
+
+        pool = WorktreePool(repo, 1, root=Path(tmp) / "pool")
+        start = time.perf_counter()
+        pool.warm("HEAD")
+        warm_ms = (time.perf_counter() - start) * 1e3
+        start = time.perf_counter()
+        for _ in range(args.runs):
+            lease = pool.lease("HEAD")
+            dirty(lease.path)
+            pool.release(lease)
+        pool_ms = (time.perf_counter() - start) * 1e3
+
+    print(
+        json.dumps(
+            {
+                "files": args.files,
+                "runs": args.runs,
+                "fresh_worktree_ms_per_run": round(fresh_ms / args.runs, 1),
+                "pool_warm_ms": round(warm_ms, 1),
+                "pool_lease_release_ms_per_run": round(pool_ms / args.runs, 1),
+                "pool_stats": pool.stats,
+            },
+            sort_keys=True,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
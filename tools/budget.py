@@ -0,0 +1,207 @@
+"""Queue-wide budget ledger for codex runs.
+
+Workers reserve budget before launching codex and reconcile it with what the
+run actually used afterwards; a reservation that would overrun the queue's
+totals is refused with BUDGET_EXHAUSTED. The ledger is one JSON file under
+state_root()/queue, rewritten under a lock (_util.shared_lock: flock, or a
+link lock when the state root is shared between hosts), so every worker on
+the state root sees the same totals. Writes are fenced (_util.check_fence):
+an update made under a link lock that was broken is redone, not saved over
+the newer holder's ledger.
+
+Limits:
+- max_iterations: codex runs per queue (control strategy
+  tool_policy.budgets.max_iterations).
+- max_codex_minutes: total codex wall-clock minutes per queue (optional).
+The limits are recorded when the ledger is created and hold for the queue
+from then on, whatever limits later workers pass in.
+Each run reserves one iteration plus its item's budgets.max_codex_minutes.
+Reservations left by crashed workers expire and count as fully spent.
+Runs whose diff exceeded the item's budgets.max_patch_lines (denied by the
+worker gate) are counted per work item under diff_budget_exceeded.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from _util import check_fence, load_json, shared_lock, state_root, write_json
+
+# Extra life for a reservation beyond its reserved codex time (or beyond
+# DEFAULT_RESERVATION_SECONDS for items without a codex budget).
+RESERVATION_MARGIN_SECONDS = 300.0
+DEFAULT_RESERVATION_SECONDS = 1800.0
+
+
+class BudgetExhausted(Exception):
+    """A new run would overrun the queue's budget."""
+
+    reason_code = "BUDGET_EXHAUSTED"
+
+
+@dataclass(frozen=True)
+class Reservation:
+    reservation_id: str
+    work_item_id: str
+    codex_seconds: float
+
+
+def budget_limits(
+    control_strategy: dict | None = None,
+    max_codex_minutes: float | None = None,
+) -> dict[str, Any]:
+    """Ledger limits from a ControlStrategy and an optional queue minute cap."""
+    budgets = (control_strategy or {}).get("tool_policy", {}).get("budgets", {})
+    return {
+        "max_iterations": budgets.get("max_iterations"),
+        "max_codex_minutes": max_codex_minutes,
+        "max_tool_calls_per_iter": budgets.get("max_tool_calls_per_iter"),
+    }
+
+
+class BudgetLedger:
+    """Reserve/reconcile codex budget in queue/budget_ledger.json."""
+
+    def __init__(self, queue_id: str, limits: dict[str, Any], path: Path | None = None):
+        self.queue_id = queue_id
+        self.limits = limits
+        self.path = path or state_root() / "queue" / "budget_ledger.json"
+        self.lock_path = self.path.with_suffix(".lock")
+
+    def _load(self) -> dict[str, Any]:
+        ledger = load_json(self.path) if self.path.exists() else None
+        if not ledger or ledger.get("queue_id") != self.queue_id:
+            ledger = {
+                "queue_id": self.queue_id,
+                "spent": {"runs": 0, "codex_seconds": 0.0, "tool_calls": 0},
+                "reserved": {},
+                "refused": 0,
+            }
+        ledger.setdefault("diff_budget_exceeded", {})
+        # Fixed by whoever creates the ledger: later workers with other
+        # limits do not change the queue's totals.
+        ledger.setdefault("limits", self.limits)
+        now = time.time()
+        for rid, res in list(ledger["reserved"].items()):
+            if res["expires_at"] < now:
+                # The worker never reconciled: assume it used everything.
+                del ledger["reserved"][rid]
+                ledger["spent"]["runs"] += 1
+                ledger["spent"]["codex_seconds"] += res["codex_seconds"]
+        return ledger
+
+    def _update(self, update: Callable[[dict[str, Any]], Any]) -> Any:
+        """Run update(ledger) under the ledger lock and save the ledger.
+
+        update returns its result, or None to leave the ledger unsaved; an
+        exception it returns (rather than raises) is raised after the save.
+        Saves are fenced (check_fence): if the lock was broken meanwhile and a
+        newer holder has written the ledger, the update is redone against it.
+        """
+        while True:
+            with shared_lock(self.lock_path, timeout=None) as lock:
+                ledger = self._load()
+                result = update(ledger)
+                if result is None:
+                    return None
+                if not check_fence(self.path, getattr(lock, "token", None)):
+                    continue  # our lock was broken: redo on the newer ledger
+                write_json(self.path, ledger)
+            if isinstance(result, BaseException):
+                raise result
+            return result
+
+    def reserve(self, work_item: dict) -> Reservation:
+        """Reserve one run of work_item, or raise BudgetExhausted."""
+        minutes = work_item.get("budgets", {}).get("max_codex_minutes")
+        seconds = float(minutes) * 60 if minutes else 0.0
+
+        def update(ledger: dict[str, Any]) -> Any:
+            reserved = ledger["reserved"].values()
+            runs = ledger["spent"]["runs"] + len(reserved)
+            used = ledger["spent"]["codex_seconds"] + sum(
+                r["codex_seconds"] for r in reserved
+            )
+            max_runs = ledger["limits"].get("max_iterations")
+            max_minutes = ledger["limits"].get("max_codex_minutes")
+            if max_runs is not None and runs + 1 > max_runs:
+                ledger["refused"] += 1
+                return BudgetExhausted(
+                    f"max_iterations {max_runs} reached ({runs} runs)"
+                )
+            if max_minutes is not None and used + seconds > max_minutes * 60:
+                ledger["refused"] += 1
+                return BudgetExhausted(
+                    f"max_codex_minutes {max_minutes} would be exceeded "
+                    f"({used / 60:.1f} min used or reserved, run needs {seconds / 60:.1f})"
+                )
+            rid = uuid.uuid4().hex
+            ledger["reserved"][rid] = {
+                "work_item_id": work_item["work_item_id"],
+                "codex_seconds": seconds,
+                "pid": os.getpid(),
+                "host": socket.gethostname(),
+                "reserved_at": time.time(),
+                "expires_at": time.time()
+                + (seconds or DEFAULT_RESERVATION_SECONDS)
+                + RESERVATION_MARGIN_SECONDS,
+            }
+            return Reservation(rid, work_item["work_item_id"], seconds)
+
+        return self._update(update)
+
+    def reconcile(
+        self, reservation: Reservation, codex_seconds: float, tool_calls: int = 0
+    ) -> None:
+        """Replace a reservation with what the run actually used."""
+
+        def update(ledger: dict[str, Any]) -> bool | None:
+            if ledger["reserved"].pop(reservation.reservation_id, None) is None:
+                return None  # expired and already charged in full
+            ledger["spent"]["runs"] += 1
+            ledger["spent"]["codex_seconds"] += codex_seconds
+            ledger["spent"]["tool_calls"] += tool_calls
+            return True
+
+        self._update(update)
+
+    def cancel(self, reservation: Reservation) -> None:
+        """Drop a reservation whose run never started."""
+
+        def update(ledger: dict[str, Any]) -> bool | None:
+            if ledger["reserved"].pop(reservation.reservation_id, None) is None:
+                return None
+            return True
+
+        self._update(update)
+
+    def record_diff_budget_exceeded(self, work_item_id: str, diff_lines: int) -> None:
+        """Count a run denied for a diff over its item's max_patch_lines."""
+
+        def update(ledger: dict[str, Any]) -> bool:
+            item = ledger["diff_budget_exceeded"].setdefault(
+                work_item_id, {"runs": 0, "max_diff_lines": 0}
+            )
+            item["runs"] += 1
+            item["max_diff_lines"] = max(item["max_diff_lines"], diff_lines)
+            return True
+
+        self._update(update)
+
+    def summary(self) -> dict[str, Any]:
+        with shared_lock(self.lock_path, timeout=None):
+            ledger = self._load()
+        return {
+            "limits": ledger["limits"],
+            "spent": ledger["spent"],
+            "reserved": len(ledger["reserved"]),
+            "refused": ledger["refused"],
+            "diff_budget_exceeded": ledger["diff_budget_exceeded"],
+        }
@@ -0,0 +1,207 @@
+"""Priority-ordered, lease-based work item claiming.
+
+A ClaimEngine hands out leases on WorkQueue items: the most urgent item
+(priority 0 first, then queue order) that still has a free slot, with at most
+max_workers (default 1) leases per item. Slots are lock files under lock_dir
+(see _util.shared_lock), so the limit also holds across processes; a dead
+process's flock slots are freed by the kernel. With the link lock backend the
+limit holds across hosts sharing lock_dir, and a dead holder's slot is freed
+once its pid is gone (same node) or its lease has run out (other nodes).
+Claims are not fenced (_util.check_fence): a slot guards no shared file, as
+each run writes under its own candidate_id, so a holder whose link lock was
+broken can at worst run its item a second time.
+
+Items with free capacity sit in a heap; an item leaves it when saturated and
+returns when one of its leases is released or expires, so a claim never walks
+past saturated items. Items whose free-looking slots are all held by other
+processes are parked and retried after retry_seconds.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from _util import FlockLock, LinkLock, LockBusy, shared_lock
+
+DEFAULT_LEASE_SECONDS = 1800.0
+# Added to budgets.max_codex_minutes, so the run's own budget stop (and its
+# SIGTERM grace) fires before the lease does.
+LEASE_MARGIN_SECONDS = 60.0
+
+
+def lease_seconds_for(work_item: dict, default: float = DEFAULT_LEASE_SECONDS) -> float:
+    """Lease length for an item: its budgets.max_codex_minutes plus
+    LEASE_MARGIN_SECONDS, else default."""
+    minutes = work_item.get("budgets", {}).get("max_codex_minutes")
+    if isinstance(minutes, (int, float)) and minutes > 0:
+        return float(minutes) * 60 + LEASE_MARGIN_SECONDS
+    return default
+
+
+class Lease:
+    """One claimed slot on a work item, valid until expires_at (monotonic)."""
+
+    def __init__(
+        self,
+        index: int,
+        work_item: dict,
+        slot: int,
+        lock: FlockLock | LinkLock,
+        expires_at: float,
+    ):
+        self.index = index
+        self.work_item = work_item
+        self.slot = slot
+        self.lock = lock
+        self.expires_at = expires_at
+        self.expired = False
+
+    @property
+    def work_item_id(self) -> str:
+        return self.work_item["work_item_id"]
+
+
+class _Item:
+    __slots__ = ("key", "leases", "max_workers", "parked", "queued", "work_item")
+
+    def __init__(self, index: int, work_item: dict):
+        self.key = (work_item["priority"], index)
+        self.work_item = work_item
+        self.max_workers = work_item.get("max_workers", 1)
+        self.leases: dict[int, Lease] = {}
+        self.queued = False
+        self.parked = False
+
+
+class ClaimEngine:
+    """Thread-safe claim/release of work item leases; see the module docstring."""
+
+    def __init__(
+        self,
+        work_items: list[dict],
+        lock_dir: Path,
+        *,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        retry_seconds: float = 1.0,
+    ):
+        self.lock_dir = lock_dir
+        self.lease_seconds = lease_seconds
+        self.retry_seconds = retry_seconds
+        self._mutex = threading.Lock()
+        self._items = [_Item(i, wi) for i, wi in enumerate(work_items)]
+        self._ready: list[tuple[tuple[int, int], int]] = []
+        self._parked: list[tuple[float, int]] = []
+        self._expiry: list[tuple[float, int, Lease]] = []
+        self._seq = itertools.count()
+        self._active = 0
+        self.stats = {"claimed": 0, "released": 0, "expired": 0, "parked": 0}
+        for n, item in enumerate(self._items):
+            self._push(n)
+
+    def _push(self, n: int) -> None:
+        item = self._items[n]
+        if not item.queued and len(item.leases) < item.max_workers:
+            item.queued = True
+            heapq.heappush(self._ready, (item.key, n))
+
+    def _try_slots(self, n: int) -> Lease | None:
+        item = self._items[n]
+        lease_seconds = lease_seconds_for(item.work_item, self.lease_seconds)
+        for slot in range(item.max_workers):
+            if slot in item.leases:
+                continue
+            lock = shared_lock(
+                self.lock_dir / f"claim_{item.work_item['work_item_id']}.{slot}.lock",
+                timeout=0,
+                lease_seconds=lease_seconds,
+                heartbeat=False,
+            )
+            try:
+                lock.acquire()
+            except LockBusy:
+                continue
+            return Lease(
+                n, item.work_item, slot, lock, time.monotonic() + lease_seconds
+            )
+        return None
+
+    def claim(self) -> Lease | None:
+        """Lease a slot on the most urgent item with capacity, or None."""
+        with self._mutex:
+            now = time.monotonic()
+            self._reap(now)
+            while self._parked and self._parked[0][0] <= now:
+                _, n = heapq.heappop(self._parked)
+                self._items[n].parked = False
+                self._push(n)
+            while self._ready:
+                _, n = self._ready[0]
+                item = self._items[n]
+                lease = self._try_slots(n)
+                if lease is None:
+                    # Free here, held by other processes: retry later.
+                    heapq.heappop(self._ready)
+                    item.queued = False
+                    item.parked = True
+                    heapq.heappush(self._parked, (now + self.retry_seconds, n))
+                    self.stats["parked"] += 1
+                    continue
+                item.leases[lease.slot] = lease
+                self._active += 1
+                if len(item.leases) >= item.max_workers:
+                    heapq.heappop(self._ready)
+                    item.queued = False
+                heapq.heappush(self._expiry, (lease.expires_at, next(self._seq), lease))
+                self.stats["claimed"] += 1
+                return lease
+            return None
+
+    def _drop(self, lease: Lease) -> bool:
+        item = self._items[lease.index]
+        if item.leases.get(lease.slot) is not lease:
+            return False
+        del item.leases[lease.slot]
+        self._active -= 1
+        lease.lock.release()
+        if not item.parked:
+            self._push(lease.index)
+        return True
+
+    def release(self, lease: Lease) -> None:
+        """Give a lease back; a no-op if it already expired."""
+        with self._mutex:
+            if self._drop(lease):
+                self.stats["released"] += 1
+
+    def _reap(self, now: float) -> list[Lease]:
+        reaped = []
+        while self._expiry and self._expiry[0][0] <= now:
+            _, _, lease = heapq.heappop(self._expiry)
+            if self._drop(lease):
+                lease.expired = True
+                self.stats["expired"] += 1
+                reaped.append(lease)
+        return reaped
+
+    def reap(self) -> list[Lease]:
+        """Release every lease past its expiry; returns them (marked expired)."""
+        with self._mutex:
+            return self._reap(time.monotonic())
+
+    def pending(self) -> bool:
+        """True if some item may become claimable later (leased or parked)."""
+        with self._mutex:
+            return bool(self._parked) or self._active > 0
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._mutex:
+            return dict(
+                self.stats,
+                active=self._active,
+                ready=len(self._ready),
+            )
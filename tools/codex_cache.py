@@ -0,0 +1,146 @@
+"""Local cache of codex results.
+
+A codex run is a pure-enough function of what it is asked to do: the work
+item's objective_slice, the base_ref it starts from, the pattern's
+prompt_profile_id, the prompt text and the patch_proposal schema. Re-running
+a queue after a controller crash, or retrying an objective on an unchanged
+base_ref, can reuse the earlier run's validated patch_proposal.json and event
+summary instead of paying for another codex session.
+
+Entries live in state_root()/cache/codex/<key>/ and are published by renaming
+a finished temp dir into place, so readers never see half an entry. Hits bump
+the entry's mtime; once there are more than max_entries the least recently
+used are removed. An entry that cannot be fully read back (evicted meanwhile,
+or its patch_proposal.json no longer validates) is a miss.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any
+
+import jsonschema
+from _util import (
+    canonical_digest,
+    load_json,
+    sha256_file_cached,
+    state_root,
+    validate_artifact,
+    write_json,
+)
+
+CODEX_CACHE_MAX_ENTRIES = 256
+# Files copied into and out of an entry, besides summary.json. Every stored
+# entry has the patch; the event log is optional.
+CACHED_FILES = ("patch_proposal.json", "codex_events.jsonl")
+
+
+class CodexCache:
+    """get/put codex results by key_for(); see the module docstring."""
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        *,
+        max_entries: int = CODEX_CACHE_MAX_ENTRIES,
+        prompt_profiles: dict[str, str] | None = None,
+    ):
+        self.root = root or state_root() / "cache" / "codex"
+        self.max_entries = max_entries
+        self.prompt_profiles = prompt_profiles or {}
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def key_for(
+        self, work_item: dict, base_ref: str, prompt: str, schema_path: Path
+    ) -> str:
+        pattern = work_item["pattern"]
+        return canonical_digest(
+            {
+                "objective_slice": work_item["objective_slice"],
+                "base_ref": base_ref,
+                "pattern": pattern,
+                "prompt_profile_id": self.prompt_profiles.get(pattern),
+                "prompt": prompt,
+                "patch_proposal_schema": sha256_file_cached(schema_path),
+            }
+        )
+
+    def get(
+        self, key: str, out_dir: Path, stamp: dict[str, Any] | None = None
+    ) -> dict[str, Any] | None:
+        """Copy a cached result into out_dir and return its event summary.
+
+        stamp (e.g. the new run's candidate_id and work_item_id) overrides
+        fields of the copied patch_proposal.json, which is then re-validated.
+        """
+        entry = self.root / key
+        copied = []
+        try:
+            summary = load_json(entry / "summary.json")
+            for name in CACHED_FILES:
+                try:
+                    shutil.copyfile(entry / name, out_dir / name)
+                except FileNotFoundError:
+                    if name == "patch_proposal.json":
+                        raise
+                    continue
+                copied.append(out_dir / name)
+            patch = load_json(out_dir / "patch_proposal.json")
+            patch.update(stamp or {})
+            validate_artifact("patch_proposal", patch)
+            write_json(out_dir / "patch_proposal.json", patch, kind="patch_proposal")
+            os.utime(entry)
+        except (FileNotFoundError, ValueError, jsonschema.ValidationError):
+            # Absent, evicted while we read it, or no longer valid.
+            for path in copied:
+                path.unlink(missing_ok=True)
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return summary
+
+    def put(self, key: str, out_dir: Path, summary: dict[str, Any]) -> None:
+        """Store a successful run's outputs from out_dir under key."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / f".tmp-{uuid.uuid4().hex}"
+        tmp.mkdir()
+        try:
+            for name in CACHED_FILES:
+                if (out_dir / name).exists():
+                    shutil.copyfile(out_dir / name, tmp / name)
+            write_json(tmp / "summary.json", summary)
+            os.rename(tmp, self.root / key)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+            if not (self.root / key).exists():
+                raise
+            return  # another worker stored it first
+        self.stats["stores"] += 1
+        self.evict()
+
+    def evict(self) -> int:
+        """Remove least recently used entries beyond max_entries."""
+        entries = []
+        with os.scandir(self.root) as it:
+            for d in it:
+                if d.is_dir() and not d.name.startswith("."):
+                    try:
+                        entries.append((d.stat().st_mtime_ns, d.path))
+                    except FileNotFoundError:
+                        continue
+        removed = 0
+        entries.sort()
+        for _, path in entries[: max(0, len(entries) - self.max_entries)]:
+            shutil.rmtree(path, ignore_errors=True)
+            removed += 1
+        self.stats["evictions"] += removed
+        return removed
+
+
+def prompt_profiles(pattern_catalog: dict | None) -> dict[str, str]:
+    """pattern -> prompt_profile_id from a PatternCatalog."""
+    patterns = (pattern_catalog or {}).get("patterns", {})
+    return {name: p["prompt_profile_id"] for name, p in patterns.items()}
@@ -6,6 +6,8 @@ Inputs:
 
 Outputs:
   - generated python modules (default under src/xtrl_contracts/...)
+  - specialized validators per registry artifact kind (manifest "validators")
+  - a single $ref-resolved schema bundle keyed by artifact kind (manifest "bundle")
   - tools/contracts/codegen_hashes.json (schema + output sha256)
 
 Notes:
@@ -24,6 +26,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from schema_bundle import build_bundle
+from validator_codegen import UnsupportedSchema, compile_schema
+
 
 @dataclass(frozen=True)
 class Entry:
@@ -97,6 +102,61 @@ def run_codegen(
     subprocess.run(cmd, check=True)
 
 
+def generate_validators(
+    *,
+    repo_root: Path,
+    registry: Path,
+    output_dir: Path,
+    entry_points: dict[str, dict[str, str]] | None = None,
+) -> tuple[list[dict[str, Any]], list[dict[str, str]]]:
+    """Emit one straight-line validator module per registry artifact kind.
+
+    Kinds whose schema uses keywords outside the compiled subset are skipped and
+    reported; the runtime falls back to jsonschema for them. entry_points adds
+    per-kind `validate_<name>` functions for subschemas (see compile_schema).
+    """
+    artifacts = json.loads((repo_root / registry).read_text(encoding="utf-8"))[
+        "artifacts"
+    ]
+    out_dir_abs = (repo_root / output_dir).resolve()
+    out_dir_abs.mkdir(parents=True, exist_ok=True)
+    ensure_pkg_dirs(repo_root, [output_dir / "__init__.py"])
+
+    entries: list[dict[str, Any]] = []
+    skipped: list[dict[str, str]] = []
+    for kind in sorted(artifacts):
+        schema = Path(artifacts[kind]["schema"])
+        schema_abs = (repo_root / schema).resolve()
+        output = output_dir / f"{kind}.py"
+        try:
+            source = compile_schema(
+                json.loads(schema_abs.read_text(encoding="utf-8")),
+                source=str(schema),
+                entry_points=(entry_points or {}).get(kind),
+            )
+        except UnsupportedSchema as exc:
+            skipped.append({"kind": kind, "schema": str(schema), "reason": str(exc)})
+            continue
+        (repo_root / output).write_text(source, encoding="utf-8")
+        entries.append(
+            {
+                "kind": kind,
+                "schema": str(schema),
+                "schema_sha256": sha256_file(schema_abs),
+                "output": str(output),
+                "output_sha256": sha256_file(repo_root / output),
+            }
+        )
+
+    # Drop modules for kinds that are no longer generated.
+    current = {Path(e["output"]).name for e in entries} | {"__init__.py"}
+    for stale in out_dir_abs.glob("*.py"):
+        if stale.name not in current:
+            stale.unlink()
+
+    return entries, skipped
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument(
@@ -119,6 +179,11 @@ def main() -> int:
         action="store_true",
         help="Fail if any schema/output path is missing",
     )
+    ap.add_argument(
+        "--skip-models",
+        action="store_true",
+        help="Skip pydantic model codegen (validators and the schema bundle still run)",
+    )
     args = ap.parse_args()
 
     repo_root = Path(args.repo_root).resolve()
@@ -135,17 +200,39 @@ def main() -> int:
             if not (repo_root / e.schema).exists():
                 raise FileNotFoundError(f"missing schema: {e.schema}")
 
-    outputs = [e.output for e in entries]
-    ensure_pkg_dirs(repo_root, outputs)
+    if not args.skip_models:
+        outputs = [e.output for e in entries]
+        ensure_pkg_dirs(repo_root, outputs)
 
-    for e in entries:
-        run_codegen(
+        for e in entries:
+            run_codegen(
+                repo_root=repo_root,
+                schema=e.schema,
+                output=e.output,
+                input_file_type=input_file_type,
+                output_model_type=output_model_type,
+                disable_timestamp=disable_timestamp,
+            )
+
+    validators_cfg = manifest.get("validators") or {}
+    validator_entries: list[dict[str, Any]] = []
+    validators_skipped: list[dict[str, str]] = []
+    if validators_cfg:
+        validator_entries, validators_skipped = generate_validators(
             repo_root=repo_root,
-            schema=e.schema,
-            output=e.output,
-            input_file_type=input_file_type,
-            output_model_type=output_model_type,
-            disable_timestamp=disable_timestamp,
+            registry=Path(validators_cfg.get("registry", "control/ssot/registry.json")),
+            output_dir=Path(validators_cfg["output_dir"]),
+            entry_points=validators_cfg.get("entry_points"),
+        )
+
+    bundle_cfg = manifest.get("bundle") or {}
+    if bundle_cfg:
+        bundle = build_bundle(
+            repo_root, Path(bundle_cfg.get("registry", "control/ssot/registry.json"))
+        )
+        bundle_out = (repo_root / bundle_cfg["output"]).resolve()
+        bundle_out.write_text(
+            json.dumps(bundle, indent=2, sort_keys=True) + "\n", encoding="utf-8"
         )
 
     hashes: dict[str, Any] = {
@@ -153,8 +240,11 @@ def main() -> int:
         "tool": {
             "python": sys.version.split()[0],
             "generator": "datamodel-code-generator",
+            "validator_generator": "tools/contracts/validator_codegen.py",
         },
         "entries": [],
+        "validators": validator_entries,
+        "validators_skipped": validators_skipped,
     }
 
     for e in entries:
@@ -0,0 +1,136 @@
+"""Bundle SSOT schemas into one file with every `$ref` pre-resolved.
+
+Each registry artifact kind maps to a self-contained schema: local
+(`#/definitions/...`) and file-relative (`_common.json#/...`) refs are replaced
+by a copy of their target. Draft-07 ignores keywords next to `$ref`, so the
+replacement drops them too. Refs that would recurse into themselves are left in
+place, with the root `definitions` kept so they still resolve.
+
+The bundle records the sha256 and size of registry.json and of every source
+schema; `tools/_util.bundled_schema` uses them as its staleness check.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+BUNDLE_VERSION = 1
+
+# Draft-07 keywords whose values are (maps of / lists of) subschemas.
+SCHEMA_KEYWORDS = {
+    "items",
+    "additionalItems",
+    "additionalProperties",
+    "propertyNames",
+    "contains",
+    "not",
+    "if",
+    "then",
+    "else",
+}
+SCHEMA_LIST_KEYWORDS = {"allOf", "anyOf", "oneOf", "items"}
+SCHEMA_MAP_KEYWORDS = {"properties", "patternProperties", "dependencies"}
+
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class _Inliner:
+    def __init__(self, root_doc: Any, root_path: Path):
+        self.root_doc = root_doc
+        self.root_path = root_path
+        self.docs: dict[Path, Any] = {root_path: root_doc}
+        self.kept_refs = False
+
+    def load(self, path: Path) -> Any:
+        if path not in self.docs:
+            self.docs[path] = json.loads(path.read_text(encoding="utf-8"))
+        return self.docs[path]
+
+    def target(self, ref: str, base: Path) -> tuple[Path, str, Any]:
+        file_part, _, pointer = ref.partition("#")
+        doc_path = (base.parent / file_part).resolve() if file_part else base
+        node = self.load(doc_path)
+        for part in pointer.split("/")[1:] if pointer else []:
+            part = part.replace("~1", "/").replace("~0", "~")
+            node = node[int(part)] if isinstance(node, list) else node[part]
+        return doc_path, pointer, node
+
+    def inline(self, node: Any, base: Path, stack: tuple) -> Any:
+        """Inline refs in a schema node; keyword values are walked by kind."""
+        if not isinstance(node, dict):
+            return node
+        ref = node.get("$ref")
+        if isinstance(ref, str):
+            doc_path, pointer, target = self.target(ref, base)
+            key = (doc_path, pointer)
+            if key in stack:
+                if doc_path != self.root_path:
+                    raise ValueError(f"recursive external $ref: {ref}")
+                self.kept_refs = True
+                return {"$ref": f"#{pointer}"}
+            return self.inline(copy.deepcopy(target), doc_path, (*stack, key))
+
+        out: dict[str, Any] = {}
+        for k, v in node.items():
+            if k == "definitions":
+                continue
+            if k in SCHEMA_MAP_KEYWORDS and isinstance(v, dict):
+                out[k] = {
+                    name: self.inline(sub, base, stack) for name, sub in v.items()
+                }
+            elif k in SCHEMA_LIST_KEYWORDS and isinstance(v, list):
+                out[k] = [self.inline(sub, base, stack) for sub in v]
+            elif k in SCHEMA_KEYWORDS:
+                out[k] = self.inline(v, base, stack)
+            else:
+                out[k] = v
+        return out
+
+
+def bundle_schema(schema: Any, schema_path: Path) -> Any:
+    """Return schema with refs inlined (definitions kept only if still needed)."""
+    inliner = _Inliner(schema, schema_path.resolve())
+    out = inliner.inline(schema, inliner.root_path, ())
+    if inliner.kept_refs and isinstance(schema, dict) and "definitions" in schema:
+        out["definitions"] = {
+            name: inliner.inline(
+                sub, inliner.root_path, ((inliner.root_path, f"/definitions/{name}"),)
+            )
+            for name, sub in schema["definitions"].items()
+        }
+    return out
+
+
+def build_bundle(repo_root: Path, registry: Path) -> dict[str, Any]:
+    registry_abs = repo_root / registry
+    registry_bytes = registry_abs.read_bytes()
+    artifacts = json.loads(registry_bytes)["artifacts"]
+
+    bundle: dict[str, Any] = {
+        "bundle_version": BUNDLE_VERSION,
+        "registry": {
+            "path": str(registry),
+            "sha256": sha256_bytes(registry_bytes),
+            "size": len(registry_bytes),
+        },
+        "artifacts": {},
+        "schemas": {},
+    }
+    for kind in sorted(artifacts):
+        schema_rel = artifacts[kind]["schema"]
+        schema_abs = repo_root / schema_rel
+        raw = schema_abs.read_bytes()
+        bundle["artifacts"][kind] = {
+            "schema": schema_rel,
+            "sha256": sha256_bytes(raw),
+            "size": len(raw),
+            "version": artifacts[kind].get("version"),
+        }
+        bundle["schemas"][kind] = bundle_schema(json.loads(raw), schema_abs)
+    return bundle
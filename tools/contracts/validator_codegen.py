@@ -0,0 +1,486 @@
+"""Compile SSOT JSON Schemas (Draft-07 subset) into straight-line Python validators.
+
+The generated module has no runtime dependency on jsonschema and does not walk the
+schema when validating: every keyword is lowered to inline checks at codegen time,
+in the style of fastjsonschema. Local `#/definitions/...` refs become module-level
+functions so shared definitions are emitted once.
+
+Semantics follow jsonschema.Draft7Validator without a format checker:
+- `$ref` overrides sibling keywords (Draft-07 behaviour)
+- `format`, `default`, `title`, `description`, `examples` are annotations only
+- `integer` accepts integral floats; bools are never numbers
+
+Schemas using a validation keyword outside the supported subset raise
+UnsupportedSchema; callers should skip generation and fall back to jsonschema.
+
+Output is emitted already in `ruff format` style so generated files pass the
+repo-wide format check without a formatter in the codegen loop.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+LINE_LENGTH = 88
+ROOT_PATH = "{path}"
+
+UNSUPPORTED_KEYWORDS = {
+    "patternProperties",
+    "dependencies",
+    "if",
+    "then",
+    "else",
+    "contains",
+    "additionalItems",
+    "multipleOf",
+    "contentMediaType",
+    "contentEncoding",
+}
+
+TYPE_CHECKS = {
+    "string": "isinstance({v}, str)",
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    "number": "_is_number({v})",
+    "integer": "_is_integer({v})",
+}
+
+PRELUDE = '''\
+class ValidationError(ValueError):
+    """Raised by generated validators; the message starts with the data path."""
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value):
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _equal(one, two):
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(_equal(a, b) for a, b in zip(one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(_equal(one[k], two[k]) for k in one)
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def _unique(items):
+    for i, a in enumerate(items):
+        for b in items[i + 1 :]:
+            if _equal(a, b):
+                return False
+    return True'''
+
+
+class UnsupportedSchema(ValueError):
+    """The schema uses a keyword outside the compiled subset."""
+
+
+def fstring_text(text: str) -> str:
+    """Escape literal text for embedding inside a double-quoted f-string."""
+    return (
+        text.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+        .replace("{", "{{")
+        .replace("}", "}}")
+    )
+
+
+def py_literal(value: Any) -> str:
+    """Render a JSON value as a Python literal with ruff-style double quotes."""
+    if isinstance(value, str):
+        return json.dumps(value)
+    if value is True:
+        return "True"
+    if value is False:
+        return "False"
+    if value is None:
+        return "None"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, list):
+        return "[" + ", ".join(py_literal(x) for x in value) + "]"
+    if isinstance(value, dict):
+        items = (f"{json.dumps(k)}: {py_literal(v)}" for k, v in value.items())
+        return "{" + ", ".join(items) + "}"
+    raise UnsupportedSchema(f"non-JSON literal: {value!r}")
+
+
+def call_lines(ind: str, head: str, *args: str) -> list[str]:
+    """`head(args...)` wrapped the way `ruff format` would wrap it."""
+    joined = ", ".join(args)
+    line = f"{ind}{head}({joined})"
+    if len(line) <= LINE_LENGTH:
+        return [line]
+    if len(args) == 1 or len(f"{ind}    {joined}") <= LINE_LENGTH:
+        return [f"{ind}{head}(", f"{ind}    {joined}", f"{ind})"]
+    return [f"{ind}{head}(", *[f"{ind}    {a}," for a in args], f"{ind})"]
+
+
+def frozenset_const(name: str, values: list[str]) -> list[str]:
+    items = [json.dumps(x) for x in values]
+    line = f"{name} = frozenset([{', '.join(items)}])"
+    if len(line) <= LINE_LENGTH:
+        return [line]
+    inner = f"    [{', '.join(items)}]"
+    if len(inner) <= LINE_LENGTH:
+        return [f"{name} = frozenset(", inner, ")"]
+    return [
+        f"{name} = frozenset(",
+        "    [",
+        *[f"        {x}," for x in items],
+        "    ]",
+        ")",
+    ]
+
+
+def guard(ind: str, cond: str, body: list[str]) -> list[str]:
+    """Nest body under `if cond:`, folding a lone inner `if` into one condition."""
+    inner_ind = ind + "    "
+    heads = [i for i, line in enumerate(body) if not line.startswith(inner_ind + " ")]
+    first = body[0][len(inner_ind) :]
+    if heads == [0] and first.startswith("if ") and first.endswith(":"):
+        merged = f"{ind}if {cond} and {first[3:]}"
+        if len(merged) <= LINE_LENGTH:
+            return [merged, *(line[4:] for line in body[1:])]
+    return [f"{ind}if {cond}:", *body]
+
+
+class _Compiler:
+    def __init__(self, root: Any):
+        self.root = root
+        self.consts: list[str] = []
+        self.functions: list[list[str]] = []
+        self.ref_names: dict[str, str] = {}
+        self.counter = 0
+
+    def fresh(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def const(self, prefix: str, expr: str) -> str:
+        name = self.fresh(f"_{prefix}_")
+        self.consts.append(f"{name} = {expr}")
+        return name
+
+    def set_const(self, prefix: str, values: list[str]) -> str:
+        name = self.fresh(f"_{prefix}_")
+        self.consts.extend(frozenset_const(name, sorted(set(values))))
+        return name
+
+    def fail(self, ind: str, path: str, message: str) -> list[str]:
+        return call_lines(ind, "raise ValidationError", f'f"{path}{message}"')
+
+    def check(self, ind: str, cond: str, path: str, message: str) -> list[str]:
+        return [f"{ind}if {cond}:", *self.fail(ind + "    ", path, message)]
+
+    def resolve(self, ref: str) -> Any:
+        if not ref.startswith("#"):
+            raise UnsupportedSchema(f"non-local $ref: {ref}")
+        node = self.root
+        for part in ref[2:].split("/") if ref != "#" else []:
+            part = part.replace("~1", "/").replace("~0", "~")
+            node = node[int(part)] if isinstance(node, list) else node[part]
+        return node
+
+    def function(self, name: str, schema: Any) -> None:
+        body = self.node(schema, "data", ROOT_PATH, "    ")
+        self.functions.append([f"def {name}(data, path):", *(body or ["    pass"])])
+
+    def ref_function(self, ref: str) -> str:
+        name = self.ref_names.get(ref)
+        if name is None:
+            slug = re.sub(r"[^0-9A-Za-z_]+", "_", ref[2:]) or "root"
+            name = f"_ref_{slug}"
+            self.ref_names[ref] = name
+            self.function(name, self.resolve(ref))
+        return name
+
+    def node(self, schema: Any, v: str, path: str, ind: str) -> list[str]:
+        """Lines validating variable `v`; `path` is f-string text rendering its path."""
+        if schema is True:
+            return []
+        if schema is False:
+            return self.fail(ind, path, " is not allowed (schema is false)")
+        if not isinstance(schema, dict):
+            raise UnsupportedSchema(f"schema node is {type(schema).__name__}")
+
+        if "$ref" in schema:
+            fn = self.ref_function(schema["$ref"])
+            return call_lines(ind, fn, v, self.path_arg(path))
+
+        if "$id" in schema and schema is not self.root:
+            raise UnsupportedSchema("nested $id changes the resolution scope")
+        bad = UNSUPPORTED_KEYWORDS.intersection(schema)
+        if bad:
+            raise UnsupportedSchema(f"unsupported keywords: {sorted(bad)}")
+
+        out: list[str] = []
+        known = self.emit_type(schema, v, path, ind, out)
+        self.emit_enum_const(schema, v, path, ind, out)
+        for kind, emit in (
+            ("string", self.emit_string),
+            ("number", self.emit_number),
+            ("array", self.emit_array),
+            ("object", self.emit_object),
+        ):
+            typed = known == kind or (kind == "number" and known == "integer")
+            body_ind = ind if typed else ind + "    "
+            body = emit(schema, v, path, body_ind)
+            if body and not typed:
+                body = guard(ind, TYPE_CHECKS[kind].format(v=v), body)
+            out.extend(body)
+        self.emit_combinators(schema, v, path, ind, out)
+        return out
+
+    @staticmethod
+    def path_arg(path: str) -> str:
+        return "path" if path == ROOT_PATH else f'f"{path}"'
+
+    def emit_type(
+        self, schema: dict, v: str, path: str, ind: str, out: list[str]
+    ) -> str | None:
+        types = schema.get("type")
+        if types is None:
+            return None
+        names = [types] if isinstance(types, str) else list(types)
+        for t in names:
+            if t not in TYPE_CHECKS:
+                raise UnsupportedSchema(f"unknown type: {t}")
+        checks = [TYPE_CHECKS[t].format(v=v) for t in names]
+        cond = (
+            f"not {checks[0]}" if len(checks) == 1 else f"not ({' or '.join(checks)})"
+        )
+        out.extend(
+            self.check(ind, cond, path, fstring_text(f" is not of type {types!r}"))
+        )
+        return names[0] if len(names) == 1 else None
+
+    def emit_enum_const(
+        self, schema: dict, v: str, path: str, ind: str, out: list[str]
+    ) -> None:
+        if "enum" in schema:
+            values = schema["enum"]
+            if values and all(isinstance(x, str) for x in values):
+                name = self.set_const("ENUM", values)
+                cond = f"not (isinstance({v}, str) and {v} in {name})"
+                message = f" is not one of {{sorted({name})}}"
+            else:
+                name = self.const("ENUM", py_literal(values))
+                cond = f"not any(_equal({v}, x) for x in {name})"
+                message = f" is not one of {{{name}!r}}"
+            out.extend(self.check(ind, cond, path, message))
+        if "const" in schema:
+            value = schema["const"]
+            name = self.const("CONST", py_literal(value))
+            if isinstance(value, str):
+                cond = f"not (isinstance({v}, str) and {v} == {name})"
+            else:
+                cond = f"not _equal({v}, {name})"
+            out.extend(self.check(ind, cond, path, f" was expected to be {{{name}!r}}"))
+
+    def emit_string(self, schema: dict, v: str, path: str, ind: str) -> list[str]:
+        out: list[str] = []
+        if "minLength" in schema:
+            n = int(schema["minLength"])
+            out.extend(
+                self.check(ind, f"len({v}) < {n}", path, f" is shorter than {n}")
+            )
+        if "maxLength" in schema:
+            n = int(schema["maxLength"])
+            out.extend(self.check(ind, f"len({v}) > {n}", path, f" is longer than {n}"))
+        if "pattern" in schema:
+            name = self.const("PATTERN", f"re.compile({py_literal(schema['pattern'])})")
+            message = f" does not match {{{name}.pattern!r}}"
+            out.extend(self.check(ind, f"not {name}.search({v})", path, message))
+        return out
+
+    def emit_number(self, schema: dict, v: str, path: str, ind: str) -> list[str]:
+        out: list[str] = []
+        for kw, op in (
+            ("minimum", "<"),
+            ("maximum", ">"),
+            ("exclusiveMinimum", "<="),
+            ("exclusiveMaximum", ">="),
+        ):
+            if kw not in schema:
+                continue
+            bound = schema[kw]
+            if isinstance(bound, bool) or not isinstance(bound, (int, float)):
+                raise UnsupportedSchema(f"{kw} must be a number")
+            out.extend(
+                self.check(
+                    ind, f"{v} {op} {bound!r}", path, f" violates {kw} {bound!r}"
+                )
+            )
+        return out
+
+    def emit_array(self, schema: dict, v: str, path: str, ind: str) -> list[str]:
+        out: list[str] = []
+        if "minItems" in schema:
+            n = int(schema["minItems"])
+            message = f" has fewer than {n} items"
+            out.extend(self.check(ind, f"len({v}) < {n}", path, message))
+        if "maxItems" in schema:
+            n = int(schema["maxItems"])
+            message = f" has more than {n} items"
+            out.extend(self.check(ind, f"len({v}) > {n}", path, message))
+        if schema.get("uniqueItems") is True:
+            out.extend(
+                self.check(ind, f"not _unique({v})", path, " has non-unique items")
+            )
+        if "items" in schema:
+            items = schema["items"]
+            if isinstance(items, list):
+                raise UnsupportedSchema("tuple-form items")
+            idx = self.fresh("i")
+            item = self.fresh("v")
+            inner = self.node(items, item, f"{path}[{{{idx}}}]", ind + "    ")
+            if inner:
+                out.append(f"{ind}for {idx}, {item} in enumerate({v}):")
+                out.extend(inner)
+        return out
+
+    def emit_object(self, schema: dict, v: str, path: str, ind: str) -> list[str]:
+        out: list[str] = []
+        required = schema.get("required") or []
+        if required:
+            name = self.set_const("REQUIRED", required)
+            message = f" is missing required {{sorted({name} - {v}.keys())}}"
+            out.extend(self.check(ind, f"not {name} <= {v}.keys()", path, message))
+        for kw, op, word in (
+            ("minProperties", "<", "fewer"),
+            ("maxProperties", ">", "more"),
+        ):
+            if kw in schema:
+                n = int(schema[kw])
+                message = f" has {word} than {n} properties"
+                out.extend(self.check(ind, f"len({v}) {op} {n}", path, message))
+        properties = schema.get("properties") or {}
+        for key in sorted(properties):
+            child = self.fresh("v")
+            child_path = f"{path}.{fstring_text(key)}"
+            inner = self.node(properties[key], child, child_path, ind + "    ")
+            if inner:
+                out.append(f"{ind}if {json.dumps(key)} in {v}:")
+                out.append(f"{ind}    {child} = {v}[{json.dumps(key)}]")
+                out.extend(inner)
+        if "additionalProperties" in schema:
+            extra_schema = schema["additionalProperties"]
+            props = self.set_const("PROPS", list(properties))
+            if extra_schema is False:
+                message = f" has unexpected properties {{sorted({v}.keys() - {props})}}"
+                out.extend(self.check(ind, f"{v}.keys() - {props}", path, message))
+            else:
+                key = self.fresh("k")
+                child = self.fresh("v")
+                child_path = f"{path}.{{{key}}}"
+                inner = self.node(extra_schema, child, child_path, ind + "    ")
+                if inner:
+                    out.append(f"{ind}for {key}, {child} in {v}.items():")
+                    out.append(f"{ind}    if {key} in {props}:")
+                    out.append(f"{ind}        continue")
+                    out.extend(inner)
+        if "propertyNames" in schema:
+            key = self.fresh("k")
+            child_path = f"{path}.{{{key}}}"
+            inner = self.node(schema["propertyNames"], key, child_path, ind + "    ")
+            if inner:
+                out.append(f"{ind}for {key} in {v}:")
+                out.extend(inner)
+        return out
+
+    def emit_combinators(
+        self, schema: dict, v: str, path: str, ind: str, out: list[str]
+    ) -> None:
+        for sub in schema.get("allOf") or []:
+            out.extend(self.node(sub, v, path, ind))
+        arg = self.path_arg(path)
+        for kw in ("anyOf", "oneOf"):
+            subs = schema.get(kw)
+            if not subs:
+                continue
+            count = self.fresh("n")
+            out.append(f"{ind}{count} = 0")
+            for sub in subs:
+                fn = self.fresh("_sub_")
+                self.function(fn, sub)
+                out.append(f"{ind}try:")
+                out.extend(call_lines(ind + "    ", fn, v, arg))
+                out.append(f"{ind}    {count} += 1")
+                out.append(f"{ind}except ValidationError:")
+                out.append(f"{ind}    pass")
+            if kw == "anyOf":
+                out.extend(
+                    self.check(ind, f"{count} == 0", path, " matches no anyOf branch")
+                )
+            else:
+                message = f" matches {{{count}}} oneOf branches, expected 1"
+                out.extend(self.check(ind, f"{count} != 1", path, message))
+        if "not" in schema:
+            fn = self.fresh("_sub_")
+            self.function(fn, schema["not"])
+            out.append(f"{ind}try:")
+            out.extend(call_lines(ind + "    ", fn, v, arg))
+            out.append(f"{ind}except ValidationError:")
+            out.append(f"{ind}    pass")
+            out.append(f"{ind}else:")
+            out.extend(self.fail(ind + "    ", path, " must not match the not schema"))
+
+
+def compile_schema(
+    schema: Any, *, source: str = "", entry_points: dict[str, str] | None = None
+) -> str:
+    """Return the source of a module exposing `validate(data, path="$")`.
+
+    entry_points maps a name to a JSON pointer into schema; each one adds a
+    `validate_<name>(data, path="$")` for that subschema (e.g. one array item).
+    """
+    compiler = _Compiler(schema)
+    body = compiler.node(schema, "data", ROOT_PATH, "    ")
+    validators = [
+        [
+            'def validate(data, path="$"):',
+            '    """Raise ValidationError if data does not conform; return data."""',
+            *body,
+            "    return data",
+        ]
+    ]
+    for name, pointer in sorted((entry_points or {}).items()):
+        sub = compiler.node(compiler.resolve(f"#{pointer}"), "data", ROOT_PATH, "    ")
+        validators.append(
+            [
+                f'def validate_{name}(data, path="$"):',
+                f'    """Validate data against the subschema at {pointer}."""',
+                *sub,
+                "    return data",
+            ]
+        )
+
+    header = "# generated by tools/contracts/gen.py; never hand-edit\n"
+    if source:
+        header += f"# source: {source}\n"
+    header += "from __future__ import annotations"
+    if any(".compile(" in line for line in compiler.consts):
+        header += "\n\nimport re"
+    parts = [header, PRELUDE]
+    if compiler.consts:
+        parts.append("\n".join(compiler.consts))
+    parts.extend("\n".join(fn) for fn in validators)
+    parts.extend("\n".join(fn) for fn in compiler.functions)
+    return "\n\n\n".join(parts) + "\n"
@@ -0,0 +1,237 @@
+"""Single-pass unified diff statistics.
+
+parse_unified_diff() walks a diff line by line (git-style or plain
+`diff -u` output) and keeps O(1) state per line plus one record per file, so
+multi-megabyte diffs are read in linear time without splitting them into a
+list. Hunk line counts from the @@ headers decide where a hunk ends, so body
+lines such as "--- x" or "diff --git" inside a hunk are counted, not taken
+for headers.
+
+Per file it records added/removed line counts, the old and new paths, a
+status (added, deleted, modified, renamed, copied) and whether the change is
+binary.
+"""
+
+from __future__ import annotations
+
+import io
+import re
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+_HUNK = re.compile(r"^@@ -\d+(?:,(\d+))? \+\d+(?:,(\d+))? @@")
+_BINARY = re.compile(r"^Binary files (.+) and (.+) differ$")
+_ESCAPES = {"a": "\a", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v"}
+
+
+def _unquote(path: str) -> str:
+    """Undo git's C-style quoting of paths with special characters."""
+    if len(path) < 2 or path[0] != '"' or path[-1] != '"':
+        return path
+    out = bytearray()
+    body = path[1:-1]
+    i = 0
+    while i < len(body):
+        c = body[i]
+        if c == "\\" and i + 1 < len(body):
+            nxt = body[i + 1]
+            if nxt in "01234567":
+                out.append(int(body[i + 1 : i + 4], 8))
+                i += 4
+                continue
+            out += _ESCAPES.get(nxt, nxt).encode()
+            i += 2
+            continue
+        out += c.encode()
+        i += 1
+    return out.decode("utf-8", errors="surrogateescape")
+
+
+def _strip_prefix(path: str) -> str | None:
+    """a/x or b/x -> x; /dev/null -> None."""
+    path = _unquote(path.split("\t", 1)[0].rstrip("\n"))
+    if path == "/dev/null":
+        return None
+    if path[:2] in ("a/", "b/"):
+        return path[2:]
+    return path
+
+
+def _git_header_paths(rest: str) -> tuple[str | None, str | None]:
+    """Paths from "diff --git a/X b/Y" (rest is "a/X b/Y")."""
+    if rest.startswith('"'):
+        end = rest.find('" ', 1)
+        if end > 0:
+            return _strip_prefix(rest[: end + 1]), _strip_prefix(rest[end + 2 :])
+    # Unquoted paths may contain " b/"; prefer the split with equal halves.
+    half = (len(rest) - 1) // 2
+    if rest[half : half + 3] == " b/" and rest[2:half] == rest[half + 3 :]:
+        return rest[2:half], rest[half + 3 :]
+    a, sep, b = rest.partition(" b/")
+    if not sep:
+        return None, None
+    return _strip_prefix(a), b
+
+
+class FileDiff:
+    __slots__ = ("added", "binary", "new_path", "old_path", "removed", "status")
+
+    def __init__(self, old_path: str | None = None, new_path: str | None = None):
+        self.old_path = old_path
+        self.new_path = new_path
+        self.added = 0
+        self.removed = 0
+        self.binary = False
+        self.status: str | None = None
+
+    @property
+    def path(self) -> str:
+        return self.new_path or self.old_path or ""
+
+    def as_dict(self) -> dict[str, Any]:
+        status = self.status
+        if status is None:
+            if self.old_path is None:
+                status = "added"
+            elif self.new_path is None:
+                status = "deleted"
+            else:
+                status = "modified"
+        out: dict[str, Any] = {
+            "path": self.path,
+            "status": status,
+            "added": self.added,
+            "removed": self.removed,
+            "binary": self.binary,
+        }
+        if status in ("renamed", "copied"):
+            out["old_path"] = self.old_path
+        return out
+
+
+class DiffStats:
+    """Result of parse_unified_diff(): per-file records and totals."""
+
+    def __init__(self, files: list[FileDiff]):
+        self.files = files
+
+    @property
+    def insertions(self) -> int:
+        return sum(f.added for f in self.files)
+
+    @property
+    def deletions(self) -> int:
+        return sum(f.removed for f in self.files)
+
+    @property
+    def touched_paths(self) -> list[str]:
+        """Every path the diff writes, deletes or renames away from, sorted."""
+        paths = set()
+        for f in self.files:
+            paths.update(p for p in (f.old_path, f.new_path) if p is not None)
+        return sorted(paths)
+
+    def summary(self) -> dict[str, Any]:
+        """EvidenceCapsule.diff_summary."""
+        return {
+            "files_changed": len(self.files),
+            "insertions": self.insertions,
+            "deletions": self.deletions,
+            "binary_files": sum(1 for f in self.files if f.binary),
+            "files": [f.as_dict() for f in self.files],
+        }
+
+    def metrics(self) -> dict[str, int]:
+        """The diff part of CandidateSet candidate metrics."""
+        return {
+            "diff_lines_total": self.insertions + self.deletions,
+            "files_touched": len(self.files),
+        }
+
+
+def parse_unified_diff(lines: Iterable[str]) -> DiffStats:
+    """Parse a unified diff from an iterable of lines (e.g. an open file)."""
+    files: list[FileDiff] = []
+    cur: FileDiff | None = None
+    git_file = False  # cur came from a "diff --git" header
+    old_left = new_left = 0  # lines still expected in the current hunk
+
+    for line in lines:
+        if old_left > 0 or new_left > 0:
+            tag = line[:1]
+            if tag == "+":
+                cur.added += 1
+                new_left -= 1
+                continue
+            if tag == "-":
+                cur.removed += 1
+                old_left -= 1
+                continue
+            if tag == " " or line in ("\n", "\r\n", ""):
+                old_left -= 1
+                new_left -= 1
+                continue
+            if tag == "\\":  # "\ No newline at end of file"
+                continue
+            old_left = new_left = 0  # truncated hunk: fall through to headers
+
+        if line.startswith("diff --git "):
+            old, new = _git_header_paths(line[11:].rstrip("\r\n"))
+            cur = FileDiff(old, new)
+            files.append(cur)
+            git_file = True
+        elif line.startswith("--- "):
+            old = _strip_prefix(line[4:])
+            if cur is None or not git_file or cur.added or cur.removed:
+                cur = FileDiff()
+                files.append(cur)
+                git_file = False
+            cur.old_path = old
+        elif line.startswith("+++ ") and cur is not None:
+            cur.new_path = _strip_prefix(line[4:])
+        elif line.startswith("@@"):
+            m = _HUNK.match(line)
+            if m is None or cur is None:
+                continue
+            old_left = int(m.group(1)) if m.group(1) is not None else 1
+            new_left = int(m.group(2)) if m.group(2) is not None else 1
+        elif cur is not None and git_file:
+            if line.startswith("new file mode"):
+                cur.old_path = None
+            elif line.startswith("deleted file mode"):
+                cur.new_path = None
+            elif line.startswith("rename from "):
+                cur.old_path = _unquote(line[12:].rstrip("\r\n"))
+                cur.status = "renamed"
+            elif line.startswith("rename to "):
+                cur.new_path = _unquote(line[10:].rstrip("\r\n"))
+                cur.status = "renamed"
+            elif line.startswith("copy from "):
+                cur.old_path = _unquote(line[10:].rstrip("\r\n"))
+                cur.status = "copied"
+            elif line.startswith("copy to "):
+                cur.new_path = _unquote(line[8:].rstrip("\r\n"))
+                cur.status = "copied"
+            elif line.startswith("GIT binary patch"):
+                cur.binary = True
+            else:
+                m = _BINARY.match(line.rstrip("\r\n"))
+                if m is not None:
+                    cur.binary = True
+                    if m.group(1) == "/dev/null":
+                        cur.old_path = None
+                    if m.group(2) == "/dev/null":
+                        cur.new_path = None
+    return DiffStats(files)
+
+
+def patch_diff_stats(patch: dict, base_dir: Path | None = None) -> DiffStats:
+    """DiffStats for a PatchProposal's unified_diff or patch_path."""
+    if "unified_diff" in patch:
+        return parse_unified_diff(io.StringIO(patch["unified_diff"]))
+    path = Path(patch["patch_path"])
+    if not path.is_absolute() and base_dir is not None:
+        path = base_dir / path
+    with open(path, encoding="utf-8", errors="surrogateescape", newline="") as f:
+        return parse_unified_diff(f)
@@ -12,7 +12,12 @@ TOOLS_DIR = Path(__file__).resolve().parents[1]
 if str(TOOLS_DIR) not in sys.path:
     sys.path.insert(0, str(TOOLS_DIR))
 
-from _util import load_json, validate_artifact, write_json  # noqa: E402
+from _util import (  # noqa: E402
+    load_json,
+    validate_artifact,
+    write_file_atomic,
+    write_json,
+)
 
 
 def now_utc() -> str:
@@ -82,15 +87,6 @@ def render_content(
     return b""
 
 
-def write_if_changed(path: Path, content: bytes) -> str:
-    if path.exists() and path.read_bytes() == content:
-        return "skipped"
-    existed = path.exists()
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_bytes(content)
-    return "updated" if existed else "created"
-
-
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Materialize a deterministic golden packet evidence tree from a pre-contract."
@@ -133,7 +129,7 @@ def main() -> int:
 
     for rel_path in required_files:
         target = packet_dir / rel_path
-        status = write_if_changed(
+        status = write_file_atomic(
             target, render_content(rel_path, contract, run_id, packet_dir)
         )
         if status == "created":
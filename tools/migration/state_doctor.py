@@ -11,7 +11,13 @@ TOOLS_DIR = Path(__file__).resolve().parents[1]
 if str(TOOLS_DIR) not in sys.path:
     sys.path.insert(0, str(TOOLS_DIR))
 
-from _util import load_json, state_root, validate_artifact  # noqa: E402
+from _util import (  # noqa: E402
+    iter_candidate_set,
+    load_json,
+    open_snapshot,
+    state_root,
+    validate_artifact,
+)
 
 REQUIRED_DIRS = ["queue", "out", "locks", "promote", "worktrees", "ledger"]
 OPTIONAL_ARTIFACTS = [
@@ -41,7 +47,7 @@ def check_or_create_dirs(
     return created, missing
 
 
-def validate_optional_artifacts(root: Path) -> list[dict[str, str]]:
+def validate_optional_artifacts(root: Path, prefix: str = "") -> list[dict[str, str]]:
     invalid: list[dict[str, str]] = []
 
     for rel_path, kind in OPTIONAL_ARTIFACTS:
@@ -49,11 +55,19 @@ def validate_optional_artifacts(root: Path) -> list[dict[str, str]]:
         if not path.exists():
             continue
         try:
-            obj = load_json(path)
-            validate_artifact(kind, obj)
+            if kind == "candidate_set":
+                # Streamed: candidate sets grow without bound.
+                for _ in iter_candidate_set(path):
+                    pass
+            else:
+                validate_artifact(kind, load_json(path))
         except Exception as exc:  # noqa: BLE001
             invalid.append(
-                {"path": rel_path, "artifact_kind": kind, "error": str(exc).strip()}
+                {
+                    "path": prefix + rel_path,
+                    "artifact_kind": kind,
+                    "error": str(exc).strip(),
+                }
             )
 
     return invalid
@@ -78,6 +92,11 @@ def main() -> int:
     root = Path(args.state_root).resolve()
     created_dirs, missing_dirs = check_or_create_dirs(root, args.create_missing)
     invalid_artifacts = validate_optional_artifacts(root)
+    snapshot = open_snapshot(root)
+    if snapshot is not None:
+        invalid_artifacts += validate_optional_artifacts(
+            snapshot.path, f"snapshots/{snapshot.path.name}/"
+        )
 
     ok = not missing_dirs and not invalid_artifacts
     result: dict[str, Any] = {
@@ -87,6 +106,7 @@ def main() -> int:
         "created_dirs": created_dirs,
         "missing_dirs": missing_dirs,
         "invalid_artifacts": invalid_artifacts,
+        "snapshot_generation": snapshot.generation if snapshot else None,
     }
     print(json.dumps(result, sort_keys=True))
     return 0 if ok else 1
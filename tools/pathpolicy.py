@@ -0,0 +1,219 @@
+"""Compiled allowed_paths / forbidden_paths matching.
+
+Path policies appear in WorkQueue.work_items[].policy, in
+RankPolicy.hard_filters.forbidden_paths and in PacketPreContract.constraints,
+as repo-relative patterns such as "src/", ".git/" or "tools/**".
+
+A pattern is anchored at the repo root and matches a path if it matches the
+path itself or one of its parent directories, so "src/", "src" and "src/**"
+all cover everything under src/. Within a pattern, "*" and "?" match inside
+one path segment, "[...]" is a character class ("[!...]" negated) and a "**"
+segment matches any number of segments. A pattern of "" or "/" matches
+every path.
+
+compile_path_policy() builds, once per (allowed, forbidden) pair, a trie of
+the patterns' literal leading segments. Each trie node records which lists
+have a literal pattern ending there and, per list, one precompiled regex
+alternation of the glob remainders of the patterns sharing that prefix. A
+path is checked against both lists in a single walk down its segments,
+stopping as soon as the result is known.
+"""
+
+from __future__ import annotations
+
+import posixpath
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+
+FORBIDDEN = 1
+ALLOWED = 2
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+def normalize_path(path: str) -> str | None:
+    """Repo-relative POSIX form of path; None if it escapes the repo."""
+    path = path.replace("\\", "/")
+    if path.startswith("/"):
+        return None
+    path = posixpath.normpath(path)
+    if path == ".." or path.startswith("../"):
+        return None
+    return "" if path == "." else path
+
+
+def _segment_regex(segment: str) -> str:
+    out, i = [], 0
+    while i < len(segment):
+        c = segment[i]
+        i += 1
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = segment.find("]", i + 1 if segment[i : i + 1] in ("!", "]") else i)
+            if end < 0:
+                out.append(re.escape(c))
+                continue
+            body = segment[i:end].replace("\\", "\\\\")
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            elif body.startswith("^"):
+                body = "\\" + body
+            out.append(f"(?!/)[{body}]")
+            i = end + 1
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
+
+
+def _glob_regex(segments: list[str]) -> str:
+    """Regex for the path below a trie node, matching the pattern or anything
+    under what it matches."""
+    out = []
+    for j, segment in enumerate(segments):
+        last = j == len(segments) - 1
+        if segment == "**":
+            out.append(".*" if last else "(?:[^/]+/)*")
+        else:
+            out.append(_segment_regex(segment) + ("" if last else "/"))
+    if segments[-1] != "**":
+        out.append("(?:/.*)?")
+    return "".join(out)
+
+
+class _Node:
+    __slots__ = ("children", "globs", "labels")
+
+    def __init__(self):
+        self.children: dict[str, _Node] = {}
+        # Bits of the lists with a literal pattern ending here.
+        self.labels = 0
+        # label -> regex over the rest of the path below this node.
+        self.globs: dict[int, re.Pattern] = {}
+
+
+class PathPolicy:
+    """allowed/forbidden path patterns compiled into one trie.
+
+    check(path) returns None if path is admissible, else why not:
+    "forbidden" (matches a forbidden pattern), "not_allowed" (allowed is
+    non-empty and no allowed pattern matches) or "outside" (absolute or
+    escaping the repo with ".."). An empty allowed list allows every path.
+    """
+
+    def __init__(self, allowed: Iterable[str] = (), forbidden: Iterable[str] = ()):
+        self.allowed = tuple(allowed)
+        self.forbidden = tuple(forbidden)
+        self._root = _Node()
+        globs: dict[int, dict[int, list[str]]] = {}
+        nodes: dict[int, _Node] = {}
+        for label, patterns in ((FORBIDDEN, self.forbidden), (ALLOWED, self.allowed)):
+            for pattern in patterns:
+                segments = [
+                    s
+                    for s in pattern.replace("\\", "/").split("/")
+                    if s not in ("", ".")
+                ]
+                node = self._root
+                while segments and not _GLOB_CHARS.intersection(segments[0]):
+                    node = node.children.setdefault(segments.pop(0), _Node())
+                if not segments:
+                    node.labels |= label
+                    continue
+                nodes[id(node)] = node
+                globs.setdefault(id(node), {}).setdefault(label, []).append(
+                    _glob_regex(segments)
+                )
+        for key, by_label in globs.items():
+            nodes[key].globs = {
+                label: re.compile("|".join(f"(?:{rx})" for rx in regexes))
+                for label, regexes in by_label.items()
+            }
+        # Labels whose answer is needed: with no allowed patterns only
+        # forbidden matters.
+        self._wanted = FORBIDDEN | (ALLOWED if self.allowed else 0)
+
+    def __repr__(self) -> str:
+        return f"PathPolicy(allowed={self.allowed!r}, forbidden={self.forbidden!r})"
+
+    def match(self, path: str) -> int:
+        """Bits (FORBIDDEN, ALLOWED) of the lists with a pattern matching the
+        normalized path."""
+        wanted = self._wanted
+        segments = path.split("/") if path else []
+        node, bits = self._root, 0
+        for i in range(len(segments) + 1):
+            bits |= node.labels
+            if node.globs and i < len(segments):
+                rest = None
+                for label, rx in node.globs.items():
+                    if bits & label:
+                        continue
+                    if rest is None:
+                        rest = "/".join(segments[i:])
+                    if rx.fullmatch(rest):
+                        bits |= label
+            # Forbidden decides on its own; otherwise go on until allowed is
+            # known too.
+            if bits & FORBIDDEN or bits & wanted == wanted or i == len(segments):
+                break
+            node = node.children.get(segments[i])
+            if node is None:
+                break
+        return bits
+
+    def check(self, path: str) -> str | None:
+        norm = normalize_path(path)
+        if norm is None:
+            return "outside"
+        bits = self.match(norm)
+        if bits & FORBIDDEN:
+            return "forbidden"
+        if self.allowed and not bits & ALLOWED:
+            return "not_allowed"
+        return None
+
+    def violations(self, paths: Iterable[str]) -> list[tuple[str, str]]:
+        """(path, reason) for every path check() rejects, in input order."""
+        check = self.check
+        out = []
+        for path in paths:
+            reason = check(path)
+            if reason is not None:
+                out.append((path, reason))
+        return out
+
+
+@lru_cache(maxsize=256)
+def _compiled(allowed: tuple, forbidden: tuple) -> PathPolicy:
+    return PathPolicy(allowed, forbidden)
+
+
+def compile_path_policy(
+    allowed: Iterable[str] | None = None, forbidden: Iterable[str] | None = None
+) -> PathPolicy:
+    """Cached PathPolicy for these pattern lists (policies are immutable)."""
+    return _compiled(tuple(allowed or ()), tuple(forbidden or ()))
+
+
+def policy_path_policy(*policies: dict | None) -> PathPolicy:
+    """PathPolicy for the allowed_paths / forbidden_paths of policy objects
+    (work item policy, RankPolicy.hard_filters, pre-contract constraints).
+
+    Forbidden lists are combined. A path must be allowed by every policy
+    that restricts it, so at most one of them may carry allowed_paths.
+    """
+    allowed: list | None = None
+    forbidden: list = []
+    for policy in policies:
+        if not policy:
+            continue
+        forbidden += policy.get("forbidden_paths") or []
+        if policy.get("allowed_paths"):
+            if allowed is not None:
+                raise ValueError("more than one policy sets allowed_paths")
+            allowed = policy["allowed_paths"]
+    return compile_path_policy(allowed, forbidden)
@@ -0,0 +1,156 @@
+"""Resource-governed subprocesses for codex and checks.
+
+spawn() starts a command in its own process group (so a kill reaches
+everything it forked) with optional limits applied in the child just before
+exec: rlimits (CPU seconds, address space, open files), niceness and CPU
+affinity. The limits are applied by a tiny exec shim (python -I -S -c ...)
+rather than preexec_fn, which is not safe in the threaded worker pool; the
+shim execs in place, so the pid, exit status and rusage are the command's.
+
+wait() reaps with os.wait4 to get the child's own rusage (CPU seconds, max
+RSS) even when several runs are in flight; run() is spawn + wait for checks.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import resource
+import signal
+import subprocess
+import sys
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+from typing import Any
+
+# Seconds between the CPU soft limit (SIGXCPU) and the hard limit (SIGKILL).
+CPU_LIMIT_GRACE_SECONDS = 5
+
+_EXEC_SHIM = """\
+import json, os, resource, sys
+spec = json.loads(sys.argv[1])
+for name, soft, hard in spec["rlimits"]:
+    res = getattr(resource, name)
+    cur = resource.getrlimit(res)[1]
+    if cur != resource.RLIM_INFINITY:
+        soft, hard = min(soft, cur), min(hard, cur)
+    resource.setrlimit(res, (soft, hard))
+if spec["nice"]:
+    os.nice(spec["nice"])
+if spec["cpus"]:
+    os.sched_setaffinity(0, spec["cpus"])
+try:
+    os.execvp(sys.argv[2], sys.argv[2:])
+except OSError as exc:
+    sys.stderr.write(f"{sys.argv[2]}: {exc}\\n")
+    sys.exit(127)
+"""
+
+
+@dataclass(frozen=True)
+class ProcLimits:
+    """Per-run limits; None/0/False means "leave as inherited"."""
+
+    cpu_seconds: int | None = None  # RLIMIT_CPU
+    memory_bytes: int | None = None  # RLIMIT_AS
+    open_files: int | None = None  # RLIMIT_NOFILE
+    nice: int = 0
+    cpus: tuple[int, ...] | None = None  # sched_setaffinity
+    pin_cpus: bool = False  # for_slot() pins each slot to one CPU
+
+    def for_slot(self, slot: int) -> ProcLimits:
+        """These limits for worker slot `slot`, pinned to one CPU if pin_cpus."""
+        if not self.pin_cpus or not hasattr(os, "sched_getaffinity"):
+            return self
+        cpus = sorted(self.cpus or os.sched_getaffinity(0))
+        return replace(self, cpus=(cpus[slot % len(cpus)],))
+
+    def _spec(self) -> dict[str, Any] | None:
+        rlimits = []
+        if self.cpu_seconds:
+            rlimits.append(
+                (
+                    "RLIMIT_CPU",
+                    self.cpu_seconds,
+                    self.cpu_seconds + CPU_LIMIT_GRACE_SECONDS,
+                )
+            )
+        if self.memory_bytes:
+            rlimits.append(("RLIMIT_AS", self.memory_bytes, self.memory_bytes))
+        if self.open_files:
+            rlimits.append(("RLIMIT_NOFILE", self.open_files, self.open_files))
+        if not (rlimits or self.nice or self.cpus):
+            return None
+        return {
+            "rlimits": rlimits,
+            "nice": self.nice,
+            "cpus": list(self.cpus or ()),
+        }
+
+
+def spawn(
+    cmd: Sequence[str], limits: ProcLimits | None = None, **popen_kwargs: Any
+) -> subprocess.Popen:
+    """Popen(cmd) in a new process group, under limits."""
+    spec = limits._spec() if limits is not None else None
+    if spec is not None:
+        cmd = [sys.executable, "-I", "-S", "-c", _EXEC_SHIM, json.dumps(spec), *cmd]
+    return subprocess.Popen(list(cmd), start_new_session=True, **popen_kwargs)
+
+
+def rusage_summary(ru: resource.struct_rusage) -> dict[str, Any]:
+    """CPU seconds and peak RSS (KiB on Linux) of a reaped child."""
+    return {
+        "cpu_user_s": round(ru.ru_utime, 3),
+        "cpu_system_s": round(ru.ru_stime, 3),
+        "max_rss_kb": ru.ru_maxrss,
+    }
+
+
+def wait(proc: subprocess.Popen, timeout: float | None = None) -> dict[str, Any] | None:
+    """Reap proc, returning rusage_summary(); raises TimeoutExpired if it is
+    still running after timeout. Sets proc.returncode.
+
+    Returns None if the child was already reaped elsewhere (no rusage).
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    delay = 0.0005
+    while proc.returncode is None:
+        try:
+            pid, status, ru = os.wait4(proc.pid, os.WNOHANG)
+        except ChildProcessError:
+            proc.wait()
+            return None
+        if pid:
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            return rusage_summary(ru)
+        if deadline is not None and time.monotonic() >= deadline:
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+        remaining = None if deadline is None else deadline - time.monotonic()
+        time.sleep(delay if remaining is None else max(0.0, min(delay, remaining)))
+        delay = min(delay * 2, 0.05)
+    return None
+
+
+def run(
+    cmd: Sequence[str],
+    limits: ProcLimits | None = None,
+    timeout: float | None = None,
+    **popen_kwargs: Any,
+) -> tuple[int, dict[str, Any] | None]:
+    """Run cmd to completion under limits; returns (returncode, rusage).
+
+    On timeout the whole process group is killed and the timeout re-raised.
+    """
+    proc = spawn(cmd, limits, **popen_kwargs)
+    try:
+        ru = wait(proc, timeout)
+    except BaseException:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        wait(proc)
+        raise
+    return proc.returncode, ru
@@ -3,50 +3,342 @@
 Consumes CandidateSet, filters+ranks candidates deterministically via RankPolicy, then
 selects a candidate for replay/promotion.
 
-This skeleton stages the SSOT + selection logic. The authoritative replay (clean checkout,
-apply patch, run full checks, commit/push) is intentionally left as a TODO because it
-depends on your chosen git plant (patch-based promotion vs CI-only).\n
+With --replay the top k candidates are replayed authoritatively (replay.py:
+clean base_ref worktrees leased from a warm WorktreePool, patch applied, the
+work item's allowed_commands run, in parallel) and the best-ranked one that
+passes is selected. Promotion itself (commit/push) is left as a TODO because
+it depends on your chosen git plant (patch-based promotion vs CI-only).\n
 Invariants:
 - single writer to promotion state (promote.lock)
 - workers never promote
+
+--daemon keeps running instead: it holds promote.lock, keeps the filtered,
+ranked candidates in a RankTable, ingests candidates as they are appended
+(CandidateTail: only new log bytes and spool files are read; the set is
+re-read only after a compaction), and rewrites promote/selection.json as
+soon as the top k changes. work_queue.json and rank_policy.json are
+re-loaded only when their content changes; a new rank policy, or new work
+item path policies, re-rank from scratch. SIGTERM/SIGINT stop it; it prints
+a JSON summary on exit.
+
+Hard filters include each candidate's touched paths (from its evidence)
+against RankPolicy.hard_filters.forbidden_paths and its work item's
+allowed_paths / forbidden_paths (pathpolicy).
 """
 
 from __future__ import annotations
 
 import argparse
+import json
+import signal
 import sys
+import threading
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any
 
 from _util import (
     AtomicLock,
+    CandidateTail,
+    check_fence,
+    compact_candidate_log,
     ensure_state_layout,
+    iter_candidate_set,
     load_json,
     now_iso,
+    open_snapshot,
+    sha256_file_cached,
+    state_root,
     validate_artifact,
     write_json,
-    state_root,
 )
-from rank import build_rank_key, passes_hard_filters
+from rank import RankTable, passes_hard_filters
+from replay import REPLAY_CHECK_TIMEOUT_SECONDS, REPLAY_WORKERS, Replayer
+from worktree_pool import WORKTREE_POOL_SIZE, WorktreeError, WorktreePool
+
+DAEMON_POLL_SECONDS = 0.05
+
+
+def build_selection(
+    work_queue: dict,
+    ranked: list[dict[str, Any]],
+    *,
+    dry_run: bool,
+    snapshot_generation: int | None,
+    replay: dict | None = None,
+) -> dict:
+    """promote/selection.json for the best of `ranked` (best first), or for
+    the replay winner (replay["promoted"]) when the candidates were replayed."""
+    if replay is None:
+        chosen = ranked[0]
+        todo = [
+            "Replay candidate patch on clean base_ref",
+            "Run authoritative checks",
+            "Emit authoritative gate_decision + next_iter_plan",
+            "Promote commit/patch according to git plant",
+        ]
+    else:
+        chosen = next(c for c in ranked if c["candidate_id"] == replay["promoted"])
+        todo = [
+            "Emit next_iter_plan",
+            "Promote commit/patch according to git plant",
+        ]
+    selection = {
+        "artifact_kind": "promotion_selection",
+        "selected_at": now_iso(),
+        "dry_run": dry_run,
+        "queue_id": work_queue["queue_id"],
+        "base_ref": work_queue["base_ref"],
+        "snapshot_generation": snapshot_generation,
+        "candidate": {
+            "candidate_id": chosen["candidate_id"],
+            "work_item_id": chosen["work_item_id"],
+            "patch_proposal_path": chosen["patch_proposal_path"],
+            "evidence_path": chosen["evidence_path"],
+            "gate_worker_path": chosen["gate_worker_path"],
+            "metrics": chosen.get("metrics", {}),
+        },
+        "ranked_candidate_ids": [c["candidate_id"] for c in ranked],
+        "todo": todo,
+    }
+    if replay is not None:
+        selection["replay"] = replay
+    return selection
+
+
+def write_selection(selection: dict, lock: AtomicLock) -> bool:
+    """Write selection.json as promote.lock's holder; False if fenced off."""
+    out_dir = state_root() / "promote"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    # A linearizer whose link lock was broken must not overwrite the
+    # selection of the one that took over.
+    if not check_fence(out_dir / "selection.json", lock.token):
+        print("promote.lock was taken over; selection discarded", file=sys.stderr)
+        return False
+    write_json(out_dir / "selection.json", selection)
+    return True
+
+
+def work_items_by_id(work_queue: dict) -> dict[str, dict]:
+    return {wi["work_item_id"]: wi for wi in work_queue.get("work_items", [])}
+
+
+def replay_ranked(
+    args: argparse.Namespace,
+    work_queue: dict,
+    work_items: dict[str, dict],
+    ranked: list[dict[str, Any]],
+) -> dict:
+    """Replay `ranked` in parallel; also written to promote/replay.json."""
+    pool = None
+    if args.worktree_pool:
+        pool = WorktreePool(Path(args.repo), args.worktree_pool)
+    replayer = Replayer(
+        Path(args.repo),
+        work_queue["base_ref"],
+        work_items,
+        workers=args.replay_workers,
+        timeout=args.check_timeout,
+        pool=pool,
+    )
+    winner, results = replayer.run(ranked)
+    replay = {
+        "base_sha": replayer.sha,
+        "promoted": winner["candidate_id"] if winner else None,
+        "results": results,
+    }
+    if pool is not None:
+        replay["worktree_pool"] = pool.stats
+    write_json(state_root() / "promote" / "replay.json", replay)
+    return replay
+
+
+class _Watched:
+    """A validated JSON input, re-loaded only when its content changes."""
+
+    def __init__(self, path: Path, kind: str):
+        self.path = path
+        self.kind = kind
+        self.digest: str | None = None
+        self.value: Any = None
+
+    def refresh(self) -> bool:
+        """True if the file's content changed (and was re-loaded)."""
+        try:
+            digest = sha256_file_cached(self.path)
+        except FileNotFoundError:
+            return False
+        if digest == self.digest:
+            return False
+        value = load_json(self.path)
+        validate_artifact(self.kind, value)
+        self.digest, self.value = digest, value
+        return True
+
+
+class LinearizerDaemon:
+    """State kept between polls by --daemon; see the module docstring."""
+
+    def __init__(self, args: argparse.Namespace):
+        queue_dir = state_root() / "queue"
+        self.dry_run = bool(args.dry_run)
+        self.k = max(args.top_k, 1)
+        self.work_queue = _Watched(
+            Path(args.queue or queue_dir / "work_queue.json"), "work_queue"
+        )
+        self.rank_policy = _Watched(
+            Path(args.rank_policy or queue_dir / "rank_policy.json"), "rank_policy"
+        )
+        self.cand_path = Path(args.candidate_set or queue_dir / "candidate_set.json")
+        self.stats = {"polls": 0, "ingested": 0, "selections": 0, "reloads": 0}
+        self.tail: CandidateTail | None = None
+        self.table: RankTable | None = None
+        self.emitted: list[str] | None = None
+        self.work_items: dict[str, dict] = {}
+        self.base_ref_error = False
+
+    def close(self) -> None:
+        if self.tail is not None:
+            self.stats["rejected"] = len(self.tail.rejected)
+            self.tail.close()
+
+    def step(self, lock: AtomicLock) -> bool:
+        """One poll: ingest, re-rank, emit on change. False if fenced off."""
+        self.stats["polls"] += 1
+        queue_changed = self.work_queue.refresh()
+        reload = self.rank_policy.refresh() or self.tail is None
+        if queue_changed:
+            work_items = work_items_by_id(self.work_queue.value)
+            # Candidates already ranked passed the old path policies.
+            reload |= {k: v.get("policy") for k, v in work_items.items()} != {
+                k: v.get("policy") for k, v in self.work_items.items()
+            }
+            self.work_items = work_items
+        if reload:
+            self.close()
+            self.tail = CandidateTail(
+                self.cand_path, self.cand_path.with_suffix(".validated.json")
+            )
+            self.table = RankTable(self.rank_policy.value or {}, keep=self.k)
+            self.emitted = None
+            self.stats["reloads"] += 1
+        work_queue, rank_policy = self.work_queue.value, self.rank_policy.value
+        if work_queue is None or rank_policy is None:
+            return True
+        for candidate in self.tail.poll():
+            self.stats["ingested"] += 1
+            work_item = self.work_items.get(candidate.get("work_item_id"))
+            if passes_hard_filters(rank_policy, candidate, work_item):
+                self.table.add(candidate)
+        base_ref = self.tail.envelope.get("base_ref", work_queue["base_ref"])
+        if base_ref != work_queue["base_ref"]:
+            if not self.base_ref_error:
+                print("candidate_set.base_ref != work_queue.base_ref", file=sys.stderr)
+            self.base_ref_error = True
+            return True
+        self.base_ref_error = False
+        ranked = self.table.top(self.k)
+        ids = [c["candidate_id"] for c in ranked]
+        if ranked and (ids != self.emitted or queue_changed):
+            selection = build_selection(
+                work_queue, ranked, dry_run=self.dry_run, snapshot_generation=None
+            )
+            if not write_selection(selection, lock):
+                return False
+            self.emitted = ids
+            self.stats["selections"] += 1
+            print(f"Selected candidate: {ids[0]}", flush=True)
+        return True
+
+
+def run_daemon(args: argparse.Namespace) -> int:
+    daemon = LinearizerDaemon(args)
+    stop = threading.Event()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, lambda *_: stop.set())
+    lock = AtomicLock(state_root() / "locks" / "promote.lock")
+    try:
+        lock.__enter__()
+    except FileExistsError as exc:
+        print(f"another linearizer is running: {exc}", file=sys.stderr)
+        return 5
+    try:
+        while not stop.is_set():
+            if not daemon.step(lock):
+                return 4
+            stop.wait(args.poll_seconds)
+    finally:
+        lock.__exit__(None, None, None)
+        daemon.close()
+    print(json.dumps(daemon.stats, sort_keys=True), flush=True)
+    return 0
 
 
 def main() -> int:
     ap = argparse.ArgumentParser()
-    ap.add_argument("--queue", default=str(state_root() / "queue" / "work_queue.json"))
+    # Defaults read the current snapshot generation (consistent, lock-free)
+    # when one has been published, else the live state/queue files. The
+    # daemon always reads the live files.
+    ap.add_argument("--queue", default=None)
+    ap.add_argument("--candidate-set", default=None)
+    ap.add_argument("--rank-policy", default=None)
+    ap.add_argument("--dry-run", action="store_true")
     ap.add_argument(
-        "--candidate-set", default=str(state_root() / "queue" / "candidate_set.json")
+        "--top-k",
+        type=int,
+        default=1,
+        help="also record the k best candidate_ids, best first",
     )
     ap.add_argument(
-        "--rank-policy", default=str(state_root() / "queue" / "rank_policy.json")
+        "--daemon",
+        action="store_true",
+        help="keep running, re-selecting as candidates arrive",
+    )
+    ap.add_argument("--poll-seconds", type=float, default=DAEMON_POLL_SECONDS)
+    ap.add_argument(
+        "--replay",
+        action="store_true",
+        help="replay the top k on clean worktrees; select the best that passes",
+    )
+    ap.add_argument(
+        "--repo", default=".", help="git repository to replay in (default: cwd)"
+    )
+    ap.add_argument("--replay-workers", type=int, default=REPLAY_WORKERS)
+    ap.add_argument(
+        "--worktree-pool",
+        type=int,
+        default=WORKTREE_POOL_SIZE,
+        help="warm worktrees kept under state/worktrees/pool (0: fresh ones)",
+    )
+    ap.add_argument(
+        "--check-timeout",
+        type=float,
+        default=REPLAY_CHECK_TIMEOUT_SECONDS,
+        help="seconds per allowed command during replay",
     )
-    ap.add_argument("--dry-run", action="store_true")
     args = ap.parse_args()
+    if args.daemon and args.replay:
+        ap.error("--replay is not supported with --daemon")
 
     ensure_state_layout()
+    if args.daemon:
+        return run_daemon(args)
 
-    queue_path = Path(args.queue)
-    cand_path = Path(args.candidate_set)
-    rp_path = Path(args.rank_policy)
+    if not args.candidate_set:
+        # Fold pending appends in first; this publishes a fresh snapshot.
+        # Wait out a concurrent compaction rather than rank a stale one.
+        live_cands = state_root() / "queue" / "candidate_set.json"
+        if live_cands.exists():
+            compact_candidate_log(live_cands, wait=True)
+    snapshot = open_snapshot()
+    base = snapshot.path if snapshot is not None else state_root()
+    queue_path = Path(args.queue or base / "queue" / "work_queue.json")
+    cand_path = Path(args.candidate_set or base / "queue" / "candidate_set.json")
+    rp_path = Path(args.rank_policy or base / "queue" / "rank_policy.json")
+    # Snapshot generations are read-only; keep the sidecar next to live state.
+    if args.candidate_set:
+        sidecar = cand_path.with_suffix(".validated.json")
+    else:
+        sidecar = state_root() / "queue" / "candidate_set.validated.json"
 
     if not queue_path.exists() or not cand_path.exists() or not rp_path.exists():
         print(
@@ -57,54 +349,51 @@ def main() -> int:
     work_queue = load_json(queue_path)
     validate_artifact("work_queue", work_queue)
 
-    cand_set = load_json(cand_path)
-    validate_artifact("candidate_set", cand_set)
-
     rank_policy = load_json(rp_path)
     validate_artifact("rank_policy", rank_policy)
 
-    if cand_set["base_ref"] != work_queue["base_ref"]:
+    # Stream the candidates: each entry is validated (skipping ones a previous
+    # run already validated, see sidecar), filtered and added to a RankTable
+    # that keeps only the best few. Ties keep the earliest entry.
+    table = RankTable(rank_policy, keep=max(args.top_k, 1))
+    work_items = work_items_by_id(work_queue)
+    envelope: dict[str, Any] = {}
+    for candidate in iter_candidate_set(cand_path, sidecar, envelope):
+        work_item = work_items.get(candidate.get("work_item_id"))
+        if passes_hard_filters(rank_policy, candidate, work_item):
+            table.add(candidate)
+    ranked = table.top(max(args.top_k, 1))
+    chosen: dict[str, Any] | None = ranked[0] if ranked else None
+
+    if envelope["base_ref"] != work_queue["base_ref"]:
         print("candidate_set.base_ref != work_queue.base_ref", file=sys.stderr)
         return 3
 
-    candidates: List[Dict[str, Any]] = list(cand_set.get("candidates", []))
-    candidates = [c for c in candidates if passes_hard_filters(rank_policy, c)]
-    if not candidates:
+    if chosen is None:
         print("No candidates after hard filters", file=sys.stderr)
         return 0
 
-    key_fn = build_rank_key(rank_policy)
-    candidates.sort(key=key_fn)
-    chosen = candidates[0]
-
-    promote_lock = state_root() / "locks" / "promote.lock"
-    with AtomicLock(promote_lock):
-        out_dir = state_root() / "promote"
-        out_dir.mkdir(parents=True, exist_ok=True)
-
-        selection = {
-            "artifact_kind": "promotion_selection",
-            "selected_at": now_iso(),
-            "dry_run": bool(args.dry_run),
-            "queue_id": work_queue["queue_id"],
-            "base_ref": work_queue["base_ref"],
-            "candidate": {
-                "candidate_id": chosen["candidate_id"],
-                "work_item_id": chosen["work_item_id"],
-                "patch_proposal_path": chosen["patch_proposal_path"],
-                "evidence_path": chosen["evidence_path"],
-                "gate_worker_path": chosen["gate_worker_path"],
-                "metrics": chosen.get("metrics", {}),
-            },
-            "todo": [
-                "Replay candidate patch on clean base_ref",
-                "Run authoritative checks",
-                "Emit authoritative gate_decision + next_iter_plan",
-                "Promote commit/patch according to git plant",
-            ],
-        }
-
-        write_json(out_dir / "selection.json", selection)
+    with AtomicLock(state_root() / "locks" / "promote.lock") as lock:
+        replay = None
+        if args.replay:
+            try:
+                replay = replay_ranked(args, work_queue, work_items, ranked)
+            except WorktreeError as exc:
+                print(exc, file=sys.stderr)
+                return 3
+            if replay["promoted"] is None:
+                print("No candidate passed replay", file=sys.stderr)
+                return 6
+            chosen = next(c for c in ranked if c["candidate_id"] == replay["promoted"])
+        selection = build_selection(
+            work_queue,
+            ranked,
+            dry_run=bool(args.dry_run),
+            snapshot_generation=snapshot.generation if snapshot else None,
+            replay=replay,
+        )
+        if not write_selection(selection, lock):
+            return 4
 
     print(f"Selected candidate: {chosen['candidate_id']}")
     return 0
@@ -1,6 +1,37 @@
 from __future__ import annotations
 
-from typing import Callable
+import heapq
+import json
+import os
+from array import array
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from pathpolicy import policy_path_policy
+
+# Optional vectorised selection for RankTable; XTRL_RANK_BACKEND=array
+# disables it.
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+
+def _field_value(cand: dict, field: str):
+    if field == "created_at":
+        return cand.get("created_at", "")
+    metrics = cand.get("metrics", {})
+    return metrics.get(field, 0)
+
+
+def _order_value(v, direction: str):
+    # Convert desc into a sortable inverse.
+    if direction == "desc":
+        if isinstance(v, (int, float)):
+            return -v
+        # For strings (created_at), reverse lexicographic by prefix.
+        return "\uffff" + str(v)
+    return v
 
 
 def build_rank_key(rank_policy: dict) -> Callable[[dict], tuple]:
@@ -11,41 +42,267 @@ def build_rank_key(rank_policy: dict) -> Callable[[dict], tuple]:
 
     orders = rank_policy.get("tuple_order", [])
 
-    def get_field(cand: dict, field: str):
-        if field == "created_at":
-            return cand.get("created_at", "")
-        metrics = cand.get("metrics", {})
-        return metrics.get(field, 0)
-
     def key(cand: dict) -> tuple:
-        out = []
-        for spec in orders:
-            field = spec["field"]
-            direction = spec["direction"]
-            v = get_field(cand, field)
-            # Convert desc into a sortable inverse.
+        return tuple(
+            _order_value(_field_value(cand, spec["field"]), spec["direction"])
+            for spec in orders
+        )
+
+    return key
+
+
+def rank_backend() -> str:
+    """ "numpy" when numpy is importable and not disabled, else "array"."""
+    if np is not None and os.environ.get("XTRL_RANK_BACKEND") != "array":
+        return "numpy"
+    return "array"
+
+
+class RankTable:
+    """Candidates' rank keys stored column-wise, for top-k selection.
+
+    Each tuple_order field is one column of the elements build_rank_key would
+    put in the key tuple: an array('q') of the values while they are all
+    int64s, an array('q') of ids into the distinct strings while they are all
+    strings (created_at), else a list. top_k(k) returns the rows of the k best
+    candidates, best first, in the order sorted(..., key=build_rank_key)
+    gives (ties, e.g. equal created_at, keep insertion order). With numpy
+    (rank_backend()) int and string columns are selected with a partition on
+    the first column plus a stable lexsort of the survivors; otherwise, or
+    with other value types present, by heapq.nsmallest over the zipped columns.
+
+    payload (default: the candidate) is kept per row and returned by top().
+    keep bounds memory for one-shot selection: once rows reach
+    max(4 * keep, 4096), all but the best keep rows are dropped.
+    """
+
+    def __init__(
+        self,
+        rank_policy: dict,
+        *,
+        keep: int | None = None,
+        backend: str | None = None,
+    ):
+        self.specs = [
+            (s["field"], s["direction"]) for s in rank_policy.get("tuple_order", [])
+        ]
+        self.backend = backend or rank_backend()
+        if self.backend not in ("numpy", "array"):
+            raise ValueError(f"unknown rank backend: {self.backend!r}")
+        if self.backend == "numpy" and np is None:
+            raise ValueError("rank backend numpy needs numpy installed")
+        self.keep = keep
+        self._prune_at = None if keep is None else max(4 * keep, 4096)
+        # Column kinds: None (no rows yet), "int", "str" or "any".
+        self._kinds: list[str | None] = [None] * len(self.specs)
+        self._columns: list[Any] = [array("q") for _ in self.specs]
+        self._strings: list[list[str]] = [[] for _ in self.specs]
+        self._string_ids: list[dict[str, int]] = [{} for _ in self.specs]
+        self._payloads: list[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    def add(self, candidate: dict, payload: Any = None) -> None:
+        metrics = candidate.get("metrics", {})
+        for j, (field, direction) in enumerate(self.specs):
+            # _order_value(_field_value(candidate, field), direction), inlined.
+            if field == "created_at":
+                v = candidate.get("created_at", "")
+            else:
+                v = metrics.get(field, 0)
             if direction == "desc":
-                if isinstance(v, (int, float)):
-                    out.append(-v)
+                v = -v if isinstance(v, (int, float)) else "\uffff" + str(v)
+            kind = self._kinds[j]
+            if kind == "int":
+                try:
+                    self._columns[j].append(v)
+                    continue
+                except (TypeError, OverflowError):
+                    pass
+            elif kind == "str" and type(v) is str:
+                sid = self._string_ids[j].get(v)
+                self._columns[j].append(self._intern(j, v) if sid is None else sid)
+                continue
+            self._store(j, v)
+        self._payloads.append(candidate if payload is None else payload)
+        if self._prune_at is not None and len(self._payloads) >= self._prune_at:
+            self.prune(self.keep)
+
+    def _intern(self, j: int, v: str) -> int:
+        sid = self._string_ids[j][v] = len(self._strings[j])
+        self._strings[j].append(v)
+        return sid
+
+    def _store(self, j: int, v: Any) -> None:
+        """add()'s slow path: first value of a column, or a change of kind."""
+        if self._kinds[j] is None:
+            if type(v) is str:
+                self._kinds[j] = "str"
+                self._columns[j].append(self._intern(j, v))
+                return
+            self._kinds[j] = "int"
+            try:
+                self._columns[j].append(v)
+                return
+            except (TypeError, OverflowError):
+                pass
+        if self._kinds[j] != "any":
+            self._columns[j] = self._values(j)
+            self._kinds[j] = "any"
+            self._strings[j], self._string_ids[j] = [], {}
+        self._columns[j].append(v)
+
+    def _values(self, j: int) -> list:
+        """Column j as a list of key elements."""
+        if self._kinds[j] == "str":
+            return [self._strings[j][i] for i in self._columns[j]]
+        return list(self._columns[j])
+
+    def _string_ranks(self, j: int) -> list[int] | None:
+        """Rank of each string id of column j in sort order; None if the ids
+        are already in sort order (e.g. created_at arriving in time order)."""
+        strings = self._strings[j]
+        order = sorted(range(len(strings)), key=strings.__getitem__)
+        if all(i == r for r, i in enumerate(order)):
+            return None
+        ranks = [0] * len(order)
+        for r, i in enumerate(order):
+            ranks[i] = r
+        return ranks
+
+    def extend(self, candidates: Iterable[dict]) -> None:
+        """add() each candidate, a column at a time."""
+        batch = candidates if isinstance(candidates, list) else list(candidates)
+        step = self._prune_at or len(batch) or 1
+        for start in range(0, len(batch), step):
+            chunk = batch[start : start + step]
+            for j, (field, direction) in enumerate(self.specs):
+                if field == "created_at":
+                    values = [c.get("created_at", "") for c in chunk]
                 else:
-                    # For strings (created_at), reverse lexicographic by prefix.
-                    out.append("\uffff" + str(v))
+                    values = [c.get("metrics", {}).get(field, 0) for c in chunk]
+                if direction == "desc":
+                    values = [_order_value(v, direction) for v in values]
+                self._extend_column(j, values)
+            self._payloads.extend(chunk)
+            if self._prune_at is not None and len(self._payloads) >= self._prune_at:
+                self.prune(self.keep)
+
+    def _extend_column(self, j: int, values: list) -> None:
+        kind = self._kinds[j]
+        if not values:
+            return
+        if kind in (None, "int"):
+            try:
+                self._columns[j].extend(array("q", values))
+                self._kinds[j] = "int"
+                return
+            except (TypeError, OverflowError):
+                pass
+        if kind in (None, "str") and all(type(v) is str for v in values):
+            self._kinds[j] = "str"
+            ids = self._string_ids[j]
+            self._columns[j].extend(
+                array("q", [ids[v] if v in ids else self._intern(j, v) for v in values])
+            )
+            return
+        for v in values:
+            self._store(j, v)
+
+    def top_k(self, k: int) -> list[int]:
+        """Row numbers of the k best candidates, best first."""
+        n = len(self._payloads)
+        k = min(k, n)
+        if k <= 0:
+            return []
+        if self.backend == "numpy" and "any" not in self._kinds:
+            return self._top_k_numpy(k, n)
+        columns = []
+        for j, column in enumerate(self._columns):
+            ranks = self._string_ranks(j) if self._kinds[j] == "str" else None
+            columns.append(column if ranks is None else map(ranks.__getitem__, column))
+        rows = heapq.nsmallest(k, zip(*columns, range(n)))
+        return [row[-1] for row in rows]
+
+    def _top_k_numpy(self, k: int, n: int) -> list[int]:
+        if not self.specs:
+            return list(range(k))
+        keys = []
+        for j, column in enumerate(self._columns):
+            key = np.frombuffer(column, dtype=np.int64, count=n)
+            ranks = self._string_ranks(j) if self._kinds[j] == "str" else None
+            keys.append(key if ranks is None else np.asarray(ranks)[key])
+        if k < n:
+            # Every top-k row is at most the k-th smallest first key.
+            kth = np.partition(keys[0], k - 1)[k - 1]
+            rows = np.flatnonzero(keys[0] <= kth)
+            keys = [key[rows] for key in keys]
+        else:
+            rows = np.arange(n)
+        # lexsort is stable and sorts by its last key first.
+        return rows[np.lexsort(keys[::-1])[:k]].tolist()
+
+    def top(self, k: int) -> list[Any]:
+        """Payloads of the k best candidates, best first."""
+        return [self._payloads[i] for i in self.top_k(k)]
+
+    def prune(self, k: int) -> None:
+        """Drop all rows but the k best (kept in insertion order)."""
+        rows = sorted(self.top_k(k))
+        for j, kind in enumerate(self._kinds):
+            values = self._values(j)
+            kept = [values[i] for i in rows]
+            if kind == "str":
+                self._strings[j], self._string_ids[j] = [], {}
+                ids = self._string_ids[j]
+                self._columns[j] = array(
+                    "q", [ids[v] if v in ids else self._intern(j, v) for v in kept]
+                )
+            elif kind == "any":
+                self._columns[j] = kept
             else:
-                out.append(v)
-        return tuple(out)
+                self._columns[j] = array("q", kept)
+        self._payloads = [self._payloads[i] for i in rows]
 
-    return key
 
+def candidate_touched_paths(cand: dict) -> list[str] | None:
+    """EvidenceCapsule.touched_paths of the candidate; None if its evidence
+    is missing or predates touched_paths."""
+    path = cand.get("evidence_path")
+    if not path:
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            paths = json.load(f).get("touched_paths")
+    except (OSError, ValueError, AttributeError):
+        return None
+    return paths if isinstance(paths, list) else None
 
-def passes_hard_filters(rank_policy: dict, cand: dict) -> bool:
+
+def passes_hard_filters(
+    rank_policy: dict,
+    cand: dict,
+    work_item: dict | None = None,
+    touched_paths: Iterable[str] | None = None,
+) -> bool:
+    """RankPolicy.hard_filters, plus the allowed_paths / forbidden_paths of
+    the candidate's work item policy when given.
+
+    Path filters apply to touched_paths (default: read from the candidate's
+    evidence); a candidate whose touched paths are unknown is not rejected
+    for them.
+    """
     hf = rank_policy.get("hard_filters") or {}
     max_diff = hf.get("max_diff_lines_total")
     if max_diff is not None:
         if cand.get("metrics", {}).get("diff_lines_total", 0) > max_diff:
             return False
 
-    forbidden = set(hf.get("forbidden_paths") or [])
-    # If evidence is later expanded to include touched paths here, enforce it.
-    # For now, treat this as a placeholder hook.
-    _ = forbidden
+    policy = policy_path_policy(hf, (work_item or {}).get("policy"))
+    if policy.allowed or policy.forbidden:
+        if touched_paths is None:
+            touched_paths = candidate_touched_paths(cand)
+        if touched_paths and policy.violations(touched_paths):
+            return False
     return True
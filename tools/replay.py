@@ -0,0 +1,308 @@
+"""Authoritative replay of the linearizer's top-k candidates.
+
+Each candidate is replayed in its own git worktree of base_ref, leased from
+a WorktreePool (warm slots reset to base_ref) or, without one, freshly added
+under state_root()/worktrees and removed afterwards: its PatchProposal's
+diff is checked against the work item's path policy, applied with
+`git apply`, and the work item's allowed_commands run there in order
+(procrun: own process group, limits, timeout). Replays run concurrently on a
+bounded thread pool, best-ranked first, and the result is the best-ranked
+candidate that applies and passes every command. Once that is known (it
+passed and every better candidate failed) the remaining replays are
+cancelled: queued ones never start and running commands are killed, so a
+failing first choice costs one round of parallel replays rather than a
+serial retry.
+
+Per candidate, state_root()/promote/replay/<name>/ receives the command logs
+and the authoritative gate_decision (gate.json); <name> is the candidate_id
+made path-safe plus a short hash of the raw id, so ids that sanitise alike
+(a/b, a_b) never share a directory or worktree.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import re
+import shlex
+import signal
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import jsonschema
+from _util import (
+    LockBusy,
+    default_meta,
+    load_json,
+    state_root,
+    validate_artifact,
+    write_json,
+)
+from diffstat import parse_unified_diff
+from pathpolicy import policy_path_policy
+from procrun import ProcLimits, spawn, wait
+from worktree_pool import (
+    WorktreeLease,
+    WorktreePool,
+    add_worktree,
+    git,
+    remove_worktree,
+    resolve_base_ref,
+)
+
+REPLAY_WORKERS = 4
+REPLAY_CHECK_TIMEOUT_SECONDS = 600.0
+# How often a running check, or a wait for a pool worktree, looks at the
+# cancel flag.
+REPLAY_POLL_SECONDS = 0.05
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9._-]")
+
+
+def replay_name(candidate_id: str) -> str:
+    """Directory name for a candidate's replay logs and worktree."""
+    digest = hashlib.sha256(candidate_id.encode()).hexdigest()[:8]
+    return f"{_UNSAFE.sub('_', candidate_id)}-{digest}"
+
+
+def _patch_text(patch: dict, repo: Path) -> str:
+    if "unified_diff" in patch:
+        return patch["unified_diff"]
+    path = Path(patch["patch_path"])
+    if not path.is_absolute():
+        path = repo / path
+    return path.read_text(encoding="utf-8", errors="surrogateescape")
+
+
+class Replayer:
+    """Replays ranked candidates of one WorkQueue against base_ref in repo.
+
+    run(ranked) returns (winner, results): the best-ranked passing
+    candidate's result (or None) and one result per candidate, in rank order.
+    A result is a dict: candidate_id, work_item_id, status ("passed",
+    "failed", "cancelled" or "skipped"), reason_codes, checks (one entry per
+    command run: command, rc, seconds, timed_out, rusage) and seconds.
+    """
+
+    def __init__(
+        self,
+        repo: Path,
+        base_ref: str,
+        work_items: dict[str, dict],
+        *,
+        workers: int = REPLAY_WORKERS,
+        timeout: float = REPLAY_CHECK_TIMEOUT_SECONDS,
+        limits: ProcLimits | None = None,
+        worktrees: Path | None = None,
+        out_dir: Path | None = None,
+        pool: WorktreePool | None = None,
+    ):
+        self.repo = repo
+        self.base_ref = base_ref
+        self.sha = resolve_base_ref(repo, base_ref)
+        self.work_items = work_items
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.limits = limits
+        self.worktrees = worktrees or state_root() / "worktrees"
+        self.out_dir = out_dir or state_root() / "promote" / "replay"
+        self.pool = pool
+        self._cancel = threading.Event()
+
+    def run(self, ranked: list[dict]) -> tuple[dict | None, list[dict]]:
+        self._cancel.clear()
+        results: list[dict | None] = [None] * len(ranked)
+        winner = None
+        with ThreadPoolExecutor(self.workers, thread_name_prefix="replay") as pool:
+            futures = {
+                pool.submit(self.replay_one, cand, slot % self.workers): slot
+                for slot, cand in enumerate(ranked)
+            }
+            try:
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+                    decided, winner = self._decided(results)
+                    if decided:
+                        break
+            finally:
+                # Decided (or failed): stop the replays still queued or running.
+                self._cancel.set()
+                for future in futures:
+                    future.cancel()
+        for slot, cand in enumerate(ranked):
+            if results[slot] is None:
+                results[slot] = self._result(cand, "skipped", [], [], 0.0)
+        return winner, results
+
+    @staticmethod
+    def _decided(results: list[dict | None]) -> tuple[bool, dict | None]:
+        """(True, best) once the best-ranked passing result is known."""
+        for result in results:
+            if result is None:
+                return False, None
+            if result["status"] == "passed":
+                return True, result
+        return True, None
+
+    def _result(
+        self,
+        cand: dict,
+        status: str,
+        reason_codes: list[str],
+        checks: list[dict],
+        seconds: float,
+    ) -> dict:
+        return {
+            "candidate_id": cand["candidate_id"],
+            "work_item_id": cand.get("work_item_id"),
+            "status": status,
+            "reason_codes": reason_codes,
+            "checks": checks,
+            "seconds": round(seconds, 3),
+        }
+
+    def replay_one(self, cand: dict, slot: int = 0) -> dict:
+        start = time.monotonic()
+        name = replay_name(cand["candidate_id"])
+        out_dir = self.out_dir / name
+        out_dir.mkdir(parents=True, exist_ok=True)
+        checks: list[dict] = []
+        status, reason_codes = self._replay(cand, name, out_dir, slot, checks)
+        result = self._result(
+            cand, status, reason_codes, checks, time.monotonic() - start
+        )
+        if status != "cancelled":
+            gate = {
+                "artifact_kind": "gate_decision",
+                "run_id": cand["candidate_id"],
+                "iteration_id": cand.get("work_item_id", ""),
+                "decision": "PROMOTE" if status == "passed" else "DENY",
+                "reason_codes": reason_codes,
+                "pointers": {
+                    "patch_proposal": cand.get("patch_proposal_path", ""),
+                    "evidence": cand.get("evidence_path", ""),
+                    "replay_logs": str(out_dir),
+                },
+                "meta": default_meta(),
+            }
+            validate_artifact("gate_decision", gate)
+            write_json(out_dir / "gate.json", gate)
+        return result
+
+    def _replay(
+        self, cand: dict, name: str, out_dir: Path, slot: int, checks: list[dict]
+    ) -> tuple[str, list[str]]:
+        if self._cancel.is_set():
+            return "cancelled", []
+        work_item = self.work_items.get(cand.get("work_item_id"))
+        if work_item is None:
+            return "failed", ["AMBIGUOUS_STATE_DENIED"]
+        try:
+            patch = load_json(Path(cand["patch_proposal_path"]))
+            validate_artifact("patch_proposal", patch)
+            diff = _patch_text(patch, self.repo)
+        except (KeyError, OSError, ValueError, jsonschema.ValidationError):
+            return "failed", ["MISSING_EVIDENCE_DENIED"]
+        policy = work_item.get("policy") or {}
+        touched = parse_unified_diff(io.StringIO(diff)).touched_paths
+        if policy_path_policy(policy).violations(touched):
+            return "failed", ["TOUCHED_FORBIDDEN_PATH"]
+
+        try:
+            if self.pool is not None:
+                lease = self._lease()
+                if lease is None:
+                    return "cancelled", []
+                worktree = lease.path
+            else:
+                lease = None
+                worktree = self.worktrees / name
+                add_worktree(self.repo, worktree, self.sha)
+        except subprocess.CalledProcessError as exc:
+            (out_dir / "apply.log").write_text(exc.stderr or "", encoding="utf-8")
+            return "failed", ["AMBIGUOUS_STATE_DENIED"]
+        try:
+            if diff.strip():
+                applied = git(worktree, "apply", "-", input=diff, check=False)
+                (out_dir / "apply.log").write_text(applied.stderr, encoding="utf-8")
+                if applied.returncode != 0:
+                    return "failed", ["AMBIGUOUS_STATE_DENIED"]
+            limits = self.limits.for_slot(slot) if self.limits else None
+            for i, command in enumerate(policy.get("allowed_commands") or []):
+                check = self._check(
+                    command, worktree, out_dir / f"check-{i}.log", limits
+                )
+                if check is None:
+                    return "cancelled", []
+                checks.append(check)
+                if check["rc"] != 0:
+                    return "failed", ["TESTS_FAILED"]
+            return "passed", []
+        finally:
+            if lease is not None:
+                self.pool.release(lease)
+            else:
+                remove_worktree(self.repo, worktree)
+
+    def _lease(self) -> WorktreeLease | None:
+        """A pool worktree at base_ref; None if cancelled while waiting."""
+        while not self._cancel.is_set():
+            try:
+                return self.pool.lease(self.sha, timeout=REPLAY_POLL_SECONDS)
+            except LockBusy:
+                pass
+        return None
+
+    def _check(
+        self, command: str, cwd: Path, log_path: Path, limits: ProcLimits | None
+    ) -> dict | None:
+        """Run one allowed command; None if cancelled meanwhile."""
+        start = time.monotonic()
+        deadline = start + self.timeout
+        with open(log_path, "wb") as log:
+            try:
+                proc = spawn(
+                    shlex.split(command),
+                    limits,
+                    cwd=str(cwd),
+                    stdin=subprocess.DEVNULL,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                )
+            except (OSError, ValueError) as exc:
+                log.write(f"{command}: {exc}\n".encode())
+                return {
+                    "command": command,
+                    "rc": 127,
+                    "seconds": round(time.monotonic() - start, 3),
+                    "timed_out": False,
+                    "rusage": None,
+                }
+            timed_out = False
+            while True:
+                try:
+                    rusage = wait(proc, REPLAY_POLL_SECONDS)
+                    break
+                except subprocess.TimeoutExpired:
+                    timed_out = time.monotonic() >= deadline
+                    if not (timed_out or self._cancel.is_set()):
+                        continue
+                    try:
+                        os.killpg(proc.pid, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass
+                    rusage = wait(proc)
+                    if not timed_out:
+                        return None
+                    break
+        return {
+            "command": command,
+            "rc": proc.returncode,
+            "seconds": round(time.monotonic() - start, 3),
+            "timed_out": timed_out,
+            "rusage": rusage,
+        }
@@ -2,7 +2,7 @@
 
 This script claims a work item from a WorkQueue, runs codex-cli to produce a PatchProposal,
 creates an EvidenceCapsule + worker-local gate decision, and appends the candidate to the
-CandidateSet.
+CandidateSet. With --workers N it supervises a pool of N concurrent codex runs instead.
 
 Design goals:
 - deterministic file layout under state/
@@ -15,21 +15,141 @@ NOTE: This repo stages the control plane. You must have `codex` installed for ex
 from __future__ import annotations
 
 import argparse
+import json
+import os
+import signal
 import subprocess
 import sys
+import threading
+import time
+import uuid
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any
 
 from _util import (
-    AtomicLock,
+    append_candidate,
+    default_meta,
     ensure_state_layout,
     load_json,
     now_iso,
     read_registry_schema,
+    sha256_file_cached,
+    sha256_ref,
+    state_root,
     validate_artifact,
     write_json,
-    state_root,
 )
+from autoscale import AutoscaleConfig, Autoscaler
+from budget import BudgetExhausted, BudgetLedger, budget_limits
+from claims import DEFAULT_LEASE_SECONDS, ClaimEngine
+from codex_cache import CODEX_CACHE_MAX_ENTRIES, CodexCache, prompt_profiles
+from diffstat import DiffStats, patch_diff_stats
+from pathpolicy import policy_path_policy
+from procrun import ProcLimits, spawn, wait
+from worktree_pool import WorktreePool
+
+# Running codex processes, so a supervisor can terminate them on shutdown.
+_CODEX_PROCS: set[subprocess.Popen] = set()
+_CODEX_LOCK = threading.Lock()
+# Seconds between SIGTERM and SIGKILL when a run is stopped.
+CODEX_GRACE_SECONDS = 10.0
+# stop_reason values that mean a budget ran out (vs. shutdown or lease expiry).
+BUDGET_STOP_REASONS = (
+    "max_codex_minutes",
+    "max_codex_events",
+    "max_tool_calls_per_iter",
+)
+# Event types that start a tool call, in the old (msg.type) and new (item.type
+# on item.started) codex exec --json protocols.
+_TOOL_CALL_EVENTS = {"exec_command_begin", "mcp_tool_call_begin", "patch_apply_begin"}
+_TOOL_CALL_ITEMS = {"command_execution", "mcp_tool_call", "file_change"}
+
+
+class CodexProgress:
+    """Live state of one codex run: updated by run_codex while events stream in,
+    readable from other threads. cancel() asks run_codex to stop the run."""
+
+    def __init__(self, run_id: str = ""):
+        self.run_id = run_id
+        self.started_at = time.monotonic()
+        self.finished_at: float | None = None
+        self.events = 0
+        self.tool_calls = 0
+        self.last_event_type: str | None = None
+        self.last_event_at: float | None = None
+        self.returncode: int | None = None
+        self.stop_reason: str | None = None
+        self.cached = False
+        self.rusage: dict[str, Any] | None = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    def cancel(self, reason: str) -> None:
+        if self.stop_reason is None:
+            self.stop_reason = reason
+
+    def record(self, line: bytes) -> None:
+        try:
+            event = json.loads(line)
+        except ValueError:
+            return  # stderr noise interleaved with the JSONL
+        if not isinstance(event, dict):
+            return
+        msg = event.get("msg")
+        self.last_event_type = event.get("type") or (
+            msg.get("type") if isinstance(msg, dict) else None
+        )
+        self.last_event_at = time.monotonic()
+        self.events += 1
+        item = event.get("item")
+        if self.last_event_type in _TOOL_CALL_EVENTS or (
+            self.last_event_type == "item.started"
+            and isinstance(item, dict)
+            and item.get("type") in _TOOL_CALL_ITEMS
+        ):
+            self.tool_calls += 1
+
+    def restore(self, summary: dict[str, Any]) -> None:
+        """Replay a cached run's summary: no codex ran, nothing was spent."""
+        self.events = summary["events"]
+        self.tool_calls = summary.get("tool_calls", 0)
+        self.last_event_type = summary["last_event_type"]
+        self.returncode = summary["returncode"]
+        self.finished_at = self.started_at
+        self.cached = True
+
+    def summary(self) -> dict[str, Any]:
+        idle = None
+        if self.last_event_at is not None:
+            idle = (self.finished_at or time.monotonic()) - self.last_event_at
+        return {
+            "run_id": self.run_id,
+            "events": self.events,
+            "tool_calls": self.tool_calls,
+            "last_event_type": self.last_event_type,
+            "elapsed_s": round(self.elapsed, 3),
+            "idle_s": None if idle is None else round(idle, 3),
+            "returncode": self.returncode,
+            "stop_reason": self.stop_reason,
+            "cached": self.cached,
+            "rusage": self.rusage,
+        }
+
+
+def _pump_events(stream, out, progress: CodexProgress) -> None:
+    for line in iter(stream.readline, b""):
+        out.write(line)
+        out.flush()
+        progress.record(line)
+
+
+def _signal_group(proc: subprocess.Popen, sig: int) -> None:
+    try:
+        os.killpg(proc.pid, sig)
+    except ProcessLookupError:
+        pass
 
 
 def run_codex(
@@ -38,12 +158,29 @@ def run_codex(
     out_json: Path,
     out_events_jsonl: Path,
     cwd: Path,
+    stop: threading.Event | None = None,
+    *,
+    max_seconds: float | None = None,
+    max_events: int | None = None,
+    max_tool_calls: int | None = None,
+    progress: CodexProgress | None = None,
+    grace_seconds: float = CODEX_GRACE_SECONDS,
+    limits: ProcLimits | None = None,
 ) -> int:
     """Run codex non-interactive.
 
     Contract:
-    - JSONL event stream -> out_events_jsonl
+    - JSONL event stream -> out_events_jsonl, written and parsed line by line
+      as codex emits it (progress shows event count, last event, elapsed)
     - final structured output -> out_json (validated by output_schema_path)
+
+    codex runs in its own process group under limits (rlimits, niceness, CPU
+    affinity; see procrun), and its rusage is recorded in progress.
+
+    The run is stopped when max_seconds, max_events or max_tool_calls is
+    exceeded, when stop is set, or when progress.cancel() is called: SIGTERM
+    to codex's process group, then SIGKILL after grace_seconds.
+    progress.stop_reason says why.
     """
     cmd = [
         "codex",
@@ -55,66 +192,530 @@ def run_codex(
         str(out_json),
         prompt,
     ]
-    with out_events_jsonl.open("w", encoding="utf-8") as f:
-        proc = subprocess.run(cmd, cwd=str(cwd), stdout=f, stderr=subprocess.STDOUT)
-    return int(proc.returncode)
+    progress = progress or CodexProgress()
+    with out_events_jsonl.open("wb") as f:
+        proc = spawn(
+            cmd,
+            limits,
+            cwd=str(cwd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        with _CODEX_LOCK:
+            _CODEX_PROCS.add(proc)
+        pump = threading.Thread(
+            target=_pump_events, args=(proc.stdout, f, progress), daemon=True
+        )
+        pump.start()
+        kill_at = None
+        try:
+            while True:
+                try:
+                    progress.rusage = wait(proc, timeout=0.1)
+                    break
+                except subprocess.TimeoutExpired:
+                    pass
+                if stop is not None and stop.is_set():
+                    progress.cancel("stopped")
+                if max_seconds is not None and progress.elapsed > max_seconds:
+                    progress.cancel("max_codex_minutes")
+                if max_events is not None and progress.events > max_events:
+                    progress.cancel("max_codex_events")
+                if max_tool_calls is not None and progress.tool_calls > max_tool_calls:
+                    progress.cancel("max_tool_calls_per_iter")
+                if progress.stop_reason is not None and kill_at is None:
+                    _signal_group(proc, signal.SIGTERM)
+                    kill_at = time.monotonic() + grace_seconds
+                elif kill_at is not None and time.monotonic() >= kill_at:
+                    _signal_group(proc, signal.SIGKILL)
+        finally:
+            if proc.returncode is None:  # interrupted (e.g. KeyboardInterrupt)
+                _signal_group(proc, signal.SIGKILL)
+                progress.rusage = wait(proc)
+            pump.join(timeout=1.0)
+            if pump.is_alive():  # leftover children still hold the pipe open
+                _signal_group(proc, signal.SIGKILL)
+                pump.join()
+            proc.stdout.close()
+            with _CODEX_LOCK:
+                _CODEX_PROCS.discard(proc)
+    if stop is not None and stop.is_set():  # e.g. terminate_codex() got there first
+        progress.cancel("stopped")
+    progress.returncode = int(proc.returncode)
+    progress.finished_at = time.monotonic()
+    return progress.returncode
+
+
+def terminate_codex() -> None:
+    """SIGTERM every codex process group started by run_codex still running."""
+    with _CODEX_LOCK:
+        procs = list(_CODEX_PROCS)
+    for proc in procs:
+        # Not poll(): reaping here would take the run's rusage from run_codex.
+        if proc.returncode is None:
+            _signal_group(proc, signal.SIGTERM)
 
 
 def make_evidence_stub(
-    candidate_id: str, base_ref: str, work_item_id: str, codex_rc: int, out_dir: Path
-) -> Dict[str, Any]:
+    candidate_id: str,
+    base_ref: str,
+    work_item_id: str,
+    codex_rc: int,
+    out_dir: Path,
+    progress: CodexProgress | None = None,
+    diff: DiffStats | None = None,
+) -> dict[str, Any]:
     """Minimal evidence capsule; controller/linearizer can extend.
 
-    Current schema is permissive; this is a placeholder that keeps the artifact graph intact.
+    Inputs and outputs already on disk are referenced by sha256 of their bytes;
+    diff_summary and touched_paths come from the PatchProposal's diff.
     """
+    diff = diff or DiffStats([])
+    inputs = {"run_manifest": out_dir / "run_manifest.json"}
+    outputs = {
+        "patch_proposal": out_dir / "patch_proposal.json",
+        "codex_events": out_dir / "codex_events.jsonl",
+    }
     return {
         "artifact_kind": "evidence_capsule",
         "run_id": candidate_id,
+        "iteration_id": work_item_id,
         "base_ref": base_ref,
-        "checks": {
-            "codex": {
+        "inputs_hashes": {
+            name: sha256_ref(sha256_file_cached(path))
+            for name, path in inputs.items()
+            if path.exists()
+        },
+        "diff_summary": diff.summary(),
+        "checks": [
+            {
+                "name": "codex",
                 "ok": codex_rc == 0,
                 "rc": codex_rc,
-                "work_item_id": work_item_id,
-            },
+                **(progress.summary() if progress is not None else {}),
+            }
+        ],
+        "touched_paths": diff.touched_paths,
+        "hash_manifest": {
+            name: sha256_ref(sha256_file_cached(path))
+            for name, path in outputs.items()
+            if path.exists()
         },
-        "diff": {"files": [], "lines_added": 0, "lines_removed": 0},
-        "notes": [f"events_jsonl={str(out_dir / 'codex_events.jsonl')}"],
+        "meta": default_meta(),
     }
 
 
-def worker_gate_stub(candidate_id: str, base_ref: str, codex_rc: int) -> Dict[str, Any]:
-    """Worker-local gate: admissibility filter (NOT promotion)."""
-    if codex_rc != 0:
+def worker_gate_stub(
+    candidate_id: str,
+    work_item_id: str,
+    codex_rc: int,
+    out_dir: Path,
+    stop_reason: str | None = None,
+    path_violations: list[tuple[str, str]] | None = None,
+    diff_lines_total: int = 0,
+    max_patch_lines: int | None = None,
+) -> dict[str, Any]:
+    """Worker-local gate: admissibility filter (NOT promotion).
+
+    PROMOTE here only means "eligible for the linearizer"; it replays and
+    decides for real. path_violations are the (path, reason) pairs of the
+    diff's touched paths rejected by the work item's path policy; a diff of
+    more than max_patch_lines (the item's budgets) is DIFF_BUDGET_EXCEEDED.
+    """
+    if stop_reason in BUDGET_STOP_REASONS:
+        decision = "DENY"
+        reason_codes = ["BUDGET_EXHAUSTED"]
+    elif codex_rc != 0:
+        decision = "DENY"
+        reason_codes = ["MISSING_EVIDENCE_DENIED"]
+    elif path_violations:
         decision = "DENY"
-        reason_codes = ["CHECKS_FAILED"]
+        reason_codes = ["TOUCHED_FORBIDDEN_PATH"]
+    elif max_patch_lines is not None and diff_lines_total > max_patch_lines:
+        decision = "DENY"
+        reason_codes = ["DIFF_BUDGET_EXCEEDED"]
     else:
-        decision = "ALLOW"
+        decision = "PROMOTE"
         reason_codes = []
 
     return {
         "artifact_kind": "gate_decision",
         "run_id": candidate_id,
+        "iteration_id": work_item_id,
         "decision": decision,
         "reason_codes": reason_codes,
-        "base_ref": base_ref,
-        "created_at": now_iso(),
-        "notes": ["worker-local admissibility only"],
+        "pointers": {"evidence": str(out_dir / "evidence.json")},
+        "meta": default_meta(),
     }
 
 
-def append_candidate(candidate_set_path: Path, entry: Dict[str, Any]) -> None:
-    if candidate_set_path.exists():
-        data = load_json(candidate_set_path)
+def new_candidate_id(worker_id: str) -> str:
+    """Unique across workers, processes and hosts: time plus random suffix."""
+    return f"cand-{worker_id}-{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+
+def run_candidate(
+    queue: dict[str, Any],
+    wi: dict[str, Any],
+    worker_id: str,
+    prompt: str,
+    candidate_set_path: Path,
+    stop: threading.Event | None = None,
+    progress: CodexProgress | None = None,
+    ledger: BudgetLedger | None = None,
+    cache: CodexCache | None = None,
+    limits: ProcLimits | None = None,
+    worktrees: WorktreePool | None = None,
+) -> str | None:
+    """Run codex for one claimed work item and append the candidate.
+
+    codex is held to the item's budgets.max_codex_minutes and
+    budgets.max_codex_events (and the ledger's max_tool_calls_per_iter); a run
+    stopped by any of them is still recorded, denied with BUDGET_EXHAUSTED.
+    Returns the candidate id, or None if stop was set or progress cancelled
+    while codex ran (the run is abandoned: no evidence and no candidate).
+
+    With a ledger the run is reserved before codex starts (raising
+    BudgetExhausted if the queue's budget is spent) and reconciled with the
+    codex time and tool calls it actually used.
+
+    With a cache, a clean earlier run of the same objective, base_ref, prompt
+    profile, prompt and schema is reused instead of running codex; cache hits
+    release their reservation unspent.
+
+    With worktrees, codex runs in a worktree leased from the pool at the
+    queue's base_ref (reset and returned afterwards) instead of the cwd.
+    """
+    reservation = ledger.reserve(wi) if ledger is not None else None
+    progress = progress or CodexProgress()
+    checkout = None
+    try:
+        if worktrees is not None:
+            checkout = worktrees.lease(queue["base_ref"])
+        return _run_candidate(
+            queue,
+            wi,
+            worker_id,
+            prompt,
+            candidate_set_path,
+            stop,
+            progress,
+            ledger,
+            cache,
+            limits,
+            Path.cwd() if checkout is None else checkout.path,
+        )
+    finally:
+        if checkout is not None:
+            worktrees.release(checkout)
+        if reservation is not None:
+            if progress.returncode is None or progress.cached:
+                ledger.cancel(reservation)
+            else:
+                ledger.reconcile(reservation, progress.elapsed, progress.tool_calls)
+
+
+def _run_candidate(
+    queue: dict[str, Any],
+    wi: dict[str, Any],
+    worker_id: str,
+    prompt: str,
+    candidate_set_path: Path,
+    stop: threading.Event | None,
+    progress: CodexProgress,
+    ledger: BudgetLedger | None,
+    cache: CodexCache | None,
+    limits: ProcLimits | None,
+    workdir: Path,
+) -> str | None:
+    work_item_id = wi["work_item_id"]
+    candidate_id = new_candidate_id(worker_id)
+    budgets = wi.get("budgets", {})
+    max_minutes = budgets.get("max_codex_minutes")
+    progress.run_id = candidate_id
+    out_dir = state_root() / "out" / candidate_id
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    # Write run manifest (optional for now)
+    run_manifest = {
+        "artifact_kind": "run_manifest",
+        "run_id": candidate_id,
+        "repo_root": str(workdir),
+        "base_ref": queue["base_ref"],
+        "last_good_ref": queue["base_ref"],
+        "desired_state_id": queue["desired_state_id"],
+        "budgets": wi.get("budgets", {}),
+        "policy": wi.get(
+            "policy",
+            {
+                "allowed_paths": [],
+                "forbidden_paths": [],
+                "allowed_commands": [],
+            },
+        ),
+        "output_root": str(out_dir),
+    }
+    write_json(out_dir / "run_manifest.json", run_manifest)
+
+    # Run codex
+    patch_schema = Path(read_registry_schema("patch_proposal"))
+    patch_out = out_dir / "patch_proposal.json"
+    events_out = out_dir / "codex_events.jsonl"
+    cache_key = None
+    if cache is not None:
+        cache_key = cache.key_for(wi, queue["base_ref"], prompt, patch_schema)
+        hit = cache.get(
+            cache_key,
+            out_dir,
+            stamp={"candidate_id": candidate_id, "work_item_id": work_item_id},
+        )
+        if hit is not None:
+            progress.restore(hit)
+    if progress.cached:
+        rc = progress.returncode
     else:
-        data = {
-            "artifact_kind": "candidate_set",
-            "queue_id": entry["queue_id"],
-            "base_ref": entry["base_ref"],
-            "candidates": [],
+        rc = run_codex(
+            prompt=f"Objective: {wi['objective_slice']}\n\n{prompt}",
+            output_schema_path=patch_schema,
+            out_json=patch_out,
+            out_events_jsonl=events_out,
+            cwd=workdir,
+            stop=stop,
+            max_seconds=None if max_minutes is None else max_minutes * 60,
+            max_events=budgets.get("max_codex_events"),
+            max_tool_calls=None
+            if ledger is None
+            else ledger.summary()["limits"].get("max_tool_calls_per_iter"),
+            progress=progress,
+            limits=limits,
+        )
+    if progress.stop_reason is not None and (
+        progress.stop_reason not in BUDGET_STOP_REASONS
+    ):
+        return None
+
+    diff = DiffStats([])
+    if patch_out.exists():
+        patch = load_json(patch_out)
+        validate_artifact("patch_proposal", patch)
+        diff = patch_diff_stats(patch, workdir)
+        if (
+            cache_key is not None
+            and not progress.cached
+            and rc == 0
+            and progress.stop_reason is None
+        ):
+            cache.put(cache_key, out_dir, progress.summary())
+
+    evidence = make_evidence_stub(
+        candidate_id, queue["base_ref"], work_item_id, rc, out_dir, progress, diff
+    )
+    write_json(out_dir / "evidence.json", evidence, kind="evidence_capsule")
+    validate_artifact("evidence_capsule", evidence)
+
+    path_violations = policy_path_policy(run_manifest["policy"]).violations(
+        diff.touched_paths
+    )
+    diff_lines_total = diff.metrics()["diff_lines_total"]
+    gate = worker_gate_stub(
+        candidate_id,
+        work_item_id,
+        rc,
+        out_dir,
+        progress.stop_reason,
+        path_violations,
+        diff_lines_total,
+        budgets.get("max_patch_lines"),
+    )
+    write_json(out_dir / "gate_worker.json", gate)
+    validate_artifact("gate_decision", gate)
+    if ledger is not None and "DIFF_BUDGET_EXCEEDED" in gate["reason_codes"]:
+        ledger.record_diff_budget_exceeded(work_item_id, diff_lines_total)
+
+    # CandidateSet entry
+    entry = {
+        "queue_id": queue["queue_id"],
+        "base_ref": queue["base_ref"],
+        "candidate": {
+            "candidate_id": candidate_id,
+            "work_item_id": work_item_id,
+            "pattern": wi["pattern"],
+            "patch_proposal_path": str(patch_out),
+            "evidence_path": str(out_dir / "evidence.json"),
+            "gate_worker_path": str(out_dir / "gate_worker.json"),
+            "created_at": now_iso(),
+            "metrics": {
+                **diff.metrics(),
+                "checks_passed": 1 if rc == 0 else 0,
+                "checks_failed": 0 if rc == 0 else 1,
+                "policy_warnings": len(path_violations),
+            },
+        },
+    }
+
+    append_candidate(candidate_set_path, entry)
+    return candidate_id
+
+
+def supervise(
+    queue: dict[str, Any],
+    engine: ClaimEngine,
+    workers: int,
+    max_runs: int,
+    worker_id: str,
+    prompt: str,
+    candidate_set_path: Path,
+    ledger: BudgetLedger | None = None,
+    cache: CodexCache | None = None,
+    limits: ProcLimits | None = None,
+    autoscaler: Autoscaler | None = None,
+    worktrees: WorktreePool | None = None,
+) -> dict[str, Any]:
+    """Run up to max_runs codex executions, at most `workers` at a time.
+
+    Each pool thread leases the most urgent item with a free slot from engine,
+    runs one candidate, releases the lease and claims again. Threads wait while
+    leases are out or items are held elsewhere, and exit once nothing is left
+    to claim. The supervisor watches each run's CodexProgress; when a lease
+    expires it cancels that run (freeing the slot for another thread).
+    SIGTERM or SIGINT stops claiming, terminates running codex processes and
+    waits for the pool; abandoned runs append no candidate. Once the ledger
+    refuses a run (BUDGET_EXHAUSTED) no new runs are started; running ones
+    finish. Thread n runs codex under limits.for_slot(n), in a worktree
+    leased from worktrees when given.
+
+    With an autoscaler the pool has autoscaler.config.max_workers threads and
+    `workers` is only the starting concurrency: threads at or above the current
+    target idle (after finishing their run) and the target is re-decided as
+    the supervisor loop ticks.
+    """
+    stop = threading.Event()
+    exhausted = threading.Event()
+    done = threading.Event()
+    target = workers
+    threads_total = workers
+    if autoscaler is not None:
+        target = autoscaler.clamp(workers)
+        threads_total = autoscaler.config.max_workers
+    mutex = threading.Lock()
+    started = 0
+    candidates: list[str] = []
+    errors: list[str] = []
+    expired: list[str] = []
+    running: dict[int, CodexProgress] = {}
+    runs: list[dict[str, Any]] = []
+    refused: list[str] = []
+
+    def on_signal(signum, frame):
+        stop.set()
+        terminate_codex()
+
+    previous = {
+        sig: signal.signal(sig, on_signal) for sig in (signal.SIGTERM, signal.SIGINT)
+    }
+
+    def take_run() -> bool:
+        nonlocal started
+        with mutex:
+            if started >= max_runs:
+                return False
+            started += 1
+            return True
+
+    def pool_worker(n: int) -> None:
+        while not (stop.is_set() or exhausted.is_set() or done.is_set()) and (
+            started < max_runs
+        ):
+            if n >= target:
+                stop.wait(0.05)
+                continue
+            lease = engine.claim()
+            if lease is None:
+                if not engine.pending():
+                    done.set()
+                    return
+                stop.wait(0.05)
+                continue
+            progress = CodexProgress()
+            running[id(lease)] = progress
+            try:
+                if not take_run():
+                    return
+                cid = run_candidate(
+                    queue,
+                    lease.work_item,
+                    f"{worker_id}.{n}",
+                    prompt,
+                    candidate_set_path,
+                    stop,
+                    progress,
+                    ledger,
+                    cache,
+                    None if limits is None else limits.for_slot(n),
+                    worktrees,
+                )
+                if cid is not None:
+                    candidates.append(cid)
+            except BudgetExhausted as exc:
+                with mutex:
+                    if not exhausted.is_set():
+                        exhausted.set()
+                        refused.append(str(exc))
+            except Exception as exc:  # noqa: BLE001 - one bad run must not kill the pool
+                errors.append(f"{lease.work_item_id}: {exc}")
+            finally:
+                running.pop(id(lease), None)
+                if progress.returncode is not None:
+                    runs.append(progress.summary())
+                engine.release(lease)
+                if lease.expired:
+                    expired.append(lease.work_item_id)
+
+    threads = [
+        threading.Thread(target=pool_worker, args=(n,), name=f"worker-{n}")
+        for n in range(threads_total)
+    ]
+    peak = target
+    try:
+        for t in threads:
+            t.start()
+        while any(t.is_alive() for t in threads):
+            for lease in engine.reap():
+                progress = running.get(id(lease))
+                if progress is not None:
+                    progress.cancel("lease_expired")
+            if autoscaler is not None:
+                target = autoscaler.decide(
+                    target, len(running), engine.snapshot()["ready"]
+                )
+                peak = max(peak, target)
+            for t in threads:
+                t.join(timeout=0.1 if autoscaler is None else 0.1 / len(threads))
+    finally:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+    result = {
+        "candidates": sorted(candidates),
+        "errors": errors,
+        "expired_leases": sorted(expired),
+        "runs": sorted(runs, key=lambda run: run["run_id"]),
+        "claims": engine.snapshot(),
+        "stopped": stop.is_set(),
+    }
+    if ledger is not None:
+        result["budget"] = ledger.summary()
+        result["refused"] = refused[0] if refused else None
+    if cache is not None:
+        result["codex_cache"] = dict(cache.stats)
+    if worktrees is not None:
+        result["worktree_pool"] = dict(worktrees.stats)
+    if autoscaler is not None:
+        result["autoscale"] = {
+            "target": target,
+            "peak": peak,
+            "decisions": autoscaler.decisions,
         }
-    data["candidates"].append(entry["candidate"])
-    write_json(candidate_set_path, data)
+    return result
 
 
 def main() -> int:
@@ -133,6 +734,96 @@ def main() -> int:
         "--prompt",
         default="Implement the smallest change for the given objective slice. Output a unified diff.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="supervisor mode: run up to N codex executions concurrently",
+    )
+    parser.add_argument(
+        "--max-runs",
+        type=int,
+        default=None,
+        help="supervisor mode: total runs (default: one per claim slot in the queue)",
+    )
+    parser.add_argument(
+        "--lease-seconds",
+        type=float,
+        default=DEFAULT_LEASE_SECONDS,
+        help="claim lease for items without budgets.max_codex_minutes",
+    )
+    parser.add_argument(
+        "--control-strategy",
+        default=str(state_root() / "queue" / "control_strategy.json"),
+        help="ControlStrategy whose tool_policy.budgets feed the budget ledger (skipped if missing)",
+    )
+    parser.add_argument(
+        "--queue-codex-minutes",
+        type=float,
+        default=None,
+        help="total codex minutes the queue may spend across all workers",
+    )
+    parser.add_argument(
+        "--pattern-catalog",
+        default=str(state_root() / "queue" / "pattern_catalog.json"),
+        help="PatternCatalog giving each pattern's prompt_profile_id (skipped if missing)",
+    )
+    parser.add_argument(
+        "--no-codex-cache",
+        action="store_true",
+        help="always run codex, never reuse a cached result",
+    )
+    parser.add_argument(
+        "--codex-cache-entries",
+        type=int,
+        default=CODEX_CACHE_MAX_ENTRIES,
+        help="LRU bound on cached codex results",
+    )
+    parser.add_argument(
+        "--codex-cpu-seconds",
+        type=int,
+        default=None,
+        help="RLIMIT_CPU for each codex run",
+    )
+    parser.add_argument(
+        "--codex-memory-mb",
+        type=int,
+        default=None,
+        help="RLIMIT_AS for each codex run",
+    )
+    parser.add_argument(
+        "--codex-open-files",
+        type=int,
+        default=None,
+        help="RLIMIT_NOFILE for each codex run",
+    )
+    parser.add_argument(
+        "--codex-nice", type=int, default=0, help="niceness added to codex runs"
+    )
+    parser.add_argument(
+        "--pin-cpus",
+        action="store_true",
+        help="pin each worker slot's codex to one CPU (round robin)",
+    )
+    parser.add_argument(
+        "--autoscale",
+        action="store_true",
+        help="supervisor mode: adapt concurrency between --min-workers and --max-workers",
+    )
+    parser.add_argument("--min-workers", type=int, default=1)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--autoscale-log",
+        default=str(state_root() / "queue" / "autoscale.jsonl"),
+        help="JSONL log of scaling decisions",
+    )
+    parser.add_argument(
+        "--worktree-pool",
+        type=int,
+        default=0,
+        help="run codex in N warm worktrees of the cwd repo at the queue's "
+        "base_ref, leased per run (0: run in the cwd)",
+    )
     args = parser.parse_args()
 
     ensure_state_layout()
@@ -141,90 +832,98 @@ def main() -> int:
     queue = load_json(queue_path)
     validate_artifact("work_queue", queue)
 
-    # naive: take first work item (claim lock prevents duplication)
-    wi = queue["work_items"][0]
-    work_item_id = wi["work_item_id"]
-
-    lock_path = state_root() / "locks" / f"claim_{work_item_id}.lock"
-    try:
-        with AtomicLock(lock_path):
-            candidate_id = f"cand-{args.worker_id}-{int(Path('/proc/uptime').read_text().split()[0].split('.')[0])}"
-            out_dir = state_root() / "out" / candidate_id
-            out_dir.mkdir(parents=True, exist_ok=True)
-
-            # Write run manifest (optional for now)
-            run_manifest = {
-                "artifact_kind": "run_manifest",
-                "run_id": candidate_id,
-                "repo_root": str(Path.cwd()),
-                "base_ref": queue["base_ref"],
-                "last_good_ref": queue["base_ref"],
-                "desired_state_id": queue["desired_state_id"],
-                "budgets": wi.get("budgets", {}),
-                "policy": wi.get(
-                    "policy",
-                    {
-                        "allowed_paths": [],
-                        "forbidden_paths": [],
-                        "allowed_commands": [],
-                    },
-                ),
-                "output_root": str(out_dir),
-            }
-            write_json(out_dir / "run_manifest.json", run_manifest)
-
-            # Run codex
-            patch_schema = Path(read_registry_schema("patch_proposal"))
-            patch_out = out_dir / "patch_proposal.json"
-            events_out = out_dir / "codex_events.jsonl"
-            rc = run_codex(
-                prompt=f"Objective: {wi['objective_slice']}\n\n{args.prompt}",
-                output_schema_path=patch_schema,
-                out_json=patch_out,
-                out_events_jsonl=events_out,
-                cwd=Path.cwd(),
-            )
-
-            if patch_out.exists():
-                validate_artifact("patch_proposal", load_json(patch_out))
-
-            evidence = make_evidence_stub(
-                candidate_id, queue["base_ref"], work_item_id, rc, out_dir
-            )
-            write_json(out_dir / "evidence.json", evidence)
-            validate_artifact("evidence_capsule", evidence)
-
-            gate = worker_gate_stub(candidate_id, queue["base_ref"], rc)
-            write_json(out_dir / "gate_worker.json", gate)
-            validate_artifact("gate_decision", gate)
-
-            # CandidateSet entry
-            entry = {
-                "queue_id": queue["queue_id"],
-                "base_ref": queue["base_ref"],
-                "candidate": {
-                    "candidate_id": candidate_id,
-                    "work_item_id": work_item_id,
-                    "patch_proposal_path": str(patch_out),
-                    "evidence_path": str(out_dir / "evidence.json"),
-                    "gate_worker_path": str(out_dir / "gate_worker.json"),
-                    "created_at": now_iso(),
-                    "metrics": {
-                        "diff_lines_total": 0,
-                        "files_touched": 0,
-                        "checks_passed": 1 if rc == 0 else 0,
-                        "checks_failed": 0 if rc == 0 else 1,
-                        "policy_warnings": 0,
-                    },
-                },
-            }
-
-            append_candidate(Path(args.candidate_set), entry)
-            return 0
-
-    except FileExistsError:
-        print(f"work item already claimed: {work_item_id}", file=sys.stderr)
+    strategy_path = Path(args.control_strategy)
+    strategy = None
+    if strategy_path.exists():
+        strategy = load_json(strategy_path)
+        validate_artifact("control_strategy", strategy)
+    ledger = BudgetLedger(
+        queue["queue_id"], budget_limits(strategy, args.queue_codex_minutes)
+    )
+    limits = ProcLimits(
+        cpu_seconds=args.codex_cpu_seconds,
+        memory_bytes=None
+        if args.codex_memory_mb is None
+        else args.codex_memory_mb * 2**20,
+        open_files=args.codex_open_files,
+        nice=args.codex_nice,
+        pin_cpus=args.pin_cpus,
+    )
+    cache = None
+    if not args.no_codex_cache:
+        catalog_path = Path(args.pattern_catalog)
+        catalog = None
+        if catalog_path.exists():
+            catalog = load_json(catalog_path)
+            validate_artifact("pattern_catalog", catalog)
+        cache = CodexCache(
+            max_entries=args.codex_cache_entries,
+            prompt_profiles=prompt_profiles(catalog),
+        )
+
+    worktrees = None
+    if args.worktree_pool:
+        worktrees = WorktreePool(Path.cwd(), args.worktree_pool)
+    engine = ClaimEngine(
+        queue["work_items"],
+        state_root() / "locks",
+        lease_seconds=args.lease_seconds,
+    )
+    autoscaler = None
+    if args.autoscale:
+        autoscaler = Autoscaler(
+            AutoscaleConfig(
+                min_workers=args.min_workers,
+                max_workers=max(args.min_workers, args.max_workers),
+            ),
+            log_path=Path(args.autoscale_log),
+        )
+        args.workers = args.workers or args.min_workers
+    if args.workers:
+        max_runs = args.max_runs
+        if max_runs is None:
+            max_runs = sum(wi.get("max_workers", 1) for wi in queue["work_items"])
+        result = supervise(
+            queue,
+            engine,
+            args.workers,
+            max_runs,
+            args.worker_id,
+            args.prompt,
+            Path(args.candidate_set),
+            ledger,
+            cache,
+            limits,
+            autoscaler,
+            worktrees,
+        )
+        print(json.dumps(result, sort_keys=True))
+        if result["stopped"]:
+            return 128 + signal.SIGTERM
+        return 1 if result["errors"] else 0
+
+    lease = engine.claim()
+    if lease is None:
+        print("all work items already claimed", file=sys.stderr)
         return 2
+    try:
+        run_candidate(
+            queue,
+            lease.work_item,
+            args.worker_id,
+            args.prompt,
+            Path(args.candidate_set),
+            ledger=ledger,
+            cache=cache,
+            limits=limits.for_slot(os.getpid()),
+            worktrees=worktrees,
+        )
+    except BudgetExhausted as exc:
+        print(f"{exc.reason_code}: {exc}", file=sys.stderr)
+        return 3
+    finally:
+        engine.release(lease)
+    return 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,275 @@
+"""Warm pool of git worktrees under state_root()/worktrees/pool/<repo key>.
+
+A fresh `git worktree add` writes out the whole tree; on large repos that is
+seconds of I/O per replay or worker run. WorktreePool keeps up to `size`
+detached worktrees (slot-0 .. slot-<size-1>) of one repository and leases
+them out. lease(base_ref) takes a free slot, preferring one already at
+base_ref's commit, and brings it there with `git reset --hard` plus
+`git clean -ffdx`, which only rewrites the files that differ. release()
+resets the slot to the requested base_ref (default: the one it was leased
+at) so the next lease of the same commit finds it ready; a slot that is
+still clean at the right commit is handed out without any reset.
+
+Each slot has a lock file (_util.shared_lock), so a slot is leased to one
+holder at a time across threads, processes and (link backend) hosts, and a
+dead holder's slot frees up with its lock. A slot that fails a reset, stays
+dirty after one, or whose checkout is broken (missing, HEAD unreadable) is
+evicted: its worktree is removed and re-created on its next lease.
+slot-<i>.json records the slot's commit, lease count and evictions. The
+default pool directory is keyed by a short hash of the resolved repository
+path, so pools of different repositories never share slots.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import shutil
+import subprocess
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from _util import LockBusy, load_json, now_iso, shared_lock, state_root, write_json
+
+WORKTREE_POOL_SIZE = 4
+# Backoff between scans of the slots while all are leased.
+WORKTREE_POOL_RETRY_SECONDS = 0.05
+
+# git worktree add/remove/prune of one repo must not interleave: the thread
+# lock orders them within a process, a lock file in the repository's git
+# directory (_worktree_lock) across processes.
+_WORKTREE_LOCK = threading.Lock()
+
+
+class WorktreeError(RuntimeError):
+    pass
+
+
+def git(
+    repo: Path, *args: str, check: bool = True, **kwargs: Any
+) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        ["git", "-C", str(repo), *args],
+        capture_output=True,
+        text=True,
+        check=check,
+        **kwargs,
+    )
+
+
+def resolve_base_ref(repo: Path, base_ref: str) -> str:
+    """Commit sha of base_ref; "<ref>@<sha>" (WorkQueue form) resolves by
+    the ref first, then the sha."""
+    refs = [base_ref]
+    if "@" in base_ref:
+        refs.append(base_ref.rsplit("@", 1)[1])
+    for ref in refs:
+        out = git(
+            repo, "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}", check=False
+        )
+        if out.returncode == 0:
+            return out.stdout.strip()
+    raise WorktreeError(f"cannot resolve base_ref {base_ref!r} in {repo}")
+
+
+@contextmanager
+def _worktree_lock(repo: Path) -> Iterator[None]:
+    common = git(repo, "rev-parse", "--git-common-dir").stdout.strip()
+    lock_path = Path(repo) / common / "xtrl-worktree.lock"
+    with _WORKTREE_LOCK, shared_lock(lock_path, timeout=None):
+        yield
+
+
+def add_worktree(repo: Path, path: Path, sha: str) -> None:
+    """Detached worktree of sha at path, replacing a leftover one."""
+    if path.exists():
+        remove_worktree(repo, path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _worktree_lock(repo):
+        git(repo, "worktree", "prune", check=False)
+        git(repo, "worktree", "add", "--detach", "--quiet", str(path), sha)
+
+
+def remove_worktree(repo: Path, path: Path) -> None:
+    with _worktree_lock(repo):
+        git(repo, "worktree", "remove", "--force", str(path), check=False)
+        shutil.rmtree(path, ignore_errors=True)
+        git(repo, "worktree", "prune", check=False)
+
+
+def worktree_state(path: Path) -> tuple[str, bool] | None:
+    """(HEAD sha, clean) of a worktree; None if it is not a usable checkout.
+
+    A directory that is not itself the top of a checkout (e.g. its .git link
+    is gone and git would find an enclosing repository) is not usable.
+    """
+    if not (path / ".git").exists():
+        return None
+    head = git(path, "rev-parse", "--show-toplevel", "HEAD", check=False)
+    lines = head.stdout.splitlines()
+    if head.returncode != 0 or len(lines) != 2:
+        return None
+    if Path(lines[0]).resolve() != path.resolve():
+        return None
+    status = git(path, "status", "--porcelain", "--ignored", check=False)
+    if status.returncode != 0:
+        return None
+    return lines[1], not status.stdout
+
+
+class WorktreeLease:
+    """A leased slot: `path` is a clean checkout of `sha` until release()."""
+
+    def __init__(self, slot: int, path: Path, sha: str, lock: Any):
+        self.slot = slot
+        self.path = path
+        self.sha = sha
+        self.lock = lock
+
+    def __repr__(self) -> str:
+        return f"WorktreeLease(slot={self.slot}, sha={self.sha[:12]})"
+
+
+class WorktreePool:
+    """Leases warm worktrees of repo; see the module docstring.
+
+    stats counts, for this process: leases, warm (handed out without a
+    reset), resets, created and evicted worktrees.
+    """
+
+    def __init__(
+        self,
+        repo: Path,
+        size: int = WORKTREE_POOL_SIZE,
+        *,
+        root: Path | None = None,
+        retry_seconds: float = WORKTREE_POOL_RETRY_SECONDS,
+    ):
+        if size < 1:
+            raise ValueError("worktree pool size must be at least 1")
+        self.repo = Path(repo).resolve()
+        self.size = size
+        if root is None:
+            key = hashlib.sha256(str(self.repo).encode()).hexdigest()[:12]
+            root = state_root() / "worktrees" / "pool" / key
+        self.root = root
+        self.retry_seconds = retry_seconds
+        self.stats = {"leases": 0, "warm": 0, "resets": 0, "created": 0, "evicted": 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key: str) -> None:
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def slot_path(self, slot: int) -> Path:
+        return self.root / f"slot-{slot}"
+
+    def _meta_path(self, slot: int) -> Path:
+        return self.root / f"slot-{slot}.json"
+
+    def _meta(self, slot: int) -> dict:
+        try:
+            return load_json(self._meta_path(slot))
+        except (FileNotFoundError, ValueError):
+            return {"sha": None, "leases": 0, "evictions": 0}
+
+    def _try_slot(self, slot: int) -> Any | None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        lock = shared_lock(self.root / f"slot-{slot}.lock", timeout=0)
+        try:
+            lock.acquire()
+        except LockBusy:
+            return None
+        return lock
+
+    def lease(self, base_ref: str, timeout: float | None = None) -> WorktreeLease:
+        """A clean worktree at base_ref's commit. Waits for a free slot (up to
+        timeout seconds; None waits indefinitely), raising LockBusy on timeout.
+        """
+        sha = resolve_base_ref(self.repo, base_ref)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            # Slots already at sha first, then the rest in order.
+            slots = sorted(
+                range(self.size), key=lambda i: self._meta(i).get("sha") != sha
+            )
+            for slot in slots:
+                lock = self._try_slot(slot)
+                if lock is None:
+                    continue
+                try:
+                    self._prepare(slot, sha)
+                except BaseException:
+                    lock.release()
+                    raise
+                self._count("leases")
+                return WorktreeLease(slot, self.slot_path(slot), sha, lock)
+            if deadline is not None and time.monotonic() >= deadline:
+                raise LockBusy(f"all {self.size} worktrees under {self.root} leased")
+            time.sleep(self.retry_seconds)
+
+    def release(self, lease: WorktreeLease, base_ref: str | None = None) -> None:
+        """Reset the slot to base_ref (default: the leased commit) and free it."""
+        try:
+            sha = (
+                lease.sha if base_ref is None else resolve_base_ref(self.repo, base_ref)
+            )
+            if not self._reset(lease.slot, sha):
+                self._evict(lease.slot)
+        finally:
+            lease.lock.release()
+
+    def warm(self, base_ref: str) -> None:
+        """Create (or reset) every free slot at base_ref ahead of use."""
+        sha = resolve_base_ref(self.repo, base_ref)
+        for slot in range(self.size):
+            lock = self._try_slot(slot)
+            if lock is None:
+                continue
+            try:
+                self._prepare(slot, sha)
+            finally:
+                lock.release()
+
+    def _prepare(self, slot: int, sha: str) -> None:
+        """Bring the slot (lock held) to a clean checkout of sha."""
+        path = self.slot_path(slot)
+        state = worktree_state(path)
+        if state == (sha, True):
+            self._count("warm")
+        elif state is None or not self._reset(slot, sha):
+            if path.exists():
+                self._evict(slot)
+            add_worktree(self.repo, path, sha)
+            self._count("created")
+        meta = self._meta(slot)
+        meta.update(sha=sha, leases=meta.get("leases", 0) + 1, leased_at=now_iso())
+        write_json(self._meta_path(slot), meta)
+
+    def _reset(self, slot: int, sha: str) -> bool:
+        """Cheap reset-and-clean to sha; False if the slot is unhealthy."""
+        path = self.slot_path(slot)
+        # Never reset/clean through a broken slot into an enclosing repo.
+        if worktree_state(path) is None:
+            return False
+        self._count("resets")
+        reset = git(path, "reset", "--hard", "--quiet", sha, check=False)
+        clean = git(path, "clean", "-ffdxq", check=False)
+        if reset.returncode != 0 or clean.returncode != 0:
+            return False
+        if worktree_state(path) != (sha, True):
+            return False
+        meta = self._meta(slot)
+        meta["sha"] = sha
+        write_json(self._meta_path(slot), meta)
+        return True
+
+    def _evict(self, slot: int) -> None:
+        remove_worktree(self.repo, self.slot_path(slot))
+        meta = self._meta(slot)
+        meta.update(sha=None, evictions=meta.get("evictions", 0) + 1)
+        write_json(self._meta_path(slot), meta)
+        self._count("evicted")